@@ -53,3 +53,24 @@ PARSE_STATUS_FAILED = "failed"
 
 CONFIG_KEY_OUTPUT_PARSED_DIR = "output_parsed_dir"
 CONFIG_KEY_OUTPUT_DIR = "output_dir"
+CONFIG_KEY_PARSE_WORKERS = "max_concurrent_jobs"
+
+# ============================================================================
+# Parallel Parsing
+# ============================================================================
+
+# Fallback worker count, used only when the parser config has no
+# max_concurrent_jobs. The parser config always defines it
+# (PARSER_MAX_CONCURRENT_JOBS, default 3), so parsing is parallel by
+# default; set it to 1 for the serial, in-process parse path.
+DEFAULT_PARSE_WORKERS = 1
+SECONDS_PER_MINUTE = 60
+
+# ============================================================================
+# Incremental Mapping
+# ============================================================================
+
+# Manifest of mapped parsed.json files, stored in the mapper output directory
+MAP_MANIFEST_FILENAME = ".map_manifest.json"
+MAP_MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
@@ -0,0 +1,187 @@
+"""
+Map Phase Manifest
+
+Tracks which parsed.json files have already been mapped so the map phase
+only re-maps new or changed filings.
+
+Architecture:
+- One JSON manifest file in the mapper output directory
+- Entries keyed by resolved parsed.json path
+- Change detection: size + mtime fast path, SHA-256 content hash when the
+  stat signature differs (touching a file does not force a re-map)
+- An entry is only trusted while its recorded output folder still exists
+
+Example:
+    manifest = MapManifest(mapped_output_dir / MAP_MANIFEST_FILENAME)
+
+    if manifest.needs_mapping(parsed_file):
+        result = mapper.extract_and_export(parsed_file)
+        manifest.record(parsed_file, result['output_folder'])
+
+    manifest.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .constants import (
+    MAP_MANIFEST_VERSION,
+    HASH_CHUNK_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """
+    Compute SHA-256 hash of a file in chunks.
+
+    Args:
+        file_path: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MapManifest:
+    """
+    Persistent record of mapped parsed.json files.
+
+    Entry layout:
+        {
+            "size": int,
+            "mtime_ns": int,
+            "sha256": str,
+            "output_folder": str,
+            "mapped_at": ISO timestamp
+        }
+    """
+
+    def __init__(self, manifest_path: Path):
+        """
+        Initialize manifest and load existing entries.
+
+        Args:
+            manifest_path: Path to manifest JSON file
+        """
+        self.manifest_path = Path(manifest_path)
+        self.entries: dict[str, dict[str, any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load manifest from disk (missing or corrupt file = empty)."""
+        if not self.manifest_path.exists():
+            return
+
+        try:
+            with open(self.manifest_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable map manifest {self.manifest_path}: {e}")
+            return
+
+        if data.get('version') != MAP_MANIFEST_VERSION:
+            logger.info("Map manifest version changed - all filings will be re-mapped")
+            return
+
+        self.entries = data.get('entries', {})
+
+    @staticmethod
+    def _key(parsed_file: Path) -> str:
+        """Manifest key for a parsed.json path."""
+        return str(Path(parsed_file).resolve())
+
+    def needs_mapping(self, parsed_file: Path) -> bool:
+        """
+        Check whether a parsed.json file is new or changed.
+
+        Args:
+            parsed_file: Path to parsed.json
+
+        Returns:
+            True if the file must be (re-)mapped
+        """
+        entry = self.entries.get(self._key(parsed_file))
+        if not entry:
+            return True
+
+        output_folder = entry.get('output_folder')
+        if not output_folder or not Path(output_folder).exists():
+            return True
+
+        stat = os.stat(parsed_file)
+        if stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns'):
+            return False
+
+        if stat.st_size != entry.get('size'):
+            return True
+
+        # Same size, different mtime: compare content
+        if compute_file_hash(parsed_file) != entry.get('sha256'):
+            return True
+
+        # Content unchanged - refresh stat signature for next run
+        entry['mtime_ns'] = stat.st_mtime_ns
+        self._dirty = True
+        return False
+
+    def record(self, parsed_file: Path, output_folder: Optional[str]) -> None:
+        """
+        Record a successful mapping.
+
+        Args:
+            parsed_file: Path to parsed.json
+            output_folder: Mapper output folder for this filing
+        """
+        stat = os.stat(parsed_file)
+        self.entries[self._key(parsed_file)] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': compute_file_hash(parsed_file),
+            'output_folder': str(output_folder) if output_folder else None,
+            'mapped_at': datetime.now().isoformat(),
+        }
+        self._dirty = True
+
+    def forget(self, parsed_file: Path) -> None:
+        """
+        Drop a filing from the manifest (e.g. after a failed re-map).
+
+        Args:
+            parsed_file: Path to parsed.json
+        """
+        if self.entries.pop(self._key(parsed_file), None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write manifest atomically if anything changed."""
+        if not self._dirty:
+            return
+
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + '.tmp')
+
+        with open(tmp_path, 'w') as f:
+            json.dump(
+                {'version': MAP_MANIFEST_VERSION, 'entries': self.entries},
+                f,
+                indent=2
+            )
+
+        os.replace(tmp_path, self.manifest_path)
+        self._dirty = False
+
+
+__all__ = ['MapManifest', 'compute_file_hash']
@@ -158,6 +158,15 @@ def save_parsed_json(parsed, output_dir: Path) -> Path:
     """
     Serialize and save parsed filing as JSON.
 
+    Streams the document to disk (facts, contexts and units one at a
+    time), so memory stays flat as the filing grows. Also writes
+    parsed.instance.json (contexts, dimensions, ix:nonFraction attributes
+    and instance file identity), which the mapper and verification read
+    instead of re-scanning the instance document. With
+    PARSER_WRITE_FACTS_SIDECAR enabled, also writes the columnar
+    parsed.facts.bin, whose header the library reads instead of
+    parsed.json.
+
     Args:
         parsed: ParsedFiling object
         output_dir: Output directory
@@ -166,11 +175,23 @@ def save_parsed_json(parsed, output_dir: Path) -> Path:
         Path to saved JSON file
     """
     from parser.xbrl_parser.serialization.json_serializer import JSONSerializer
+    from parser.xbrl_parser.serialization.facts_sidecar import FactsSidecarWriter
+    from parser.xbrl_parser.serialization.instance_sidecar import InstanceSidecarWriter
 
     serializer = JSONSerializer()
-    json_output = serializer.serialize(parsed)
-
     json_file = output_dir / "parsed.json"
-    json_file.write_text(json_output)
+
+    try:
+        # A sidecar from an earlier run must never outlive its parsed.json
+        FactsSidecarWriter.remove(json_file)
+        InstanceSidecarWriter.remove(json_file)
+        serializer.write(parsed, json_file)
+        InstanceSidecarWriter().write(parsed, json_file)
+        if serializer.config.get('write_facts_sidecar', False):
+            FactsSidecarWriter(serializer).write(parsed, json_file)
+    finally:
+        if parsed.instance.is_streamed:
+            # Facts were spooled to disk by a streaming parse - now copied through
+            parsed.instance.fact_spool.discard()
 
     return json_file
@@ -0,0 +1,172 @@
+"""
+Parse Phase Worker Functions
+
+Process-pool entry points for the parallel parsing phase of workflow
+orchestration.
+
+Architecture:
+- Each worker process builds ONE XBRLParser in its initializer and reuses it
+  (warm taxonomy service, instance parser and loaders) for every filing it
+  receives
+- Tasks and results are plain dictionaries so they pickle cheaply; no
+  database objects or sessions ever cross the process boundary
+- Database status updates stay in the parent process (WorkflowOrchestrator)
+"""
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
+from .parse_helpers import (
+    create_output_directory,
+    enrich_metadata,
+    save_parsed_json,
+)
+
+# Per-process parser instance, created by init_parse_worker()
+_worker_parser = None
+
+
+def init_parse_worker(mode_value: str) -> None:
+    """
+    Initialize a parse worker process.
+
+    Called once per worker by ProcessPoolExecutor. The parser created here
+    is reused for every filing handled by this process.
+
+    Args:
+        mode_value: ParsingMode value (e.g. 'full')
+    """
+    global _worker_parser
+
+    from parser.xbrl_parser.orchestrator import XBRLParser, ParsingMode
+
+    _worker_parser = XBRLParser(mode=ParsingMode(mode_value))
+
+
+def build_parse_task(
+    downloaded_filing,
+    entity,
+    filing_path: Path,
+    market_id: str,
+    actual_form_type: str,
+    parser_output: Path
+) -> dict[str, any]:
+    """
+    Build a picklable parse task from database objects.
+
+    Args:
+        downloaded_filing: DownloadedFiling database object
+        entity: Entity database object
+        filing_path: Path to filing directory
+        market_id: Market identifier
+        actual_form_type: Actual form type from physical path
+        parser_output: Parser output base directory
+
+    Returns:
+        Task dictionary for parse_filing_task()
+    """
+    filing_date = None
+    if downloaded_filing.filing_search:
+        filing_date = downloaded_filing.filing_search.filing_date
+
+    return {
+        'filing_id': str(downloaded_filing.filing_id),
+        'filing_path': str(filing_path),
+        'parser_output': str(parser_output),
+        'market_id': market_id,
+        'actual_form_type': actual_form_type,
+        'filing_date': filing_date,
+        'company_name': entity.company_name,
+        'market_entity_id': entity.market_entity_id,
+        'market_type': entity.market_type,
+    }
+
+
+def parse_filing_task(task: dict[str, any]) -> dict[str, any]:
+    """
+    Parse one filing inside a worker process.
+
+    Never raises: failures are reported in the returned dictionary so the
+    parent can apply the same status handling as the serial path.
+
+    Args:
+        task: Task dictionary from build_parse_task()
+
+    Returns:
+        Dictionary with filing_id, success, json_file, error and duration
+    """
+    start = time.time()
+    result = {
+        'filing_id': task['filing_id'],
+        'success': False,
+        'json_file': None,
+        'error': None,
+        'duration': 0.0,
+    }
+
+    try:
+        if _worker_parser is None:
+            raise RuntimeError("Parse worker not initialized")
+
+        parsed = _worker_parser.parse(Path(task['filing_path']))
+
+        entity, downloaded_filing = _metadata_sources(task)
+        enrich_metadata(parsed, entity, downloaded_filing,
+                        task['actual_form_type'])
+
+        filing_date_str = None
+        if task['filing_date']:
+            filing_date_str = task['filing_date'].strftime('%Y-%m-%d')
+
+        output_dir = create_output_directory(
+            Path(task['parser_output']),
+            task['market_id'],
+            task['company_name'],
+            task['actual_form_type'],
+            filing_date_str
+        )
+
+        json_file = save_parsed_json(parsed, output_dir)
+
+        result['success'] = True
+        result['json_file'] = str(json_file)
+
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    result['duration'] = time.time() - start
+    return result
+
+
+def _metadata_sources(task: dict[str, any]) -> tuple:
+    """
+    Rebuild the attribute shapes enrich_metadata() expects.
+
+    Args:
+        task: Task dictionary
+
+    Returns:
+        Tuple of (entity, downloaded_filing) lightweight stand-ins
+    """
+    entity = SimpleNamespace(
+        company_name=task['company_name'],
+        market_entity_id=task['market_entity_id'],
+        market_type=task['market_type'],
+    )
+
+    filing_search: Optional[SimpleNamespace] = None
+    if task['filing_date'] is not None:
+        filing_search = SimpleNamespace(filing_date=task['filing_date'])
+
+    downloaded_filing = SimpleNamespace(filing_search=filing_search)
+
+    return entity, downloaded_filing
+
+
+__all__ = [
+    'init_parse_worker',
+    'build_parse_task',
+    'parse_filing_task',
+]
@@ -26,8 +26,10 @@ Example:
     )
 """
 
+import asyncio
 import logging
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -60,6 +62,10 @@ from .constants import (
     PARSE_STATUS_FAILED,
     PARSED_JSON_FILENAME,
     GLOB_PATTERN_PARSED_FILES,
+    CONFIG_KEY_PARSE_WORKERS,
+    DEFAULT_PARSE_WORKERS,
+    SECONDS_PER_MINUTE,
+    MAP_MANIFEST_FILENAME,
 )
 from .parse_helpers import (
     extract_form_type_from_path,
@@ -68,6 +74,12 @@ from .parse_helpers import (
     enrich_metadata,
     save_parsed_json,
 )
+from .map_manifest import MapManifest
+from .parse_workers import (
+    init_parse_worker,
+    build_parse_task,
+    parse_filing_task,
+)
 
 
 class WorkflowState:
@@ -91,6 +103,14 @@ class WorkflowState:
         self.filings_downloaded = 0
         self.filings_parsed = 0
         self.filings_mapped = 0
+        self.filings_parse_failed = 0
+        self.filings_parse_skipped = 0
+        self.filings_map_skipped = 0
+        self.filings_map_failed = 0
+
+        # Parse throughput tracking
+        self.parse_workers = 1
+        self.parse_seconds = 0.0
 
         # Error tracking
         self.errors: list[dict[str, any]] = []
@@ -119,6 +139,12 @@ class WorkflowState:
             'timestamp': datetime.now().isoformat()
         })
 
+    def parse_throughput(self) -> float:
+        """Parsed filings per minute over the parse phase."""
+        if self.parse_seconds <= 0:
+            return 0.0
+        return self.filings_parsed * SECONDS_PER_MINUTE / self.parse_seconds
+
     def to_dict(self) -> dict[str, any]:
         """Convert state to dictionary."""
         return {
@@ -136,7 +162,14 @@ class WorkflowState:
                 'found': self.filings_found,
                 'downloaded': self.filings_downloaded,
                 'parsed': self.filings_parsed,
-                'mapped': self.filings_mapped
+                'mapped': self.filings_mapped,
+                'parse_failed': self.filings_parse_failed,
+                'parse_skipped': self.filings_parse_skipped,
+                'parse_workers': self.parse_workers,
+                'parse_seconds': round(self.parse_seconds, 2),
+                'parse_per_minute': round(self.parse_throughput(), 2),
+                'map_skipped': self.filings_map_skipped,
+                'map_failed': self.filings_map_failed
             },
             'errors': len(self.errors),
             'warnings': len(self.warnings)
@@ -178,7 +211,8 @@ class WorkflowOrchestrator:
     def __init__(
         self,
         db_config: Optional[DatabaseConfig] = None,
-        parser_config: Optional[ParserConfig] = None
+        parser_config: Optional[ParserConfig] = None,
+        parse_workers: Optional[int] = None
     ):
         """
         Initialize workflow orchestrator.
@@ -186,11 +220,20 @@ class WorkflowOrchestrator:
         Args:
             db_config: Optional database ConfigLoader instance
             parser_config: Optional parser ConfigLoader instance
+            parse_workers: Optional number of parse worker processes.
+                If None, uses PARSER_MAX_CONCURRENT_JOBS from parser config.
+                1 parses serially in-process.
         """
         self.db_config = db_config if db_config else DatabaseConfig()
         self.parser_config = parser_config if parser_config else ParserConfig()
         self.logger = logging.getLogger('workflow_orchestrator')
 
+        if parse_workers is None:
+            parse_workers = self.parser_config.get(
+                CONFIG_KEY_PARSE_WORKERS, DEFAULT_PARSE_WORKERS
+            )
+        self.parse_workers = max(1, int(parse_workers))
+
         # State tracking
         self.state = WorkflowState()
 
@@ -209,7 +252,8 @@ class WorkflowOrchestrator:
         form_type: str,
         num_filings: int = 1,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        force_remap: bool = False
     ) -> dict[str, any]:
         """
         Run complete end-to-end workflow.
@@ -221,6 +265,7 @@ class WorkflowOrchestrator:
             num_filings: Number of historical filings to process
             start_date: Optional start date filter
             end_date: Optional end date filter
+            force_remap: Re-map every parsed filing, ignoring the map manifest
 
         Returns:
             Dictionary with complete workflow results and statistics
@@ -293,7 +338,8 @@ class WorkflowOrchestrator:
             # Phase 4: Map (75-100%)
             self.state.update("map", PROGRESS_MAP_START,
                               "Mapping to financial statements")
-            map_results = await self._phase_map(market_id, form_type)
+            map_results = await self._phase_map(market_id, form_type,
+                                                force=force_remap)
 
             # Complete
             self.state.update("complete", PROGRESS_COMPLETE,
@@ -428,6 +474,7 @@ class WorkflowOrchestrator:
 
         try:
             parsed_count = 0
+            phase_start = time.time()
 
             with session_scope() as session:
                 # Get recently downloaded filings
@@ -443,74 +490,231 @@ class WorkflowOrchestrator:
                     f"Found {len(downloaded)} filings ready for parsing"
                 )
 
-                # Initialize parser
-                if not self._parser:
-                    from parser.xbrl_parser.orchestrator import (
-                        XBRLParser,
-                        ParsingMode
-                    )
-                    self._parser = XBRLParser(mode=ParsingMode.FULL)
-
                 # Get parser output directory
                 parser_output = get_parser_output_directory(self.parser_config)
 
-                # Parse each filing
-                for downloaded_filing, entity in downloaded:
-                    try:
-                        parsed_count += self._parse_single_filing(
-                            downloaded_filing,
-                            entity,
-                            market_id,
-                            form_type,
-                            parser_output
-                        )
-                    except Exception as e:
-                        self.logger.error(
-                            f"Parse failed for {downloaded_filing.filing_id}: {e}"
-                        )
-                        self.state.add_warning("parse",
-                                               f"Failed to parse filing: {e}")
-                        downloaded_filing.parse_status = PARSE_STATUS_FAILED
+                workers = min(self.parse_workers, len(downloaded))
+
+                if workers > 1:
+                    parsed_count = await self._parse_filings_parallel(
+                        downloaded,
+                        market_id,
+                        form_type,
+                        parser_output,
+                        workers
+                    )
+                else:
+                    workers = 1
+                    parsed_count = self._parse_filings_serial(
+                        downloaded,
+                        market_id,
+                        form_type,
+                        parser_output
+                    )
 
                 session.commit()
 
             self.state.filings_parsed = parsed_count
+            self.state.parse_workers = workers
+            self.state.parse_seconds = time.time() - phase_start
             self.state.parse_complete = True
 
-            self.logger.info(f"Parse complete: {parsed_count} filings parsed")
+            self.logger.info(
+                f"Parse complete: {parsed_count} filings parsed, "
+                f"{self.state.filings_parse_failed} failed, "
+                f"{self.state.filings_parse_skipped} skipped in "
+                f"{self.state.parse_seconds:.1f}s with {workers} worker(s) "
+                f"({self.state.parse_throughput():.1f} filings/min)"
+            )
 
-            return {'parsed_count': parsed_count}
+            return {
+                'parsed_count': parsed_count,
+                'failed_count': self.state.filings_parse_failed,
+                'skipped_count': self.state.filings_parse_skipped,
+                'workers': workers,
+                'duration': self.state.parse_seconds
+            }
 
         except Exception as e:
             self.state.add_error("parse", f"Parse phase failed: {e}")
             raise
 
-    def _parse_single_filing(
+    def _parse_filings_serial(
         self,
-        downloaded_filing,
-        entity,
+        downloaded: list,
         market_id: str,
         form_type: str,
         parser_output: Path
     ) -> int:
         """
-        Parse a single filing.
+        Parse filings one by one in this process.
 
         Args:
-            downloaded_filing: DownloadedFiling database object
-            entity: Entity database object
+            downloaded: List of (DownloadedFiling, Entity) tuples
             market_id: Market identifier
             form_type: Form type (user input)
             parser_output: Parser output base directory
 
         Returns:
-            1 if parsed successfully, 0 otherwise
+            Number of filings parsed successfully
         """
-        filing_path = Path(downloaded_filing.download_directory)
+        # Initialize parser
+        if not self._parser:
+            from parser.xbrl_parser.orchestrator import (
+                XBRLParser,
+                ParsingMode
+            )
+            self._parser = XBRLParser(mode=ParsingMode.FULL)
+
+        parsed_count = 0
+
+        for downloaded_filing, entity in downloaded:
+            try:
+                parsed_count += self._parse_single_filing(
+                    downloaded_filing,
+                    entity,
+                    market_id,
+                    form_type,
+                    parser_output
+                )
+            except Exception as e:
+                self._record_parse_failure(downloaded_filing, e)
+
+        return parsed_count
+
+    async def _parse_filings_parallel(
+        self,
+        downloaded: list,
+        market_id: str,
+        form_type: str,
+        parser_output: Path,
+        workers: int
+    ) -> int:
+        """
+        Parse filings in a pool of worker processes.
+
+        Pre-checks and all database status updates run in this process;
+        workers only parse and write parsed.json. The event loop stays
+        free while workers run.
+
+        Args:
+            downloaded: List of (DownloadedFiling, Entity) tuples
+            market_id: Market identifier
+            form_type: Form type (user input)
+            parser_output: Parser output base directory
+            workers: Number of worker processes
+
+        Returns:
+            Number of filings parsed successfully
+        """
+        from parser.xbrl_parser.orchestrator import ParsingMode
+
+        pending = {}
+
+        for downloaded_filing, entity in downloaded:
+            filing_path = Path(downloaded_filing.download_directory)
 
+            if not self._check_parseable(downloaded_filing, entity, filing_path):
+                continue
+
+            actual_form_type = extract_form_type_from_path(filing_path, form_type)
+
+            task = build_parse_task(
+                downloaded_filing,
+                entity,
+                filing_path,
+                market_id,
+                actual_form_type,
+                parser_output
+            )
+            pending[task['filing_id']] = (downloaded_filing, task)
+
+        if not pending:
+            return 0
+
+        self.logger.info(
+            f"Parsing {len(pending)} filings with {workers} worker processes"
+        )
+
+        loop = asyncio.get_running_loop()
+        parsed_count = 0
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_parse_worker,
+            initargs=(ParsingMode.FULL.value,)
+        ) as pool:
+
+            async def run_task(task: dict[str, any]) -> dict[str, any]:
+                try:
+                    return await loop.run_in_executor(
+                        pool, parse_filing_task, task
+                    )
+                except Exception as e:
+                    # Worker process died (e.g. BrokenProcessPool)
+                    return {
+                        'filing_id': task['filing_id'],
+                        'success': False,
+                        'json_file': None,
+                        'error': f"{type(e).__name__}: {e}",
+                        'duration': 0.0,
+                    }
+
+            runs = [run_task(task) for _, task in pending.values()]
+
+            for completed in asyncio.as_completed(runs):
+                result = await completed
+                downloaded_filing, _ = pending[result['filing_id']]
+
+                if result['success']:
+                    downloaded_filing.parse_status = PARSE_STATUS_COMPLETED
+                    downloaded_filing.parsed_output_path = result['json_file']
+                    parsed_count += 1
+                    self.logger.info(
+                        f"Parsed successfully: {result['json_file']} "
+                        f"({result['duration']:.1f}s)"
+                    )
+                else:
+                    self._record_parse_failure(
+                        downloaded_filing, result['error']
+                    )
+
+        return parsed_count
+
+    def _record_parse_failure(self, downloaded_filing, error) -> None:
+        """
+        Record a failed parse for a filing.
+
+        Args:
+            downloaded_filing: DownloadedFiling database object
+            error: Exception or error message
+        """
+        self.logger.error(
+            f"Parse failed for {downloaded_filing.filing_id}: {error}"
+        )
+        self.state.add_warning("parse", f"Failed to parse filing: {error}")
+        self.state.filings_parse_failed += 1
+        downloaded_filing.parse_status = PARSE_STATUS_FAILED
+
+    def _check_parseable(self, downloaded_filing, entity, filing_path: Path) -> bool:
+        """
+        Check that a filing directory exists and holds parseable XBRL.
+
+        PDF-only filings are marked failed with a warning. Filings that
+        are not parsed count as skipped, not as parse failures.
+
+        Args:
+            downloaded_filing: DownloadedFiling database object
+            entity: Entity database object
+            filing_path: Path to filing directory
+
+        Returns:
+            True if the filing should be parsed
+        """
         if not filing_path.exists():
             self.logger.warning(f"Filing directory not found: {filing_path}")
-            return 0
+            self.state.filings_parse_skipped += 1
+            return False
 
         # Check if there are parseable XBRL files (not just PDFs)
         parseable_extensions = {'.xml', '.xbrl', '.xhtml', '.html', '.htm'}
@@ -530,6 +734,35 @@ class WorkflowOrchestrator:
                 "parse",
                 f"{entity.company_name}: Only PDF available from source (iXBRL not filed)"
             )
+            self.state.filings_parse_skipped += 1
+            return False
+
+        return True
+
+    def _parse_single_filing(
+        self,
+        downloaded_filing,
+        entity,
+        market_id: str,
+        form_type: str,
+        parser_output: Path
+    ) -> int:
+        """
+        Parse a single filing.
+
+        Args:
+            downloaded_filing: DownloadedFiling database object
+            entity: Entity database object
+            market_id: Market identifier
+            form_type: Form type (user input)
+            parser_output: Parser output base directory
+
+        Returns:
+            1 if parsed successfully, 0 otherwise
+        """
+        filing_path = Path(downloaded_filing.download_directory)
+
+        if not self._check_parseable(downloaded_filing, entity, filing_path):
             return 0
 
         self.logger.info(f"Parsing: {entity.company_name} - {filing_path}")
@@ -575,14 +808,19 @@ class WorkflowOrchestrator:
     async def _phase_map(
         self,
         market_id: str,
-        form_type: str
+        form_type: str,
+        force: bool = False
     ) -> dict[str, any]:
         """
         Phase 4: Map to financial statements.
 
+        Only new or changed parsed.json files are mapped; unchanged files
+        recorded in the map manifest are skipped unless force is set.
+
         Args:
             market_id: Market identifier
             form_type: Form type
+            force: Re-map all parsed files regardless of the manifest
 
         Returns:
             Dictionary with mapping statistics
@@ -608,17 +846,31 @@ class WorkflowOrchestrator:
                 f"Found {len(parsed_files)} parsed files ready for mapping"
             )
 
+            manifest = MapManifest(
+                self._mapper.output_manager.base_dir / MAP_MANIFEST_FILENAME
+            )
+
             mapped_count = 0
             output_paths = []
+            skipped = []
+            remapped = []
+            failed = []
 
             for parsed_file in parsed_files:
+                if not force and not manifest.needs_mapping(parsed_file):
+                    self.logger.info(f"Unchanged, skipping: {parsed_file}")
+                    skipped.append(str(parsed_file))
+                    continue
+
                 try:
                     self.logger.info(f"Mapping: {parsed_file}")
 
                     # Run mapping
                     result = self._mapper.extract_and_export(parsed_file)
 
+                    manifest.record(parsed_file, result['output_folder'])
                     output_paths.append(result['output_folder'])
+                    remapped.append(str(parsed_file))
                     mapped_count += 1
 
                     self.logger.info(
@@ -633,15 +885,29 @@ class WorkflowOrchestrator:
                     self.logger.error(f"Map failed for {parsed_file}: {e}", exc_info=True)
                     self.state.add_warning("map",
                                            f"Failed to map filing: {e}")
+                    manifest.forget(parsed_file)
+                    failed.append(str(parsed_file))
+
+            manifest.save()
 
             self.state.filings_mapped = mapped_count
+            self.state.filings_map_skipped = len(skipped)
+            self.state.filings_map_failed = len(failed)
             self.state.map_complete = True
 
-            self.logger.info(f"Map complete: {mapped_count} filings mapped")
+            self.logger.info(
+                f"Map complete: {mapped_count} filings mapped, "
+                f"{len(skipped)} unchanged skipped, {len(failed)} failed"
+            )
 
             return {
                 'mapped_count': mapped_count,
-                'output_paths': output_paths
+                'skipped_count': len(skipped),
+                'failed_count': len(failed),
+                'output_paths': output_paths,
+                'remapped': remapped,
+                'skipped': skipped,
+                'failed': failed
             }
 
         except Exception as e:
@@ -658,6 +924,8 @@ class WorkflowOrchestrator:
                 'filings_downloaded': self.state.filings_downloaded,
                 'filings_parsed': self.state.filings_parsed,
                 'filings_mapped': self.state.filings_mapped,
+                'filings_map_skipped': self.state.filings_map_skipped,
+                'filings_map_failed': self.state.filings_map_failed,
                 'total_time_seconds': round(
                     time.time() - self.state.start_time, 2
                 )
@@ -86,6 +86,11 @@ DEFAULT_MAX_RETRIES: int = DEFAULT_RETRY_ATTEMPTS  # Alias for backward compatib
 DEFAULT_RETRY_DELAY: float = 1.0  # Initial retry delay in seconds
 DEFAULT_MAX_RETRY_DELAY: int = 60  # Maximum retry delay in seconds
 DEFAULT_MAX_CONCURRENT: int = 3  # Maximum concurrent downloads
+DEFAULT_MAX_CONNECTIONS_PER_HOST: int = 4  # Open requests per host, all downloads combined
+DEFAULT_REQUESTS_PER_SECOND: float = 10.0  # Per host; SEC fair access allows 10 req/s
+DEFAULT_EXTRACTION_WORKERS: int = 2  # Threads for extraction/validation off the event loop
+DEFAULT_TEMP_HEADROOM_MB: int = 100  # Free temp space kept in reserve while downloads wait
+DEFAULT_UNKNOWN_DOWNLOAD_MB: int = 50  # Temp reservation when Content-Length is unknown
 
 # ============================================================================
 # DATABASE CONFIGURATION DEFAULTS
@@ -307,6 +312,10 @@ ENV_RETRY_ATTEMPTS: str = 'DOWNLOADER_RETRY_ATTEMPTS'
 ENV_RETRY_DELAY: str = 'DOWNLOADER_RETRY_DELAY'
 ENV_MAX_RETRY_DELAY: str = 'DOWNLOADER_MAX_RETRY_DELAY'
 ENV_MAX_CONCURRENT: str = 'DOWNLOADER_MAX_CONCURRENT'
+ENV_MAX_PER_HOST: str = 'DOWNLOADER_MAX_PER_HOST'
+ENV_REQUESTS_PER_SECOND: str = 'DOWNLOADER_REQUESTS_PER_SECOND'
+ENV_EXTRACTION_WORKERS: str = 'DOWNLOADER_EXTRACTION_WORKERS'
+ENV_TEMP_HEADROOM_MB: str = 'DOWNLOADER_TEMP_HEADROOM_MB'
 ENV_CHUNK_SIZE: str = 'DOWNLOADER_CHUNK_SIZE'
 ENV_ENABLE_RESUME: str = 'DOWNLOADER_ENABLE_RESUME'
 
@@ -378,6 +387,11 @@ __all__ = [
     'DEFAULT_RETRY_DELAY',
     'DEFAULT_MAX_RETRY_DELAY',
     'DEFAULT_MAX_CONCURRENT',
+    'DEFAULT_MAX_CONNECTIONS_PER_HOST',
+    'DEFAULT_REQUESTS_PER_SECOND',
+    'DEFAULT_EXTRACTION_WORKERS',
+    'DEFAULT_TEMP_HEADROOM_MB',
+    'DEFAULT_UNKNOWN_DOWNLOAD_MB',
 
     # Database Configuration Defaults
     'DEFAULT_DB_PORT',
@@ -449,6 +463,10 @@ __all__ = [
     'ENV_RETRY_DELAY',
     'ENV_MAX_RETRY_DELAY',
     'ENV_MAX_CONCURRENT',
+    'ENV_MAX_PER_HOST',
+    'ENV_REQUESTS_PER_SECOND',
+    'ENV_EXTRACTION_WORKERS',
+    'ENV_TEMP_HEADROOM_MB',
     'ENV_CHUNK_SIZE',
     'ENV_ENABLE_RESUME',
     'ENV_MAX_ARCHIVE_SIZE',
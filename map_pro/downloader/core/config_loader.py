@@ -33,6 +33,10 @@ from downloader.constants import (
     ENV_RETRY_DELAY,
     ENV_MAX_RETRY_DELAY,
     ENV_MAX_CONCURRENT,
+    ENV_MAX_PER_HOST,
+    ENV_REQUESTS_PER_SECOND,
+    ENV_EXTRACTION_WORKERS,
+    ENV_TEMP_HEADROOM_MB,
     ENV_CHUNK_SIZE,
     ENV_ENABLE_RESUME,
     ENV_MAX_ARCHIVE_SIZE,
@@ -62,6 +66,10 @@ from downloader.constants import (
     DEFAULT_RETRY_DELAY,
     DEFAULT_MAX_RETRY_DELAY,
     DEFAULT_MAX_CONCURRENT,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_EXTRACTION_WORKERS,
+    DEFAULT_TEMP_HEADROOM_MB,
     DEFAULT_DB_PORT,
     DEFAULT_DB_POOL_SIZE,
     DEFAULT_DB_POOL_MAX_OVERFLOW,
@@ -174,6 +182,10 @@ class ConfigLoader:
             'retry_delay': self._get_int(ENV_RETRY_DELAY, DEFAULT_RETRY_DELAY),
             'max_retry_delay': self._get_int(ENV_MAX_RETRY_DELAY, DEFAULT_MAX_RETRY_DELAY),
             'max_concurrent': self._get_int(ENV_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT),
+            'max_per_host': self._get_int(ENV_MAX_PER_HOST, DEFAULT_MAX_CONNECTIONS_PER_HOST),
+            'requests_per_second': self._get_float(ENV_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND),
+            'extraction_workers': self._get_int(ENV_EXTRACTION_WORKERS, DEFAULT_EXTRACTION_WORKERS),
+            'temp_headroom_mb': self._get_int(ENV_TEMP_HEADROOM_MB, DEFAULT_TEMP_HEADROOM_MB),
             'chunk_size': self._get_int(ENV_CHUNK_SIZE, DEFAULT_CHUNK_SIZE),
             'enable_resume': self._get_bool(ENV_ENABLE_RESUME, True),
             
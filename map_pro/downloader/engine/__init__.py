@@ -10,6 +10,7 @@ Architecture:
 - DistributionProcessor: Routes by distribution type
 - ArchiveDownloader: Handles ZIP/TAR downloads
 - DistributionDetector: Auto-detects distribution types
+- RequestLimiter: Shared per-host connection and rate limits
 """
 
 from downloader.engine.coordinator import DownloadCoordinator
@@ -17,6 +18,8 @@ from downloader.engine.distribution_processor import DistributionProcessor
 from downloader.engine.archive_downloader import ArchiveDownloader
 from downloader.engine.distribution_detector import DistributionDetector
 from downloader.engine.protocol_handlers import HTTPHandler
+from downloader.engine.rate_limiter import RequestLimiter
+from downloader.engine.temp_budget import TempSpaceBudget
 from downloader.engine.stream_handler import StreamHandler, ChunkIterator
 from downloader.engine.retry_manager import RetryManager, with_retry
 from downloader.engine.validator import Validator
@@ -41,6 +44,7 @@ __all__ = [
     
     # Protocol handlers
     'HTTPHandler',
+    'RequestLimiter',
     'StreamHandler',
     'ChunkIterator',
     
@@ -48,6 +52,7 @@ __all__ = [
     'RetryManager',
     'with_retry',
     'Validator',
+    'TempSpaceBudget',
     'DatabaseRepository',
     
     # Helper components
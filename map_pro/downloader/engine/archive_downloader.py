@@ -6,8 +6,13 @@ Handles downloading and extracting ZIP/TAR archive files.
 Separated from main coordinator for better modularity.
 """
 
+import asyncio
+import functools
 import os
+import tempfile
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import Optional
 
 from downloader.core.logger import get_logger
 from downloader.core.config_loader import ConfigLoader
@@ -29,6 +34,8 @@ class ArchiveDownloader:
     - Extracting archives to target directory
     - Retry logic
     - File verification
+    - Unique temp paths for concurrent downloads of same-named files
+    - Extraction off the event loop (optional executor)
     """
     
     def __init__(
@@ -36,7 +43,8 @@ class ArchiveDownloader:
         http_handler: HTTPHandler,
         retry_manager: RetryManager,
         temp_dir: Path,
-        config: ConfigLoader
+        config: ConfigLoader,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize archive downloader.
@@ -46,11 +54,56 @@ class ArchiveDownloader:
             retry_manager: Retry manager for failed downloads
             temp_dir: Temporary directory for downloads
             config: Configuration loader
+            executor: Executor for blocking extraction work (None = the
+                event loop's default executor)
         """
         self.http_handler = http_handler
         self.retry_manager = retry_manager
-        self.temp_dir = temp_dir
+        self.temp_dir = Path(temp_dir)
         self.config = config
+        self.executor = executor
+        
+        # Temp paths owned by in-flight downloads
+        self._reserved: set[Path] = set()
+    
+    def _reserve_temp_path(self, filename: str) -> Path:
+        """
+        Get a temp path no other in-flight download is using.
+        
+        The file keeps its name (callers rely on it); a clash is moved
+        into its own temp subdirectory instead.
+        
+        Args:
+            filename: Archive file name
+            
+        Returns:
+            Reserved temp path
+        """
+        temp_path = self.temp_dir / filename
+        
+        if temp_path in self._reserved:
+            temp_path = Path(tempfile.mkdtemp(dir=self.temp_dir)) / filename
+        
+        self._reserved.add(temp_path)
+        return temp_path
+    
+    def release(self, temp_path: Optional[Path]) -> None:
+        """
+        Release a temp path after its file was extracted or moved.
+        
+        Args:
+            temp_path: Path returned in DownloadResult.file_path
+        """
+        if temp_path is None:
+            return
+        
+        self._reserved.discard(temp_path)
+        
+        if temp_path.parent != self.temp_dir:
+            try:
+                temp_path.parent.rmdir()
+            except OSError:
+                pass
     
     async def download_to_temp(self, url: str) -> DownloadResult:
         """
@@ -64,7 +117,7 @@ class ArchiveDownloader:
         """
         # Extract filename from URL
         filename = os.path.basename(url)
-        temp_path = self.temp_dir / filename
+        temp_path = self._reserve_temp_path(filename)
         
         logger.info(f"{LOG_PROCESS} Downloading to temp: {temp_path.name}")
         
@@ -83,6 +136,7 @@ class ArchiveDownloader:
             # Verify download succeeded
             if not download_result or not download_result.success:
                 logger.error(f"Download failed")
+                self.release(temp_path)
                 return DownloadResult(
                     success=False,
                     error_message="Download failed"
@@ -91,6 +145,7 @@ class ArchiveDownloader:
             # Verify file exists
             if not temp_path.exists():
                 logger.error(f"Downloaded file not found: {temp_path}")
+                self.release(temp_path)
                 return DownloadResult(
                     success=False,
                     error_message=f"File not found: {temp_path}"
@@ -105,6 +160,7 @@ class ArchiveDownloader:
         
         except Exception as e:
             logger.error(f"Download failed: {e}")
+            self.release(temp_path)
             return DownloadResult(
                 success=False,
                 error_message=f"Unexpected error: {e}"
@@ -114,6 +170,9 @@ class ArchiveDownloader:
         """
         Extract archive to target directory.
         
+        Unpacking runs in the executor so other downloads keep streaming
+        while an archive is extracted.
+        
         Args:
             archive_path: Path to archive file
             target_dir: Extraction destination
@@ -126,10 +185,14 @@ class ArchiveDownloader:
         try:
             # Use ArchiveHandler for format-agnostic extraction
             handler = ArchiveHandler(self.config)
-            extract_result = handler.extract(
-                archive_path=archive_path,
-                target_dir=target_dir,
-                cleanup_archive=True  # Remove temp file after extraction
+            extract_result = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                functools.partial(
+                    handler.extract,
+                    archive_path=archive_path,
+                    target_dir=target_dir,
+                    cleanup_archive=True  # Remove temp file after extraction
+                )
             )
             
             if extract_result.success:
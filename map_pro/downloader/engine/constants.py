@@ -102,6 +102,13 @@ HEADER_ACCEPT = 'Accept'
 HEADER_ACCEPT_ENCODING = 'Accept-Encoding'
 HEADER_RANGE = 'Range'
 
+# ============================================================================
+# TEMP SPACE BACK-PRESSURE
+# ============================================================================
+
+# Seconds between free-space re-checks while a download waits for temp space
+TEMP_SPACE_POLL_INTERVAL = 5.0
+
 # ============================================================================
 # RETRY MANAGER CONSTANTS
 # ============================================================================
@@ -170,6 +177,9 @@ __all__ = [
     'HEADER_ACCEPT_ENCODING',
     'HEADER_RANGE',
     
+    # Temp space back-pressure
+    'TEMP_SPACE_POLL_INTERVAL',
+    
     # Retry manager
     'MAX_RETRY_DELAY',
     
@@ -13,9 +13,13 @@ Architecture:
 - Component integration
 - Database reflects reality principle
 - IPO logging throughout
+- Bounded concurrency: up to max_concurrent downloads in flight, with a
+  shared RequestLimiter enforcing per-host connection and rate limits
 """
 
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from pathlib import Path
 
@@ -23,6 +27,7 @@ from downloader.core.logger import get_logger
 from downloader.core.config_loader import ConfigLoader
 from downloader.core.data_paths import DataPathsManager
 from downloader.engine.protocol_handlers import HTTPHandler
+from downloader.engine.rate_limiter import RequestLimiter
 from downloader.engine.retry_manager import RetryManager
 from downloader.engine.validator import Validator
 from downloader.engine.db_operations import DatabaseRepository
@@ -30,8 +35,11 @@ from downloader.engine.path_resolver import PathResolver
 from downloader.engine.failure_handler import FailureHandler
 from downloader.engine.archive_downloader import ArchiveDownloader
 from downloader.engine.distribution_processor import DistributionProcessor
+from downloader.engine.temp_budget import TempSpaceBudget
 from downloader.engine.result import ProcessingResult
 from downloader.constants import (
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_EXTRACTION_WORKERS,
     STATUS_DOWNLOADING,
     STATUS_COMPLETED,
     LOG_INPUT,
@@ -52,7 +60,7 @@ class DownloadCoordinator:
     
     Workflow:
     1. Query database for pending downloads (filings + taxonomies)
-    2. For each download:
+    2. For each download (up to max_concurrent at a time):
        a. Determine type (filing or taxonomy) via PathResolver
        b. Download and extract (distribution-agnostic)
        c. Validate files exist
@@ -75,8 +83,13 @@ class DownloadCoordinator:
         """
         self.config = config if config else ConfigLoader()
         
+        # Shared by every component that makes requests, so per-host
+        # limits hold across all concurrent downloads
+        self.rate_limiter = RequestLimiter.from_config(self.config)
+        self.max_concurrent = max(1, self.config.get('max_concurrent', DEFAULT_MAX_CONCURRENT))
+        
         # Initialize core components
-        self.http_handler = HTTPHandler(self.config)
+        self.http_handler = HTTPHandler(self.config, rate_limiter=self.rate_limiter)
         self.retry_manager = RetryManager(config=self.config)
         self.validator = Validator(self.config)
         self.path_manager = DataPathsManager(self.config)
@@ -99,26 +112,63 @@ class DownloadCoordinator:
         )
         self.failure_handler = FailureHandler(self.db_repo)
         
+        # Blocking disk work (unpacking, validation, instance discovery)
+        # runs here so downloads keep streaming while archives are unpacked.
+        # Threads suffice: zlib and file IO release the GIL.
+        self.extraction_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.get('extraction_workers', DEFAULT_EXTRACTION_WORKERS)),
+            thread_name_prefix='downloader-extract'
+        )
+        
+        # Back-pressure: downloads wait while temp space is committed
+        # to archives not yet extracted
+        self.temp_budget = TempSpaceBudget.from_config(self.validator, self.config)
+        
         # Initialize archive downloader
         self.archive_downloader = ArchiveDownloader(
             http_handler=self.http_handler,
             retry_manager=self.retry_manager,
             temp_dir=self.temp_dir,
-            config=self.config
+            config=self.config,
+            executor=self.extraction_executor
         )
         
         # Initialize distribution processor
         self.distribution_processor = DistributionProcessor(
             archive_downloader=self.archive_downloader,
-            config=self.config
+            config=self.config,
+            rate_limiter=self.rate_limiter,
+            temp_budget=self.temp_budget
         )
     
-    async def process_pending_downloads(self, limit: int = 100) -> dict:
+    async def _run_blocking(self, func, *args):
+        """
+        Run blocking filesystem work in the extraction executor.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+            
+        Returns:
+            Result of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.extraction_executor, func, *args)
+    
+    async def process_pending_downloads(
+        self,
+        limit: int = 100,
+        max_concurrent: Optional[int] = None
+    ) -> dict:
         """
         Process pending downloads from database.
         
+        Downloads run concurrently (bounded by max_concurrent); requests
+        are additionally limited per host by the shared RequestLimiter.
+        
         Args:
             limit: Maximum number to process
+            max_concurrent: Downloads in flight at once (config default if None)
             
         Returns:
             Dictionary with processing statistics
@@ -143,21 +193,49 @@ class DownloadCoordinator:
         all_pending = pending_filings + pending_taxonomies
         stats['total'] = len(all_pending)
         
+        workers = max(1, min(max_concurrent or self.max_concurrent, len(all_pending) or 1))
+        
         logger.info(
             f"{LOG_PROCESS} Found {len(pending_filings)} pending filings, "
-            f"{len(pending_taxonomies)} pending taxonomies"
+            f"{len(pending_taxonomies)} pending taxonomies "
+            f"({workers} concurrent)"
         )
         
-        # Process each download
+        # Process downloads with a fixed pool of workers
+        queue: asyncio.Queue = asyncio.Queue()
         for item in all_pending:
-            result = await self.process_single_filing(item)
-            
-            if result.success:
-                stats['succeeded'] += 1
-            else:
-                stats['failed'] += 1
+            queue.put_nowait(item)
+        
+        async def worker():
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                try:
+                    result = await self.process_single_filing(item)
+                    succeeded = result.success
+                except Exception as e:
+                    # Keep the other downloads running
+                    logger.error(f"Unexpected error scheduling download: {e}", exc_info=True)
+                    succeeded = False
+                
+                if succeeded:
+                    stats['succeeded'] += 1
+                else:
+                    stats['failed'] += 1
+                
+                logger.info(
+                    f"{LOG_PROCESS} Progress: {stats['succeeded'] + stats['failed']}/{stats['total']} "
+                    f"({stats['failed']} failed)"
+                )
+        
+        await asyncio.gather(*(worker() for _ in range(workers)))
         
         stats['duration'] = time.time() - start_time
+        stats['requests'] = self.rate_limiter.get_statistics()
+        stats['temp_space'] = self.temp_budget.get_statistics()
         
         logger.info(
             f"{LOG_OUTPUT} Processing complete: {stats['succeeded']}/{stats['total']} succeeded "
@@ -226,7 +304,9 @@ class DownloadCoordinator:
             result.extraction_result = processing_result.extraction_result
             
             # Validate extraction
-            validation_result = self.validator.validate_extraction(target_dir)
+            validation_result = await self._run_blocking(
+                self.validator.validate_extraction, target_dir
+            )
             if not validation_result.valid:
                 result.error_stage = 'validation'
                 await self.failure_handler.handle_failure(filing, result, download_type)
@@ -241,7 +321,7 @@ class DownloadCoordinator:
                 await self.failure_handler.handle_failure(filing, result, download_type)
                 return result
             
-            final_file_count = len(list(target_dir.rglob('*')))
+            final_file_count = await self._run_blocking(self._count_files, target_dir)
             if final_file_count == 0:
                 logger.error(f"{LOG_OUTPUT} CRITICAL: Directory exists but contains no files!")
                 result.error_stage = 'verification'
@@ -255,12 +335,16 @@ class DownloadCoordinator:
             
             # Update database based on type
             if download_type == 'filing':
+                instance_file = await self._run_blocking(
+                    self.validator.find_instance_file, target_dir
+                )
+                
                 # Create DownloadedFiling record
                 db_success = self.db_repo.create_downloaded_filing(
                     search_id=str(filing.search_id),
                     entity_id=str(filing.entity_id),
                     download_directory=target_dir,
-                    instance_file=None  # Could add instance file discovery here
+                    instance_file=instance_file
                 )
                 
                 if db_success:
@@ -296,10 +380,16 @@ class DownloadCoordinator:
         
         return result
     
+    @staticmethod
+    def _count_files(directory: Path) -> int:
+        """Count all entries below directory (final verification)."""
+        return len(list(directory.rglob('*')))
+    
     async def close(self):
         """Close coordinator and cleanup resources."""
         logger.info("Closing download coordinator")
         await self.http_handler.close()
+        self.extraction_executor.shutdown(wait=True)
 
 
 __all__ = ['DownloadCoordinator']
\ No newline at end of file
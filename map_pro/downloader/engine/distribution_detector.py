@@ -19,6 +19,7 @@ from urllib.parse import urlparse
 from downloader.core.logger import get_logger
 from downloader.core.config_loader import ConfigLoader
 from downloader.constants import LOG_INPUT, LOG_PROCESS, LOG_OUTPUT
+from downloader.engine.rate_limiter import RequestLimiter, request_slot
 from downloader.engine.constants import (
     ARCHIVE_CONTENT_TYPES,
     XSD_CONTENT_TYPES,
@@ -52,16 +53,23 @@ class DistributionDetector:
     - unknown: Cannot determine
     """
     
-    def __init__(self, config: Optional[ConfigLoader] = None, timeout: int = None):
+    def __init__(
+        self,
+        config: Optional[ConfigLoader] = None,
+        timeout: int = None,
+        rate_limiter: Optional[RequestLimiter] = None
+    ):
         """
         Initialize detector.
         
         Args:
             config: Optional ConfigLoader instance for User-Agent configuration
             timeout: HTTP request timeout (uses constant if None)
+            rate_limiter: Optional shared per-host request limiter
         """
         self.config = config if config else ConfigLoader()
         self.timeout = timeout or DETECTION_TIMEOUT
+        self.rate_limiter = rate_limiter
         self._session: Optional[aiohttp.ClientSession] = None
     
     async def detect(self, url: str) -> dict[str, any]:
@@ -145,7 +153,8 @@ class DistributionDetector:
         headers = self._build_headers(url=url)
         
         try:
-            async with self._session.head(url, headers=headers, allow_redirects=True) as response:
+            async with request_slot(self.rate_limiter, url), \
+                    self._session.head(url, headers=headers, allow_redirects=True) as response:
                 content_type = response.headers.get('Content-Type', '').lower()
                 content_length = int(response.headers.get('Content-Length', 0))
                 
@@ -11,6 +11,8 @@ Automatically detects and processes:
 100% distribution-agnostic - no hardcoded assumptions.
 """
 
+import contextlib
+import shutil
 from pathlib import Path
 from typing import Optional
 
@@ -20,6 +22,8 @@ from downloader.engine.distribution_detector import DistributionDetector
 from downloader.engine.extraction.xsd_handler import XSDHandler
 from downloader.engine.extraction.directory_handler import DirectoryHandler
 from downloader.engine.archive_downloader import ArchiveDownloader
+from downloader.engine.rate_limiter import RequestLimiter
+from downloader.engine.temp_budget import TempSpaceBudget
 from downloader.engine.result import ProcessingResult, ExtractionResult
 from downloader.constants import LOG_PROCESS, LOG_OUTPUT
 
@@ -36,16 +40,42 @@ class DistributionProcessor:
     - directory â†’ DirectoryHandler
     """
     
-    def __init__(self, archive_downloader: ArchiveDownloader, config: Optional[ConfigLoader] = None):
+    def __init__(
+        self,
+        archive_downloader: ArchiveDownloader,
+        config: Optional[ConfigLoader] = None,
+        rate_limiter: Optional[RequestLimiter] = None,
+        temp_budget: Optional[TempSpaceBudget] = None
+    ):
         """
         Initialize distribution processor.
         
         Args:
             archive_downloader: Archive download/extraction handler
             config: Optional ConfigLoader instance for User-Agent configuration
+            rate_limiter: Optional shared per-host request limiter, passed to
+                every handler that makes requests
+            temp_budget: Optional temp space budget; archive and iXBRL
+                downloads wait for room before they start
         """
         self.archive_downloader = archive_downloader
         self.config = config if config else ConfigLoader()
+        self.rate_limiter = rate_limiter
+        self.temp_budget = temp_budget
+    
+    def _reserve_temp_space(self, size: int):
+        """
+        Get a temp space reservation, or a no-op context without a budget.
+        
+        Args:
+            size: Expected download size in bytes (0 = unknown)
+            
+        Returns:
+            Async context manager
+        """
+        if self.temp_budget is None:
+            return contextlib.nullcontext()
+        return self.temp_budget.reserve(size)
     
     async def download_and_extract(self, url: str, target_dir: Path) -> ProcessingResult:
         """
@@ -67,7 +97,7 @@ class DistributionProcessor:
         
         # Step 1: Detect distribution type
         logger.info(f"{LOG_PROCESS} Detecting distribution type")
-        detector = DistributionDetector(config=self.config)
+        detector = DistributionDetector(config=self.config, rate_limiter=self.rate_limiter)
         
         try:
             detection = await detector.detect(url)
@@ -91,16 +121,17 @@ class DistributionProcessor:
             
             dist_type = detection['type']
             working_url = detection['url']  # May be different from original
+            content_length = detection.get('content_length', 0)
             
             logger.info(f"{LOG_OUTPUT} Detected type: {dist_type}")
             logger.info(f"{LOG_OUTPUT} Working URL: {working_url}")
             
             # Step 2: Route to appropriate handler
             if dist_type == 'archive':
-                return await self._handle_archive(working_url, target_dir)
+                return await self._handle_archive(working_url, target_dir, content_length)
 
             elif dist_type == 'ixbrl':
-                return await self._handle_ixbrl(working_url, target_dir)
+                return await self._handle_ixbrl(working_url, target_dir, content_length)
 
             elif dist_type == 'xsd':
                 return await self._handle_xsd(working_url, target_dir)
@@ -111,7 +142,7 @@ class DistributionProcessor:
             else:
                 # Unknown type - try single file download as fallback
                 logger.warning(f"Unknown distribution type, trying single file download")
-                return await self._handle_ixbrl(working_url, target_dir)
+                return await self._handle_ixbrl(working_url, target_dir, content_length)
         
         except Exception as e:
             result.error_stage = 'detection'
@@ -119,7 +150,12 @@ class DistributionProcessor:
             logger.error(f"Error in distribution detection: {e}")
             return result
     
-    async def _handle_ixbrl(self, url: str, target_dir: Path) -> ProcessingResult:
+    async def _handle_ixbrl(
+        self,
+        url: str,
+        target_dir: Path,
+        content_length: int = 0
+    ) -> ProcessingResult:
         """
         Handle iXBRL/XHTML single file downloads.
 
@@ -128,6 +164,7 @@ class DistributionProcessor:
         Args:
             url: iXBRL file URL
             target_dir: Target directory
+            content_length: Expected size in bytes (0 = unknown)
 
         Returns:
             ProcessingResult
@@ -141,20 +178,23 @@ class DistributionProcessor:
             target_dir.mkdir(parents=True, exist_ok=True)
 
             # Download directly to target (no temp, no extraction)
-            temp_result = await self.archive_downloader.download_to_temp(url)
-            if not temp_result.success:
-                result.error_stage = 'download'
-                result.download_result = temp_result
-                return result
+            async with self._reserve_temp_space(content_length):
+                temp_result = await self.archive_downloader.download_to_temp(url)
+                if not temp_result.success:
+                    result.error_stage = 'download'
+                    result.download_result = temp_result
+                    return result
 
-            result.download_result = temp_result
+                result.download_result = temp_result
 
-            # Move file to target directory (no extraction needed)
-            import shutil
-            source_path = temp_result.file_path
-            target_path = target_dir / source_path.name
+                # Move file to target directory (no extraction needed)
+                source_path = temp_result.file_path
+                target_path = target_dir / source_path.name
 
-            shutil.move(str(source_path), str(target_path))
+                try:
+                    shutil.move(str(source_path), str(target_path))
+                finally:
+                    self.archive_downloader.release(source_path)
 
             result.success = True
             result.extraction_result = ExtractionResult(
@@ -171,13 +211,22 @@ class DistributionProcessor:
             logger.error(f"iXBRL download error: {e}")
             return result
 
-    async def _handle_archive(self, url: str, target_dir: Path) -> ProcessingResult:
+    async def _handle_archive(
+        self,
+        url: str,
+        target_dir: Path,
+        content_length: int = 0
+    ) -> ProcessingResult:
         """
         Handle ZIP/archive downloads.
 
+        The temp space reservation is held until the archive has been
+        extracted and removed from temp.
+
         Args:
             url: Archive URL
             target_dir: Target directory
+            content_length: Expected archive size in bytes (0 = unknown)
 
         Returns:
             ProcessingResult
@@ -186,20 +235,25 @@ class DistributionProcessor:
 
         logger.info(f"{LOG_PROCESS} Handling as archive")
         
-        # Download to temp
-        temp_result = await self.archive_downloader.download_to_temp(url)
-        if not temp_result.success:
-            result.error_stage = 'download'
+        async with self._reserve_temp_space(content_length):
+            # Download to temp
+            temp_result = await self.archive_downloader.download_to_temp(url)
+            if not temp_result.success:
+                result.error_stage = 'download'
+                result.download_result = temp_result
+                return result
+            
             result.download_result = temp_result
-            return result
-        
-        result.download_result = temp_result
+            
+            # Extract
+            try:
+                extract_result = await self.archive_downloader.extract(
+                    temp_result.file_path,
+                    target_dir
+                )
+            finally:
+                self.archive_downloader.release(temp_result.file_path)
         
-        # Extract
-        extract_result = await self.archive_downloader.extract(
-            temp_result.file_path,
-            target_dir
-        )
         if not extract_result.success:
             result.error_stage = 'extraction'
             result.extraction_result = extract_result
@@ -225,7 +279,7 @@ class DistributionProcessor:
         logger.info(f"{LOG_PROCESS} Handling as XSD schema")
         
         try:
-            xsd_handler = XSDHandler()
+            xsd_handler = XSDHandler(config=self.config, rate_limiter=self.rate_limiter)
             xsd_result = await xsd_handler.download_schema(url, target_dir)
             await xsd_handler.close()
             
@@ -266,7 +320,7 @@ class DistributionProcessor:
         logger.info(f"{LOG_PROCESS} Handling as directory structure")
         
         try:
-            dir_handler = DirectoryHandler()
+            dir_handler = DirectoryHandler(rate_limiter=self.rate_limiter)
             dir_result = await dir_handler.mirror_directory(url, target_dir)
             await dir_handler.close()
             
@@ -21,6 +21,7 @@ from html.parser import HTMLParser
 
 from downloader.core.logger import get_logger
 from downloader.constants import LOG_INPUT, LOG_PROCESS, LOG_OUTPUT
+from downloader.engine.rate_limiter import RequestLimiter, request_slot
 from downloader.engine.extraction.constants import (
     DIRECTORY_TIMEOUT,
     DIRECTORY_MAX_DEPTH,
@@ -70,16 +71,23 @@ class DirectoryHandler:
     Automatically discovers and downloads entire directory trees.
     """
     
-    def __init__(self, timeout: int = None, max_depth: int = None):
+    def __init__(
+        self,
+        timeout: int = None,
+        max_depth: int = None,
+        rate_limiter: Optional[RequestLimiter] = None
+    ):
         """
         Initialize directory handler.
         
         Args:
             timeout: HTTP request timeout (uses constant if None)
             max_depth: Maximum directory depth (uses constant if None)
+            rate_limiter: Optional shared per-host request limiter
         """
         self.timeout = timeout or DIRECTORY_TIMEOUT
         self.max_depth = max_depth or DIRECTORY_MAX_DEPTH
+        self.rate_limiter = rate_limiter
         self._session: Optional[aiohttp.ClientSession] = None
         self._downloaded: Set[str] = set()
     
@@ -162,7 +170,7 @@ class DirectoryHandler:
         
         try:
             # Fetch directory listing
-            async with self._session.get(url) as response:
+            async with request_slot(self.rate_limiter, url), self._session.get(url) as response:
                 if response.status != 200:
                     logger.warning(f"HTTP {response.status} for {url}")
                     return set()
@@ -228,7 +236,7 @@ class DirectoryHandler:
             local_path = target_dir / filename
             
             # Download file
-            async with self._session.get(url) as response:
+            async with request_slot(self.rate_limiter, url), self._session.get(url) as response:
                 if response.status != 200:
                     logger.warning(f"HTTP {response.status} for {url}")
                     return None
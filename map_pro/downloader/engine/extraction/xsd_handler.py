@@ -23,6 +23,7 @@ import base64
 from downloader.core.logger import get_logger
 from downloader.core.config_loader import ConfigLoader
 from downloader.constants import LOG_INPUT, LOG_PROCESS, LOG_OUTPUT
+from downloader.engine.rate_limiter import RequestLimiter, request_slot
 from downloader.engine.extraction.constants import (
     XML_NAMESPACES,
     XPATH_IMPORT,
@@ -46,7 +47,13 @@ class XSDHandler:
     by parsing import/include declarations.
     """
     
-    def __init__(self, timeout: int = None, max_depth: int = None, config: Optional[ConfigLoader] = None):
+    def __init__(
+        self,
+        timeout: int = None,
+        max_depth: int = None,
+        config: Optional[ConfigLoader] = None,
+        rate_limiter: Optional[RequestLimiter] = None
+    ):
         """
         Initialize XSD handler.
 
@@ -54,10 +61,12 @@ class XSDHandler:
             timeout: HTTP request timeout (uses constant if None)
             max_depth: Maximum import depth (uses constant if None)
             config: Optional ConfigLoader instance for authentication
+            rate_limiter: Optional shared per-host request limiter
         """
         self.timeout = timeout or XSD_DOWNLOAD_TIMEOUT
         self.max_depth = max_depth or XSD_MAX_IMPORT_DEPTH
         self.config = config if config else ConfigLoader()
+        self.rate_limiter = rate_limiter
         self._session: Optional[aiohttp.ClientSession] = None
         self._downloaded: Set[str] = set()  # Track downloaded files
     
@@ -149,7 +158,8 @@ class XSDHandler:
                     return set()
             else:
                 # Standard download
-                async with self._session.get(url, headers=headers, allow_redirects=True) as response:
+                async with request_slot(self.rate_limiter, url), \
+                        self._session.get(url, headers=headers, allow_redirects=True) as response:
                     if response.status != 200:
                         logger.warning(f"HTTP {response.status} for {url}")
                         return set()
@@ -295,7 +305,8 @@ class XSDHandler:
             logger.info(f"{LOG_PROCESS} Trying format: {accept_format}")
 
             try:
-                async with self._session.get(url, headers=headers, allow_redirects=True) as response:
+                async with request_slot(self.rate_limiter, url), \
+                        self._session.get(url, headers=headers, allow_redirects=True) as response:
                     if response.status == 200:
                         content = await response.read()
                         actual_type = response.headers.get('Content-Type', accept_format)
@@ -22,6 +22,7 @@ import time
 from downloader.core.logger import get_logger
 from downloader.core.config_loader import ConfigLoader
 from downloader.engine.stream_handler import StreamHandler
+from downloader.engine.rate_limiter import RequestLimiter, request_slot
 from downloader.engine.result import DownloadResult
 from downloader.constants import (
     DEFAULT_CHUNK_SIZE,
@@ -67,14 +68,20 @@ class HTTPHandler:
         )
     """
     
-    def __init__(self, config: Optional[ConfigLoader] = None):
+    def __init__(
+        self,
+        config: Optional[ConfigLoader] = None,
+        rate_limiter: Optional[RequestLimiter] = None
+    ):
         """
         Initialize HTTP handler.
         
         Args:
             config: Optional ConfigLoader instance
+            rate_limiter: Optional shared per-host request limiter
         """
         self.config = config if config else ConfigLoader()
+        self.rate_limiter = rate_limiter
         
         self.chunk_size = self.config.get('chunk_size', DEFAULT_CHUNK_SIZE)
         self.timeout = self.config.get('request_timeout', DEFAULT_TIMEOUT)
@@ -128,7 +135,7 @@ class HTTPHandler:
             # Make request
             logger.info(f"{LOG_PROCESS} Sending HTTP GET request")
             
-            async with session.get(
+            async with request_slot(self.rate_limiter, url), session.get(
                 url,
                 headers=request_headers,
                 timeout=aiohttp.ClientTimeout(
@@ -325,7 +332,8 @@ class HTTPHandler:
         try:
             session = await self._get_session()
 
-            async with session.head(url, headers=self._build_headers(url=url)) as response:
+            async with request_slot(self.rate_limiter, url), \
+                    session.head(url, headers=self._build_headers(url=url)) as response:
                 if response.status == HTTP_OK:
                     content_length = response.headers.get('Content-Length')
                     content_type = response.headers.get('Content-Type')
@@ -0,0 +1,172 @@
+# Path: downloader/engine/rate_limiter.py
+"""
+Request Limiter
+
+Shared per-host request limiting for concurrent downloads.
+One instance is shared by every component that talks HTTP during a
+download run, so limits hold across all concurrent downloads.
+
+Architecture:
+- Per-host connection cap (asyncio.Semaphore per host)
+- Per-host request spacing (minimum interval between request starts)
+- Hosts are independent: a slow taxonomy host never blocks SEC requests
+- Market-agnostic: limits come from configuration, not host names
+
+Example:
+    limiter = RequestLimiter(requests_per_second=10, max_per_host=4)
+
+    async with limiter.request(url):
+        async with session.get(url) as response:
+            ...
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import AsyncIterator, Optional
+from urllib.parse import urlparse
+
+from downloader.core.logger import get_logger
+from downloader.core.config_loader import ConfigLoader
+from downloader.constants import (
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_REQUESTS_PER_SECOND,
+)
+
+logger = get_logger(__name__, 'engine')
+
+
+class RequestLimiter:
+    """
+    Limits concurrent and per-second requests per host.
+
+    A request slot is held for the whole request (including streaming the
+    body), so max_per_host bounds open connections per host. Request
+    starts on a host are spaced at least 1/requests_per_second apart.
+
+    Example:
+        limiter = RequestLimiter.from_config(config)
+
+        async with limiter.request('https://www.sec.gov/Archives/...'):
+            ...
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        max_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST
+    ):
+        """
+        Initialize request limiter.
+
+        Args:
+            requests_per_second: Maximum request starts per second per host
+                (0 or less disables spacing)
+            max_per_host: Maximum simultaneous requests per host
+        """
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.max_per_host = max(1, max_per_host)
+
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._next_start: dict[str, float] = {}
+
+        self.requests = 0
+        self.wait_time = 0.0
+
+    @classmethod
+    def from_config(cls, config: Optional[ConfigLoader] = None) -> 'RequestLimiter':
+        """
+        Create limiter from downloader configuration.
+
+        Args:
+            config: Optional ConfigLoader instance
+
+        Returns:
+            RequestLimiter
+        """
+        config = config if config else ConfigLoader()
+        return cls(
+            requests_per_second=config.get('requests_per_second', DEFAULT_REQUESTS_PER_SECOND),
+            max_per_host=config.get('max_per_host', DEFAULT_MAX_CONNECTIONS_PER_HOST)
+        )
+
+    @staticmethod
+    def _host(url: str) -> str:
+        """Get limiting key (host) for URL."""
+        return urlparse(url).netloc.lower()
+
+    @contextlib.asynccontextmanager
+    async def request(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold a request slot for URL's host.
+
+        Args:
+            url: Request URL
+        """
+        host = self._host(url)
+
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+
+        waited_from = time.monotonic()
+        async with semaphore:
+            await self._wait_for_turn(host)
+            self.requests += 1
+            self.wait_time += time.monotonic() - waited_from
+            yield
+
+    async def _wait_for_turn(self, host: str) -> None:
+        """
+        Sleep until the next request start is allowed for host.
+
+        Args:
+            host: Host key
+        """
+        if not self.interval:
+            return
+
+        lock = self._locks.get(host)
+        if lock is None:
+            lock = self._locks[host] = asyncio.Lock()
+
+        async with lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start_at + self.interval
+
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+
+    def get_statistics(self) -> dict[str, any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with request count and total time spent waiting
+        """
+        return {
+            'requests': self.requests,
+            'wait_time': round(self.wait_time, 2),
+            'hosts': len(self._semaphores),
+        }
+
+
+def request_slot(limiter: Optional[RequestLimiter], url: str):
+    """
+    Get a request slot from limiter, or a no-op context if None.
+
+    Args:
+        limiter: Shared limiter (None = unlimited)
+        url: Request URL
+
+    Returns:
+        Async context manager
+    """
+    if limiter is None:
+        return contextlib.nullcontext()
+    return limiter.request(url)
+
+
+__all__ = ['RequestLimiter', 'request_slot']
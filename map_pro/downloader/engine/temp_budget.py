@@ -0,0 +1,168 @@
+# Path: downloader/engine/temp_budget.py
+"""
+Temp Space Budget
+
+Back-pressure for concurrent downloads sharing the temp directory.
+
+Each archive download reserves its expected size before it starts and
+releases it once the archive has been extracted (or moved) and removed.
+A new download only starts when the temp directory has room for every
+outstanding reservation plus a safety headroom, so a burst of large
+downloads waiting for extraction cannot exhaust temp space.
+
+Architecture:
+- Reservations tracked in bytes (Content-Length, or an estimate)
+- Free space checked through Validator.verify_temp_space
+- The first reservation is always admitted (progress is guaranteed;
+  a genuinely full disk fails in the download itself)
+
+Example:
+    budget = TempSpaceBudget(validator, headroom_bytes=100 * 1024 * 1024)
+
+    async with budget.reserve(content_length):
+        await download_to_temp(url)
+        await extract(...)
+"""
+
+import asyncio
+import contextlib
+from typing import AsyncIterator, Optional
+
+from downloader.core.logger import get_logger
+from downloader.core.config_loader import ConfigLoader
+from downloader.engine.validator import Validator
+from downloader.constants import (
+    DEFAULT_TEMP_HEADROOM_MB,
+    DEFAULT_UNKNOWN_DOWNLOAD_MB,
+    LOG_PROCESS,
+)
+from downloader.engine.constants import TEMP_SPACE_POLL_INTERVAL
+
+logger = get_logger(__name__, 'engine')
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class TempSpaceBudget:
+    """
+    Admits downloads only while temp space covers all reservations.
+    
+    Example:
+        budget = TempSpaceBudget.from_config(validator, config)
+        
+        async with budget.reserve(detection['content_length']):
+            ...
+    """
+    
+    def __init__(
+        self,
+        validator: Validator,
+        headroom_bytes: int = DEFAULT_TEMP_HEADROOM_MB * BYTES_PER_MB,
+        unknown_size_bytes: int = DEFAULT_UNKNOWN_DOWNLOAD_MB * BYTES_PER_MB
+    ):
+        """
+        Initialize temp space budget.
+        
+        Args:
+            validator: Validator providing verify_temp_space()
+            headroom_bytes: Free space to keep beyond all reservations
+            unknown_size_bytes: Reservation for downloads of unknown size
+        """
+        self.validator = validator
+        self.headroom_bytes = headroom_bytes
+        self.unknown_size_bytes = unknown_size_bytes
+        
+        self.reserved_bytes = 0
+        self.active = 0
+        self.waits = 0
+        
+        self._condition: Optional[asyncio.Condition] = None
+    
+    @classmethod
+    def from_config(
+        cls,
+        validator: Validator,
+        config: Optional[ConfigLoader] = None
+    ) -> 'TempSpaceBudget':
+        """
+        Create budget from downloader configuration.
+        
+        Args:
+            validator: Validator providing verify_temp_space()
+            config: Optional ConfigLoader instance
+            
+        Returns:
+            TempSpaceBudget
+        """
+        config = config if config else ConfigLoader()
+        return cls(
+            validator,
+            headroom_bytes=config.get('temp_headroom_mb', DEFAULT_TEMP_HEADROOM_MB) * BYTES_PER_MB
+        )
+    
+    def _fits(self, size: int) -> bool:
+        """Check whether a new reservation of size bytes can start now."""
+        if self.active == 0:
+            return True
+        return self.validator.verify_temp_space(
+            self.reserved_bytes + size + self.headroom_bytes
+        )
+    
+    @contextlib.asynccontextmanager
+    async def reserve(self, size: Optional[int]) -> AsyncIterator[int]:
+        """
+        Hold a temp space reservation.
+        
+        Waits until the reservation fits. Released when the block exits.
+        
+        Args:
+            size: Expected download size in bytes (None/0 = unknown)
+            
+        Yields:
+            Reserved size in bytes
+        """
+        size = size if size and size > 0 else self.unknown_size_bytes
+        
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        condition = self._condition
+        
+        async with condition:
+            if not self._fits(size):
+                self.waits += 1
+                logger.info(
+                    f"{LOG_PROCESS} Waiting for temp space: {size / BYTES_PER_MB:.1f} MB "
+                    f"requested, {self.reserved_bytes / BYTES_PER_MB:.1f} MB reserved by "
+                    f"{self.active} downloads"
+                )
+                while not self._fits(size):
+                    # Poll as well: space can be freed outside this process
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(condition.wait(), TEMP_SPACE_POLL_INTERVAL)
+            
+            self.reserved_bytes += size
+            self.active += 1
+        
+        try:
+            yield size
+        finally:
+            async with condition:
+                self.reserved_bytes -= size
+                self.active -= 1
+                condition.notify_all()
+    
+    def get_statistics(self) -> dict[str, any]:
+        """
+        Get budget statistics.
+        
+        Returns:
+            Dictionary with current reservations and wait count
+        """
+        return {
+            'reserved_mb': round(self.reserved_bytes / BYTES_PER_MB, 1),
+            'active': self.active,
+            'waits': self.waits,
+        }
+
+
+__all__ = ['TempSpaceBudget']
@@ -49,6 +49,11 @@ TAXONOMY_NAMESPACE_KEY = 'taxonomy_namespaces'
 FACTS_KEY = 'facts'
 METADATA_KEY = 'metadata'
 
+# Optional columnar facts sidecar written by the parser (parsed.facts.bin)
+FACTS_SIDECAR_SUFFIX = '.facts.bin'
+FACTS_SIDECAR_MAGIC = b'XBRLFCT1'
+FACTS_SIDECAR_VERSION = 1
+
 
 # ============================================================================
 # LIBRARY STATUS CONSTANTS
@@ -114,6 +119,9 @@ __all__ = [
     'TAXONOMY_NAMESPACE_KEY',
     'FACTS_KEY',
     'METADATA_KEY',
+    'FACTS_SIDECAR_SUFFIX',
+    'FACTS_SIDECAR_MAGIC',
+    'FACTS_SIDECAR_VERSION',
     
     # Status constants
     'LIBRARY_STATUS_ACTIVE',
@@ -11,10 +11,12 @@ Discovery (Doorkeepers):
 Content Readers:
 - ParsedReader: Reads parsed.json and extracts namespaces
 - TaxonomyReader: Verifies physical taxonomy existence
+- FactColumns: Reads the parser's columnar facts sidecar
 """
 
 from library.loaders.parsed_loader import ParsedLoader, ParsedFileLocation
 from library.loaders.taxonomy_loader import TaxonomyLoader, TaxonomyLocation
+from library.loaders.facts_sidecar import FactColumns
 from library.loaders.parsed_reader import ParsedReader, ParsedFilingInfo
 from library.loaders.taxonomy_reader import TaxonomyReader, TaxonomyVerification
 
@@ -25,6 +27,7 @@ __all__ = [
     'TaxonomyLocation',
     'ParsedReader',
     'ParsedFilingInfo',
+    'FactColumns',
     'TaxonomyReader',
     'TaxonomyVerification',
 ]
\ No newline at end of file
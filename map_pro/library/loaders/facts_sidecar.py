@@ -0,0 +1,229 @@
+# Path: library/loaders/facts_sidecar.py
+"""
+Columnar Facts Sidecar Reader
+
+Reads parsed.facts.bin, the binary companion the parser can write next
+to parsed.json (see parser/xbrl_parser/serialization/facts_sidecar.py for
+the layout).
+
+The sidecar header holds the parsed.json document without facts; facts
+are stored column by column (interned values) and decoded row by row from
+a memory map.
+
+ParsedReader only needs the document (namespaces), so it reads the header
+and never parses the facts. Rebuilding every fact as a dictionary is
+slower than json.load of parsed.json, so readers that need all facts keep
+reading parsed.json.
+
+RESPONSIBILITY: Read the sidecar. Does not interpret it.
+
+Example:
+    columns = FactColumns.open(parsed_json_path)
+    if columns:
+        with columns:
+            namespaces = columns.document['instance']['namespaces']
+            concepts = columns.column('concept')
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional
+
+from library.core.logger import get_logger
+from library.constants import (
+    FACTS_SIDECAR_SUFFIX,
+    FACTS_SIDECAR_MAGIC,
+    FACTS_SIDECAR_VERSION,
+    LOG_INPUT,
+)
+
+logger = get_logger(__name__, 'loaders')
+
+_UNDECODED = object()
+
+
+class FactColumns:
+    """
+    Memory-mapped facts of one parsed filing.
+
+    Rows are returned as fact dictionaries identical to the entries of
+    parsed.json's instance.facts. Repeated values (concepts, contexts,
+    units, ...) are decoded once and shared, so returned facts must be
+    treated as read-only.
+
+    Owns the memory map: call close() (or use it as a context manager)
+    when done. The document stays usable after closing.
+    """
+
+    def __init__(self, buffer: mmap.mmap, header: dict[str, any]):
+        """
+        Initialize from an opened sidecar (use FactColumns.open).
+
+        Args:
+            buffer: Memory map of the sidecar file (owned from now on)
+            header: Parsed header
+        """
+        self._buffer = buffer
+        self.document: dict[str, any] = header['document']
+        self.fact_count: int = header['fact_count']
+
+        # Every view into the map, released before the map is closed
+        self._views: list[memoryview] = [memoryview(buffer)]
+        view = self._views[0]
+
+        self._columns = {
+            spec['name']: self._array(view, spec['offset'], 'i', self.fact_count)
+            for spec in header['columns']
+        }
+        self.column_names = list(self._columns)
+        self._names_and_columns = list(self._columns.items())
+        self._numeric = self._array(view, header['numeric']['offset'], 'd', self.fact_count)
+
+        pool = header['pool']
+        self._pool_ends = self._array(view, pool['offsets'], 'Q', pool['count'])
+        self._pool_data = self._view(view, pool['data'], pool['data_length'])
+        self._pool_values = [_UNDECODED] * pool['count']
+
+    @classmethod
+    def open(cls, json_path: Path) -> Optional['FactColumns']:
+        """
+        Open the sidecar belonging to a parsed.json.
+
+        Args:
+            json_path: Path to parsed.json
+
+        Returns:
+            FactColumns, or None if there is no valid, current sidecar
+        """
+        json_path = Path(json_path)
+        path = json_path.with_name(json_path.stem + FACTS_SIDECAR_SUFFIX)
+        if not path.exists() or not json_path.exists():
+            return None
+
+        buffer = None
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic_len = len(FACTS_SIDECAR_MAGIC)
+            if buffer[:magic_len] != FACTS_SIDECAR_MAGIC:
+                logger.warning(f"{LOG_INPUT} Not a facts sidecar: {path}")
+                buffer.close()
+                return None
+
+            (header_len,) = struct.unpack_from('<I', buffer, magic_len)
+            header = json.loads(buffer[magic_len + 4:magic_len + 4 + header_len])
+
+            if header.get('version') != FACTS_SIDECAR_VERSION:
+                logger.info(f"{LOG_INPUT} Unsupported facts sidecar version in {path}, using JSON")
+                buffer.close()
+                return None
+
+            stat = json_path.stat()
+            source = header.get('source', {})
+            if source.get('size') != stat.st_size or source.get('mtime_ns') != stat.st_mtime_ns:
+                logger.info(f"{LOG_INPUT} Facts sidecar is stale for {json_path}, using JSON")
+                buffer.close()
+                return None
+
+            return cls(buffer, header)
+
+        except Exception as e:
+            logger.warning(f"{LOG_INPUT} Could not read facts sidecar {path}: {e}")
+            if buffer is not None and not buffer.closed:
+                buffer.close()
+            return None
+
+    def close(self) -> None:
+        """Release the memory map (rows and columns are no longer readable)."""
+        if self._buffer is None:
+            return
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._buffer.close()
+        self._buffer = None
+
+    def __enter__(self) -> 'FactColumns':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _view(self, view: memoryview, offset: int, length: int) -> memoryview:
+        """Slice of the map, tracked so close() can release it."""
+        block = view[offset:offset + length]
+        self._views.append(block)
+        return block
+
+    def _array(self, view: memoryview, offset: int, typecode: str, length: int):
+        """Typed view over a block (copied and swapped on big-endian hosts)."""
+        size = array(typecode).itemsize * length
+        block = self._view(view, offset, size)
+        if sys.byteorder == 'little':
+            typed = block.cast(typecode)
+            self._views.append(typed)
+            return typed
+        swapped = array(typecode, bytes(block))
+        swapped.byteswap()
+        return swapped
+
+    def _value(self, index: int) -> any:
+        """Decode one pool entry (cached)."""
+        if index < 0:
+            return None
+        value = self._pool_values[index]
+        if value is _UNDECODED:
+            start = self._pool_ends[index - 1] if index else 0
+            value = json.loads(bytes(self._pool_data[start:self._pool_ends[index]]))
+            self._pool_values[index] = value
+        return value
+
+    def _decoded_pool(self) -> list:
+        """Every pool entry decoded, with None appended for index -1."""
+        value = self._value
+        values = [value(index) for index in range(len(self._pool_values))]
+        values.append(None)
+        return values
+
+    def __len__(self) -> int:
+        return self.fact_count
+
+    def __getitem__(self, row: int) -> dict[str, any]:
+        """Fact dictionary for one row."""
+        if row < 0:
+            row += self.fact_count
+        if not 0 <= row < self.fact_count:
+            raise IndexError(row)
+        value = self._value
+        return {name: value(column[row]) for name, column in self._names_and_columns}
+
+    def __iter__(self) -> Iterator[dict[str, any]]:
+        for row in range(self.fact_count):
+            yield self[row]
+
+    def column(self, name: str) -> list:
+        """
+        All values of one fact field, in row order.
+
+        Args:
+            name: Fact key (e.g. 'concept', 'context_ref')
+
+        Returns:
+            List of values (None where null or the key is absent)
+        """
+        column = self._columns.get(name)
+        if column is None:
+            return [None] * self.fact_count
+        return list(map(self._decoded_pool().__getitem__, column))
+
+    def numeric_values(self):
+        """Numeric fact values as float64 (NaN where nil or non-numeric)."""
+        return self._numeric
+
+
+__all__ = ['FactColumns']
@@ -7,7 +7,7 @@ Uses ParsedLoader to find files, then reads content.
 
 Architecture:
 - Uses parsed_loader.py to discover files
-- Reads JSON content
+- Reads JSON content (sidecar document header when present)
 - Extracts namespace URIs
 - Returns required taxonomy information
 - Does NOT resolve namespaces to library names (engine's job)
@@ -21,6 +21,7 @@ from dataclasses import dataclass
 from library.core.config_loader import LibraryConfig
 from library.core.logger import get_logger
 from library.loaders.parsed_loader import ParsedLoader, ParsedFileLocation
+from library.loaders.facts_sidecar import FactColumns
 from library.constants import LOG_INPUT, LOG_PROCESS, LOG_OUTPUT
 
 logger = get_logger(__name__, 'loaders')
@@ -110,9 +111,15 @@ class ParsedReader:
         logger.debug(f"{LOG_INPUT} Reading: {json_path}")
         
         try:
-            # Load JSON
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Load JSON (facts are not needed, so the sidecar's
+            # document header spares reading them when present)
+            columns = FactColumns.open(json_path)
+            if columns is not None:
+                with columns:
+                    data = columns.document
+            else:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # Extract namespaces
             namespaces = self._extract_namespaces(data)
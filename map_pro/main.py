@@ -17,6 +17,9 @@ Usage:
 
     # Or with direct execution
     ./main.py
+
+    # Re-map every parsed filing, ignoring the map manifest
+    python main.py --force-remap
 """
 
 import sys
@@ -109,9 +112,15 @@ class MapProCLI:
     - Complete workflow execution
     """
 
-    def __init__(self):
-        """Initialize CLI."""
+    def __init__(self, force_remap: bool = False):
+        """
+        Initialize CLI.
+
+        Args:
+            force_remap: Re-map every parsed filing, ignoring the map manifest
+        """
         self.logger = logging.getLogger('map_pro_cli')
+        self.force_remap = force_remap
 
         # User inputs
         self.market_id: Optional[str] = None
@@ -317,6 +326,8 @@ class MapProCLI:
         print(f"  Company:            {self.company_identifier}")
         print(f"  Filing Type:        {self.form_type}")
         print(f"  Filings to Process: {self.num_filings}")
+        if self.force_remap:
+            print("  Force Re-map:       yes (unchanged filings are mapped again)")
         print("\n" + "=" * 80)
         print("\nThis will execute the complete workflow:")
         print("   Search for filings in market database")
@@ -354,7 +365,8 @@ class MapProCLI:
                 market_id=self.market_id,
                 company_identifier=self.company_identifier,
                 form_type=self.form_type,
-                num_filings=self.num_filings
+                num_filings=self.num_filings,
+                force_remap=self.force_remap
             )
 
             # Display results
@@ -382,6 +394,7 @@ class MapProCLI:
         print(f"   Filings Downloaded:  {summary['filings_downloaded']}")
         print(f"   Filings Parsed:      {summary['filings_parsed']}")
         print(f"   Filings Mapped:      {summary['filings_mapped']}")
+        print(f"   Unchanged (skipped): {summary['filings_map_skipped']}")
         print(f"   Total Time:          {summary['total_time_seconds']:.1f} seconds")
 
         if results.get('errors'):
@@ -394,7 +407,7 @@ class MapProCLI:
 
         print("\n" + "=" * 80)
 
-        if summary['filings_mapped'] > 0:
+        if summary['filings_mapped'] > 0 or summary['filings_map_skipped'] > 0:
             print("\n Success! Financial statements have been generated.")
             print("\nOutput locations:")
             print(f"   Parsed XBRL: Check database for parsed output paths")
@@ -421,11 +434,22 @@ class MapProCLI:
 
 async def main():
     """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Map Pro - XBRL filing processor')
+    parser.add_argument(
+        '--force-remap',
+        action='store_true',
+        help='Re-map every parsed filing, ignoring the map manifest',
+    )
+
+    args = parser.parse_args()
+
     # Log startup complete
     log_startup_complete()
 
     # Run CLI
-    cli = MapProCLI()
+    cli = MapProCLI(force_remap=args.force_remap)
     await cli.run()
 
 
@@ -41,6 +41,7 @@ from .parser_output import (
     FilingCharacteristics
 )
 from .filing_analyzer import FilingAnalyzer
+from .instance_sidecar import load_instance_scan
 
 # Data source loaders
 from .xbrl_filings import XBRLFilingsLoader
@@ -91,6 +92,7 @@ __all__ = [
     'ParsedFiling',
     'FilingCharacteristics',
     'FilingAnalyzer',
+    'load_instance_scan',
     
     # Source data access
     'XBRLFilingsLoader',
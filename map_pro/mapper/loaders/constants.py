@@ -152,6 +152,14 @@ NAMESPACE_CONTAINER_PATTERNS = [
     'xmlns',
 ]
 
+# ==============================================================================
+# INSTANCE SCAN SIDECAR (Parser output)
+# ==============================================================================
+
+# Contexts, dimensions and ix attributes of the instance (parsed.instance.json)
+INSTANCE_SIDECAR_SUFFIX = '.instance.json'
+INSTANCE_SIDECAR_VERSION = 1
+
 # ==============================================================================
 # OPERATIONAL CONFIGURATION (Keep)
 # ==============================================================================
@@ -218,6 +226,10 @@ __all__ = [
     'METADATA_CONTAINER_PATTERNS',
     'NAMESPACE_CONTAINER_PATTERNS',
     
+    # Instance scan sidecar
+    'INSTANCE_SIDECAR_SUFFIX',
+    'INSTANCE_SIDECAR_VERSION',
+    
     # Configuration
     'MAX_DIRECTORY_DEPTH',
     'MAX_FILE_SIZES',
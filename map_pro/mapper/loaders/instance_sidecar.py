@@ -0,0 +1,73 @@
+# Path: loaders/instance_sidecar.py
+"""
+Instance Scan Sidecar Reader
+
+Reads parsed.instance.json, which the parser writes next to parsed.json
+(see parser/xbrl_parser/serialization/instance_sidecar.py for the
+layout): contexts with period and dimensions, ix:nonFraction attributes
+and the identity of the instance document.
+
+With it the mapper does not need to locate, sniff and re-read the
+instance .htm/.xml. Returns None when there is no valid, current
+sidecar, so callers fall back to reading the instance document.
+
+RESPONSIBILITY: Load the instance scan. Does not interpret it.
+
+Example:
+    scan = load_instance_scan(parsed_json_path)
+    if scan:
+        contexts = scan['contexts']
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+from .constants import (
+    INSTANCE_SIDECAR_SUFFIX,
+    INSTANCE_SIDECAR_VERSION,
+)
+
+
+logger = logging.getLogger('input.instance_sidecar')
+
+
+def load_instance_scan(json_path: Path) -> Optional[dict[str, any]]:
+    """
+    Load the instance scan belonging to a parsed.json.
+
+    Args:
+        json_path: Path to parsed.json
+
+    Returns:
+        Scan dictionary ('instance_file', 'contexts', 'numeric_facts'),
+        or None if there is no valid, current sidecar
+    """
+    json_path = Path(json_path)
+    path = json_path.with_name(json_path.stem + INSTANCE_SIDECAR_SUFFIX)
+    if not path.exists() or not json_path.exists():
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            scan = json.load(f)
+
+        if scan.get('version') != INSTANCE_SIDECAR_VERSION:
+            logger.info(f"Unsupported instance sidecar version in {path}")
+            return None
+
+        stat = json_path.stat()
+        source = scan.get('source', {})
+        if source.get('size') != stat.st_size or source.get('mtime_ns') != stat.st_mtime_ns:
+            logger.info(f"Instance sidecar is stale for {json_path}")
+            return None
+
+        return scan
+
+    except Exception as e:
+        logger.warning(f"Could not read instance sidecar {path}: {e}")
+        return None
+
+
+__all__ = ['load_instance_scan']
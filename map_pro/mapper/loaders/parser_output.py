@@ -41,16 +41,54 @@ class FilingCharacteristics:
 
 @dataclass
 class ParsedFiling:
-    """Deserialized parsed filing with discovered structure."""
+    """
+    Deserialized parsed filing with discovered structure.
+
+    facts, contexts and units are converted from raw_data on first access
+    and cached as tuples of slotted model objects. Every consumer (one per
+    presentation network) shares the same objects, so they must be treated
+    as read-only. Call invalidate_cache() after modifying raw_data.
+    """
     characteristics: FilingCharacteristics
     raw_data: dict[str, any]
     discovered_structure: any
     extension_concepts: list[dict[str, any]] = field(default_factory=list)
     source_file: Optional[Path] = None
-    
+
+    # Materialized model caches (built lazily from raw_data)
+    _facts: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _contexts: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _units: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def facts(self) -> tuple['Fact', ...]:
+        """Facts from raw_data as Fact objects (converted once, cached)."""
+        if self._facts is None:
+            self._facts = self._build_facts()
+        return self._facts
+
+    @property
+    def contexts(self) -> tuple['Context', ...]:
+        """Contexts from raw_data as Context objects (converted once, cached)."""
+        if self._contexts is None:
+            self._contexts = self._build_contexts()
+        return self._contexts
+
     @property
-    def facts(self) -> list['Fact']:
-        """Access facts from raw_data, converted to Fact objects."""
+    def units(self) -> tuple['Unit', ...]:
+        """Units from raw_data as Unit objects (converted once, cached)."""
+        if self._units is None:
+            self._units = self._build_units()
+        return self._units
+
+    def invalidate_cache(self) -> None:
+        """Drop materialized facts/contexts/units so they are rebuilt from raw_data."""
+        self._facts = None
+        self._contexts = None
+        self._units = None
+
+    def _build_facts(self) -> tuple:
+        """Convert raw fact dicts to Fact objects."""
         from ..mapping.models.fact import Fact
         
         instance = self.raw_data.get('instance', {})
@@ -76,11 +114,10 @@ class ParsedFiling:
             )
             fact_objects.append(fact_obj)
         
-        return fact_objects
+        return tuple(fact_objects)
 
-    @property
-    def contexts(self):
-        """Access contexts - adaptive to dict or list structure, converted to Context objects."""
+    def _build_contexts(self) -> tuple:
+        """Convert raw contexts to Context objects - adaptive to dict or list structure."""
         from ..mapping.models.context import Context
         from datetime import datetime
         
@@ -138,11 +175,10 @@ class ParsedFiling:
             )
             context_objects.append(context_obj)
         
-        return context_objects
+        return tuple(context_objects)
 
-    @property
-    def units(self):
-        """Access units - adaptive to dict or list structure, converted to Unit objects."""
+    def _build_units(self) -> tuple:
+        """Convert raw units to Unit objects - adaptive to dict or list structure."""
         from ..mapping.models.unit import Unit
         
         instance = self.raw_data.get('instance', {})
@@ -172,7 +208,7 @@ class ParsedFiling:
             )
             unit_objects.append(unit_obj)
         
-        return unit_objects
+        return tuple(unit_objects)
 
 
 class ParserOutputDeserializer:
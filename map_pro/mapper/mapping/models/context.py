@@ -12,7 +12,7 @@ from typing import Optional
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     """
     XBRL context representation.
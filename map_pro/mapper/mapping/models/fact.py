@@ -11,7 +11,7 @@ from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Fact:
     """
     XBRL fact representation.
@@ -10,7 +10,7 @@ A unit defines the measurement unit for numeric facts.
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
     """
     XBRL unit representation.
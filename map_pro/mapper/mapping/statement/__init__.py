@@ -27,6 +27,7 @@ from .unmapped_tracker import (
 )
 from .hierarchy_builder import HierarchyBuilder
 from .fact_extractor import FactExtractor
+from .fact_index import FactIndex
 from .fact_enricher import FactEnricher
 
 __all__ = [
@@ -56,5 +57,6 @@ __all__ = [
     # Builders
     'HierarchyBuilder',
     'FactExtractor',
+    'FactIndex',
     'FactEnricher',  # NEW: Value enrichment
 ]
\ No newline at end of file
@@ -6,7 +6,8 @@ Extracts facts from parsed filing according to presentation hierarchy.
 Handles QName normalization and hierarchical traversal.
 
 DIMENSION EXTRACTION:
-- Reads dimensional information DIRECTLY from XBRL source files
+- Reads contexts from the parser's instance scan (parsed.instance.json)
+- Otherwise reads dimensional information DIRECTLY from XBRL source files
 - Falls back to parsed.json contexts if XBRL path not available
 """
 
@@ -14,12 +15,12 @@ import logging
 import re
 from pathlib import Path
 from typing import Optional
-from collections import defaultdict
 
 from ...loaders.parser_output import ParsedFiling
-from ...components.qname_utils import QNameUtils
+from ...loaders.instance_sidecar import load_instance_scan
 from ...mapping.statement.models import StatementFact
 from ...mapping.statement.fact_enricher import FactEnricher
+from ...mapping.statement.fact_index import FactIndex
 
 
 class FactExtractor:
@@ -27,7 +28,7 @@ class FactExtractor:
     Extracts facts following presentation hierarchy order.
 
     Responsibilities:
-    - Build concept-to-facts mapping with normalized QNames
+    - Build the per-filing FactIndex (concept lookups by normalized QName)
     - Traverse hierarchy depth-first
     - Extract facts in presentation order
     - Handle parent-child relationships
@@ -46,6 +47,7 @@ class FactExtractor:
         self._get_attr = get_attr_func
         self.fact_enricher = FactEnricher()  # Initialize enricher
         self._context_cache: dict[str, dict] = {}  # Cache context_id -> period/dimension info
+        self._context_cache_filing: Optional[ParsedFiling] = None
 
         # XBRL filing path for direct context/dimension extraction
         self._xbrl_filing_path = xbrl_filing_path
@@ -55,7 +57,8 @@ class FactExtractor:
         self,
         hierarchy: dict[str, any],
         parsed_filing: ParsedFiling,
-        role_uri: str
+        role_uri: str,
+        fact_index: Optional[FactIndex] = None
     ) -> list[StatementFact]:
         """
         Extract facts following hierarchy order.
@@ -67,6 +70,8 @@ class FactExtractor:
             hierarchy: Hierarchy structure with roots, children, parents, order
             parsed_filing: Parsed filing with facts
             role_uri: Role URI for this statement
+            fact_index: Per-filing fact index shared across statements
+                (built here if not supplied)
             
         Returns:
             List of StatementFacts in hierarchical order
@@ -76,8 +81,8 @@ class FactExtractor:
         # Build context cache for period lookup (CRITICAL for calculation verification)
         self._build_context_cache(parsed_filing)
 
-        # Build concept-to-facts map with normalized local names
-        concept_facts_map = self._build_concept_facts_map(parsed_filing)
+        if fact_index is None:
+            fact_index = self.build_fact_index(parsed_filing)
         
         # Traverse hierarchy depth-first
         visited = set()
@@ -86,7 +91,7 @@ class FactExtractor:
             self._traverse_and_extract(
                 root,
                 hierarchy,
-                concept_facts_map,
+                fact_index,
                 parsed_filing,
                 statement_facts,
                 visited,
@@ -111,41 +116,29 @@ class FactExtractor:
 
         return enriched_facts
     
-    def _build_concept_facts_map(self, parsed_filing: ParsedFiling) -> dict[str, list]:
+    def build_fact_index(self, parsed_filing: ParsedFiling) -> FactIndex:
         """
-        Build map from normalized concept names to facts.
-        
-        Normalizes QNames to local names for matching:
-        - us-gaap:Assets -> Assets
-        - us-gaap_Assets -> Assets
-        - Assets -> Assets
-        
+        Build the per-filing fact index.
+
+        Call once per filing and pass the result to every
+        extract_facts_in_order() call.
+
         Args:
             parsed_filing: Parsed filing with facts
-            
+
         Returns:
-            Dictionary mapping local concept names to lists of facts
+            FactIndex keyed by normalized local name
         """
-        concept_facts_map = defaultdict(list)
-        
-        for fact in parsed_filing.facts:
-            concept_name = self._get_attr(fact, 'name')
-            if concept_name:
-                try:
-                    local_name = QNameUtils.get_local_name(concept_name)
-                    concept_facts_map[local_name].append(fact)
-                except Exception as e:
-                    self.logger.debug(f"Failed to normalize concept '{concept_name}': {e}")
-        
-        return concept_facts_map
+        return FactIndex.build(parsed_filing, self._get_attr)
 
     def _build_context_cache(self, parsed_filing: ParsedFiling) -> None:
         """
         Build cache mapping context_id to period and dimension information.
 
         PRIORITY for dimension extraction:
-        1. XBRL source file (direct parsing) - most accurate for dimensions
-        2. Parsed filing contexts - fallback
+        1. Instance scan sidecar - the parser's own read of the XBRL source
+        2. XBRL source file (direct parsing) - most accurate for dimensions
+        3. Parsed filing contexts - fallback
 
         This is CRITICAL for calculation verification - facts must be grouped
         by period to ensure calculations compare values from the same time.
@@ -158,9 +151,32 @@ class FactExtractor:
         if self._xbrl_contexts_loaded and self._context_cache:
             return
 
+        # Parsed-filing contexts are equally stable within one filing
+        if self._context_cache_filing is parsed_filing and self._context_cache:
+            return
+
         self._context_cache.clear()
+        self._context_cache_filing = parsed_filing
+
+        # PRIORITY 1: Contexts scanned by the parser (no instance re-read)
+        if not self._xbrl_contexts_loaded:
+            scan_contexts = self._load_contexts_from_scan(parsed_filing)
 
-        # PRIORITY 1: Try loading contexts directly from XBRL source file
+            if scan_contexts:
+                self._context_cache = scan_contexts
+                self._xbrl_contexts_loaded = True
+
+                contexts_with_dims = sum(
+                    1 for ctx in scan_contexts.values()
+                    if ctx.get('dimensions')
+                )
+                self.logger.info(
+                    f"Loaded {len(scan_contexts)} contexts from instance scan, "
+                    f"{contexts_with_dims} with dimensions"
+                )
+                return
+
+        # PRIORITY 2: Try loading contexts directly from XBRL source file
         if self._xbrl_filing_path and not self._xbrl_contexts_loaded:
             try:
                 xbrl_contexts = self._load_contexts_from_xbrl(self._xbrl_filing_path)
@@ -185,7 +201,7 @@ class FactExtractor:
                     f"Falling back to parsed filing."
                 )
 
-        # PRIORITY 2: Fallback to parsed filing contexts
+        # PRIORITY 3: Fallback to parsed filing contexts
         try:
             contexts = parsed_filing.contexts
             for context in contexts:
@@ -227,6 +243,27 @@ class FactExtractor:
         except Exception as e:
             self.logger.warning(f"Failed to build context cache: {e}")
 
+    def _load_contexts_from_scan(self, parsed_filing: ParsedFiling) -> dict[str, dict]:
+        """
+        Load contexts from the instance scan next to parsed.json.
+
+        Args:
+            parsed_filing: Parsed filing (source_file is its parsed.json)
+
+        Returns:
+            Dictionary mapping context_id to context info, empty if the
+            filing has no current instance scan
+        """
+        source_file = getattr(parsed_filing, 'source_file', None)
+        if not source_file:
+            return {}
+
+        scan = load_instance_scan(source_file)
+        if not scan:
+            return {}
+
+        return scan.get('contexts') or {}
+
     def _load_contexts_from_xbrl(self, filing_path: Path) -> dict[str, dict]:
         """
         Load contexts directly from XBRL instance document.
@@ -532,7 +569,7 @@ class FactExtractor:
         self,
         concept: str,
         hierarchy: dict[str, any],
-        concept_facts_map: dict[str, list],
+        fact_index: FactIndex,
         parsed_filing: ParsedFiling,
         statement_facts: list[StatementFact],
         visited: set[str],
@@ -547,7 +584,7 @@ class FactExtractor:
         Args:
             concept: Current concept to process (from hierarchy)
             hierarchy: Hierarchy structure
-            concept_facts_map: Map from LOCAL NAMES to their facts
+            fact_index: Per-filing fact index (keyed by LOCAL NAMES)
             parsed_filing: Parsed filing
             statement_facts: List to append facts to (modified in place)
             visited: Set of visited concepts (prevents loops)
@@ -559,16 +596,13 @@ class FactExtractor:
         
         visited.add(concept)
         
-        # Normalize concept to local name for lookup
-        concept_local = QNameUtils.get_local_name(concept)
-        
         # Get facts for this concept using normalized name
-        facts = concept_facts_map.get(concept_local, [])
+        facts = fact_index.get(concept)
         
         if facts:
             self.logger.debug(
                 f"Matched {len(facts)} facts for concept '{concept}' "
-                f"(normalized to '{concept_local}')"
+                f"(normalized to '{fact_index.local_name(concept)}')"
             )
         
         # Get order for this concept
@@ -623,7 +657,7 @@ class FactExtractor:
             self._traverse_and_extract(
                 child,
                 hierarchy,
-                concept_facts_map,
+                fact_index,
                 parsed_filing,
                 statement_facts,
                 visited,
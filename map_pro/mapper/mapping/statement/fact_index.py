@@ -0,0 +1,124 @@
+# Path: mapping/statement/fact_index.py
+"""
+Fact Index
+
+Per-filing lookup structure from concepts to facts.
+
+Built ONCE per filing by StatementBuilder and shared by every presentation
+network, so hierarchy traversal does dictionary lookups instead of
+re-grouping all facts for each statement.
+
+Keyed by normalized local name: QName variations (us-gaap:Assets,
+us-gaap_Assets, Assets) all map to 'Assets'. Facts keep their filing
+order inside every bucket.
+"""
+
+import logging
+from typing import Callable
+from collections import defaultdict
+
+from ...loaders.parser_output import ParsedFiling
+from ...components.qname_utils import QNameUtils
+
+
+logger = logging.getLogger('mapping.statement.fact_index')
+
+
+class FactIndex:
+    """
+    Concept-keyed index over the facts of one filing.
+
+    Example:
+        index = FactIndex.build(parsed_filing, get_attr)
+
+        facts = index.get('us-gaap:Assets')
+    """
+
+    def __init__(self):
+        """Initialize empty index (use FactIndex.build to populate)."""
+        self.by_name: dict[str, list] = {}
+        self.concept_names: set[str] = set()
+        self.total_facts = 0
+        self._local_names: dict[str, str] = {}
+
+    @classmethod
+    def build(
+        cls,
+        parsed_filing: ParsedFiling,
+        get_attr_func: Callable
+    ) -> 'FactIndex':
+        """
+        Build the index in a single pass over the filing's facts.
+
+        Args:
+            parsed_filing: Parsed filing with facts
+            get_attr_func: Function to safely get attributes from fact objects
+
+        Returns:
+            Populated FactIndex
+        """
+        index = cls()
+        by_name = defaultdict(list)
+
+        for fact in parsed_filing.facts:
+            index.total_facts += 1
+
+            concept_name = get_attr_func(fact, 'name')
+            if not concept_name:
+                continue
+
+            index.concept_names.add(concept_name)
+
+            try:
+                local_name = index.local_name(concept_name)
+            except Exception as e:
+                logger.debug(f"Failed to normalize concept '{concept_name}': {e}")
+                continue
+
+            by_name[local_name].append(fact)
+
+        index.by_name = dict(by_name)
+
+        logger.info(
+            f"Built fact index: {index.total_facts} facts, "
+            f"{len(index.by_name)} concepts"
+        )
+
+        return index
+
+    def local_name(self, concept: str) -> str:
+        """
+        Normalize a concept QName to its local name (memoized).
+
+        Args:
+            concept: Concept in any QName form
+
+        Returns:
+            Local name
+        """
+        local_name = self._local_names.get(concept)
+        if local_name is None:
+            local_name = QNameUtils.get_local_name(concept)
+            self._local_names[concept] = local_name
+        return local_name
+
+    def get(self, concept: str) -> list:
+        """
+        Get all facts for a concept.
+
+        Args:
+            concept: Concept in any QName form
+
+        Returns:
+            Facts in filing order (empty list if none)
+        """
+        return self.by_name.get(self.local_name(concept), [])
+
+    def __contains__(self, concept: str) -> bool:
+        return self.local_name(concept) in self.by_name
+
+    def __len__(self) -> int:
+        return self.total_facts
+
+
+__all__ = ['FactIndex']
@@ -37,6 +37,7 @@ from ...mapping.network_classifier import NetworkClassifier
 from ...mapping.statement.models import Statement, StatementSet, StatementFact
 from ...mapping.statement.hierarchy_builder import HierarchyBuilder
 from ...mapping.statement.fact_extractor import FactExtractor
+from ...mapping.statement.fact_index import FactIndex
 
 
 class StatementBuilder:
@@ -45,6 +46,7 @@ class StatementBuilder:
     
     Workflow:
     1. Initialize components (DimensionHandler, RelationshipNavigator, NetworkClassifier)
+       and build the per-filing FactIndex once
     2. For each presentation network:
        a. Build hierarchy from arcs
        b. Extract facts matching concepts in hierarchy
@@ -66,6 +68,7 @@ class StatementBuilder:
         # Extracted components for clean separation
         self.hierarchy_builder = HierarchyBuilder()
         self.fact_extractor = None  # Initialized after we have _get_attr
+        self.fact_index: Optional[FactIndex] = None  # Built once per filing
         
         # Statistics tracker
         self.statistics = None
@@ -171,6 +174,9 @@ class StatementBuilder:
         if xbrl_filing_path:
             self.logger.info(f"FactExtractor initialized with XBRL path: {xbrl_filing_path}")
 
+        # Concept -> facts index shared by every presentation network
+        self.fact_index = self.fact_extractor.build_fact_index(parsed_filing)
+
         self.logger.info("Components initialized successfully")
     
     def _build_statement_from_network(
@@ -217,7 +223,8 @@ class StatementBuilder:
         statement.facts = self.fact_extractor.extract_facts_in_order(
             hierarchy,
             parsed_filing,
-            network.role_uri
+            network.role_uri,
+            fact_index=self.fact_index
         )
         
         # STEP 4: Calculate structural metrics with ACTUAL fact count
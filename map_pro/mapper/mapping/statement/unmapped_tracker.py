@@ -23,6 +23,7 @@ from collections import Counter
 
 from ...loaders.parser_output import ParsedFiling
 from ...mapping.statement.models import StatementSet
+from ...mapping.statement.fact_index import FactIndex
 
 
 @dataclass
@@ -66,7 +67,7 @@ class UnmappedFactsTracker:
     
     Example:
         tracker = UnmappedFactsTracker()
-        report = tracker.analyze(parsed_filing, statement_set)
+        report = tracker.analyze(parsed_filing, statement_set, builder.fact_index)
         
         print(f"Unmapped: {report.unmapped_rate:.1f}%")
         for fact in report.unmapped_facts[:10]:
@@ -81,7 +82,8 @@ class UnmappedFactsTracker:
     def analyze(
         self,
         parsed_filing: ParsedFiling,
-        statement_set: StatementSet
+        statement_set: StatementSet,
+        fact_index: Optional[FactIndex] = None
     ) -> UnmappedFactsReport:
         """
         Analyze which facts were not mapped and why.
@@ -89,12 +91,17 @@ class UnmappedFactsTracker:
         Args:
             parsed_filing: Original parsed filing with all facts
             statement_set: Statement set with mapped facts
+            fact_index: Optional per-filing fact index from StatementBuilder
+                (avoids another pass over all facts for concept names)
             
         Returns:
             UnmappedFactsReport with analysis
         """
         total_facts = len(parsed_filing.facts)
         
+        # Investigation result per concept (same for every fact of a concept)
+        investigations: dict[str, tuple[str, list[str]]] = {}
+        
         # Collect all mapped fact identifiers
         mapped_fact_ids = set()
         for statement in statement_set.statements:
@@ -118,11 +125,13 @@ class UnmappedFactsTracker:
             
             if fact_id not in mapped_fact_ids:
                 # Investigate why
-                reason, notes = self._investigate_unmapped(
-                    fact,
-                    parsed_filing,
-                    statement_set
-                )
+                if fact_name not in investigations:
+                    investigations[fact_name] = self._investigate_unmapped(
+                        fact,
+                        parsed_filing,
+                        statement_set
+                    )
+                reason, notes = investigations[fact_name]
                 
                 unmapped_fact = UnmappedFact(
                     concept=fact_name,
@@ -131,7 +140,7 @@ class UnmappedFactsTracker:
                     unit_ref=self._get_fact_attr(fact, 'unit_ref'),
                     decimals=self._get_fact_attr(fact, 'decimals'),
                     reason=reason,
-                    investigation_notes=notes
+                    investigation_notes=list(notes)
                 )
                 unmapped_facts.append(unmapped_fact)
         
@@ -144,7 +153,10 @@ class UnmappedFactsTracker:
         reasons_summary = Counter(f.reason for f in unmapped_facts)
         
         # Identify concepts that never got mapped
-        all_concepts = set(self._get_fact_attr(f, 'name') for f in parsed_filing.facts)
+        if fact_index is not None:
+            all_concepts = set(fact_index.concept_names)
+        else:
+            all_concepts = set(self._get_fact_attr(f, 'name') for f in parsed_filing.facts)
         mapped_concepts = set(f.concept for s in statement_set.statements for f in s.facts)
         never_mapped = all_concepts - mapped_concepts
         
@@ -213,6 +213,7 @@ class ConfigLoader:
             'json_pretty_print': self._get_bool('PARSER_JSON_PRETTY_PRINT', True),
             'json_indent': self._get_int('PARSER_JSON_INDENT', 2),
             'enable_output_compression': self._get_bool('PARSER_ENABLE_OUTPUT_COMPRESSION', False),
+            'write_facts_sidecar': self._get_bool('PARSER_WRITE_FACTS_SIDECAR', False),
             
             # ================================================================
             # FEATURE FLAGS
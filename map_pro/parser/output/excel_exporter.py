@@ -122,7 +122,7 @@ class ExcelExporter:
             ("Period End", str(metadata.period_end_date) if metadata.period_end_date else "N/A"),
             ("Market", metadata.market or "N/A"),
             ("", ""),
-            ("Total Facts", len(filing.instance.facts)),
+            ("Total Facts", filing.instance.total_facts),
             ("Contexts", len(filing.instance.contexts)),
             ("Units", len(filing.instance.units)),
             ("", ""),
@@ -59,7 +59,7 @@ class DataExtractor:
         """
         facts_data = []
         
-        for fact in filing.instance.facts:
+        for fact in filing.instance.iter_facts():
             fact_dict = {
                 'concept': fact.concept,
                 'value': fact.value,
@@ -183,7 +183,7 @@ class DataExtractor:
             'company_name': metadata.company_name,
             'market': metadata.market,
             'source_files_count': len(metadata.source_files),
-            'fact_count': len(filing.instance.facts),
+            'fact_count': filing.instance.total_facts,
             'context_count': len(filing.instance.contexts),
             'unit_count': len(filing.instance.units),
             'error_count': len(filing.errors.errors),
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Optional
 from datetime import datetime
 from collections import Counter
+from itertools import islice
 
 from xbrl_parser.models.parsed_filing import ParsedFiling
 from xbrl_parser.models.error import ErrorSeverity
@@ -39,6 +40,7 @@ class ReportGenerator:
         """
         lines = []
         metadata = filing.metadata
+        total_facts = filing.instance.total_facts
         
         lines.append("=" * 70)
         lines.append("XBRL FILING SUMMARY")
@@ -60,7 +62,7 @@ class ReportGenerator:
         # Data summary
         lines.append("DATA SUMMARY")
         lines.append("-" * 70)
-        lines.append(f"Total Facts:     {len(filing.instance.facts):,}")
+        lines.append(f"Total Facts:     {total_facts:,}")
         lines.append(f"Contexts:        {len(filing.instance.contexts):,}")
         lines.append(f"Units:           {len(filing.instance.units):,}")
         lines.append(f"Concepts:        {len(filing.taxonomy.concepts):,}")
@@ -75,8 +77,11 @@ class ReportGenerator:
         monetary_count = 0
         with_footnotes = 0
         nil_count = 0
+        concept_counts = Counter()
         
-        for fact in filing.instance.facts:
+        # One pass (streamed facts are read back from the spool)
+        for fact in filing.instance.iter_facts():
+            concept_counts[fact.concept] += 1
             fact_type = fact.fact_type.value if fact.fact_type else "UNKNOWN"
             type_counts[fact_type] = type_counts.get(fact_type, 0) + 1
             
@@ -103,14 +108,14 @@ class ReportGenerator:
         lines.append(f"By Type:         {' | '.join(type_list)}")
         
         if monetary_count > 0:
-            pct = (monetary_count / len(filing.instance.facts) * 100) if len(filing.instance.facts) > 0 else 0
+            pct = (monetary_count / total_facts * 100) if total_facts > 0 else 0
             lines.append(f"Monetary Facts:  {monetary_count:,} ({pct:.0f}%)")
         
         if with_footnotes > 0:
             lines.append(f"With Footnotes:  {with_footnotes:,} facts reference footnotes")
         
         if nil_count > 0:
-            pct = (nil_count / len(filing.instance.facts) * 100) if len(filing.instance.facts) > 0 else 0
+            pct = (nil_count / total_facts * 100) if total_facts > 0 else 0
             lines.append(f"Nil Facts:       {nil_count:,} ({pct:.0f}%)")
         
         lines.append("")
@@ -119,7 +124,6 @@ class ReportGenerator:
         lines.append("TOP CONCEPTS (by frequency)")
         lines.append("-" * 70)
         
-        concept_counts = Counter(fact.concept for fact in filing.instance.facts)
         top_concepts = concept_counts.most_common(5)
         
         for i, (concept, count) in enumerate(top_concepts, 1):
@@ -182,8 +186,8 @@ class ReportGenerator:
             lines.append("PERFORMANCE")
             lines.append("-" * 70)
             lines.append(f"Parse Time:      {parse_time:.2f} seconds")
-            if parse_time > 0 and len(filing.instance.facts) > 0:
-                throughput = len(filing.instance.facts) / parse_time
+            if parse_time > 0 and total_facts > 0:
+                throughput = total_facts / parse_time
                 lines.append(f"Facts/Second:    {throughput:,.0f}")
             lines.append("")
         
@@ -212,7 +216,7 @@ class ReportGenerator:
         lines.append("FACT BREAKDOWN BY TYPE")
         lines.append("-" * 70)
         fact_types = {}
-        for fact in filing.instance.facts:
+        for fact in filing.instance.iter_facts():
             fact_type = fact.fact_type.value if fact.fact_type else "unknown"
             fact_types[fact_type] = fact_types.get(fact_type, 0) + 1
         
@@ -270,13 +274,13 @@ class ReportGenerator:
         lines.append("=" * 80)
         lines.append("")
         
-        facts = filing.instance.facts
+        facts = filing.instance.iter_facts()
         if concept_filter:
-            facts = [f for f in facts if concept_filter.lower() in f.concept.lower()]
+            facts = (f for f in facts if concept_filter.lower() in f.concept.lower())
             lines.append(f"Filter: {concept_filter}")
             lines.append("")
         
-        facts = facts[:max_facts]
+        facts = list(islice(facts, max_facts))
         
         for i, fact in enumerate(facts, 1):
             lines.append(f"{i}. {fact.concept}")
@@ -286,8 +290,8 @@ class ReportGenerator:
             lines.append(f"   Type:        {fact.fact_type.value if fact.fact_type else 'N/A'}")
             lines.append("")
         
-        if len(filing.instance.facts) > max_facts:
-            lines.append(f"... and {len(filing.instance.facts) - max_facts} more facts")
+        if filing.instance.total_facts > max_facts:
+            lines.append(f"... and {filing.instance.total_facts - max_facts} more facts")
         
         return "\n".join(lines)
     
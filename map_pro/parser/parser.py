@@ -44,6 +44,7 @@ def main():
     print("XBRL PARSER - PRODUCTION INTERFACE")
     print("=" * 80)
     
+    filing = None
     try:
         # Step 1: Initialize output directories
         print("\nInitializing output directories...")
@@ -72,7 +73,7 @@ def main():
         parse_time = (datetime.now() - start_time).total_seconds()
         
         print(f"\nParsing completed in {parse_time:.2f} seconds")
-        print(f"Extracted {len(filing.instance.facts):,} facts")
+        print(f"Extracted {filing.instance.total_facts:,} facts")
         
         # Step 3.5: Populate metadata from filing_entry
         filing.metadata.market = filing_entry.market
@@ -124,11 +125,10 @@ def main():
         print(f"   {json_file}")
         
         serializer = JSONSerializer()
-        json_output = serializer.serialize(filing)
-        json_file.write_text(json_output)
+        serializer.write(filing, json_file)
         
         print(f"   Size: {json_file.stat().st_size / 1024:.1f} KB")
-        print(f"   Facts: {len(filing.instance.facts):,}")
+        print(f"   Facts: {filing.instance.total_facts:,}")
         print(f"   ✓ Saved")
         
         # 5b. CSV export
@@ -180,14 +180,18 @@ def main():
         print("STATISTICS")
         print("=" * 80)
         
-        facts_with_ids = sum(1 for f in filing.instance.facts if f.id)
-        facts_with_footnotes = sum(1 for f in filing.instance.facts if f.footnote_refs and len(f.footnote_refs) > 0)
-        facts_with_source = sum(1 for f in filing.instance.facts if f.source_line)
+        facts_with_ids = 0
+        facts_with_footnotes = 0
+        facts_with_source = 0
+        for f in filing.instance.iter_facts():
+            facts_with_ids += 1 if f.id else 0
+            facts_with_footnotes += 1 if f.footnote_refs else 0
+            facts_with_source += 1 if f.source_line else 0
         total_footnotes = len(filing.instance.footnotes) if hasattr(filing.instance, 'footnotes') and filing.instance.footnotes else 0
         
         print(f"\nPerformance:")
         print(f"  Parse time: {parse_time:.2f} seconds")
-        print(f"  Facts/second: {len(filing.instance.facts) / parse_time:,.0f}" if parse_time > 0 else "  Facts/second: N/A")
+        print(f"  Facts/second: {filing.instance.total_facts / parse_time:,.0f}" if parse_time > 0 else "  Facts/second: N/A")
         
         print(f"\nFact Attributes:")
         print(f"  With IDs: {facts_with_ids:,}")
@@ -221,6 +225,11 @@ def main():
         logger.error(f"Parsing failed: {e}", exc_info=True)
         print(f"\nERROR: {e}")
         return 1
+    
+    finally:
+        if filing is not None and filing.instance.is_streamed:
+            # Facts were spooled to disk by a streaming parse - all outputs written
+            filing.instance.fact_spool.discard()
 
 
 if __name__ == '__main__':
@@ -87,4 +87,37 @@ MAX_FILENAME_LENGTH = 30         # Long filenames get penalty
 
 # Hyphen/underscore limits
 MAX_SIMPLE_HYPHENS = 1           # Simple filenames have ≤1 hyphen
-MAX_UNDERSCORES_PENALTY = 2      # Too many underscores = penalty
\ No newline at end of file
+MAX_UNDERSCORES_PENALTY = 2      # Too many underscores = penalty
+# ============================================================================
+# STREAMING EXTRACTION
+# ============================================================================
+
+# Subdirectory of output_dir holding fact spool files during streaming parses
+STREAMING_SPOOL_DIRNAME = 'streaming_spool'
+
+# ============================================================================
+# INSTANCE DOCUMENT HANDLE
+# ============================================================================
+
+# Instance documents with these extensions are inline XBRL
+INLINE_XBRL_EXTENSIONS = ('.xhtml', '.html', '.htm')
+
+# Bytes read to sniff the document type (HTML vs XHTML)
+INSTANCE_HEADER_BYTES = 1024
+
+# Clark-notation tags for the schemaRef header scan
+_LINK_NS = 'http://www.xbrl.org/2003/linkbase'
+SCHEMA_REF_TAG = f'{{{_LINK_NS}}}schemaRef'
+XLINK_HREF_ATTR = '{http://www.w3.org/1999/xlink}href'
+
+# xbrli:xbrl children allowed before contexts, units and facts (XBRL 2.1 4.2)
+INSTANCE_HEADER_TAGS = frozenset(
+    f'{{{_LINK_NS}}}{name}'
+    for name in ('schemaRef', 'linkbaseRef', 'roleRef', 'arcroleRef')
+)
+
+# ix:header elements (Inline XBRL 1.0 and 1.1); schemaRefs live inside them
+IX_HEADER_TAGS = frozenset((
+    '{http://www.xbrl.org/2008/inlineXBRL}header',
+    '{http://www.xbrl.org/2013/inlineXBRL}header',
+))
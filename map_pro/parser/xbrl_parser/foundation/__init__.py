@@ -6,6 +6,7 @@ Core infrastructure for XML parsing, URI resolution, and namespace management.
 """
 
 from ..foundation.xml_parser import XMLParser, XMLParseResult
+from ..foundation.instance_document import InstanceDocument
 from ..foundation.http_fetcher import HTTPFetcher
 from ..foundation.taxonomy_cache import TaxonomyCache
 from ..foundation.registry_manager import (
@@ -28,6 +29,7 @@ __all__ = [
     # XML parsing
     'XMLParser',
     'XMLParseResult',
+    'InstanceDocument',
     # URI resolution
     'HTTPFetcher',
     'TaxonomyCache',
@@ -0,0 +1,212 @@
+# Path: xbrl_parser/foundation/instance_document.py
+"""
+Instance Document Handle
+
+One handle per parse on the instance document (.htm/.xhtml or .xml),
+shared by the parser phases so the file is read and parsed once.
+
+Before, the taxonomy phase parsed the whole instance just to find its
+link:schemaRef elements, and extraction parsed it again (iXBRL: twice,
+once for the ix: facts and once for contexts and units).
+
+The handle:
+- reads the file once (read_bytes)
+- builds the tree once (inline_root for iXBRL, xml_result for XML)
+- finds schemaRefs in that tree, or - when no tree will be built
+  (streaming extraction) - with an iterparse header scan that stops
+  after the document header
+
+Example:
+    document = InstanceDocument(entry_point, config)
+
+    schema_refs = document.schema_refs()    # builds the tree
+    root = document.inline_root()           # same tree, no re-parse
+
+    document.release()                      # drop tree and bytes
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from lxml import etree, html
+
+from ...core.config_loader import ConfigLoader
+from ..foundation.xml_parser import XMLParser, XMLParseResult
+from ..constants import (
+    INLINE_XBRL_EXTENSIONS,
+    INSTANCE_HEADER_BYTES,
+    INSTANCE_HEADER_TAGS,
+    IX_HEADER_TAGS,
+    SCHEMA_REF_TAG,
+    XLINK_HREF_ATTR,
+)
+
+
+class InstanceDocument:
+    """
+    Parsed-once view of an instance document.
+
+    Attributes:
+        path: Instance document path
+        is_inline: True for inline XBRL (by file extension)
+        build_tree: Whether the full tree will be needed. If False,
+            schema_refs() scans the header instead of parsing everything.
+        parse_count: Number of full parses done (at most one)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        config: Optional[ConfigLoader] = None,
+        build_tree: bool = True
+    ):
+        """
+        Initialize instance document handle.
+
+        Args:
+            path: Instance document path
+            config: Configuration (XML parser settings for .xml instances)
+            build_tree: Parse the full tree on first use (False for
+                streaming extraction, which never needs it)
+        """
+        self.path = Path(path)
+        self.config = config
+        self.is_inline = self.path.suffix.lower() in INLINE_XBRL_EXTENSIONS
+        self.build_tree = build_tree
+        self.parse_count = 0
+        self.logger = logging.getLogger(__name__)
+
+        self._content: Optional[bytes] = None
+        self._inline_root: Optional[etree._Element] = None
+        self._parsed_as_html = False
+        self._xml_result: Optional[XMLParseResult] = None
+        self._schema_refs: Optional[list[str]] = None
+
+    def read_bytes(self) -> bytes:
+        """File content (read once)."""
+        if self._content is None:
+            with open(self.path, 'rb') as f:
+                self._content = f.read()
+        return self._content
+
+    def header(self) -> str:
+        """Start of the document, decoded leniently (for type sniffing)."""
+        if self._content is not None:
+            head = self._content[:INSTANCE_HEADER_BYTES]
+        else:
+            with open(self.path, 'rb') as f:
+                head = f.read(INSTANCE_HEADER_BYTES)
+        return head.decode('utf-8', errors='ignore')
+
+    def inline_root(self) -> etree._Element:
+        """
+        Root of the iXBRL document (parsed once).
+
+        Parsed as XHTML first (keeps namespaces), falling back to the
+        HTML parser for documents that are not well-formed XML.
+        """
+        if self._inline_root is None:
+            content = self.read_bytes()
+            self.parse_count += 1
+            try:
+                self._inline_root = etree.fromstring(content)
+            except etree.XMLSyntaxError:
+                self._inline_root = html.fromstring(content)
+                self._parsed_as_html = True
+        return self._inline_root
+
+    def xml_result(self) -> XMLParseResult:
+        """XMLParser result for an XML instance (parsed once)."""
+        if self._xml_result is None:
+            self.parse_count += 1
+            self._xml_result = XMLParser(self.config).parse_file(self.path)
+        return self._xml_result
+
+    def schema_refs(self) -> list[str]:
+        """
+        xlink:href of every link:schemaRef, in document order.
+
+        Uses the document tree when it is (or will be) built, otherwise
+        an iterparse scan that stops after the document header.
+
+        Returns:
+            Schema reference URIs as written in the document
+        """
+        if self._schema_refs is not None:
+            return self._schema_refs
+
+        root = None
+        if self.build_tree or self._inline_root is not None or self._xml_result is not None:
+            root = self.inline_root() if self.is_inline else self.xml_result().root
+
+        if root is not None:
+            refs = self._refs_in_tree(root)
+            if not refs and self._parsed_as_html:
+                # The HTML parser drops namespaces
+                refs = self._scan_header()
+        else:
+            refs = self._scan_header()
+
+        self._schema_refs = refs
+        return refs
+
+    def release(self) -> None:
+        """Drop the file content and parsed tree (schemaRefs are kept)."""
+        self._content = None
+        self._inline_root = None
+        self._xml_result = None
+
+    @staticmethod
+    def _refs_in_tree(root: etree._Element) -> list[str]:
+        """schemaRef hrefs anywhere in a parsed tree."""
+        return [
+            href for href in (
+                element.get(XLINK_HREF_ATTR) for element in root.iter(SCHEMA_REF_TAG)
+            )
+            if href
+        ]
+
+    def _scan_header(self) -> list[str]:
+        """
+        Find schemaRefs without building the whole tree.
+
+        Stops at the end of the first ix:header (iXBRL) or at the first
+        context, unit or fact (XML) once a schemaRef has been seen;
+        documents without one in the header are scanned to the end.
+        """
+        refs = []
+        depth = 0
+        try:
+            events = etree.iterparse(
+                str(self.path),
+                events=('start', 'end'),
+                recover=True,
+                resolve_entities=False,
+                no_network=True,
+            )
+            for event, element in events:
+                if event == 'start':
+                    depth += 1
+                    if depth == 2 and refs and element.tag not in INSTANCE_HEADER_TAGS \
+                            and not self.is_inline:
+                        break
+                    continue
+
+                depth -= 1
+                if element.tag == SCHEMA_REF_TAG:
+                    href = element.get(XLINK_HREF_ATTR)
+                    if href:
+                        refs.append(href)
+                elif element.tag in IX_HEADER_TAGS and refs:
+                    break
+                if depth >= 1:
+                    element.clear()
+        except etree.XMLSyntaxError as e:
+            self.logger.warning(f"Header scan of {self.path.name} stopped: {e}")
+
+        self.logger.debug(f"Header scan found {len(refs)} schema references")
+        return refs
+
+
+__all__ = ['InstanceDocument']
@@ -17,6 +17,9 @@ Example:
     parser = InstanceParser()
     result = parser.parse_instance(Path("filing.xml"))
     
+    # Or, for a tree already in memory (e.g. transformed iXBRL):
+    # result = parser.parse_tree(xbrl_root, source_path=Path("filing.htm"))
+    
     print(f"Extracted {len(result.facts)} facts")
     print(f"Contexts: {len(result.contexts)}")
     print(f"Units: {len(result.units)}")
@@ -28,8 +31,11 @@ from pathlib import Path
 from dataclasses import dataclass, field
 import time
 
+from lxml import etree
+
 from ...core.config_loader import ConfigLoader
 from ..foundation.xml_parser import XMLParser
+from ..foundation.instance_document import InstanceDocument
 from ..models.fact import Fact
 from ..models.context import Context
 from ..models.unit import Unit
@@ -110,7 +116,11 @@ class InstanceParser:
         
         self.logger.info("InstanceParser initialized")
     
-    def parse_instance(self, instance_path: Path) -> InstanceParseResult:
+    def parse_instance(
+        self,
+        instance_path: Path,
+        document: Optional[InstanceDocument] = None
+    ) -> InstanceParseResult:
         """
         Parse complete XBRL instance document.
         
@@ -122,6 +132,8 @@ class InstanceParser:
         
         Args:
             instance_path: Path to instance XML file
+            document: Shared handle on the instance; its parsed tree is
+                used instead of parsing the file again
             
         Returns:
             InstanceParseResult with extracted data and statistics
@@ -147,58 +159,137 @@ class InstanceParser:
                 raise FileNotFoundError(f"Instance file not found: {instance_path}")
             
             # Parse XML
-            xml_result = self.xml_parser.parse_file(instance_path)
+            if document is not None:
+                xml_result = document.xml_result()
+            else:
+                xml_result = self.xml_parser.parse_file(instance_path)
             if not xml_result.well_formed:
                 result.errors.extend(xml_result.errors)
                 return result
             
-            root = xml_result.root
-            
-            # Extract schema references
-            result.schema_refs = self._extract_schema_refs(root)
-            
-            # Extract namespace map from root element
-            if hasattr(root, 'nsmap') and root.nsmap:
-                result.namespaces = {k if k is not None else 'default': v for k, v in root.nsmap.items()}
-
-            # Parse contexts
-            result.contexts = self._parse_contexts(root, result)
-            result.context_count = len(result.contexts)
-            
-            # Parse units
-            result.units = self._parse_units(root, result)
-            result.unit_count = len(result.units)
-            
-            # Extract facts (with ALL attributes)
-            result.facts = self._extract_facts(root, result)
-            result.fact_count = len(result.facts)
+            self._parse_root(xml_result.root, result)
             
-            # Extract footnotes
-            result.footnotes = self._extract_footnotes(root, result)
-            result.footnote_count = len(result.footnotes)
-            
-            # Link footnotes to facts (bi-directional linking)
-            # This populates fact.footnote_refs based on footnote.fact_refs
-            self._link_footnotes_to_facts(result.facts, result.footnotes)
+        except Exception as e:
+            self._record_failure(result, e)
+        
+        result.parse_time_seconds = time.time() - start_time
+        return result
+    
+    def parse_tree(
+        self,
+        root: etree._Element,
+        source_path: Optional[Path] = None
+    ) -> InstanceParseResult:
+        """
+        Parse an instance document that is already in memory.
+        
+        Used for iXBRL, where the transformer builds the xbrli:xbrl tree
+        directly, so nothing is serialized to disk and re-parsed.
+        
+        Args:
+            root: xbrli:xbrl root element (or an ElementTree)
+            source_path: Document the tree came from, recorded as
+                instance_path and as each fact's source_file
             
-            self.logger.info(
-                f"Instance parsed successfully: {result.fact_count} facts, "
-                f"{result.context_count} contexts, {result.unit_count} units, "
-                f"{result.footnote_count} footnotes"
-            )
+        Returns:
+            InstanceParseResult with extracted data and statistics
             
+        Example:
+            ixbrl_result = ixbrl_parser.parse_ixbrl(html_path)
+            result = parser.parse_tree(ixbrl_result.xbrl_root, source_path=html_path)
+        """
+        if isinstance(root, etree._ElementTree):
+            root = root.getroot()
+        
+        self.logger.info(f"Parsing in-memory instance document: {source_path or '<memory>'}")
+        
+        start_time = time.time()
+        result = InstanceParseResult()
+        result.instance_path = str(source_path) if source_path else None
+        
+        try:
+            self._parse_root(root, result)
         except Exception as e:
-            self.logger.error(f"Instance parsing failed: {e}", exc_info=True)
-            result.errors.append(ParsingError(
-                category=ErrorCategory.XBRL_INVALID,
-                message=f"Failed to parse instance: {e}",
-                severity="ERROR",
-                source_file=str(instance_path)
-            ))
+            self._record_failure(result, e)
         
         result.parse_time_seconds = time.time() - start_time
         return result
     
+    def parse_bytes(
+        self,
+        content: bytes,
+        source_path: Optional[Path] = None
+    ) -> InstanceParseResult:
+        """
+        Parse an instance document from raw XML bytes.
+        
+        Args:
+            content: Instance XML content
+            source_path: Document the content came from (for provenance)
+            
+        Returns:
+            InstanceParseResult with extracted data and statistics
+        """
+        xml_result = self.xml_parser.parse_string(content)
+        if not xml_result.well_formed:
+            result = InstanceParseResult()
+            result.instance_path = str(source_path) if source_path else None
+            result.errors.extend(xml_result.errors)
+            return result
+        
+        return self.parse_tree(xml_result.root, source_path=source_path)
+    
+    def _parse_root(self, root: etree._Element, result: InstanceParseResult) -> None:
+        """
+        Extract everything from a parsed instance root into result.
+        
+        Args:
+            root: xbrli:xbrl root element
+            result: Result to populate (instance_path already set)
+        """
+        # Extract schema references
+        result.schema_refs = self._extract_schema_refs(root)
+        
+        # Extract namespace map from root element
+        if hasattr(root, 'nsmap') and root.nsmap:
+            result.namespaces = {k if k is not None else 'default': v for k, v in root.nsmap.items()}
+
+        # Parse contexts
+        result.contexts = self._parse_contexts(root, result)
+        result.context_count = len(result.contexts)
+        
+        # Parse units
+        result.units = self._parse_units(root, result)
+        result.unit_count = len(result.units)
+        
+        # Extract facts (with ALL attributes)
+        result.facts = self._extract_facts(root, result)
+        result.fact_count = len(result.facts)
+        
+        # Extract footnotes
+        result.footnotes = self._extract_footnotes(root, result)
+        result.footnote_count = len(result.footnotes)
+        
+        # Link footnotes to facts (bi-directional linking)
+        # This populates fact.footnote_refs based on footnote.fact_refs
+        self._link_footnotes_to_facts(result.facts, result.footnotes)
+        
+        self.logger.info(
+            f"Instance parsed successfully: {result.fact_count} facts, "
+            f"{result.context_count} contexts, {result.unit_count} units, "
+            f"{result.footnote_count} footnotes"
+        )
+    
+    def _record_failure(self, result: InstanceParseResult, error: Exception) -> None:
+        """Record an instance parsing failure on result."""
+        self.logger.error(f"Instance parsing failed: {error}", exc_info=True)
+        result.errors.append(ParsingError(
+            category=ErrorCategory.XBRL_INVALID,
+            message=f"Failed to parse instance: {error}",
+            severity="ERROR",
+            source_file=result.instance_path
+        ))
+    
     def _extract_schema_refs(self, root) -> list[str]:
         """
         Extract schema references from instance.
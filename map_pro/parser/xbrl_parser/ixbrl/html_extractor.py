@@ -70,13 +70,19 @@ class HTMLExtractor:
         self.logger = logging.getLogger(__name__)
         self.logger.debug("HTMLExtractor initialized")
     
-    def extract_ix_elements(self, file_path: Path, result) -> list[etree._Element]:
+    def extract_ix_elements(
+        self,
+        file_path: Path,
+        result,
+        tree: Optional[etree._Element] = None
+    ) -> list[etree._Element]:
         """
         Extract all iXBRL elements from HTML document.
         
         Args:
             file_path: Path to HTML/XHTML file
             result: Parse result for error tracking
+            tree: Already parsed document (file_path is not read again)
             
         Returns:
             list of ix: namespace elements
@@ -88,7 +94,8 @@ class HTMLExtractor:
         
         try:
             # Parse HTML document
-            tree = self._parse_html(file_path)
+            if tree is None:
+                tree = self._parse_html(file_path)
             
             # Extract ix: elements
             ix_elements = self._find_ix_elements(tree)
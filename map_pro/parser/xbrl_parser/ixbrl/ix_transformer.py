@@ -15,7 +15,8 @@ Example:
     from ..ixbrl import IXTransformer
     
     transformer = IXTransformer()
-    xbrl_xml = transformer.transform_to_xbrl(ix_elements, result)
+    xbrl_root = transformer.build_xbrl_tree(ix_elements, contexts, units, footnotes, nsmap, result)
+    xbrl_xml = IXTransformer.to_xml_string(xbrl_root)
 """
 
 import logging
@@ -86,9 +87,43 @@ class IXTransformer:
         """
         Transform iXBRL elements to standard XBRL XML.
         
+        String form of build_xbrl_tree(). Prefer build_xbrl_tree() when the
+        result is parsed again in-process.
+        
+        Args:
+            ix_elements: list of ix: namespace elements
+            contexts: list of real xbrli:context elements extracted from HTML
+            units: list of real xbrli:unit elements extracted from HTML
+            footnotes: list of ix:footnote elements extracted from HTML
+            nsmap: Namespace map from HTML root element
+            result: Parse result for error tracking
+            
+        Returns:
+            Standard XBRL XML string ("" on failure)
+        """
+        root = self.build_xbrl_tree(ix_elements, contexts, units, footnotes, nsmap, result)
+        if root is None:
+            return ""
+        return self.to_xml_string(root)
+    
+    def build_xbrl_tree(
+        self,
+        ix_elements: list[etree._Element],
+        contexts: list[etree._Element],
+        units: list[etree._Element],
+        footnotes: list[etree._Element],
+        nsmap: dict[str, str],
+        result
+    ) -> Optional[etree._Element]:
+        """
+        Transform iXBRL elements to a standard XBRL element tree.
+        
         Uses real extracted contexts, units, footnotes, and namespace map from HTML root.
         NO FAKE DATA - all contexts and units must be real.
         
+        Context and unit elements are moved (not copied) from the HTML tree.
+        Each transformed fact keeps the source line of its ix: element.
+        
         Args:
             ix_elements: list of ix: namespace elements
             contexts: list of real xbrli:context elements extracted from HTML
@@ -98,10 +133,10 @@ class IXTransformer:
             result: Parse result for error tracking
             
         Returns:
-            Standard XBRL XML string
+            xbrli:xbrl root element, or None on failure
             
         Example:
-            xbrl_xml = transformer.transform_to_xbrl(
+            xbrl_root = transformer.build_xbrl_tree(
                 ix_elements, 
                 contexts,
                 units,
@@ -159,18 +194,8 @@ class IXTransformer:
                     root.append(footnote_link)
                     self.logger.info(f"Added {len(footnotes)} footnotes to XBRL")
             
-            # Serialize to XML string
-            xbrl_xml = etree.tostring(
-                root,
-                encoding='unicode',
-                pretty_print=True
-            )
-            
-            # Add XML declaration manually
-            xbrl_xml = '<?xml version="1.0" encoding="UTF-8"?>\n' + xbrl_xml
-            
             self.logger.info("Transformation to XBRL complete")
-            return xbrl_xml
+            return root
             
         except Exception as e:
             self.logger.error(f"Failed to transform to XBRL: {e}", exc_info=True)
@@ -179,7 +204,27 @@ class IXTransformer:
                 message=f"Failed to transform to XBRL: {e}",
                 severity=ErrorSeverity.ERROR
             ))
-            return ""
+            return None
+    
+    @staticmethod
+    def to_xml_string(root: etree._Element) -> str:
+        """
+        Serialize a transformed XBRL tree to an XML document string.
+        
+        Args:
+            root: Root element from build_xbrl_tree()
+            
+        Returns:
+            XML string with declaration
+        """
+        xbrl_xml = etree.tostring(
+            root,
+            encoding='unicode',
+            pretty_print=True
+        )
+        
+        # Add XML declaration manually
+        return '<?xml version="1.0" encoding="UTF-8"?>\n' + xbrl_xml
     
     def _create_xbrl_root(self) -> etree._Element:
             """
@@ -279,6 +324,10 @@ class IXTransformer:
         # set fact value
         fact.text = self._get_fact_value(ix_elem)
         
+        # Provenance: point at the ix: element in the source document
+        if ix_elem.sourceline is not None:
+            fact.sourceline = ix_elem.sourceline
+        
         return fact
     
     def _is_fact_element(self, tag: str) -> bool:
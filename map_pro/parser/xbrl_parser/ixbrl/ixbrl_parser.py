@@ -28,6 +28,7 @@ from dataclasses import dataclass, field
 import time
 
 from ...core.config_loader import ConfigLoader
+from ..foundation.instance_document import InstanceDocument
 from ..models.error import ParsingError, ErrorCategory, ErrorSeverity
 from ..ixbrl.constants import (
     IX_NS_2013,
@@ -44,7 +45,7 @@ class IXBRLParseResult:
     Contains extracted XBRL data and statistics.
     """
     # Extracted data (transformed to standard XBRL)
-    xbrl_document: Optional[str] = None  # Transformed XML string
+    xbrl_root: Optional[any] = None  # Transformed XBRL tree (lxml element)
     
     # Statistics
     ixbrl_path: Optional[str] = None
@@ -53,6 +54,10 @@ class IXBRLParseResult:
     continuation_count: int = 0
     parse_time_seconds: float = 0.0
     
+    # ix:nonFraction presentation attributes (sign, scale, format), which
+    # the transformed XBRL does not carry
+    numeric_attributes: list[dict[str, Optional[str]]] = field(default_factory=list)
+    
     # Metadata
     document_type: str = "HTML"  # HTML or XHTML
     ix_version: Optional[str] = None  # iXBRL specification version
@@ -60,6 +65,14 @@ class IXBRLParseResult:
     # Errors
     errors: list[ParsingError] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    
+    @property
+    def xbrl_document(self) -> Optional[str]:
+        """Transformed XBRL as an XML string (serialized on each access)."""
+        if self.xbrl_root is None:
+            return None
+        from ..ixbrl.ix_transformer import IXTransformer
+        return IXTransformer.to_xml_string(self.xbrl_root)
 
 
 class IXBRLParser:
@@ -75,8 +88,8 @@ class IXBRLParser:
         # Parse iXBRL document
         result = parser.parse_ixbrl(Path("filing.html"))
         
-        # Get transformed XBRL
-        xbrl_xml = result.xbrl_document
+        # Get transformed XBRL tree (or result.xbrl_document for XML text)
+        xbrl_root = result.xbrl_root
     """
     
     def __init__(self, config: Optional[ConfigLoader] = None):
@@ -98,7 +111,11 @@ class IXBRLParser:
         
         self.logger.info(f"IXBRLParser initialized (enabled={self.enabled})")
     
-    def parse_ixbrl(self, ixbrl_path: Path) -> IXBRLParseResult:
+    def parse_ixbrl(
+        self,
+        ixbrl_path: Path,
+        document: Optional[InstanceDocument] = None
+    ) -> IXBRLParseResult:
         """
         Parse complete iXBRL document.
         
@@ -107,6 +124,8 @@ class IXBRLParser:
         
         Args:
             ixbrl_path: Path to iXBRL HTML/XHTML file
+            document: Shared handle on the document (XBRLParser passes
+                the one its taxonomy phase already parsed)
             
         Returns:
             IXBRLParseResult with transformed XBRL and statistics
@@ -131,11 +150,14 @@ class IXBRLParser:
             if not ixbrl_path.exists():
                 raise FileNotFoundError(f"iXBRL file not found: {ixbrl_path}")
             
+            if document is None:
+                document = InstanceDocument(ixbrl_path, self.config)
+            
             # Detect document type
-            result.document_type = self._detect_document_type(ixbrl_path)
+            result.document_type = self._detect_document_type(document)
             
             # Extract all iXBRL data from HTML
-            extraction_data = self._extract_all_ixbrl_data(ixbrl_path, result)
+            extraction_data = self._extract_all_ixbrl_data(document, result)
             
             ix_elements = extraction_data['ix_elements']
             contexts = extraction_data['contexts']
@@ -151,7 +173,7 @@ class IXBRLParser:
             )
             
             # Transform to standard XBRL using real extracted data
-            result.xbrl_document = self._transform_to_xbrl(
+            result.xbrl_root = self._transform_to_xbrl(
                 ix_elements,
                 contexts,
                 units,
@@ -160,6 +182,8 @@ class IXBRLParser:
                 result
             )
             
+            result.numeric_attributes = self._collect_numeric_attributes(ix_elements)
+            
             # Update statistics
             result.fact_count = len([e for e in ix_elements if self._is_fact_element(e)])
             result.hidden_fact_count = len([e for e in ix_elements if self._is_hidden(e)])
@@ -181,19 +205,18 @@ class IXBRLParser:
         result.parse_time_seconds = time.time() - start_time
         return result
     
-    def _detect_document_type(self, file_path: Path) -> str:
+    def _detect_document_type(self, document: InstanceDocument) -> str:
         """
         Detect if document is HTML or XHTML.
         
         Args:
-            file_path: Path to file
+            document: iXBRL document handle
             
         Returns:
             'HTML' or 'XHTML'
         """
         # Read first few lines
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            header = f.read(1024).lower()
+        header = document.header().lower()
         
         # Check for XHTML doctype
         if 'xhtml' in header:
@@ -201,7 +224,7 @@ class IXBRLParser:
         
         return 'HTML'
     
-    def _extract_all_ixbrl_data(self, file_path: Path, result: IXBRLParseResult) -> dict:
+    def _extract_all_ixbrl_data(self, document: InstanceDocument, result: IXBRLParseResult) -> dict:
         """
         Extract ALL iXBRL data from HTML document.
         
@@ -214,7 +237,7 @@ class IXBRLParser:
         - Namespace map from root element
         
         Args:
-            file_path: Path to iXBRL file
+            document: iXBRL document handle (parsed once, shared)
             result: Parse result for error tracking
             
         Returns:
@@ -225,24 +248,14 @@ class IXBRLParser:
         if self._html_extractor is None:
             self._html_extractor = HTMLExtractor(self.config)
         
-        # Parse HTML once
-        with open(file_path, 'rb') as f:
-            content = f.read()
-        
-        # Try XHTML parser first
-        try:
-            from lxml import etree
-            tree = etree.fromstring(content)
-        except etree.XMLSyntaxError:
-            # Fall back to HTML parser
-            from lxml import html as lxml_html
-            tree = lxml_html.fromstring(content)
+        # Parse HTML once (XHTML first, HTML parser as fallback)
+        tree = document.inline_root()
         
         # Extract namespace map from root element
         nsmap = self._html_extractor.extract_namespace_map(tree)
         
         # Extract ix: fact elements
-        ix_elements = self._html_extractor.extract_ix_elements(file_path, result)
+        ix_elements = self._html_extractor.extract_ix_elements(document.path, result, tree=tree)
         
         # Extract real contexts from HTML
         contexts = self._html_extractor.extract_contexts(tree)
@@ -293,9 +306,9 @@ class IXBRLParser:
         footnotes: list,
         nsmap: dict[str, str],
         result: IXBRLParseResult
-    ) -> str:
+    ):
         """
-        Transform iXBRL elements to standard XBRL XML.
+        Transform iXBRL elements to a standard XBRL element tree.
         
         Uses real extracted contexts, units, footnotes, and namespace map.
         
@@ -308,14 +321,14 @@ class IXBRLParser:
             result: Parse result for error tracking
             
         Returns:
-            Standard XBRL XML string
+            xbrli:xbrl root element, or None if transformation failed
         """
         from ..ixbrl.ix_transformer import IXTransformer
         
         if self._transformer is None:
             self._transformer = IXTransformer(self.config)
         
-        return self._transformer.transform_to_xbrl(
+        return self._transformer.build_xbrl_tree(
             ix_elements,
             contexts,
             units,
@@ -324,6 +337,31 @@ class IXBRLParser:
             result
         )
     
+    def _collect_numeric_attributes(self, ix_elements: list) -> list[dict[str, Optional[str]]]:
+        """
+        Collect the attributes of ix:nonFraction elements.
+        
+        Args:
+            ix_elements: Extracted ix: elements
+            
+        Returns:
+            One dictionary per nonFraction element (concept, context_ref,
+            id, sign, scale, format)
+        """
+        attributes = []
+        for element in ix_elements:
+            if not isinstance(element.tag, str) or 'nonfraction' not in element.tag.lower():
+                continue
+            attributes.append({
+                'concept': element.get('name'),
+                'context_ref': element.get('contextRef'),
+                'id': element.get('id'),
+                'sign': element.get('sign'),
+                'scale': element.get('scale'),
+                'format': element.get('format'),
+            })
+        return attributes
+    
     def _is_fact_element(self, element) -> bool:
         """Check if element is an iXBRL fact."""
         if not hasattr(element, 'tag'):
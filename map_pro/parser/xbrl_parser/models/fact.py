@@ -242,6 +242,45 @@ class Fact:
         }
 
 
+    @classmethod
+    def from_record(cls, record: dict[str, any]) -> 'Fact':
+        """
+        Rebuild a fact from its parsed.json dictionary (e.g. a fact spool
+        record).
+        
+        Errors and warnings are not restored (records only keep counts).
+        
+        Args:
+            record: Fact dictionary as written by JSONSerializer
+            
+        Returns:
+            Fact
+        """
+        fact_type = record.get('fact_type')
+        reliability = record.get('reliability')
+        source_file = record.get('source_file')
+        return cls(
+            concept=record['concept'],
+            value=record.get('value'),
+            context_ref=record.get('context_ref'),
+            unit_ref=record.get('unit_ref'),
+            decimals=record.get('decimals'),
+            precision=record.get('precision'),
+            id=record.get('id'),
+            is_nil=bool(record.get('is_nil', False)),
+            fact_type=FactType(fact_type) if fact_type else FactType.TEXT,
+            language=record.get('language'),
+            footnote_refs=list(record.get('footnote_refs') or []),
+            tuple_parent=record.get('tuple_parent'),
+            tuple_order=record.get('tuple_order'),
+            reliability=FactReliability(reliability) if reliability else FactReliability.HIGH,
+            source_component=record.get('source_component'),
+            source_file=Path(source_file) if source_file else None,
+            source_line=record.get('source_line'),
+            source_element=record.get('source_element'),
+        )
+
+
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
@@ -14,7 +14,7 @@ This module defines:
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 from datetime import datetime
 from pathlib import Path
 
@@ -179,6 +179,13 @@ class InstanceData:
         
         fact_count_by_concept: Fact counts by concept
         fact_count_by_type: Fact counts by type
+        
+        fact_spool: FactSpool holding serialized facts when the filing was
+            parsed in streaming mode (facts is then empty)
+        
+        source_format: Instance document format ('ixbrl' or 'xbrl')
+        ix_numeric_attributes: Attributes of each ix:nonFraction element
+            (concept, context_ref, id, sign, scale, format); iXBRL only
     """
     facts: list[Fact] = field(default_factory=list)
     contexts: dict[str, Context] = field(default_factory=dict)
@@ -189,6 +196,38 @@ class InstanceData:
     fact_count_by_concept: dict[str, int] = field(default_factory=dict)
     fact_count_by_type: dict[str, int] = field(default_factory=dict)
     
+    fact_spool: Optional[any] = field(default=None, repr=False, compare=False)
+    
+    source_format: Optional[str] = None
+    ix_numeric_attributes: list[dict[str, Optional[str]]] = field(
+        default_factory=list, repr=False
+    )
+    
+    @property
+    def is_streamed(self) -> bool:
+        """True if facts were streamed to a spool instead of kept in memory."""
+        return self.fact_spool is not None
+    
+    @property
+    def total_facts(self) -> int:
+        """Number of facts, including streamed facts."""
+        if self.fact_spool is not None:
+            return len(self.fact_spool)
+        return len(self.facts)
+    
+    def iter_facts(self) -> Iterator[Fact]:
+        """
+        All facts in document order, including streamed facts.
+        
+        Streamed facts are read back from the fact spool (one pass over
+        the file per call), so prefer a single iteration for large filings.
+        """
+        if self.fact_spool is not None:
+            for record in self.fact_spool:
+                yield Fact.from_record(record)
+            return
+        yield from self.facts
+    
     def get_context(self, context_id: str) -> Optional[Context]:
         """Get context by ID."""
         return self.contexts.get(context_id)
@@ -199,12 +238,12 @@ class InstanceData:
     
     def get_facts_by_concept(self, concept: str) -> list[Fact]:
         """Get all facts for specific concept."""
-        return [f for f in self.facts if f.concept == concept]
+        return [f for f in self.iter_facts() if f.concept == concept]
     
     def to_dict(self) -> dict[str, any]:
         """Convert to dictionary."""
         return {
-            'fact_count': len(self.facts),
+            'fact_count': self.total_facts,
             'context_count': len(self.contexts),
             'unit_count': len(self.units),
             'footnote_count': len(self.footnotes),
@@ -28,6 +28,7 @@ class Phase(str, Enum):
     TAXONOMY_LOADING = "taxonomy_loading"
     INSTANCE_PARSING = "instance_parsing"
     VALIDATION = "validation"
+    MARKET_VALIDATION = "market_validation"
     INDEXING = "indexing"
     SERIALIZATION = "serialization"
     TOTAL = "total"
@@ -24,6 +24,10 @@ from .parser_modes import ParsingMode, get_mode_config
 from .models.parsed_filing import ParsedFiling, FilingMetadata
 from .models.error import ErrorSeverity
 from .entry_point_detector import EntryPointDetector
+from .constants import STREAMING_SPOOL_DIRNAME
+from .foundation.instance_document import InstanceDocument
+from .observability.performance import PerformanceMonitor, Phase
+from .serialization.constants import INSTANCE_FORMAT_IXBRL, INSTANCE_FORMAT_XBRL
 from ..core.config_loader import ConfigLoader
 from ..loaders import XBRLFilingsLoader, TaxonomyLoader
 
@@ -84,11 +88,13 @@ class XBRLParser:
         self._taxonomy_service = None
         self._instance_parser = None
         self._ixbrl_parser = None
+        self._streaming_parser = None
         self._validation_registry = None
         self._market_registry = None
         self._serializer = None
         self._metrics = None
         self._profiler = None
+        self._performance = PerformanceMonitor()
 
         # Progress tracking
         self.progress = ParsingProgress()
@@ -131,9 +137,11 @@ class XBRLParser:
         self.logger.info(f"Starting parse: {filing_path}")
         self.logger.info(f"Mode: {self.mode.value}")
         
-        # Initialize progress
+        # Initialize progress and per-phase timings
         self.progress = ParsingProgress()
         self._notify_progress(progress_callback)
+        self._performance.reset()
+        self._performance.start()
         
         # Initialize metrics if enabled
         if self.mode_config.enable_metrics:
@@ -146,27 +154,39 @@ class XBRLParser:
                 self._start_profiling()
             
             # Phase 1: Discovery (0-15%)
-            entry_point = self._phase_discovery(filing_path, progress_callback)
+            with self._performance.phase_context(Phase.DISCOVERY):
+                document = self._phase_discovery(filing_path, progress_callback)
             
             # Phase 2: Taxonomy Loading (15-35%)
             taxonomy = None
             if self.mode_config.load_taxonomy:
-                taxonomy = self._phase_taxonomy(entry_point, progress_callback)
+                with self._performance.phase_context(Phase.TAXONOMY_LOADING):
+                    taxonomy = self._phase_taxonomy(document, progress_callback)
             
             # Phase 3: Instance Parsing (35-60%)
-            parsed_filing = self._phase_extraction(entry_point, taxonomy, progress_callback)
+            with self._performance.phase_context(Phase.INSTANCE_PARSING):
+                try:
+                    parsed_filing = self._phase_extraction(document, taxonomy, progress_callback)
+                finally:
+                    document.release()
             
             # Phase 4: Core Validation (60-75%)
             if self.mode_config.validate_structure:
-                self._phase_validation(parsed_filing, progress_callback)
+                with self._performance.phase_context(Phase.VALIDATION):
+                    self._phase_validation(parsed_filing, progress_callback)
             
             # Phase 5: Market Validation (75-85%)
             if self.mode_config.market_validation:
-                self._phase_market_validation(parsed_filing, progress_callback)
+                with self._performance.phase_context(Phase.MARKET_VALIDATION):
+                    self._phase_market_validation(parsed_filing, progress_callback)
             
             # Phase 6: Serialization (85-100%)
             if self.mode_config.serialize_output:
-                self._phase_serialization(parsed_filing, output_path, progress_callback)
+                with self._performance.phase_context(Phase.SERIALIZATION):
+                    self._phase_serialization(parsed_filing, output_path, progress_callback)
+            
+            self._performance.end()
+            self._log_phase_timings()
             
             # Stop profiling
             if self.mode_config.enable_profiling:
@@ -180,7 +200,7 @@ class XBRLParser:
             if self.mode_config.enable_metrics:
                 self._metrics.increment('parse_completed')
                 self._metrics.timer('parse_duration', time.time() - self.progress.start_time)
-                self._metrics.gauge('facts_extracted', len(parsed_filing.instance.facts))
+                self._metrics.gauge('facts_extracted', parsed_filing.instance.total_facts)
                 
                 # ErrorCollection uses count_by_severity() method, not properties
                 counts = parsed_filing.errors.count_by_severity()
@@ -190,7 +210,7 @@ class XBRLParser:
             
             # ErrorCollection uses count_by_severity() method
             counts = parsed_filing.errors.count_by_severity()
-            self.logger.info(f"Facts: {len(parsed_filing.instance.facts)}, " +
+            self.logger.info(f"Facts: {parsed_filing.instance.total_facts}, " +
                            f"Errors: {counts[ErrorSeverity.ERROR]}, " +
                            f"Warnings: {counts[ErrorSeverity.WARNING]}")
             
@@ -206,8 +226,14 @@ class XBRLParser:
             
             raise
     
-    def _phase_discovery(self, filing_path: Path, progress_callback: Optional[Callable]) -> Path:
-        """Phase 1: Discovery - Find entry point file."""
+    def _phase_discovery(self, filing_path: Path,
+                         progress_callback: Optional[Callable]) -> InstanceDocument:
+        """
+        Phase 1: Discovery - Find entry point file.
+        
+        Returns the handle on the instance document that the taxonomy and
+        extraction phases share, so the file is read and parsed once.
+        """
         self.progress.update("discovery", 5, "Discovering entry point")
         self._notify_progress(progress_callback)
         
@@ -215,16 +241,22 @@ class XBRLParser:
         
         # If it's a file, use it directly
         if filing_path.is_file():
-            self.logger.info(f"Entry point: {filing_path.name}")
-            return filing_path
+            entry_point = filing_path
+            self.logger.info(f"Entry point: {entry_point.name}")
         
         # If it's a directory, find entry point using loader
-        if filing_path.is_dir():
+        elif filing_path.is_dir():
             entry_point = self._find_entry_point(filing_path)
             self.logger.info(f"Entry point found: {entry_point.name}")
-            return entry_point
         
-        raise ValueError(f"Invalid filing path: {filing_path}")
+        else:
+            raise ValueError(f"Invalid filing path: {filing_path}")
+        
+        # Streaming extraction never builds the tree: the taxonomy phase
+        # then only scans the document header for schemaRefs
+        document = InstanceDocument(entry_point, self.config)
+        document.build_tree = not self._should_stream(entry_point, document.is_inline)
+        return document
     
     def _find_entry_point(self, directory: Path) -> Path:
         """
@@ -267,7 +299,7 @@ class XBRLParser:
         return instance_file
     
     
-    def _phase_taxonomy(self, entry_point: Path, progress_callback: Optional[Callable]) -> any:
+    def _phase_taxonomy(self, document: InstanceDocument, progress_callback: Optional[Callable]) -> any:
         """Phase 2: Taxonomy Loading."""
         self.progress.update("taxonomy", 20, "Loading taxonomy")
         self._notify_progress(progress_callback)
@@ -281,7 +313,7 @@ class XBRLParser:
         
         # Load taxonomy
         try:
-            taxonomy = self._taxonomy_service.load_from_instance(entry_point)
+            taxonomy = self._taxonomy_service.load_from_instance(document.path, document)
             self.logger.info(f"Taxonomy loaded: {len(taxonomy.concepts) if hasattr(taxonomy, 'concepts') else 0} concepts")
             return taxonomy
         except Exception as e:
@@ -289,7 +321,7 @@ class XBRLParser:
             from .models.parsed_filing import TaxonomyData
             return TaxonomyData()
     
-    def _phase_extraction(self, entry_point: Path, taxonomy: any,
+    def _phase_extraction(self, document: InstanceDocument, taxonomy: any,
                           progress_callback: Optional[Callable]) -> ParsedFiling:
         """Phase 3: Instance Parsing - Extract facts and data."""
         self.progress.update("extraction", 40, "Parsing instance")
@@ -297,32 +329,34 @@ class XBRLParser:
         
         self.logger.info("Phase 3: Instance Parsing")
         
-        # Determine if inline XBRL
-        is_inline = entry_point.suffix.lower() in ['.xhtml', '.html', '.htm']
+        entry_point = document.path
+        is_inline = document.is_inline
+        fact_spool = None
+        numeric_attributes = []
         
-        if is_inline:
+        if not document.build_tree:
+            self.logger.info("Using streaming extraction")
+            result, fact_spool = self._extract_streaming(entry_point, progress_callback)
+        elif is_inline:
             self.logger.info("Detected inline XBRL format")
             if not self._ixbrl_parser:
                 from .ixbrl.ixbrl_parser import IXBRLParser
                 self._ixbrl_parser = IXBRLParser(config=self.config)
             
-            ixbrl_result = self._ixbrl_parser.parse_ixbrl(entry_point)
+            ixbrl_result = self._ixbrl_parser.parse_ixbrl(entry_point, document)
+            numeric_attributes = ixbrl_result.numeric_attributes
             
-            # iXBRL returns transformed XML - parse with instance parser
-            if ixbrl_result.xbrl_document:
+            # iXBRL returns the transformed XBRL tree - parse it in memory.
+            # Facts keep the .htm path and source lines for provenance.
+            if ixbrl_result.xbrl_root is not None:
                 if not self._instance_parser:
                     from .instance.instance_parser import InstanceParser
                     self._instance_parser = InstanceParser(config=self.config)
                 
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as tmp:
-                    tmp.write(ixbrl_result.xbrl_document)
-                    tmp_path = Path(tmp.name)
-                
-                try:
-                    result = self._instance_parser.parse_instance(tmp_path)
-                finally:
-                    tmp_path.unlink()
+                result = self._instance_parser.parse_tree(
+                    ixbrl_result.xbrl_root,
+                    source_path=entry_point
+                )
                 
                 result.errors.extend(ixbrl_result.errors)
             else:
@@ -335,7 +369,7 @@ class XBRLParser:
                 from .instance.instance_parser import InstanceParser
                 self._instance_parser = InstanceParser(config=self.config)
             
-            result = self._instance_parser.parse_instance(entry_point)
+            result = self._instance_parser.parse_instance(entry_point, document)
         
         # Create ParsedFiling
         from .models.parsed_filing import InstanceData
@@ -376,11 +410,14 @@ class XBRLParser:
 
         # Create InstanceData
         instance_data = InstanceData(
-            facts=result.facts,
+            facts=result.facts if fact_spool is None else [],
             contexts=result.contexts,
             units=result.units,
             namespaces=result.namespaces if hasattr(result, 'namespaces') else {},
-            footnotes={fn_id: fn.content for fn_id, fn in result.footnotes.items()} if result.footnotes else {}
+            footnotes={fn_id: fn.content for fn_id, fn in result.footnotes.items()} if result.footnotes else {},
+            fact_spool=fact_spool,
+            source_format=INSTANCE_FORMAT_IXBRL if is_inline else INSTANCE_FORMAT_XBRL,
+            ix_numeric_attributes=numeric_attributes
         )
         
         parsed_filing.instance = instance_data
@@ -390,11 +427,98 @@ class XBRLParser:
         for error in result.errors:
             parsed_filing.errors.add(error)
         
-        self.logger.info(f"Extraction complete: {len(result.facts)} facts, " +
+        self.logger.info(f"Extraction complete: {instance_data.total_facts} facts, " +
                         f"{len(result.contexts)} contexts, {len(result.units)} units")
         
         return parsed_filing
     
+    def _should_stream(self, entry_point: Path, is_inline: bool) -> bool:
+        """
+        Decide whether to use streaming extraction.
+        
+        Streaming is used when the mode requests it, or automatically when
+        enable_streaming is set and the instance exceeds streaming_threshold_mb.
+        Inline XBRL always uses the standard path: the HTML document has to
+        be transformed as a whole before facts exist.
+        """
+        use_streaming = self.mode_config.streaming_mode
+        
+        if not use_streaming and self.config.get('enable_streaming', False):
+            from .streaming import should_use_streaming
+            threshold_mb = self.config.get('streaming_threshold_mb')
+            use_streaming = should_use_streaming(entry_point, threshold_mb)
+            if use_streaming:
+                self.logger.info(
+                    f"Instance exceeds {threshold_mb}MB - selecting streaming extraction"
+                )
+        
+        if use_streaming and is_inline:
+            self.logger.info(
+                "Streaming not available for inline XBRL - using standard extraction"
+            )
+            return False
+        
+        return use_streaming
+    
+    def _extract_streaming(self, entry_point: Path,
+                           progress_callback: Optional[Callable]) -> tuple:
+        """
+        Extract facts with StreamingParser, spooling serialized facts to disk.
+        
+        Returns an InstanceParseResult whose facts list only holds the
+        leading facts needed for DEI metadata extraction, plus the FactSpool
+        with every fact (written to parsed.json by JSONSerializer.write()).
+        """
+        from .streaming import StreamingParser, FactSpool
+        from .serialization.json_serializer import JSONSerializer
+        from .metadata_extractor import MetadataExtractor
+        
+        if not self._streaming_parser:
+            self._streaming_parser = StreamingParser(
+                batch_size=self.config.get('streaming_batch_size'),
+                memory_threshold_mb=self.config.get('memory_cleanup_threshold_mb'),
+                config=self.config
+            )
+        if not self._serializer:
+            self._serializer = JSONSerializer(self.config)
+        
+        spool_dir = Path(self.config.get('output_dir')) / STREAMING_SPOOL_DIRNAME
+        fact_spool = FactSpool(spool_dir, prefix=entry_point.stem)
+        head_facts = []
+        head_limit = MetadataExtractor.DEI_SEARCH_LIMIT
+        
+        try:
+            for batch in self._streaming_parser.parse_stream(entry_point):
+                if len(head_facts) < head_limit:
+                    head_facts.extend(batch.facts[:head_limit - len(head_facts)])
+                
+                fact_spool.append(
+                    (self._serializer.serialize_fact(f, batch.contexts, batch.units)
+                     for f in batch.facts),
+                    encoder_cls=self._serializer.encoder_cls
+                )
+                
+                self.progress.update(
+                    "extraction", 40,
+                    f"Streamed {batch.total_facts_so_far} facts"
+                )
+                self._notify_progress(progress_callback)
+        except Exception:
+            fact_spool.discard()
+            raise
+        
+        fact_spool.close()
+        
+        result = self._streaming_parser.result
+        result.facts = head_facts
+        
+        self.logger.info(
+            f"Streamed {len(fact_spool)} facts in "
+            f"{self._streaming_parser.total_batches} batches to {fact_spool.path}"
+        )
+        
+        return result, fact_spool
+    
     def _phase_validation(self, filing: ParsedFiling, progress_callback: Optional[Callable]) -> None:
         """Phase 4: Core Validation."""
         self.progress.update("validation", 65, "Validating structure")
@@ -406,6 +530,11 @@ class XBRLParser:
             from .validation.registry import ValidationRegistry
             self._validation_registry = ValidationRegistry(config=self.config)
         
+        if filing.instance.is_streamed:
+            self.logger.info(
+                "Facts were streamed to disk - validating contexts and units only"
+            )
+        
         validation_summary = self._validation_registry.validate_filing(filing)
         
         all_errors = []
@@ -452,6 +581,15 @@ class XBRLParser:
         
         self.logger.info("Serialization phase complete (output handled by parser.py)")
     
+    def _log_phase_timings(self) -> None:
+        """Log how long each phase of the last parse took."""
+        report = self._performance.get_report()
+        timings = ", ".join(
+            f"{phase} {metrics['duration']:.3f}s"
+            for phase, metrics in report['phases'].items()
+        )
+        self.logger.info(f"Phase timings: {timings} (total {report['total_duration']:.3f}s)")
+    
     def _notify_progress(self, callback: Optional[Callable]) -> None:
         """Notify progress callback if provided."""
         if callback:
@@ -490,7 +628,8 @@ class XBRLParser:
         """Get parser statistics."""
         stats = {
             'mode': self.mode.value,
-            'progress': self.progress.to_dict()
+            'progress': self.progress.to_dict(),
+            'performance': self._performance.get_report()
         }
         if self._metrics:
             stats['metrics'] = self._metrics.get_summary()
@@ -6,6 +6,10 @@ Components for serializing XBRL parsed data.
 
 This module provides:
 - JSON serialization (full, compact, debug, anonymized)
+- Streaming JSON writer (incremental, optional gzip/compact whitespace)
+- Columnar facts sidecar (parsed.facts.bin) for fast downstream loading
+- Instance scan sidecar (parsed.instance.json): contexts, dimensions and
+  ix:nonFraction attributes, so later stages need not re-read the instance
 - Checkpoint system (save/resume parsing state)
 - Schema migration (version compatibility)
 - Constants (formats, versions, settings)
@@ -37,6 +41,13 @@ from ..serialization.json_serializer import (
     JSONSerializer,
     JSONEncoder
 )
+from ..serialization.json_stream import (
+    JSONStreamWriter,
+    LazyDict,
+    LazyList
+)
+from ..serialization.facts_sidecar import FactsSidecarWriter
+from ..serialization.instance_sidecar import InstanceSidecarWriter
 from ..serialization.checkpoint import CheckpointManager
 from ..serialization.migration import (
     SchemaMigrator,
@@ -49,6 +60,11 @@ __all__ = [
     # JSON Serialization
     'JSONSerializer',
     'JSONEncoder',
+    'JSONStreamWriter',
+    'LazyDict',
+    'LazyList',
+    'FactsSidecarWriter',
+    'InstanceSidecarWriter',
     
     # Checkpoints
     'CheckpointManager',
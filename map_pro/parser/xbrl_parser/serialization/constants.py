@@ -51,6 +51,11 @@ MAX_DECIMAL_PLACES = 10
 ISO_DATE_FORMAT = "%Y-%m-%d"
 ISO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+# Separators (same as json.dumps: pretty output uses ': ', compact ':')
+JSON_ITEM_SEPARATOR = ","
+JSON_KEY_SEPARATOR = ": "
+JSON_COMPACT_KEY_SEPARATOR = ":"
+
 # ==============================================================================
 # CHECKPOINT CONFIGURATION
 # ==============================================================================
@@ -123,6 +128,29 @@ DEFAULT_COMPRESSION_LEVEL = 6
 COMPRESSION_GZIP = "gzip"
 COMPRESSION_NONE = "none"
 
+# ==============================================================================
+# COLUMNAR FACTS SIDECAR
+# ==============================================================================
+
+# Sidecar next to parsed.json: parsed.json -> parsed.facts.bin
+FACTS_SIDECAR_SUFFIX = ".facts.bin"
+
+# File signature and format version
+FACTS_SIDECAR_MAGIC = b"XBRLFCT1"
+FACTS_SIDECAR_VERSION = 1
+
+# ==============================================================================
+# INSTANCE SCAN SIDECAR
+# ==============================================================================
+
+# Sidecar next to parsed.json: parsed.json -> parsed.instance.json
+INSTANCE_SIDECAR_SUFFIX = ".instance.json"
+INSTANCE_SIDECAR_VERSION = 1
+
+# Instance document formats
+INSTANCE_FORMAT_IXBRL = "ixbrl"
+INSTANCE_FORMAT_XBRL = "xbrl"
+
 # ==============================================================================
 # FILE NAMING
 # ==============================================================================
@@ -195,6 +223,9 @@ __all__ = [
     'MAX_DECIMAL_PLACES',
     'ISO_DATE_FORMAT',
     'ISO_DATETIME_FORMAT',
+    'JSON_ITEM_SEPARATOR',
+    'JSON_KEY_SEPARATOR',
+    'JSON_COMPACT_KEY_SEPARATOR',
     
     # Checkpoint settings
     'CHECKPOINT_EXTENSION',
@@ -214,6 +245,17 @@ __all__ = [
     'COMPRESSION_GZIP',
     'COMPRESSION_NONE',
     
+    # Columnar facts sidecar
+    'FACTS_SIDECAR_SUFFIX',
+    'FACTS_SIDECAR_MAGIC',
+    'FACTS_SIDECAR_VERSION',
+    
+    # Instance scan sidecar
+    'INSTANCE_SIDECAR_SUFFIX',
+    'INSTANCE_SIDECAR_VERSION',
+    'INSTANCE_FORMAT_IXBRL',
+    'INSTANCE_FORMAT_XBRL',
+    
     # File naming
     'OUTPUT_FILENAME_PATTERN',
     'CHECKPOINT_FILENAME_PATTERN',
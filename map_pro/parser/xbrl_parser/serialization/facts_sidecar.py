@@ -0,0 +1,292 @@
+# Path: xbrl_parser/serialization/facts_sidecar.py
+"""
+Columnar Facts Sidecar
+
+Binary companion to parsed.json for fast downstream loading.
+
+parsed.json repeats every key (and a dozen nulls) for each fact, so every
+consumer pays for parsing the whole document. The sidecar stores the same
+facts column by column with interned values, plus the rest of the
+document (metadata, contexts, units, namespaces, ...) in its header.
+Readers can take the document without touching facts, and decode facts
+row by row from memory-mapped columns.
+
+FILE LAYOUT (parsed.facts.bin, little-endian):
+    magic        8 bytes   FACTS_SIDECAR_MAGIC
+    header_len   uint32
+    header       UTF-8 JSON, space-padded so blocks start 8-byte aligned
+    blocks       8-byte aligned arrays, offsets relative to file start
+
+HEADER:
+    version      FACTS_SIDECAR_VERSION
+    fact_count   Number of facts (rows)
+    source       {'size', 'mtime_ns'} of the parsed.json this mirrors;
+                 readers ignore the sidecar when parsed.json differs
+    document     parsed.json without instance.facts
+    columns      [{'name', 'offset'}] one int32 column per fact key:
+                 index into the value pool, -1 = null
+    numeric      {'offset'} float64 column: numeric fact value, NaN if
+                 nil or not a number
+    pool         {'count', 'offsets', 'data', 'data_length'}: uint64
+                 end offsets of each entry in the UTF-8 data block; each
+                 entry is the JSON text of one distinct value
+
+The reader is library/loaders/facts_sidecar.py (FactColumns): the
+library's ParsedReader takes the document from the header and skips facts,
+falling back to parsed.json when no valid sidecar exists. Consumers that
+need every fact as a dictionary read parsed.json, which is faster than
+rebuilding rows from the columns.
+
+Example:
+    writer = FactsSidecarWriter(serializer)
+    writer.write(parsed_filing, Path('parsed.json'))
+"""
+
+import json
+import logging
+import math
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Optional
+
+from ..models.parsed_filing import ParsedFiling
+from ..serialization.json_serializer import JSONSerializer
+from ..serialization.json_stream import LazyDict, LazyList
+from ..serialization.constants import (
+    JSON_ENCODING,
+    FACTS_SIDECAR_SUFFIX,
+    FACTS_SIDECAR_MAGIC,
+    FACTS_SIDECAR_VERSION,
+)
+
+ALIGNMENT = 8
+
+
+def sidecar_path(json_path: Path) -> Path:
+    """Get the sidecar path for a parsed.json path."""
+    json_path = Path(json_path)
+    return json_path.with_name(json_path.stem + FACTS_SIDECAR_SUFFIX)
+
+
+class FactsSidecarWriter:
+    """
+    Writes the columnar facts sidecar for a parsed filing.
+
+    Must run after parsed.json has been written (the sidecar records its
+    size and modification time).
+
+    Example:
+        serializer = JSONSerializer()
+        serializer.write(filing, json_path)
+        FactsSidecarWriter(serializer).write(filing, json_path)
+    """
+
+    def __init__(self, serializer: Optional[JSONSerializer] = None):
+        """
+        Initialize sidecar writer.
+
+        Args:
+            serializer: Serializer producing the fact records and document;
+                pass the one that wrote parsed.json so the sidecar keeps
+                its _meta
+        """
+        self.serializer = serializer or JSONSerializer()
+        self.logger = logging.getLogger(__name__)
+
+    def write(self, filing: ParsedFiling, json_path: Path) -> Path:
+        """
+        Write parsed.facts.bin next to json_path.
+
+        Args:
+            filing: Parsed filing that was written to json_path
+            json_path: The parsed.json it mirrors
+
+        Returns:
+            Path to sidecar
+        """
+        json_path = Path(json_path)
+        output_path = sidecar_path(json_path)
+
+        encoder = self.serializer.encoder_cls(ensure_ascii=False)
+        pool_index: dict[str, int] = {}
+        pool_data: list[bytes] = []
+        pool_ends = array('Q')
+        pool_size = 0
+
+        columns: dict[str, array] = {}
+        numeric = array('d')
+        count = 0
+
+        for record in self.serializer.iter_fact_records(filing):
+            for name, value in record.items():
+                column = columns.get(name)
+                if column is None:
+                    # Key first seen now: earlier rows are null
+                    column = columns[name] = array('i', [-1]) * count
+
+                if value is None:
+                    column.append(-1)
+                    continue
+
+                text = encoder.encode(value)
+                index = pool_index.get(text)
+                if index is None:
+                    index = pool_index[text] = len(pool_data)
+                    data = text.encode(JSON_ENCODING)
+                    pool_data.append(data)
+                    pool_size += len(data)
+                    pool_ends.append(pool_size)
+                column.append(index)
+
+            count += 1
+            for column in columns.values():
+                if len(column) < count:
+                    column.append(-1)
+
+            numeric.append(self._numeric_value(record))
+
+        header = {
+            'version': FACTS_SIDECAR_VERSION,
+            'fact_count': count,
+            'source': self._source_stamp(json_path),
+            'document': self._document_without_facts(filing),
+        }
+
+        blocks = [(name, column) for name, column in columns.items()]
+        blocks.append(('__numeric__', numeric))
+        blocks.append(('__pool_offsets__', pool_ends))
+
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        try:
+            self._write_file(tmp_path, header, blocks, b''.join(pool_data), len(pool_data))
+            os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        self.logger.info(
+            f"Wrote facts sidecar: {count} facts, {len(columns)} columns, "
+            f"{len(pool_data)} distinct values, "
+            f"{output_path.stat().st_size / 1024:.1f}KB"
+        )
+        return output_path
+
+    @staticmethod
+    def remove(json_path: Path) -> None:
+        """Delete a sidecar so it cannot go stale next to a new parsed.json."""
+        try:
+            sidecar_path(json_path).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write_file(
+        self,
+        path: Path,
+        header: dict,
+        blocks: list[tuple[str, array]],
+        pool_blob: bytes,
+        pool_count: int
+    ) -> None:
+        """Lay out header and blocks; offsets depend on the header length."""
+        # Offsets are digits in the header, so iterate until the header
+        # length is stable (at most a couple of passes)
+        header_len = 0
+        while True:
+            offset = self._align(len(FACTS_SIDECAR_MAGIC) + 4 + header_len)
+            layout = {}
+            for name, block in blocks:
+                layout[name] = offset
+                offset = self._align(offset + len(block) * block.itemsize)
+            data_offset = offset
+
+            header['columns'] = [
+                {'name': name, 'offset': layout[name]}
+                for name, _ in blocks[:-2]
+            ]
+            header['numeric'] = {'offset': layout['__numeric__']}
+            header['pool'] = {
+                'count': pool_count,
+                'offsets': layout['__pool_offsets__'],
+                'data': data_offset,
+                'data_length': len(pool_blob),
+            }
+
+            header_bytes = json.dumps(
+                header, cls=self.serializer.encoder_cls, ensure_ascii=False
+            ).encode(JSON_ENCODING)
+            padded_len = self._align(len(FACTS_SIDECAR_MAGIC) + 4 + len(header_bytes)) \
+                - len(FACTS_SIDECAR_MAGIC) - 4
+            if padded_len == header_len:
+                break
+            header_len = padded_len
+
+        with open(path, 'wb') as f:
+            f.write(FACTS_SIDECAR_MAGIC)
+            f.write(struct.pack('<I', header_len))
+            f.write(header_bytes.ljust(header_len, b' '))
+
+            for name, block in blocks:
+                self._pad_to(f, layout[name])
+                if sys.byteorder != 'little':
+                    block = array(block.typecode, block)
+                    block.byteswap()
+                block.tofile(f)
+
+            self._pad_to(f, data_offset)
+            f.write(pool_blob)
+
+    def _document_without_facts(self, filing: ParsedFiling) -> dict[str, any]:
+        """Materialize the parsed.json document, leaving facts out."""
+        document = self.serializer.build_document(filing)
+        if self.serializer.last_meta is not None:
+            # Same export timestamp and format as the parsed.json written
+            document['_meta'] = dict(self.serializer.last_meta)
+        instance = document.get('instance')
+        if isinstance(instance, LazyDict):
+            document['instance'] = LazyDict(
+                (key, value) for key, value in instance.items if key != 'facts'
+            )
+        return self._materialize(document)
+
+    def _materialize(self, value: any) -> any:
+        """Convert LazyDict/LazyList (at any depth) to dict/list."""
+        if isinstance(value, LazyDict):
+            return {key: self._materialize(item) for key, item in value.items}
+        if isinstance(value, LazyList):
+            return [self._materialize(item) for item in value.items]
+        if isinstance(value, dict):
+            return {key: self._materialize(item) for key, item in value.items()}
+        return value
+
+    @staticmethod
+    def _numeric_value(record: dict[str, any]) -> float:
+        """Numeric fact value, NaN when nil or not a number."""
+        value = record.get('value')
+        if value is None or record.get('is_nil'):
+            return math.nan
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+
+    @staticmethod
+    def _source_stamp(json_path: Path) -> dict[str, int]:
+        """Identify the parsed.json version the sidecar mirrors."""
+        stat = json_path.stat()
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    @staticmethod
+    def _align(offset: int) -> int:
+        return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+    @staticmethod
+    def _pad_to(f, offset: int) -> None:
+        position = f.tell()
+        if position < offset:
+            f.write(b'\0' * (offset - position))
+
+
+__all__ = ['FactsSidecarWriter', 'sidecar_path']
@@ -0,0 +1,192 @@
+# Path: xbrl_parser/serialization/instance_sidecar.py
+"""
+Instance Scan Sidecar
+
+Per-filing summary of the instance document, written next to parsed.json
+from data the parser already holds after its single pass over the
+instance.
+
+Later stages used to open the instance .htm/.xml again on their own:
+the mapper re-read it to find contexts and dimensions, verification
+re-read it for sign="-" attributes, and instance discovery sniffed the
+headers of candidate files. They read this sidecar instead.
+
+FILE (parsed.instance.json):
+    version          INSTANCE_SIDECAR_VERSION
+    source           {'size', 'mtime_ns'} of the parsed.json it belongs to;
+                     readers ignore the sidecar when parsed.json differs
+    instance_file    {'path', 'name', 'size', 'mtime_ns', 'format'} of the
+                     instance document ('ixbrl' or 'xbrl')
+    contexts         {context_id: {'period_type', 'period_start',
+                     'period_end', 'dimensions'}}; dimensions map axis to
+                     member, typed dimensions as 'axis[typed]' to their text
+    numeric_facts    [{'concept', 'context_ref', 'id', 'sign', 'scale',
+                     'format'}] one entry per ix:nonFraction (iXBRL only;
+                     the transformed XBRL keeps none of these attributes)
+
+Readers live next to each consumer (mapper and verification loaders).
+
+Example:
+    InstanceSidecarWriter().write(parsed_filing, Path('parsed.json'))
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from ..models.context import Context
+from ..models.parsed_filing import ParsedFiling
+from ..serialization.constants import (
+    JSON_ENCODING,
+    INSTANCE_SIDECAR_SUFFIX,
+    INSTANCE_SIDECAR_VERSION,
+)
+
+# Markup inside typed dimension values
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def instance_sidecar_path(json_path: Path) -> Path:
+    """Get the instance sidecar path for a parsed.json path."""
+    json_path = Path(json_path)
+    return json_path.with_name(json_path.stem + INSTANCE_SIDECAR_SUFFIX)
+
+
+class InstanceSidecarWriter:
+    """
+    Writes the instance scan sidecar for a parsed filing.
+
+    Must run after parsed.json has been written (the sidecar records its
+    size and modification time).
+
+    Example:
+        serializer.write(filing, json_path)
+        InstanceSidecarWriter().write(filing, json_path)
+    """
+
+    def __init__(self):
+        """Initialize sidecar writer."""
+        self.logger = logging.getLogger(__name__)
+
+    def write(self, filing: ParsedFiling, json_path: Path) -> Optional[Path]:
+        """
+        Write parsed.instance.json next to json_path.
+
+        Args:
+            filing: Parsed filing that was written to json_path
+            json_path: The parsed.json it belongs to
+
+        Returns:
+            Path to sidecar, or None if the instance document is unknown
+        """
+        json_path = Path(json_path)
+        instance_file = self._instance_file(filing)
+        if instance_file is None:
+            self.logger.debug("No instance document recorded, skipping instance sidecar")
+            return None
+
+        instance = filing.instance
+        data = {
+            'version': INSTANCE_SIDECAR_VERSION,
+            'source': self._source_stamp(json_path),
+            'instance_file': instance_file,
+            'contexts': {
+                context_id: self._context_info(context)
+                for context_id, context in instance.contexts.items()
+            },
+            'numeric_facts': instance.ix_numeric_attributes,
+        }
+
+        output_path = instance_sidecar_path(json_path)
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding=JSON_ENCODING) as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        self.logger.info(
+            f"Wrote instance sidecar: {len(data['contexts'])} contexts, "
+            f"{len(data['numeric_facts'])} numeric facts"
+        )
+        return output_path
+
+    @staticmethod
+    def remove(json_path: Path) -> None:
+        """Delete a sidecar so it cannot go stale next to a new parsed.json."""
+        try:
+            instance_sidecar_path(json_path).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _instance_file(self, filing: ParsedFiling) -> Optional[dict[str, any]]:
+        """Identity of the instance document the filing was parsed from."""
+        entry_point = filing.metadata.entry_point
+        if not entry_point:
+            return None
+
+        entry_point = Path(entry_point)
+        try:
+            stat = entry_point.stat()
+        except OSError:
+            return None
+
+        return {
+            'path': str(entry_point.resolve()),
+            'name': entry_point.name,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'format': filing.instance.source_format,
+        }
+
+    def _context_info(self, context: Context) -> dict[str, any]:
+        """Period and dimensions of a context."""
+        period = context.period
+        period_type = period.period_type.value if period.period_type else None
+        period_start = None
+        period_end = None
+
+        if period.is_instant():
+            period_end = self._date_text(period.instant)
+        elif period.is_duration():
+            period_start = self._date_text(period.start_date)
+            period_end = self._date_text(period.end_date)
+
+        dimensions = {}
+        for section in (context.segment, context.scenario):
+            if section is None:
+                continue
+            for dimension in section.explicit_dimensions:
+                dimensions[dimension.dimension] = dimension.member
+            for dimension in section.typed_dimensions:
+                value = _TAG_PATTERN.sub('', dimension.value_xml or '').strip()
+                if value:
+                    dimensions[f'{dimension.dimension}[typed]'] = value
+
+        return {
+            'period_type': period_type,
+            'period_start': period_start,
+            'period_end': period_end,
+            'dimensions': dimensions,
+        }
+
+    @staticmethod
+    def _date_text(value: any) -> Optional[str]:
+        """ISO text of a period date."""
+        if value is None:
+            return None
+        return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+    @staticmethod
+    def _source_stamp(json_path: Path) -> dict[str, int]:
+        """Identify the parsed.json version the sidecar belongs to."""
+        stat = json_path.stat()
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+__all__ = ['InstanceSidecarWriter', 'instance_sidecar_path']
@@ -23,8 +23,15 @@ Example:
     
     # Save to file
     serializer.save(parsed_filing, "output.json")
+    
+    # Stream to file (facts, contexts and units written one at a time)
+    serializer.write(parsed_filing, Path("parsed.json"))
+    
+    # Compact whitespace, gzip compressed
+    serializer.write(parsed_filing, Path("parsed.json.gz"), pretty=False, compress=True)
 """
 
+import io
 import json
 import logging
 import gzip
@@ -52,8 +59,9 @@ from ..serialization.constants import (
     DEFAULT_COMPRESSION_LEVEL,
     MAX_OUTPUT_SIZE_WARNING,
     MSG_SERIALIZATION_FAILED,
-    MSG_OUTPUT_TOO_LARGE
+    MSG_OUTPUT_TOO_LARGE,
 )
+from ..serialization.json_stream import JSONStreamWriter, LazyDict, LazyList
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -129,6 +137,9 @@ class JSONSerializer:
         compact_json = serializer.serialize(filing, compact=True)
     """
     
+    # Encoder used for every JSON document this serializer produces
+    encoder_cls = JSONEncoder
+    
     def __init__(self, config: Optional[ConfigLoader] = None):
         """
         Initialize JSON serializer.
@@ -142,6 +153,10 @@ class JSONSerializer:
         # Get configuration
         self.schema_version = self.config.get('output_schema_version', CURRENT_SCHEMA_VERSION)
         self.enable_compression = self.config.get('enable_output_compression', False)
+        self.pretty_print = self.config.get('json_pretty_print', True)
+        self.indent = self.config.get('json_indent', JSON_INDENT)
+        # _meta of the last document written (sidecars repeat it)
+        self.last_meta: Optional[dict[str, any]] = None
         # self.output_dir = self.config.get('output_exports_dir')  # REMOVED - save() not used
         
         self.logger.debug(
@@ -176,37 +191,20 @@ class JSONSerializer:
                 f"Serializing filing: compact={compact}, anonymize={anonymize}"
             )
             
-            # Convert to dict
-            data = self._to_dict(
-                filing,
-                compact=compact,
-                anonymize=anonymize,
-                include_debug=include_debug
-            )
-            
-            # Add metadata
-            data['_meta'] = {
-                'schema_version': self.schema_version,
-                'export_timestamp': datetime.now().isoformat(),
-                'export_format': self._get_format_name(compact, anonymize, include_debug)
-            }
-            
-            # Serialize to JSON
-            json_str = json.dumps(
-                data,
-                cls=JSONEncoder,
-                indent=JSON_INDENT,
-                ensure_ascii=False
+            buffer = io.StringIO()
+            self._write_document(
+                buffer, filing, compact, anonymize, include_debug, self._get_indent()
             )
+            json_str = buffer.getvalue()
             
-            # Check size
-            size_bytes = len(json_str.encode(JSON_ENCODING))
-            if size_bytes > MAX_OUTPUT_SIZE_WARNING:
+            # Check size (characters; close enough for the warning threshold)
+            size = len(json_str)
+            if size > MAX_OUTPUT_SIZE_WARNING:
                 self.logger.warning(
-                    f"{MSG_OUTPUT_TOO_LARGE}: {size_bytes / 1024 / 1024:.1f}MB"
+                    f"{MSG_OUTPUT_TOO_LARGE}: {size / 1024 / 1024:.1f}MB"
                 )
             
-            self.logger.info(f"Serialization completed: {size_bytes / 1024:.1f}KB")
+            self.logger.info(f"Serialization completed: {size / 1024:.1f}KB")
             return json_str
             
         except Exception as e:
@@ -272,12 +270,208 @@ class JSONSerializer:
             self.logger.error(f"Failed to save JSON: {e}", exc_info=True)
             raise
     
-    def _to_dict(
+    def write(
+        self,
+        filing: ParsedFiling,
+        output_path: Path,
+        compact: bool = False,
+        anonymize: bool = False,
+        include_debug: bool = False,
+        pretty: Optional[bool] = None,
+        compress: bool = False
+    ) -> Path:
+        """
+        Serialize parsed filing directly to a file.
+        
+        Produces the same document as serialize(), but facts, contexts and
+        units are written one at a time, so memory does not grow with the
+        size of the output. Required for filings parsed in streaming mode,
+        whose facts live in a FactSpool on disk.
+        
+        Args:
+            filing: Parsed filing to write
+            output_path: Destination file
+            compact: If True, only include essential fields
+            anonymize: If True, redact sensitive information
+            include_debug: If True, include debug artifacts
+            pretty: Indent output (None = use config json_pretty_print);
+                False writes compact whitespace
+            compress: If True, gzip the output ('.gz' appended if missing)
+            
+        Returns:
+            Path to written file
+        """
+        output_path = Path(output_path)
+        if compress and output_path.suffix != '.gz':
+            output_path = Path(str(output_path) + '.gz')
+        
+        indent = self._get_indent(pretty)
+        
+        try:
+            self.logger.info(
+                f"Writing filing: compact={compact}, anonymize={anonymize}, "
+                f"streamed={filing.instance.is_streamed}, indent={indent}, "
+                f"compress={compress}"
+            )
+            
+            if compress:
+                stream = gzip.open(
+                    output_path, 'wt',
+                    encoding=JSON_ENCODING,
+                    compresslevel=DEFAULT_COMPRESSION_LEVEL
+                )
+            else:
+                stream = open(output_path, 'w', encoding=JSON_ENCODING)
+            
+            with stream:
+                self._write_document(
+                    stream, filing, compact, anonymize, include_debug, indent
+                )
+            
+            size_bytes = output_path.stat().st_size
+            if size_bytes > MAX_OUTPUT_SIZE_WARNING:
+                self.logger.warning(
+                    f"{MSG_OUTPUT_TOO_LARGE}: {size_bytes / 1024 / 1024:.1f}MB"
+                )
+            
+            self.logger.info(
+                f"Wrote {filing.instance.total_facts} facts to {output_path}: "
+                f"{size_bytes / 1024:.1f}KB"
+            )
+            return output_path
+            
+        except Exception as e:
+            self.logger.error(f"{MSG_SERIALIZATION_FAILED}: {e}", exc_info=True)
+            raise
+    
+    def _get_indent(self, pretty: Optional[bool] = None) -> Optional[int]:
+        """
+        Resolve output indentation.
+        
+        Args:
+            pretty: Indent output (None = use config)
+            
+        Returns:
+            Indent width, or None for compact whitespace
+        """
+        if pretty is None:
+            pretty = self.pretty_print
+        return self.indent if pretty else None
+    
+    def _write_document(
+        self,
+        stream,
+        filing: ParsedFiling,
+        compact: bool,
+        anonymize: bool,
+        include_debug: bool,
+        indent: Optional[int]
+    ) -> None:
+        """
+        Write the full JSON document to a text stream.
+        
+        Args:
+            stream: Text stream
+            filing: Parsed filing
+            compact: Only include essential fields
+            anonymize: Redact sensitive data
+            include_debug: Include debug artifacts
+            indent: Indent width (None = compact whitespace)
+        """
+        data = self.build_document(filing, compact, anonymize, include_debug)
+        self.last_meta = data['_meta']
+        
+        writer = JSONStreamWriter(stream, encoder_cls=self.encoder_cls, indent=indent)
+        writer.write(LazyDict(data.items()))
+    
+    def build_document(
         self,
         filing: ParsedFiling,
         compact: bool = False,
         anonymize: bool = False,
         include_debug: bool = False
+    ) -> dict[str, any]:
+        """
+        Build the output document with lazy facts, contexts and units.
+        
+        Args:
+            filing: Parsed filing
+            compact: Only include essential fields
+            anonymize: Redact sensitive data
+            include_debug: Include debug artifacts
+            
+        Returns:
+            Document dictionary for JSONStreamWriter (facts, contexts and
+            units as LazyList/LazyDict, consumed once)
+        """
+        data = self._to_dict(
+            filing,
+            compact=compact,
+            anonymize=anonymize,
+            include_debug=include_debug,
+            lazy=True
+        )
+        
+        # Add metadata
+        data['_meta'] = {
+            'schema_version': self.schema_version,
+            'export_timestamp': datetime.now().isoformat(),
+            'export_format': self._get_format_name(compact, anonymize, include_debug)
+        }
+        
+        return data
+    
+    def serialize_fact(
+        self,
+        fact: any,
+        contexts: Optional[dict] = None,
+        units: Optional[dict] = None
+    ) -> dict[str, any]:
+        """
+        Serialize one fact to the dictionary shape used in parsed.json.
+        
+        Args:
+            fact: Fact to serialize
+            contexts: Contexts by ID (for denormalized period fields)
+            units: Units by ID (for denormalized unit measures)
+            
+        Returns:
+            Fact dictionary
+        """
+        return self._serialize_fact(fact, False, contexts, units)
+    
+    def iter_fact_records(self, filing: ParsedFiling, anonymize: bool = False):
+        """
+        Yield fact dictionaries exactly as they appear in parsed.json.
+        
+        Facts come from memory or, for streamed filings, the fact spool.
+        
+        Args:
+            filing: Parsed filing
+            anonymize: Redact fact values
+            
+        Yields:
+            Fact dictionaries in document order
+        """
+        instance = filing.instance
+        
+        if instance.is_streamed:
+            for record in instance.fact_spool:
+                if anonymize:
+                    record['value'] = '[REDACTED]'
+                yield record
+            return
+        
+        for fact in instance.facts:
+            yield self._serialize_fact(fact, anonymize, instance.contexts, instance.units)
+    
+    def _to_dict(
+        self,
+        filing: ParsedFiling,
+        compact: bool = False,
+        anonymize: bool = False,
+        include_debug: bool = False,
+        lazy: bool = False
     ) -> dict[str, any]:
         """
         Convert parsed filing to dictionary.
@@ -287,17 +481,19 @@ class JSONSerializer:
             compact: Only include essential fields
             anonymize: Redact sensitive data
             include_debug: Include debug artifacts
+            lazy: Produce facts, contexts and units as LazyList/LazyDict
+                for JSONStreamWriter instead of materializing them
             
         Returns:
             Dictionary representation
         """
         if compact:
-            return self._to_compact_dict(filing, anonymize)
+            return self._to_compact_dict(filing, anonymize, lazy)
         
         # Full output
         data = {
             'metadata': self._serialize_metadata(filing.metadata, anonymize),
-            'instance': self._serialize_instance(filing.instance, anonymize),
+            'instance': self._serialize_instance(filing.instance, anonymize, lazy),
             'reliability': filing.reliability.value if filing.reliability else None,
             'quality_score': filing.quality_score
         }
@@ -327,7 +523,8 @@ class JSONSerializer:
     def _to_compact_dict(
         self,
         filing: ParsedFiling,
-        anonymize: bool = False
+        anonymize: bool = False,
+        lazy: bool = False
     ) -> dict[str, any]:
         """
         Convert to compact dictionary (facts only).
@@ -335,28 +532,31 @@ class JSONSerializer:
         Args:
             filing: Parsed filing
             anonymize: Redact sensitive data
+            lazy: Produce facts, contexts and units lazily
             
         Returns:
             Compact dictionary
         """
+        instance = filing.instance
+        facts = self.iter_fact_records(filing, anonymize)
+        contexts = (
+            (cid, self._serialize_context(ctx, anonymize))
+            for cid, ctx in instance.contexts.items()
+        )
+        units = (
+            (uid, self._serialize_unit(unit))
+            for uid, unit in instance.units.items()
+        )
+        
         return {
             'metadata': {
                 'filing_id': filing.metadata.filing_id if not anonymize else '[REDACTED]',
                 'document_type': filing.metadata.document_type,
                 'period_end_date': filing.metadata.period_end_date
             },
-            'facts': [
-                self._serialize_fact(f, anonymize, filing.instance.contexts, filing.instance.units)
-                for f in filing.instance.facts
-            ],
-            'contexts': {
-                cid: self._serialize_context(ctx, anonymize)
-                for cid, ctx in filing.instance.contexts.items()
-            },
-            'units': {
-                uid: self._serialize_unit(unit)
-                for uid, unit in filing.instance.units.items()
-            }
+            'facts': LazyList(facts) if lazy else list(facts),
+            'contexts': LazyDict(contexts) if lazy else dict(contexts),
+            'units': LazyDict(units) if lazy else dict(units)
         }
     
     def _serialize_metadata(
@@ -381,25 +581,38 @@ class JSONSerializer:
     def _serialize_instance(
         self,
         instance: any,
-        anonymize: bool
+        anonymize: bool,
+        lazy: bool = False
     ) -> dict[str, any]:
-        """Serialize instance data."""
-        return {
-            'facts': [
+        """Serialize instance data (as a LazyDict when lazy)."""
+        if getattr(instance, 'is_streamed', False):
+            facts = (
+                dict(record, value='[REDACTED]') if anonymize else record
+                for record in instance.fact_spool
+            )
+        else:
+            facts = (
                 self._serialize_fact(f, anonymize, instance.contexts, instance.units)
                 for f in instance.facts
-            ],
-            'contexts': {
-                cid: self._serialize_context(ctx, anonymize)
-                for cid, ctx in instance.contexts.items()
-            },
-            'units': {
-                uid: self._serialize_unit(unit)
-                for uid, unit in instance.units.items()
-            },
+            )
+        contexts = (
+            (cid, self._serialize_context(ctx, anonymize))
+            for cid, ctx in instance.contexts.items()
+        )
+        units = (
+            (uid, self._serialize_unit(unit))
+            for uid, unit in instance.units.items()
+        )
+        
+        data = {
+            'facts': LazyList(facts) if lazy else list(facts),
+            'contexts': LazyDict(contexts) if lazy else dict(contexts),
+            'units': LazyDict(units) if lazy else dict(units),
             'namespaces': instance.namespaces if hasattr(instance, 'namespaces') else {},
             'footnotes': instance.footnotes if hasattr(instance, 'footnotes') else {}
         }
+        
+        return LazyDict(data.items()) if lazy else data
     
     def _serialize_fact(self, fact: any, anonymize: bool, contexts: dict = None, units: dict = None) -> dict[str, any]:
         """Serialize a fact with ALL attributes (26 total including denormalized fields)."""
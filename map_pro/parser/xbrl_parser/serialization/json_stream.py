@@ -0,0 +1,158 @@
+# Path: xbrl_parser/serialization/json_stream.py
+"""
+JSON Stream Writer
+
+Incremental JSON writer for large documents.
+
+Writes a document to a text stream piece by piece instead of building
+one string with json.dumps(). Containers wrapped in LazyDict/LazyList are
+written item by item as their iterables are consumed, so the facts,
+contexts and units of a filing never exist as one serialized block.
+Everything else is encoded with the regular encoder.
+
+Output is byte-identical to json.dumps(document, indent=indent,
+ensure_ascii=False) with the same encoder; indent=None produces compact
+output without whitespace.
+
+Example:
+    document = {
+        'metadata': {...},
+        'facts': LazyList(serialize(f) for f in facts),
+    }
+
+    with open(path, 'w', encoding='utf-8') as f:
+        JSONStreamWriter(f, indent=2).write(LazyDict(document.items()))
+"""
+
+import json
+from typing import Iterable, Optional, TextIO
+
+from ..serialization.constants import (
+    JSON_INDENT,
+    JSON_ITEM_SEPARATOR,
+    JSON_KEY_SEPARATOR,
+    JSON_COMPACT_KEY_SEPARATOR,
+)
+
+
+class LazyList:
+    """JSON array whose items are produced by an iterable while writing."""
+
+    __slots__ = ('items',)
+
+    def __init__(self, items: Iterable[any]):
+        self.items = items
+
+
+class LazyDict:
+    """JSON object whose (key, value) pairs are produced while writing."""
+
+    __slots__ = ('items',)
+
+    def __init__(self, items: Iterable[tuple[any, any]]):
+        self.items = items
+
+
+class JSONStreamWriter:
+    """
+    Writes JSON documents containing LazyDict/LazyList to a text stream.
+
+    Example:
+        writer = JSONStreamWriter(stream, encoder_cls=JSONEncoder, indent=None)
+        writer.write(LazyDict(data.items()))
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        encoder_cls: type = json.JSONEncoder,
+        indent: Optional[int] = JSON_INDENT
+    ):
+        """
+        Initialize stream writer.
+
+        Args:
+            stream: Text stream to write to
+            encoder_cls: json.JSONEncoder subclass for non-JSON types
+            indent: Indent width (None = compact, no whitespace)
+        """
+        self.stream = stream
+        self.indent = indent
+
+        key_separator = JSON_KEY_SEPARATOR if indent is not None else JSON_COMPACT_KEY_SEPARATOR
+        self._key_separator = key_separator
+        self._encoder = encoder_cls(
+            indent=indent,
+            separators=(JSON_ITEM_SEPARATOR, key_separator),
+            ensure_ascii=False
+        )
+        self._newlines: dict[int, str] = {}
+
+    def write(self, document: any) -> None:
+        """
+        Write a complete JSON document.
+
+        Args:
+            document: Value to write (LazyDict/LazyList at any nesting)
+        """
+        self._write_value(document, 0)
+
+    def _newline(self, level: int) -> str:
+        """Line break plus indentation for a nesting level ('' if compact)."""
+        if self.indent is None:
+            return ''
+        newline = self._newlines.get(level)
+        if newline is None:
+            newline = self._newlines[level] = '\n' + ' ' * (self.indent * level)
+        return newline
+
+    def _write_value(self, value: any, level: int) -> None:
+        if isinstance(value, LazyDict):
+            self._write_dict(value.items, level)
+        elif isinstance(value, LazyList):
+            self._write_list(value.items, level)
+        else:
+            text = self._encoder.encode(value)
+            if level and self.indent is not None:
+                # Nested pretty-printed value: shift its lines to this level
+                text = text.replace('\n', self._newline(level))
+            self.stream.write(text)
+
+    def _write_list(self, items: Iterable[any], level: int) -> None:
+        write = self.stream.write
+        item_prefix = self._newline(level + 1)
+
+        first = True
+        for item in items:
+            write(('[' if first else JSON_ITEM_SEPARATOR) + item_prefix)
+            self._write_value(item, level + 1)
+            first = False
+
+        write('[]' if first else self._newline(level) + ']')
+
+    def _write_dict(self, items: Iterable[tuple[any, any]], level: int) -> None:
+        write = self.stream.write
+        item_prefix = self._newline(level + 1)
+
+        first = True
+        for key, value in items:
+            write(
+                ('{' if first else JSON_ITEM_SEPARATOR)
+                + item_prefix
+                + self._encode_key(key)
+                + self._key_separator
+            )
+            self._write_value(value, level + 1)
+            first = False
+
+        write('{}' if first else self._newline(level) + '}')
+
+    def _encode_key(self, key: any) -> str:
+        """Encode an object key the way json.dumps does."""
+        if not isinstance(key, str):
+            # json.dumps turns int/float/bool/None keys into their JSON text
+            key = self._encoder.encode(key)
+        return self._encoder.encode(key)
+
+
+__all__ = ['JSONStreamWriter', 'LazyDict', 'LazyList']
@@ -8,6 +8,7 @@ exceed memory limits when loaded entirely into DOM.
 Components:
     - stream_parser: SAX-style event-driven parser
     - memory_manager: Memory tracking and management
+    - fact_spool: Disk-backed store for streamed, serialized facts
 
 Example:
     from ..streaming import StreamingParser, should_use_streaming
@@ -32,6 +33,7 @@ from ..streaming.memory_manager import (
     MemoryThresholds,
     MemoryManager,
 )
+from ..streaming.fact_spool import FactSpool
 
 __all__ = [
     'StreamBatch',
@@ -40,4 +42,5 @@ __all__ = [
     'MemorySnapshot',
     'MemoryThresholds',
     'MemoryManager',
+    'FactSpool',
 ]
@@ -0,0 +1,120 @@
+# Path: xbrl_parser/streaming/fact_spool.py
+"""
+Fact Spool
+
+Disk-backed store for serialized facts produced by streaming parses.
+
+When a filing is parsed in streaming mode, fact batches are serialized as
+they come out of iterparse and appended here (one JSON record per line)
+instead of being kept in ParsedFiling.instance.facts. JSONSerializer.write()
+later copies the records into parsed.json, so peak memory is bounded by the
+batch size rather than the filing size.
+
+Example:
+    spool = FactSpool(spool_dir, prefix=filing_id)
+
+    for batch in streaming_parser.parse_stream(instance_path):
+        spool.append(serialize(f) for f in batch.facts)
+
+    spool.close()
+
+    for record in spool:
+        ...
+
+    spool.discard()
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ..serialization.constants import JSON_ENCODING
+
+
+class FactSpool:
+    """
+    Append-only JSON-lines file of serialized fact records.
+
+    Records are plain dictionaries in the same shape JSONSerializer
+    produces for facts, so they can be written to parsed.json unchanged.
+    """
+
+    SUFFIX = '.facts.jsonl'
+
+    def __init__(self, spool_dir: Path, prefix: str = 'filing'):
+        """
+        Create a new spool file.
+
+        Args:
+            spool_dir: Directory for spool files (created if missing)
+            prefix: File name prefix (usually the filing ID)
+        """
+        self.logger = logging.getLogger(__name__)
+
+        spool_dir = Path(spool_dir)
+        spool_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, path = tempfile.mkstemp(
+            dir=spool_dir,
+            prefix=f"{prefix}-",
+            suffix=self.SUFFIX
+        )
+        self.path = Path(path)
+        self._file = os.fdopen(fd, 'w', encoding=JSON_ENCODING)
+        self._count = 0
+
+    def append(self, records: Iterable[dict[str, any]], encoder_cls=None) -> int:
+        """
+        Append serialized fact records.
+
+        Args:
+            records: Fact dictionaries
+            encoder_cls: Optional json.JSONEncoder subclass for non-JSON types
+
+        Returns:
+            Number of records appended
+        """
+        if self._file is None:
+            raise ValueError(f"Fact spool is closed: {self.path}")
+
+        written = 0
+        for record in records:
+            self._file.write(json.dumps(record, cls=encoder_cls, ensure_ascii=False))
+            self._file.write('\n')
+            written += 1
+
+        self._count += written
+        return written
+
+    def close(self) -> None:
+        """Flush and close the spool for writing."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[dict[str, any]]:
+        """Iterate records in write order (closes the spool for writing)."""
+        self.close()
+        with open(self.path, 'r', encoding=JSON_ENCODING) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def discard(self) -> None:
+        """Close and delete the spool file."""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Could not remove fact spool {self.path}: {e}")
+
+
+__all__ = ['FactSpool']
@@ -10,20 +10,34 @@ exceed memory limits if loaded entirely into a DOM. Facts are extracted
 and yielded incrementally as they are discovered.
 """
 
+import copy
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Generator, Optional
 from lxml import etree
 from dataclasses import dataclass
 
-from ..models.fact import Fact, FactType
-from ..models.context import Context, EntityIdentifier, Period, PeriodType
-from ..models.unit import Unit, UnitType
+from ...core.config_loader import ConfigLoader
+from ..models.fact import Fact
+from ..models.context import Context
+from ..models.unit import Unit
 from ..models.error import ParsingError, ErrorSeverity, ErrorCategory
+from ..instance.instance_parser import InstanceParseResult
+from ..instance.context_parser import ContextParser
+from ..instance.unit_parser import UnitParser
+from ..instance.fact_extractor import FactExtractor
+from ..instance.footnote_extractor import FootnoteExtractor
+from ..instance.constants import XBRLI_NS, LINK_NS, XLINK_NS
 from ..streaming.memory_manager import MemoryManager, MemoryThresholds
 from ..foundation.namespace_registry import NamespaceRegistry
 
 
+CONTEXT_TAG = f"{{{XBRLI_NS}}}context"
+UNIT_TAG = f"{{{XBRLI_NS}}}unit"
+SCHEMA_REF_TAG = f"{{{LINK_NS}}}schemaRef"
+FOOTNOTE_LINK_TAG = f"{{{LINK_NS}}}footnoteLink"
+
+
 @dataclass
 class StreamBatch:
     """
@@ -31,8 +45,8 @@ class StreamBatch:
     
     Attributes:
         facts: list of facts in this batch
-        contexts: Contexts referenced by facts
-        units: Units referenced by facts
+        contexts: Contexts parsed so far (live dictionary, grows during parse)
+        units: Units parsed so far (live dictionary, grows during parse)
         batch_number: Sequential batch number
         total_facts_so_far: Total facts processed
     """
@@ -47,8 +61,16 @@ class StreamingParser:
     """
     Streaming XBRL parser for large files.
     
-    Uses SAX-style event-driven parsing to process XBRL filings incrementally,
-    yielding batches of facts without loading the entire document into memory.
+    Uses lxml iterparse to process XBRL instances incrementally, yielding
+    batches of facts without keeping the document tree in memory. Each
+    top-level element is parsed with the same context/unit/fact parsers
+    as the DOM path (InstanceParser), then cleared.
+    
+    Limitations compared to the DOM path:
+        - Footnotes are collected, but facts already yielded are not
+          back-linked to them (footnoteLink elements follow the facts)
+        - Facts that precede their context are held until the end of the
+          document and yielded in the final batch
     
     Example:
         parser = StreamingParser(
@@ -65,7 +87,8 @@ class StreamingParser:
         self,
         batch_size: int = 1000,
         memory_threshold_mb: float = 512.0,
-        enable_memory_management: bool = True
+        enable_memory_management: bool = True,
+        config: Optional[ConfigLoader] = None
     ):
         """
         Initialize streaming parser.
@@ -74,9 +97,11 @@ class StreamingParser:
             batch_size: Number of facts per batch
             memory_threshold_mb: Memory threshold for cleanup (MB)
             enable_memory_management: Enable automatic memory management
+            config: Configuration loader (creates default if None)
         """
         self.batch_size = batch_size
         self.enable_memory_management = enable_memory_management
+        self.config = config or ConfigLoader()
         self.logger = logging.getLogger(__name__)
         
         # Memory management
@@ -93,10 +118,17 @@ class StreamingParser:
         # Namespace registry
         self.namespace_registry = NamespaceRegistry()
         
-        # State
-        self.contexts: dict[str, Context] = {}
-        self.units: dict[str, Unit] = {}
-        self.errors: list[ParsingError] = []
+        # Element parsers shared with the DOM path
+        self._context_parser = ContextParser(self.config)
+        self._unit_parser = UnitParser(self.config)
+        self._fact_extractor = FactExtractor(self.config)
+        self._footnote_extractor = FootnoteExtractor(self.config)
+        
+        # State (everything except facts, which are yielded)
+        self.result = InstanceParseResult()
+        self.contexts: dict[str, Context] = self.result.contexts
+        self.units: dict[str, Unit] = self.result.units
+        self.errors: list[ParsingError] = self.result.errors
         
         # Statistics
         self.total_facts = 0
@@ -109,6 +141,10 @@ class StreamingParser:
         """
         Parse XBRL file as stream, yielding batches of facts.
         
+        After the generator is exhausted, self.result holds contexts,
+        units, namespaces, schema references, footnotes and errors
+        (result.facts stays empty).
+        
         Args:
             file_path: Path to XBRL file
             
@@ -127,9 +163,11 @@ class StreamingParser:
         self.logger.info(f"Starting streaming parse: {file_path}")
         
         # Reset state
-        self.contexts = {}
-        self.units = {}
-        self.errors = []
+        self.result = InstanceParseResult()
+        self.result.instance_path = str(file_path)
+        self.contexts = self.result.contexts
+        self.units = self.result.units
+        self.errors = self.result.errors
         self.total_facts = 0
         self.total_batches = 0
         
@@ -139,66 +177,89 @@ class StreamingParser:
                 str(file_path),
                 events=('start', 'end'),
                 huge_tree=True,
-                recover=True
+                recover=True,
+                remove_comments=True
             )
             
             current_batch: list[Fact] = []
+            pending_facts: list[etree._Element] = []
+            footnote_links: list[etree._Element] = []
+            root = None
+            depth = 0
             
             for event, elem in context_iter:
-                # Extract namespace
                 if event == 'start':
-                    self._process_namespace(elem)
+                    if root is None:
+                        root = elem
+                        self._process_namespace(elem)
+                    depth += 1
+                    continue
                 
-                # Process elements on end event
-                if event == 'end':
-                    # Extract context
-                    if elem.tag.endswith('}context') or elem.tag == 'context':
-                        self._extract_context(elem)
-                    
-                    # Extract unit
-                    elif elem.tag.endswith('}unit') or elem.tag == 'unit':
-                        self._extract_unit(elem)
-                    
-                    # Extract fact
-                    elif self._is_fact_element(elem):
+                depth -= 1
+                
+                # Only direct children of the root are contexts, units and
+                # facts; nested elements are parsed with their parent
+                if depth != 1:
+                    continue
+                
+                tag = elem.tag
+                
+                if tag == CONTEXT_TAG:
+                    self._extract_context(elem)
+                
+                elif tag == UNIT_TAG:
+                    self._extract_unit(elem)
+                
+                elif tag == SCHEMA_REF_TAG:
+                    href = elem.get(f"{{{XLINK_NS}}}href")
+                    if href:
+                        self.result.schema_refs.append(href)
+                
+                elif tag == FOOTNOTE_LINK_TAG:
+                    footnote_links.append(copy.deepcopy(elem))
+                
+                elif self._is_fact_element(elem):
+                    if elem.get('contextRef') in self.contexts:
                         fact = self._extract_fact(elem)
                         if fact:
                             current_batch.append(fact)
                             self.total_facts += 1
+                    else:
+                        # Context declared later in the document
+                        pending_facts.append(copy.deepcopy(elem))
+                
+                # Clear element and already-processed siblings to free memory
+                elem.clear(keep_tail=False)
+                while elem.getprevious() is not None:
+                    del root[0]
+                
+                # Yield batch if size reached
+                if len(current_batch) >= self.batch_size:
+                    yield self._make_batch(current_batch)
+                    current_batch = []
                     
-                    # Clear element to free memory
-                    elem.clear()
-                    
-                    # Remove from parent to allow garbage collection
-                    while elem.getprevious() is not None:
-                        del elem.getparent()[0]
-                    
-                    # Yield batch if size reached
-                    if len(current_batch) >= self.batch_size:
-                        self.total_batches += 1
-                        yield StreamBatch(
-                            facts=current_batch,
-                            contexts=dict(self.contexts),
-                            units=dict(self.units),
-                            batch_number=self.total_batches,
-                            total_facts_so_far=self.total_facts
-                        )
-                        current_batch = []
-                        
-                        # Check memory
-                        if self.memory_manager:
-                            self.memory_manager.check_memory()
+                    # Check memory
+                    if self.memory_manager:
+                        self.memory_manager.check_memory()
+            
+            # Facts whose context appeared after them
+            for elem in pending_facts:
+                fact = self._extract_fact(elem)
+                if fact:
+                    current_batch.append(fact)
+                    self.total_facts += 1
             
             # Yield final batch if any facts remain
             if current_batch:
-                self.total_batches += 1
-                yield StreamBatch(
-                    facts=current_batch,
-                    contexts=dict(self.contexts),
-                    units=dict(self.units),
-                    batch_number=self.total_batches,
-                    total_facts_so_far=self.total_facts
-                )
+                yield self._make_batch(current_batch)
+            
+            if footnote_links:
+                self._extract_footnotes(root, footnote_links)
+            
+            self.result.fact_count = self.total_facts
+            self.result.context_count = len(self.contexts)
+            self.result.unit_count = len(self.units)
+            self.result.footnote_count = len(self.result.footnotes)
             
             self.logger.info(
                 f"Streaming parse complete: {self.total_facts} facts "
@@ -227,14 +288,37 @@ class StreamingParser:
             self.logger.error(f"Streaming parse error: {e}")
             raise
     
+    def _make_batch(self, facts: list[Fact]) -> StreamBatch:
+        """
+        Wrap facts in a StreamBatch.
+        
+        Args:
+            facts: Facts in this batch
+            
+        Returns:
+            StreamBatch sharing the live context/unit dictionaries
+        """
+        self.total_batches += 1
+        return StreamBatch(
+            facts=facts,
+            contexts=self.contexts,
+            units=self.units,
+            batch_number=self.total_batches,
+            total_facts_so_far=self.total_facts
+        )
+    
     def _process_namespace(self, elem: etree._Element) -> None:
         """
-        Extract and register namespace from element.
+        Extract and register namespaces from the root element.
         
         Args:
             elem: XML element
         """
         if elem.nsmap:
+            self.result.namespaces = {
+                k if k is not None else 'default': v
+                for k, v in elem.nsmap.items()
+            }
             for prefix, uri in elem.nsmap.items():
                 if prefix and uri:
                     self.namespace_registry.register(prefix, uri, declared_in="streaming")
@@ -249,8 +333,9 @@ class StreamingParser:
         Returns:
             True if element represents a fact
         """
-        # Facts have contextRef attribute
-        return elem.get('contextRef') is not None
+        if not isinstance(elem.tag, str):
+            return False
+        return not self._fact_extractor._is_structure_element(elem)
     
     def _extract_context(self, elem: etree._Element) -> None:
         """
@@ -264,66 +349,9 @@ class StreamingParser:
             if not context_id:
                 return
             
-            # Simplified context extraction for streaming mode
-            # Create minimal valid EntityIdentifier
-            # Find entity element (namespace-agnostic)
-            entity_elem = None
-            for child in elem:
-                if child.tag.endswith('}entity') or child.tag == 'entity':
-                    entity_elem = child
-                    break
-            
-            if entity_elem is not None:
-                identifier_elem = None
-                for child in entity_elem:
-                    if child.tag.endswith('}identifier') or child.tag == 'identifier':
-                        identifier_elem = child
-                        break
-                if identifier_elem is not None:
-                    scheme = identifier_elem.get('scheme', 'http://unknown')
-                    identifier = identifier_elem.text or 'unknown'
-                    entity = EntityIdentifier(scheme=scheme, value=identifier)
-                else:
-                    entity = EntityIdentifier(scheme='http://unknown', value='unknown')
-            else:
-                entity = EntityIdentifier(scheme='http://unknown', value='unknown')
-            
-            # Create minimal valid Period
-            # Find period element (namespace-agnostic)
-            period_elem = None
-            for child in elem:
-                if child.tag.endswith('}period') or child.tag == 'period':
-                    period_elem = child
-                    break
-            
-            if period_elem is not None:
-                instant_elem = None
-                for child in period_elem:
-                    if child.tag.endswith('}instant') or child.tag == 'instant':
-                        instant_elem = child
-                        break
-                if instant_elem is not None:
-                    period = Period(
-                        period_type=PeriodType.INSTANT,
-                        instant=instant_elem.text
-                    )
-                else:
-                    # Assume duration
-                    period = Period(
-                        period_type=PeriodType.DURATION,
-                        start_date=None,
-                        end_date=None
-                    )
-            else:
-                period = Period(period_type=PeriodType.INSTANT, instant=None)
-            
-            context = Context(
-                id=context_id,
-                entity=entity,
-                period=period
-            )
-            
-            self.contexts[context_id] = context
+            context = self._context_parser._parse_context_element(elem, self.result)
+            if context:
+                self.contexts[context_id] = context
             
         except Exception as e:
             self.logger.debug(f"Failed to extract context: {e}")
@@ -340,25 +368,9 @@ class StreamingParser:
             if not unit_id:
                 return
             
-            # Simplified unit extraction for streaming mode
-            measures = []
-            # Find measure elements (namespace-agnostic)
-            measure_elems = []
-            for child in elem.iter():
-                if child.tag.endswith('}measure') or child.tag == 'measure':
-                    measure_elems.append(child)
-            for measure_elem in measure_elems:
-                if measure_elem.text:
-                    measures.append(measure_elem.text)
-            
-            # Default to SIMPLE unit type
-            unit = Unit(
-                id=unit_id,
-                unit_type=UnitType.SIMPLE,
-                measures=measures if measures else ['unknown']
-            )
-            
-            self.units[unit_id] = unit
+            unit = self._unit_parser._parse_unit_element(elem, self.result)
+            if unit:
+                self.units[unit_id] = unit
             
         except Exception as e:
             self.logger.debug(f"Failed to extract unit: {e}")
@@ -374,41 +386,33 @@ class StreamingParser:
             Fact object or None if extraction fails
         """
         try:
-            # Get concept name
-            concept = elem.tag
-            if '}' in concept:
-                concept = concept.split('}')[1]
-            
-            # Get value
-            value = elem.text or ""
-            
-            # Get references
-            context_ref = elem.get('contextRef')
-            unit_ref = elem.get('unitRef')
-            
-            # Get attributes
-            decimals = elem.get('decimals')
-            precision = elem.get('precision')
-            
-            # Determine fact type (simplified)
-            fact_type = FactType.NUMERIC if unit_ref else FactType.TEXT
-            
-            fact = Fact(
-                concept=concept,
-                value=value,
-                context_ref=context_ref,
-                unit_ref=unit_ref,
-                decimals=decimals,
-                precision=precision,
-                fact_type=fact_type
-            )
-            
-            return fact
-            
+            return self._fact_extractor._extract_fact(elem, self.result)
         except Exception as e:
             self.logger.debug(f"Failed to extract fact from {elem.tag}: {e}")
             return None
     
+    def _extract_footnotes(
+        self,
+        root: etree._Element,
+        footnote_links: list[etree._Element]
+    ) -> None:
+        """
+        Extract footnotes from the footnoteLink elements kept during the stream.
+        
+        Args:
+            root: Document root (for namespace map)
+            footnote_links: Detached copies of footnoteLink elements
+        """
+        container = etree.Element(root.tag, nsmap=root.nsmap)
+        container.extend(footnote_links)
+        
+        try:
+            self.result.footnotes = self._footnote_extractor.extract_footnotes(
+                container, self.result
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to extract footnotes: {e}")
+    
     def get_statistics(self) -> dict[str, any]:
         """
         Get streaming parse statistics.
@@ -422,6 +426,7 @@ class StreamingParser:
             'batch_size': self.batch_size,
             'contexts_found': len(self.contexts),
             'units_found': len(self.units),
+            'footnotes_found': len(self.result.footnotes),
             'errors': len(self.errors)
         }
         
@@ -6,6 +6,7 @@ Taxonomy loading and management components.
 
 This module provides:
 - Schema loading (XSD parsing)
+- DTS base snapshots (compiled standard taxonomies)
 - Linkbase loading (presentation, calculation, definition)
 - Network building (relationship organization)
 - Version management (compatibility checking)
@@ -33,6 +34,12 @@ from ..taxonomy.schema_loader import (
     SchemaImport
 )
 
+from ..taxonomy.dts_snapshot import (
+    DTSSnapshot,
+    DTSSnapshotStore,
+    DTSSnapshotBuilder
+)
+
 from ..taxonomy.linkbase_loader import (
     LinkbaseLoader,
     LinkbaseLoadResult,
@@ -65,6 +72,11 @@ __all__ = [
     'SchemaLoadResult',
     'SchemaImport',
     
+    # DTS base snapshots
+    'DTSSnapshot',
+    'DTSSnapshotStore',
+    'DTSSnapshotBuilder',
+    
     # Linkbase loading
     'LinkbaseLoader',
     'LinkbaseLoadResult',
@@ -176,6 +176,28 @@ DEFAULT_CACHE_SIZE_MB = 1024
 # Cache entry TTL (days)
 CACHE_ENTRY_TTL_DAYS = 30
 
+# ==============================================================================
+# DTS SNAPSHOTS
+# ==============================================================================
+
+# Schema locations with these prefixes are published taxonomies (the DTS
+# base); filing extension schemas are local files next to the instance
+REMOTE_SCHEMA_PREFIXES = ('http://', 'https://')
+
+# Snapshot format version - bump when DTSSnapshot fields change
+DTS_SNAPSHOT_VERSION = 1
+
+# Snapshot directory (under taxonomy_cache_dir) and file naming
+DTS_SNAPSHOT_DIR_NAME = 'dts_snapshots'
+DTS_SNAPSHOT_FILE_PREFIX = 'dts'
+DTS_SNAPSHOT_FILE_SUFFIX = '.pkl'
+
+# Hex digits of the entry-point set hash used in snapshot file names
+DTS_SNAPSHOT_KEY_LENGTH = 16
+
+# Schema file suffix (local taxonomy library lookup)
+SCHEMA_FILE_SUFFIX = '.xsd'
+
 # ==============================================================================
 # VALIDATION
 # ==============================================================================
@@ -237,6 +259,15 @@ __all__ = [
     'DEFAULT_CACHE_SIZE_MB',
     'CACHE_ENTRY_TTL_DAYS',
     
+    # DTS snapshots
+    'REMOTE_SCHEMA_PREFIXES',
+    'DTS_SNAPSHOT_VERSION',
+    'DTS_SNAPSHOT_DIR_NAME',
+    'DTS_SNAPSHOT_FILE_PREFIX',
+    'DTS_SNAPSHOT_FILE_SUFFIX',
+    'DTS_SNAPSHOT_KEY_LENGTH',
+    'SCHEMA_FILE_SUFFIX',
+    
     # Validation
     'REQUIRED_SCHEMA_ATTRS',
     'REQUIRED_ELEMENT_ATTRS',
@@ -0,0 +1,331 @@
+# Path: xbrl_parser/taxonomy/dts_snapshot.py
+"""
+DTS Snapshots
+
+Compiled base of a discoverable taxonomy set (DTS), stored on disk once
+per set of standard entry points.
+
+Filings that import the same published taxonomies (us-gaap, dei, srt,
+ifrs-full, ...) share everything except their extension schema. The
+snapshot holds that shared part - concepts, role types and (once linkbase
+loading exists) relationship networks - so a filing only loads its own
+extension schema on top of an unpickled base.
+
+Snapshots are:
+- keyed by the entry-point set (hash of the sorted schema locations)
+- versioned (DTS_SNAPSHOT_VERSION in the file name; other versions are
+  removed when a snapshot is saved)
+- written atomically (temp file + rename)
+
+Standard schemas are resolved from the local taxonomy library
+(taxonomy_path) by file name - parsing never fetches taxonomies over the
+network. A base with unresolved entry points is used for the current run
+but not saved, so it is rebuilt once the library has the missing files.
+
+Example:
+    store = DTSSnapshotStore(cache_dir)
+    snapshot = store.load(entry_points)
+    if snapshot is None:
+        snapshot = DTSSnapshotBuilder(config).build(entry_points)
+        if snapshot.is_complete:
+            store.save(snapshot)
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urljoin, urlparse
+
+from ...core.config_loader import ConfigLoader
+from ...loaders.taxonomy import TaxonomyLoader
+from ..models.concept import Concept
+from ..taxonomy.constants import (
+    REMOTE_SCHEMA_PREFIXES,
+    DTS_SNAPSHOT_VERSION,
+    DTS_SNAPSHOT_DIR_NAME,
+    DTS_SNAPSHOT_FILE_PREFIX,
+    DTS_SNAPSHOT_FILE_SUFFIX,
+    DTS_SNAPSHOT_KEY_LENGTH,
+    MAX_SCHEMA_COUNT,
+    SCHEMA_FILE_SUFFIX,
+)
+
+
+def is_remote_schema(schema_location: Optional[str]) -> bool:
+    """Check if a schema location is a published (remote) taxonomy."""
+    return bool(schema_location) and schema_location.startswith(REMOTE_SCHEMA_PREFIXES)
+
+
+def snapshot_key(entry_points: list[str]) -> str:
+    """
+    Key of an entry-point set (independent of order and duplicates).
+
+    Args:
+        entry_points: Standard schema locations
+
+    Returns:
+        Hex digest prefix
+    """
+    joined = '\n'.join(sorted(set(entry_points)))
+    return hashlib.sha256(joined.encode('utf-8')).hexdigest()[:DTS_SNAPSHOT_KEY_LENGTH]
+
+
+@dataclass
+class DTSSnapshot:
+    """
+    Compiled DTS base for one entry-point set.
+
+    Attributes:
+        key: snapshot_key() of entry_points
+        entry_points: Sorted standard schema locations
+        concepts: QName -> Concept of all base schemas
+        role_types: Role URI -> definition
+        networks: Relationship networks (empty until linkbases are loaded)
+        schemas: Schema location -> target namespace of each loaded schema
+        unresolved: Schema locations not found in the local library
+        version: Snapshot format version
+        created_at: Build time (epoch seconds)
+    """
+    key: str
+    entry_points: list[str]
+    concepts: dict[str, Concept] = field(default_factory=dict)
+    role_types: dict[str, str] = field(default_factory=dict)
+    networks: dict = field(default_factory=dict)
+    schemas: dict[str, str] = field(default_factory=dict)
+    unresolved: list[str] = field(default_factory=list)
+    version: int = DTS_SNAPSHOT_VERSION
+    created_at: float = 0.0
+
+    @property
+    def is_complete(self) -> bool:
+        """True if every schema of the base was resolved."""
+        return not self.unresolved
+
+
+class DTSSnapshotStore:
+    """
+    On-disk store of DTS snapshots.
+
+    One pickle file per entry-point set:
+    {cache_dir}/dts_snapshots/dts-v{version}-{key}.pkl
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize snapshot store.
+
+        Args:
+            cache_dir: Taxonomy cache directory
+        """
+        self.snapshot_dir = Path(cache_dir) / DTS_SNAPSHOT_DIR_NAME
+        self.logger = logging.getLogger(__name__)
+
+    def snapshot_path(self, key: str) -> Path:
+        """File path of a snapshot key (current format version)."""
+        return self.snapshot_dir / (
+            f"{DTS_SNAPSHOT_FILE_PREFIX}-v{DTS_SNAPSHOT_VERSION}-{key}{DTS_SNAPSHOT_FILE_SUFFIX}"
+        )
+
+    def load(self, entry_points: list[str]) -> Optional[DTSSnapshot]:
+        """
+        Load the snapshot of an entry-point set.
+
+        Args:
+            entry_points: Standard schema locations
+
+        Returns:
+            DTSSnapshot, or None if missing, unreadable or stale
+        """
+        key = snapshot_key(entry_points)
+        path = self.snapshot_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable DTS snapshot {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if not isinstance(snapshot, DTSSnapshot) \
+                or snapshot.version != DTS_SNAPSHOT_VERSION or snapshot.key != key:
+            self.logger.warning(f"Discarding stale DTS snapshot {path.name}")
+            path.unlink(missing_ok=True)
+            return None
+
+        self.logger.debug(f"Loaded DTS snapshot {path.name}: {len(snapshot.concepts)} concepts")
+        return snapshot
+
+    def save(self, snapshot: DTSSnapshot) -> Path:
+        """
+        Save a snapshot atomically and remove other format versions of it.
+
+        Args:
+            snapshot: Snapshot to save
+
+        Returns:
+            Path of the snapshot file
+        """
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        path = self.snapshot_path(snapshot.key)
+
+        fd, temp_name = tempfile.mkstemp(dir=self.snapshot_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, path)
+        except Exception:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        for stale in self.snapshot_dir.glob(
+            f"{DTS_SNAPSHOT_FILE_PREFIX}-v*-{snapshot.key}{DTS_SNAPSHOT_FILE_SUFFIX}"
+        ):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+
+        self.logger.info(
+            f"Saved DTS snapshot {path.name}: {len(snapshot.concepts)} concepts, "
+            f"{len(snapshot.schemas)} schemas"
+        )
+        return path
+
+
+class DTSSnapshotBuilder:
+    """
+    Builds a DTS snapshot by walking the standard schemas and their
+    imports, resolved from the local taxonomy library.
+    """
+
+    def __init__(self, config: Optional[ConfigLoader] = None, schema_loader=None):
+        """
+        Initialize snapshot builder.
+
+        Args:
+            config: Configuration loader (taxonomy_path)
+            schema_loader: SchemaLoader to reuse (creates one if None)
+        """
+        self.config = config or ConfigLoader()
+        self.logger = logging.getLogger(__name__)
+        self.schema_loader = schema_loader
+
+        # Schema file name -> local paths (built on first use)
+        self._library_index: Optional[dict[str, list[Path]]] = None
+
+    def build(self, entry_points: list[str]) -> DTSSnapshot:
+        """
+        Load the base schemas of an entry-point set.
+
+        Imports are followed breadth-first while they point to remote
+        schema locations.
+
+        Args:
+            entry_points: Standard schema locations
+
+        Returns:
+            DTSSnapshot (check is_complete before saving it)
+        """
+        from ..taxonomy.schema_loader import SchemaLoader
+
+        if self.schema_loader is None:
+            self.schema_loader = SchemaLoader(self.config)
+
+        ordered = sorted(set(entry_points))
+        snapshot = DTSSnapshot(key=snapshot_key(ordered), entry_points=ordered)
+
+        queue = deque(ordered)
+        seen = set(ordered)
+        while queue and len(snapshot.schemas) < MAX_SCHEMA_COUNT:
+            location = queue.popleft()
+
+            local_path = self._find_local(location)
+            if local_path is None:
+                snapshot.unresolved.append(location)
+                continue
+
+            schema_result = self.schema_loader.load_schema(local_path)
+            if schema_result.errors and not schema_result.elements:
+                snapshot.unresolved.append(location)
+                continue
+
+            snapshot.concepts.update(schema_result.elements)
+            snapshot.role_types.update(schema_result.role_types)
+            snapshot.schemas[location] = schema_result.namespace
+
+            for schema_import in schema_result.imports:
+                if not schema_import.schema_location:
+                    continue
+                imported = urljoin(location, schema_import.schema_location)
+                if is_remote_schema(imported) and imported not in seen:
+                    seen.add(imported)
+                    queue.append(imported)
+
+        snapshot.created_at = time.time()
+
+        if snapshot.unresolved:
+            self.logger.info(
+                f"DTS base: {len(snapshot.unresolved)} schemas not in the local "
+                f"taxonomy library (snapshot not saved)"
+            )
+        return snapshot
+
+    def _find_local(self, location: str) -> Optional[Path]:
+        """
+        Find the local library copy of a remote schema.
+
+        Matches by file name; when several files share the name, the one
+        whose path ends with the most URL path segments wins.
+        """
+        url_parts = [part for part in urlparse(location).path.split('/') if part]
+        if not url_parts:
+            return None
+
+        candidates = self._get_library_index().get(url_parts[-1], [])
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+
+        def matched_segments(path: Path) -> int:
+            count = 0
+            for local_part, url_part in zip(reversed(path.parts), reversed(url_parts)):
+                if local_part != url_part:
+                    break
+                count += 1
+            return count
+
+        return max(candidates, key=matched_segments)
+
+    def _get_library_index(self) -> dict[str, list[Path]]:
+        """Index schema files of the local taxonomy library by file name."""
+        if self._library_index is not None:
+            return self._library_index
+
+        self._library_index = {}
+        library_path = self.config.get('taxonomy_path')
+        if not library_path or not Path(library_path).is_dir():
+            self.logger.debug(f"Local taxonomy library not available: {library_path}")
+            return self._library_index
+
+        for path in sorted(TaxonomyLoader(self.config).discover_all_files()):
+            if path.suffix.lower() == SCHEMA_FILE_SUFFIX:
+                self._library_index.setdefault(path.name, []).append(path)
+
+        self.logger.debug(f"Indexed {len(self._library_index)} schema file names in local library")
+        return self._library_index
+
+
+__all__ = [
+    'DTSSnapshot',
+    'DTSSnapshotStore',
+    'DTSSnapshotBuilder',
+    'snapshot_key',
+    'is_remote_schema',
+]
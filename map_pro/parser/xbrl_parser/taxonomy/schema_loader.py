@@ -30,7 +30,7 @@ from ..foundation.namespace_registry import NamespaceRegistry
 from ..foundation.qname import QName, QNameResolver
 from ..models.concept import Concept, ConceptType, ConceptPeriodType
 from ..models.error import ParsingError, ErrorCategory
-from ..taxonomy.constants import XSD_NS
+from ..taxonomy.constants import XSD_NS, LINK_NS
 from ..foundation.url_addresses import (
     SEC_NAMESPACE_PATTERNS,
     ESMA_NAMESPACE_PATTERNS,
@@ -54,6 +54,7 @@ class SchemaLoadResult:
     namespace: str
     elements: dict[str, Concept] = field(default_factory=dict)
     imports: list[SchemaImport] = field(default_factory=list)
+    role_types: dict[str, str] = field(default_factory=dict)
     errors: list[ParsingError] = field(default_factory=list)
     is_extension: bool = False
 
@@ -161,6 +162,9 @@ class SchemaLoader:
             # Extract imports
             result.imports = self._extract_imports(root, schema_path_str)
             
+            # Extract role type definitions (roleURI -> definition)
+            result.role_types = self._extract_role_types(root)
+            
             # Extract element definitions
             result.elements = self._extract_elements(root, target_namespace, schema_path_str)
             
@@ -218,6 +222,28 @@ class SchemaLoader:
         
         return imports
     
+    def _extract_role_types(self, root: etree._Element) -> dict[str, str]:
+        """
+        Extract link:roleType definitions from schema.
+        
+        Args:
+            root: Schema root element
+            
+        Returns:
+            Dictionary of role URI -> definition (empty if none given)
+        """
+        role_types = {}
+        
+        for role_elem in root.iter(f"{{{LINK_NS}}}roleType"):
+            role_uri = role_elem.get('roleURI')
+            if not role_uri:
+                continue
+            
+            definition = role_elem.findtext(f"{{{LINK_NS}}}definition")
+            role_types[role_uri] = (definition or '').strip()
+        
+        return role_types
+    
     def _extract_elements(
         self,
         root: etree._Element,
@@ -6,6 +6,7 @@ High-level orchestrator for taxonomy loading and management.
 
 This service coordinates:
 - Schema loading and caching
+- DTS base snapshots (standard taxonomies compiled once per entry-point set)
 - Linkbase loading
 - Network building
 - Version management
@@ -27,7 +28,14 @@ from dataclasses import dataclass, field
 from ...core.config_loader import ConfigLoader
 from ..foundation.namespace_registry import NamespaceRegistry
 from ..foundation.taxonomy_cache import TaxonomyCache
-from ..foundation.xml_parser import XMLParser
+from ..foundation.instance_document import InstanceDocument
+from ..taxonomy.dts_snapshot import (
+    DTSSnapshot,
+    DTSSnapshotStore,
+    DTSSnapshotBuilder,
+    is_remote_schema,
+    snapshot_key,
+)
 from ..models.concept import Concept
 from ..models.error import ParsingError, ErrorCategory, ErrorSeverity
 
@@ -43,6 +51,7 @@ class TaxonomyLoadResult:
     # Loaded data
     concepts: dict[str, Concept] = field(default_factory=dict)
     namespaces: dict[str, str] = field(default_factory=dict)
+    role_types: dict[str, str] = field(default_factory=dict)
     
     # Loading statistics
     schemas_loaded: int = 0
@@ -55,6 +64,7 @@ class TaxonomyLoadResult:
     
     # Metadata
     entry_point: Optional[str] = None
+    base_entry_points: list[str] = field(default_factory=list)
     load_time_seconds: float = 0.0
     from_cache: bool = False
 
@@ -65,6 +75,10 @@ class TaxonomyService:
     
     Orchestrates schema loading, linkbase loading, and concept management.
     
+    Published taxonomies imported by a filing (the DTS base) are loaded
+    from a DTS snapshot keyed by the set of entry points; only the
+    filing's own extension schema is parsed per filing.
+    
     Example:
         config = ConfigLoader()
         service = TaxonomyService(config)
@@ -91,6 +105,15 @@ class TaxonomyService:
         cache_size_mb = self.config.get('taxonomy_cache_size_mb', 1024)
         self.cache = TaxonomyCache(cache_dir, cache_size_mb)
         
+        # DTS base snapshots (on disk when taxonomy caching is enabled,
+        # and per process by snapshot key)
+        self.snapshot_store = (
+            DTSSnapshotStore(cache_dir)
+            if self.config.get('enable_taxonomy_caching', True) else None
+        )
+        self.snapshot_builder = None
+        self._dts_snapshots: dict[str, DTSSnapshot] = {}
+        
         # Initialize namespace registry
         self.namespace_registry = NamespaceRegistry()
         
@@ -98,13 +121,18 @@ class TaxonomyService:
         self.concepts: dict[str, Concept] = {}
         self.loaded_schemas: set[str] = set()
         self.loaded_linkbases: set[str] = set()
+        self.role_types: dict[str, str] = {}
         
         # Lazy-loaded components
         self.schema_loader = None
         
         self.logger.info("TaxonomyService initialized")
     
-    def load_from_instance(self, instance_path: Path) -> TaxonomyLoadResult:
+    def load_from_instance(
+        self,
+        instance_path: Path,
+        document: Optional[InstanceDocument] = None
+    ) -> TaxonomyLoadResult:
         """
         Load taxonomy from instance document.
         
@@ -112,6 +140,8 @@ class TaxonomyService:
         
         Args:
             instance_path: Path to instance document
+            document: Shared handle on the instance (XBRLParser passes the
+                one its extraction phase uses, so the file is parsed once)
             
         Returns:
             TaxonomyLoadResult with loaded data and statistics
@@ -134,7 +164,7 @@ class TaxonomyService:
                 raise FileNotFoundError(f"Instance file not found: {instance_path}")
             
             # Extract schema references from instance
-            schema_refs = self._extract_schema_refs(instance_path)
+            schema_refs = self._extract_schema_refs(instance_path, document)
             
             if not schema_refs:
                 self.logger.warning("No schema references found in instance document")
@@ -142,10 +172,21 @@ class TaxonomyService:
             else:
                 self.logger.info(f"Found {len(schema_refs)} schema references")
             
-            # Load each schema
+            # Load each extension schema; published taxonomies (remote
+            # schemaRefs and remote imports) form the DTS base
+            base_entry_points = []
             for schema_ref in schema_refs:
+                if is_remote_schema(schema_ref):
+                    base_entry_points.append(schema_ref)
+                    continue
                 try:
-                    self._load_schema(schema_ref, result)
+                    schema_result = self._load_schema(schema_ref, result)
+                    if schema_result is not None:
+                        base_entry_points.extend(
+                            schema_import.schema_location
+                            for schema_import in schema_result.imports
+                            if is_remote_schema(schema_import.schema_location)
+                        )
                 except Exception as e:
                     self.logger.warning(f"Failed to load schema {schema_ref}: {e}")
                     result.errors.append(ParsingError(
@@ -154,6 +195,9 @@ class TaxonomyService:
                         severity=ErrorSeverity.WARNING
                     ))
             
+            if base_entry_points:
+                self._load_dts_base(base_entry_points, result)
+            
             # TODO: Load linkbases (calculation, presentation, definition)
             # This would require following linkbaseRef elements
             # For now, we have the basic concepts from schemas
@@ -161,6 +205,7 @@ class TaxonomyService:
             # Populate result
             result.concepts = self.concepts
             result.namespaces = dict(self.namespace_registry.by_prefix)
+            result.role_types = self.role_types
             result.schemas_loaded = len(self.loaded_schemas)
             result.linkbases_loaded = len(self.loaded_linkbases)
             result.concepts_loaded = len(self.concepts)
@@ -182,14 +227,21 @@ class TaxonomyService:
         
         return result
     
-    def _extract_schema_refs(self, instance_path: Path) -> list[str]:
+    def _extract_schema_refs(
+        self,
+        instance_path: Path,
+        document: Optional[InstanceDocument] = None
+    ) -> list[str]:
         """
         Extract schema references from instance document.
         
         Looks for <link:schemaRef> elements with xlink:href attributes.
+        Without a shared document handle, only the document header is
+        scanned (no full parse).
         
         Args:
             instance_path: Path to instance document
+            document: Shared handle on the instance document
             
         Returns:
             list of schema reference URIs
@@ -197,35 +249,18 @@ class TaxonomyService:
         schema_refs = []
         
         try:
-            # Parse instance document
-            parser = XMLParser()
-            result = parser.parse_file(instance_path)
-            
-            # XMLParser returns XMLParseResult with .root attribute
-            if result.root is None:
-                self.logger.warning("Failed to parse instance document")
-                return schema_refs
+            if document is None:
+                document = InstanceDocument(instance_path, self.config, build_tree=False)
             
-            root = result.root
-            
-            # Define namespaces
-            LINK_NS = 'http://www.xbrl.org/2003/linkbase'
-            XLINK_NS = 'http://www.w3.org/1999/xlink'
-            
-            # Find all schemaRef elements
-            schema_elements = root.findall(f".//{{{LINK_NS}}}schemaRef")
-            
-            for elem in schema_elements:
-                href = elem.get(f'{{{XLINK_NS}}}href')
-                if href:
-                    # Resolve relative paths
-                    if not href.startswith('http'):
-                        # Make absolute path relative to instance directory
-                        instance_dir = instance_path.parent
-                        schema_path = (instance_dir / href).resolve()
-                        schema_refs.append(str(schema_path))
-                    else:
-                        schema_refs.append(href)
+            for href in document.schema_refs():
+                # Resolve relative paths
+                if not href.startswith('http'):
+                    # Make absolute path relative to instance directory
+                    instance_dir = instance_path.parent
+                    schema_path = (instance_dir / href).resolve()
+                    schema_refs.append(str(schema_path))
+                else:
+                    schema_refs.append(href)
             
             self.logger.debug(f"Extracted {len(schema_refs)} schema references")
             
@@ -234,18 +269,21 @@ class TaxonomyService:
         
         return schema_refs
     
-    def _load_schema(self, schema_ref: str, result: TaxonomyLoadResult) -> None:
+    def _load_schema(self, schema_ref: str, result: TaxonomyLoadResult):
         """
         Load a single schema and add concepts to result.
         
         Args:
             schema_ref: Schema URI or file path
             result: TaxonomyLoadResult to populate
+            
+        Returns:
+            SchemaLoadResult, or None if the schema was already loaded
         """
         # Check if already loaded
         if schema_ref in self.loaded_schemas:
             self.logger.debug(f"Schema already loaded: {schema_ref}")
-            return
+            return None
         
         try:
             from ..taxonomy.schema_loader import SchemaLoader
@@ -260,16 +298,93 @@ class TaxonomyService:
             # Add concepts to service registry
             for qname, concept in schema_result.elements.items():
                 self.concepts[qname] = concept
+            self.role_types.update(schema_result.role_types)
             
             # Track loaded schema
             self.loaded_schemas.add(schema_ref)
             
             self.logger.debug(f"Loaded schema {schema_ref}: {len(schema_result.elements)} concepts")
+            return schema_result
             
         except Exception as e:
             self.logger.warning(f"Failed to load schema {schema_ref}: {e}")
             raise
     
+    def _load_dts_base(self, entry_points: list[str], result: TaxonomyLoadResult) -> None:
+        """
+        Add the DTS base of a set of standard entry points.
+        
+        The base comes from this process's snapshots, the on-disk
+        snapshot store, or is built from the local taxonomy library (and
+        saved if complete). Extension concepts take precedence over base
+        concepts with the same QName.
+        
+        Args:
+            entry_points: Standard schema locations imported by the filing
+            result: TaxonomyLoadResult to populate
+        """
+        snapshot = self._get_dts_snapshot(entry_points, result)
+        
+        for qname, concept in snapshot.concepts.items():
+            self.concepts.setdefault(qname, concept)
+        for role_uri, definition in snapshot.role_types.items():
+            self.role_types.setdefault(role_uri, definition)
+        self.loaded_schemas.update(snapshot.schemas)
+        
+        result.base_entry_points = snapshot.entry_points
+        if snapshot.unresolved:
+            result.warnings.append(
+                f"DTS base incomplete: {len(snapshot.unresolved)} standard schemas "
+                f"not in local taxonomy library"
+            )
+        
+        self.logger.debug(
+            f"DTS base {snapshot.key}: {len(snapshot.concepts)} concepts from "
+            f"{len(snapshot.schemas)} schemas"
+        )
+    
+    def _get_dts_snapshot(
+        self,
+        entry_points: list[str],
+        result: TaxonomyLoadResult
+    ) -> DTSSnapshot:
+        """
+        Get (load or build) the DTS snapshot of an entry-point set.
+        
+        Args:
+            entry_points: Standard schema locations
+            result: TaxonomyLoadResult (from_cache is set on a cache hit)
+            
+        Returns:
+            DTSSnapshot
+        """
+        key = snapshot_key(entry_points)
+        snapshot = self._dts_snapshots.get(key)
+        
+        if snapshot is None and self.snapshot_store is not None:
+            snapshot = self.snapshot_store.load(entry_points)
+        
+        if snapshot is not None:
+            result.from_cache = True
+        else:
+            if self.snapshot_builder is None:
+                from ..taxonomy.schema_loader import SchemaLoader
+                
+                if self.schema_loader is None:
+                    self.schema_loader = SchemaLoader(self.config)
+                self.snapshot_builder = DTSSnapshotBuilder(self.config, self.schema_loader)
+            
+            snapshot = self.snapshot_builder.build(entry_points)
+            
+            if snapshot.is_complete and self.snapshot_store is not None:
+                try:
+                    self.snapshot_store.save(snapshot)
+                except OSError as e:
+                    self.logger.warning(f"Failed to save DTS snapshot {key}: {e}")
+        
+        self._dts_snapshots[key] = snapshot
+        return snapshot
+    
     def get_concept(self, qname: str) -> Optional[Concept]:
         """
         Get concept by QName.
@@ -300,6 +415,7 @@ class TaxonomyService:
         self.concepts.clear()
         self.loaded_schemas.clear()
         self.loaded_linkbases.clear()
+        self.role_types.clear()
         self.namespace_registry = NamespaceRegistry()
         self.logger.info("Taxonomy service cleared")
 
@@ -10,6 +10,12 @@ This module validates:
 - Context matching for calculations
 - Inconsistency reporting
 
+Facts are indexed once per filing by (concept, context_ref). Each
+calculation network is then screened in one vectorised pass (NumPy, when
+available); only checks that may fail are re-verified with exact Decimal
+arithmetic, so results match the scalar path. Indexing and checking times
+are recorded with the observability PerformanceMonitor.
+
 Example:
     from ..validation import CalculationValidator
     
@@ -24,10 +30,16 @@ import logging
 from typing import Optional
 from decimal import Decimal, InvalidOperation
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from ...core.config_loader import ConfigLoader
 from ..models.parsed_filing import ParsedFiling
 from ..models.error import ParsingError, ErrorSeverity, ErrorCategory
-from ..models.fact import FactType
+from ..models.fact import Fact, FactType
+from ..observability.performance import PerformanceMonitor, Phase
 from ..validation.constants import (
     VALIDATOR_CALCULATION,
     CATEGORY_CALCULATION,
@@ -41,10 +53,96 @@ from ..validation.constants import (
     MSG_CALCULATION_TOLERANCE_EXCEEDED,
     DEFAULT_CALCULATION_TOLERANCE,
     INFINITE_PRECISION,
-    TOLERANCE_DECIMAL_PRECISION
+    TOLERANCE_DECIMAL_PRECISION,
+    CALCULATION_SCREEN_RELATIVE_MARGIN,
+    CALCULATION_SCREEN_ABSOLUTE_MARGIN
 )
 
 
+class CalculationFactIndex:
+    """
+    Numeric facts of one filing keyed by concept, then context_ref.
+    
+    Built once per validation run so every summation check is a dictionary
+    lookup instead of a scan over all facts. The first numeric fact for a
+    (concept, context) pair wins, matching the previous scan order.
+    
+    Example:
+        index = CalculationFactIndex(filing.instance.facts)
+        
+        for context_ref, fact in index.facts_for('us-gaap:Assets').items():
+            ...
+    """
+    
+    def __init__(self, facts: list[Fact]):
+        """
+        Index numeric facts.
+        
+        Args:
+            facts: Filing facts in document order
+        """
+        self.by_concept: dict[str, dict[str, Fact]] = {}
+        self._values: dict[str, dict[str, float]] = {}
+        self.fact_count = 0
+        
+        numeric = FactType.NUMERIC
+        by_concept = self.by_concept
+        
+        for fact in facts:
+            if fact.fact_type != numeric or not fact.context_ref:
+                continue
+            
+            contexts = by_concept.get(fact.concept)
+            if contexts is None:
+                contexts = by_concept[fact.concept] = {}
+            
+            if fact.context_ref not in contexts:
+                contexts[fact.context_ref] = fact
+                self.fact_count += 1
+    
+    def get(self, concept: str, context_ref: str) -> Optional[Fact]:
+        """Get the numeric fact for a concept in a context."""
+        contexts = self.by_concept.get(concept)
+        return contexts.get(context_ref) if contexts else None
+    
+    def facts_for(self, concept: str) -> dict[str, Fact]:
+        """Get context_ref -> fact for a concept, in document order."""
+        return self.by_concept.get(concept, {})
+    
+    def values_for(self, concept: str) -> dict[str, float]:
+        """
+        Get context_ref -> float value for a concept (parsed once).
+        
+        Values that do not parse as decimals map to 0.0, which is how the
+        exact path treats them in a sum.
+        """
+        values = self._values.get(concept)
+        if values is None:
+            values = {
+                context_ref: self._to_float(fact.value)
+                for context_ref, fact in self.facts_for(concept).items()
+            }
+            self._values[concept] = values
+        return values
+    
+    @staticmethod
+    def _to_float(value) -> float:
+        """Parse a fact value as float (0.0 if it is not a valid decimal)."""
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            pass
+        
+        # Spellings only Decimal accepts
+        try:
+            return float(Decimal(value))
+        except (InvalidOperation, ValueError, TypeError):
+            return 0.0
+    
+    def __len__(self) -> int:
+        return self.fact_count
+
+
 class CalculationValidator:
     """
     Validates calculation relationships.
@@ -60,17 +158,27 @@ class CalculationValidator:
         
         if errors:
             print(f"Found {len(errors)} calculation issues")
+        
+        print(validator.monitor.get_phase_duration(Phase.VALIDATION))
     """
     
-    def __init__(self, config: Optional[ConfigLoader] = None):
+    def __init__(
+        self,
+        config: Optional[ConfigLoader] = None,
+        monitor: Optional[PerformanceMonitor] = None
+    ):
         """
         Initialize calculation validator.
         
         Args:
             config: Configuration loader
+            monitor: Performance monitor for indexing/checking timings
+                (a private one is created if None; it must not have
+                another phase active while validate() runs)
         """
         self.config = config or ConfigLoader()
         self.logger = logging.getLogger(__name__)
+        self.monitor = monitor or PerformanceMonitor()
         
         # Get configuration
         self.enabled = self.config.get('enable_calculation_validation', True)
@@ -78,7 +186,7 @@ class CalculationValidator:
         
         self.logger.debug(
             f"CalculationValidator initialized: enabled={self.enabled}, "
-            f"tolerance={self.tolerance}"
+            f"tolerance={self.tolerance}, vectorised={np is not None}"
         )
     
     def get_name(self) -> str:
@@ -116,29 +224,35 @@ class CalculationValidator:
         self.logger.info(f"Validating calculations: {filing.metadata.entry_point}")
         
         # Get calculation relationships from taxonomy
-        calc_relationships = self._discover_calculations(filing)
+        calc_networks = self._discover_calculations(filing)
         
-        if not calc_relationships:
+        if not calc_networks:
             self.logger.debug("No calculation relationships found")
             return []
         
-        # Validate each calculation
-        for parent_concept, children in calc_relationships.items():
-            errors.extend(
-                self._validate_calculation(
-                    parent_concept,
-                    children,
-                    filing
+        # Index facts once for all networks
+        with self.monitor.phase_context(Phase.INDEXING):
+            fact_index = CalculationFactIndex(filing.instance.facts)
+        
+        # Validate each network
+        with self.monitor.phase_context(Phase.VALIDATION):
+            for role, calculations in calc_networks.items():
+                errors.extend(
+                    self._validate_network(calculations, fact_index, filing)
                 )
-            )
         
-        self.logger.info(f"Calculation validation completed: {len(errors)} issues")
+        self.logger.info(
+            f"Calculation validation completed: {len(errors)} issues "
+            f"(index {self.monitor.get_phase_duration(Phase.INDEXING):.3f}s, "
+            f"checks {self.monitor.get_phase_duration(Phase.VALIDATION):.3f}s, "
+            f"{len(fact_index)} indexed facts, {len(calc_networks)} networks)"
+        )
         return errors
     
     def _discover_calculations(
         self,
         filing: ParsedFiling
-    ) -> dict[str, list[tuple[str, float]]]:
+    ) -> dict[str, dict[str, list[tuple[str, float]]]]:
         """
         Discover calculation relationships from taxonomy.
         
@@ -146,86 +260,73 @@ class CalculationValidator:
             filing: Parsed filing
             
         Returns:
-            dict mapping parent concepts to list of (child_concept, weight) tuples
+            dict mapping role to {parent concept: list of (child_concept, weight)}
         """
-        calculations: dict[str, list[tuple[str, float]]] = {}
+        networks: dict[str, dict[str, list[tuple[str, float]]]] = {}
         
         if not filing.taxonomy or not filing.taxonomy.calculation_networks:
-            return calculations
+            return networks
         
-        # Extract calculation relationships from networks
-        for network in filing.taxonomy.calculation_networks:
-            for parent, children in network.items():
-                if parent not in calculations:
-                    calculations[parent] = []
+        for role, relationships in filing.taxonomy.calculation_networks.items():
+            calculations = networks.setdefault(role, {})
+            
+            for relationship in relationships:
+                if relationship.is_prohibited():
+                    continue
                 
-                for child in children:
-                    # Child should have concept and weight
-                    concept = child.get('concept', child.get('to_concept'))
-                    weight = child.get('weight', 1.0)
-                    
-                    if concept:
-                        calculations[parent].append((concept, float(weight)))
-        
-        return calculations
+                calculations.setdefault(relationship.from_concept, []).append(
+                    (relationship.to_concept, float(relationship.weight))
+                )
+        
+        return networks
     
-    def _validate_calculation(
+    def _validate_network(
         self,
-        parent_concept: str,
-        children: list[tuple[str, float]],
+        calculations: dict[str, list[tuple[str, float]]],
+        fact_index: CalculationFactIndex,
         filing: ParsedFiling
     ) -> list[ParsingError]:
         """
-        Validate a single calculation relationship.
+        Validate every calculation of one network.
+        
+        There is one check per (parent concept, context). All checks are
+        screened together, and the exact Decimal verification runs only for
+        checks that are incomplete or may be out of tolerance.
         
         Args:
-            parent_concept: Parent concept
-            children: list of (child_concept, weight) tuples
+            calculations: Parent concept to list of (child_concept, weight)
+            fact_index: Per-filing fact index
             filing: Parsed filing
             
         Returns:
-            list of errors for this calculation
+            list of errors for this network
         """
-        errors: list[ParsingError] = []
+        calculations = {
+            parent_concept: children
+            for parent_concept, children in calculations.items()
+            if fact_index.facts_for(parent_concept)
+        }
         
-        # Get all facts for parent concept
-        parent_facts = [
-            f for f in filing.instance.facts
-            if f.concept == parent_concept and f.fact_type == FactType.NUMERIC
-        ]
-        
-        if not parent_facts:
-            # Parent concept has no facts - not necessarily an error
-            return errors
+        if not calculations:
+            return []
         
-        # Validate calculation for each parent fact (by context)
-        contexts_checked: set[str] = set()
+        cleared = self._screen_network(calculations, fact_index)
         
-        for parent_fact in parent_facts:
-            if not parent_fact.context_ref:
-                continue
-            
-            # Only check each context once
-            if parent_fact.context_ref in contexts_checked:
-                continue
-            contexts_checked.add(parent_fact.context_ref)
-            
-            # Find all child facts in same context
-            child_facts = self._find_child_facts(
-                children,
-                parent_fact.context_ref,
-                filing
-            )
-            
-            # Validate arithmetic
-            errors.extend(
-                self._verify_arithmetic(
-                    parent_fact,
-                    child_facts,
-                    children,
-                    filing
-                )
-            )
+        errors: list[ParsingError] = []
+        check = 0
+        
+        for parent_concept, children in calculations.items():
+            for context_ref, parent_fact in fact_index.facts_for(parent_concept).items():
+                if not cleared[check]:
+                    errors.extend(
+                        self._verify_arithmetic(
+                            parent_fact,
+                            self._find_child_facts(children, context_ref, fact_index),
+                            children,
+                            filing
+                        )
+                    )
+                check += 1
         
         return errors
     
@@ -233,36 +334,99 @@ class CalculationValidator:
         self,
         children: list[tuple[str, float]],
         context_ref: str,
-        filing: ParsedFiling
-    ) -> dict[str, 'Fact']:
+        fact_index: CalculationFactIndex
+    ) -> dict[str, Fact]:
         """
         Find child facts in the same context.
         
         Args:
             children: list of (child_concept, weight) tuples
             context_ref: Context reference
-            filing: Parsed filing
+            fact_index: Per-filing fact index
             
         Returns:
             dict mapping child concept to fact
         """
-        child_facts: dict[str, 'Fact'] = {}
+        child_facts: dict[str, Fact] = {}
         
         for child_concept, weight in children:
-            # Find fact for this child in same context
-            matching_facts = [
-                f for f in filing.instance.facts
-                if (f.concept == child_concept and
-                    f.context_ref == context_ref and
-                    f.fact_type == FactType.NUMERIC)
-            ]
-            
-            if matching_facts:
-                # Use first matching fact
-                child_facts[child_concept] = matching_facts[0]
+            child_fact = fact_index.get(child_concept, context_ref)
+            if child_fact is not None:
+                child_facts[child_concept] = child_fact
         
         return child_facts
     
+    def _screen_network(
+        self,
+        calculations: dict[str, list[tuple[str, float]]],
+        fact_index: CalculationFactIndex
+    ) -> list[bool]:
+        """
+        Clear checks that are safely within tolerance, in one vectorised pass.
+        
+        Child values are laid out column by column (one column per
+        parent/child arc, one row per parent context) and summed for the
+        whole network with a single np.bincount. Missing children become
+        NaN, so incomplete checks are never cleared; neither are checks
+        whose float difference is close to the tolerance.
+        
+        Args:
+            calculations: Parent concept to list of (child_concept, weight)
+            fact_index: Per-filing fact index
+            
+        Returns:
+            One flag per check in _validate_network order, True when the
+            check cannot fail and exact verification can be skipped
+        """
+        if np is None:
+            return [False] * sum(
+                len(fact_index.facts_for(parent_concept)) for parent_concept in calculations
+            )
+        
+        missing = float('nan')
+        tolerance_cache: dict[any, float] = {}
+        
+        parent_values: list[float] = []
+        tolerances: list[float] = []
+        row_ids: list[int] = []
+        child_values: list[float] = []
+        weights: list[float] = []
+        
+        for parent_concept, children in calculations.items():
+            parent_facts = fact_index.facts_for(parent_concept)
+            parent_vals = fact_index.values_for(parent_concept)
+            contexts = list(parent_facts)
+            first_row = len(parent_values)
+            rows = range(first_row, first_row + len(contexts))
+            
+            parent_values.extend(parent_vals[context_ref] for context_ref in contexts)
+            
+            for context_ref in contexts:
+                decimals = parent_facts[context_ref].decimals
+                tolerance = tolerance_cache.get(decimals)
+                if tolerance is None:
+                    tolerance = float(self._calculate_tolerance(parent_facts[context_ref], {}))
+                    tolerance_cache[decimals] = tolerance
+                tolerances.append(tolerance)
+            
+            for child_concept, weight in children:
+                values = fact_index.values_for(child_concept)
+                row_ids.extend(rows)
+                child_values.extend(values.get(context_ref, missing) for context_ref in contexts)
+                weights.extend([weight] * len(contexts))
+        
+        parents = np.asarray(parent_values, dtype=np.float64)
+        ids = np.asarray(row_ids, dtype=np.intp)
+        contributions = np.asarray(child_values, dtype=np.float64) * np.asarray(weights, dtype=np.float64)
+        
+        sums = np.bincount(ids, weights=contributions, minlength=len(parents))
+        magnitudes = np.bincount(ids, weights=np.abs(contributions), minlength=len(parents)) + np.abs(parents)
+        
+        margin = magnitudes * CALCULATION_SCREEN_RELATIVE_MARGIN + CALCULATION_SCREEN_ABSOLUTE_MARGIN
+        
+        # NaN (missing child, non-finite value) compares False -> not cleared
+        return (np.abs(sums - parents) <= np.asarray(tolerances, dtype=np.float64) - margin).tolist()
+    
     def _verify_arithmetic(
         self,
         parent_fact: 'Fact',
@@ -394,4 +558,4 @@ class CalculationValidator:
         return Decimal(str(self.tolerance))
 
 
-__all__ = ['CalculationValidator']
+__all__ = ['CalculationValidator', 'CalculationFactIndex']
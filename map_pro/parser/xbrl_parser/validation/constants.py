@@ -42,6 +42,12 @@ TOLERANCE_DECIMAL_PRECISION = 10
 # Infinite precision indicator
 INFINITE_PRECISION = "INF"
 
+# Vectorised calculation screening: float64 sums are only used to decide which
+# checks need the exact Decimal comparison. Checks whose float difference is
+# within this relative margin of the tolerance are always re-checked exactly.
+CALCULATION_SCREEN_RELATIVE_MARGIN = 1e-9
+CALCULATION_SCREEN_ABSOLUTE_MARGIN = 1e-6
+
 # ==============================================================================
 # STRUCTURAL VALIDATION
 # ==============================================================================
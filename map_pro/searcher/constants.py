@@ -14,6 +14,7 @@ STATUS_IN_PROGRESS: str = 'in_progress'
 
 # HTTP Status Codes
 HTTP_OK: int = 200
+HTTP_NOT_MODIFIED: int = 304
 HTTP_NOT_FOUND: int = 404
 HTTP_TOO_MANY_REQUESTS: int = 429
 HTTP_SERVER_ERROR: int = 500
@@ -28,6 +29,24 @@ RETRYABLE_STATUS_CODES: list[int] = [
     HTTP_GATEWAY_TIMEOUT
 ]
 
+# HTTP Response Cache (shared by the market API clients)
+HTTP_CACHE_MODE_OFF: str = 'off'          # No cache, every request goes to the network
+HTTP_CACHE_MODE_CACHE: str = 'cache'      # Serve fresh entries, revalidate stale ones
+HTTP_CACHE_MODE_REPLAY: str = 'replay'    # Recorded responses only, never the network
+HTTP_CACHE_MODES: list[str] = [HTTP_CACHE_MODE_OFF, HTTP_CACHE_MODE_CACHE, HTTP_CACHE_MODE_REPLAY]
+HTTP_CACHE_DIR_NAME: str = 'http_cache'   # In searcher_cache_dir
+HTTP_CACHE_INDEX_FILENAME: str = 'index.sqlite'
+HTTP_CACHE_BODIES_DIR_NAME: str = 'bodies'
+HTTP_CACHE_BODY_FANOUT: int = 2           # Hash prefix length of body subdirectories
+HTTP_CACHEABLE_STATUS_CODES: list[int] = [HTTP_OK, HTTP_NOT_FOUND]
+HTTP_CACHE_NOT_FOUND_TTL: int = 0          # Stored 404s: recorded for replay, re-requested in cache mode
+HTTP_CACHE_STORED_HEADERS: list[str] = ['Content-Type', 'ETag', 'Last-Modified']
+HEADER_ETAG: str = 'ETag'
+HEADER_LAST_MODIFIED: str = 'Last-Modified'
+HEADER_IF_NONE_MATCH: str = 'If-None-Match'
+HEADER_IF_MODIFIED_SINCE: str = 'If-Modified-Since'
+SECONDS_PER_HOUR: int = 3600
+
 # IPO Logging Prefixes
 LOG_INPUT: str = '[INPUT]'
 LOG_PROCESS: str = '[PROCESS]'
@@ -107,6 +126,7 @@ __all__ = [
     'STATUS_FAILED',
     'STATUS_IN_PROGRESS',
     'HTTP_OK',
+    'HTTP_NOT_MODIFIED',
     'HTTP_NOT_FOUND',
     'HTTP_TOO_MANY_REQUESTS',
     'HTTP_SERVER_ERROR',
@@ -114,6 +134,22 @@ __all__ = [
     'HTTP_SERVICE_UNAVAILABLE',
     'HTTP_GATEWAY_TIMEOUT',
     'RETRYABLE_STATUS_CODES',
+    'HTTP_CACHE_MODE_OFF',
+    'HTTP_CACHE_MODE_CACHE',
+    'HTTP_CACHE_MODE_REPLAY',
+    'HTTP_CACHE_MODES',
+    'HTTP_CACHE_DIR_NAME',
+    'HTTP_CACHE_INDEX_FILENAME',
+    'HTTP_CACHE_BODIES_DIR_NAME',
+    'HTTP_CACHE_BODY_FANOUT',
+    'HTTP_CACHEABLE_STATUS_CODES',
+    'HTTP_CACHE_NOT_FOUND_TTL',
+    'HTTP_CACHE_STORED_HEADERS',
+    'HEADER_ETAG',
+    'HEADER_LAST_MODIFIED',
+    'HEADER_IF_NONE_MATCH',
+    'HEADER_IF_MODIFIED_SINCE',
+    'SECONDS_PER_HOUR',
     'LOG_INPUT',
     'LOG_PROCESS',
     'LOG_OUTPUT',
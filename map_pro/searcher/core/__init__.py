@@ -1,10 +1,19 @@
 # Path: searcher/core/__init__.py
-"""Core Module - Configuration, Logging, Path Management, and Metadata Extraction"""
+"""Core Module - Configuration, Logging, Path Management, Metadata Extraction, Rate Limiting, and HTTP Response Cache"""
 
 from .config_loader import ConfigLoader
 from .logger import get_logger, configure_logging
 from .data_paths import DataPathsManager, ensure_data_paths, validate_paths
 from .metadata_extractor import BaseMetadataExtractor
+from .rate_limiter import AsyncTokenBucket
+from .http_cache import (
+    HTTPResponseCache,
+    CachedResponse,
+    HTTPCacheMissError,
+    get_http_cache,
+    get_http_cache_statistics,
+    resolve_ttl,
+)
 
 __all__ = [
     'ConfigLoader',
@@ -14,4 +23,11 @@ __all__ = [
     'ensure_data_paths',
     'validate_paths',
     'BaseMetadataExtractor',
+    'AsyncTokenBucket',
+    'HTTPResponseCache',
+    'CachedResponse',
+    'HTTPCacheMissError',
+    'get_http_cache',
+    'get_http_cache_statistics',
+    'resolve_ttl',
 ]
\ No newline at end of file
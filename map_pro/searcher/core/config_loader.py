@@ -29,6 +29,7 @@ DEFAULT_MAX_CONCURRENT_REQUESTS: int = 3
 DEFAULT_MAX_RESULTS: int = 100
 DEFAULT_LOOKBACK_DAYS: int = 365
 DEFAULT_CACHE_EXPIRY_HOURS: int = 24
+DEFAULT_HTTP_CACHE_MODE: str = 'cache'
 DEFAULT_SEC_RATE_LIMIT: int = 10
 DEFAULT_FCA_RATE_LIMIT: int = 5
 DEFAULT_ESMA_RATE_LIMIT: int = 3
@@ -141,6 +142,8 @@ class ConfigLoader:
             # ================================================================
             'enable_cache': self._get_bool('SEARCHER_ENABLE_CACHE', True),
             'cache_expiry_hours': self._get_int('SEARCHER_CACHE_EXPIRY_HOURS', DEFAULT_CACHE_EXPIRY_HOURS),
+            # HTTP response cache of the market API clients: off, cache or replay
+            'http_cache_mode': self._get_env('SEARCHER_HTTP_CACHE_MODE', DEFAULT_HTTP_CACHE_MODE),
             
             # ================================================================
             # OPERATIONAL SETTINGS
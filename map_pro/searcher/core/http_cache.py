@@ -0,0 +1,493 @@
+# Path: searcher/core/http_cache.py
+"""
+HTTP Response Cache
+
+On-disk cache under the market API clients (SEC, UK Companies House,
+ESEF), so repeated searches do not re-fetch submissions JSON, filing
+histories and filing indexes.
+
+Storage (in searcher_cache_dir/http_cache):
+- bodies/: response bodies, content-addressed (file name = sha256 of the
+  body), so identical responses are stored once
+- index.sqlite: request (method + URL) -> status, body hash, stored
+  headers and time stored
+
+Modes (http_cache_mode):
+- off: every request goes to the network
+- cache: entries younger than their TTL are served from disk; older ones
+  are revalidated with If-None-Match / If-Modified-Since (a 304 keeps the
+  stored body). Only 200 and 404 responses are stored. A 404 is never
+  served past HTTP_CACHE_NOT_FOUND_TTL whatever the endpoint TTL, so a
+  resource that is missing today (e.g. a filing index not yet published)
+  is requested again by the next search.
+- replay: recorded responses only, whatever their age; a request that was
+  never recorded raises HTTPCacheMissError instead of going to the
+  network. Record with mode 'cache', then replay offline.
+
+TTLs are per endpoint: each client passes its own URL fragment -> seconds
+rules (see resolve_ttl); URLs matching no rule use cache_expiry_hours.
+
+Example:
+    cache = get_http_cache(config)
+    response = await cache.fetch(
+        session, url,
+        headers=headers,
+        ttl=resolve_ttl(url, SEC_HTTP_CACHE_TTLS, cache.default_ttl),
+        before_request=rate_limiter.acquire,   # not called on cache hits
+    )
+    data = response.json()
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from searcher.core.config_loader import ConfigLoader
+from searcher.core.logger import get_logger
+from searcher.constants import (
+    HTTP_NOT_MODIFIED,
+    HTTP_NOT_FOUND,
+    HTTP_CACHE_MODE_OFF,
+    HTTP_CACHE_MODE_CACHE,
+    HTTP_CACHE_MODE_REPLAY,
+    HTTP_CACHE_MODES,
+    HTTP_CACHE_DIR_NAME,
+    HTTP_CACHE_INDEX_FILENAME,
+    HTTP_CACHE_BODIES_DIR_NAME,
+    HTTP_CACHE_BODY_FANOUT,
+    HTTP_CACHEABLE_STATUS_CODES,
+    HTTP_CACHE_NOT_FOUND_TTL,
+    HTTP_CACHE_STORED_HEADERS,
+    HEADER_ETAG,
+    HEADER_LAST_MODIFIED,
+    HEADER_IF_NONE_MATCH,
+    HEADER_IF_MODIFIED_SINCE,
+    SECONDS_PER_HOUR,
+)
+
+logger = get_logger(__name__, 'core')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    request_key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    body_hash TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+"""
+
+_COUNTERS = ('requests', 'hits', 'revalidated', 'misses', 'stored', 'replay_misses')
+
+
+class HTTPCacheMissError(Exception):
+    """Request not recorded in the cache (replay mode)."""
+
+
+@dataclass
+class CachedResponse:
+    """
+    Response read completely, from the network or from the cache.
+
+    Offers the parts of aiohttp.ClientResponse the API clients use
+    (status, headers, text(), json(), raise_for_status()).
+
+    Attributes:
+        url: Request URL
+        status: HTTP status code
+        body: Response body (empty for HEAD)
+        method: Request method
+        headers: Response headers (case-insensitive; only the stored
+            headers for cached responses)
+        from_cache: True if the body came from the cache
+        revalidated: True if the server confirmed the cached body (304)
+        reason: HTTP reason phrase (network responses only)
+        request_info: aiohttp request info (network responses only)
+        history: Redirect history (network responses only)
+    """
+    url: str
+    status: int
+    body: bytes
+    method: str = 'GET'
+    headers: CIMultiDict = field(default_factory=CIMultiDict)
+    from_cache: bool = False
+    revalidated: bool = False
+    reason: Optional[str] = None
+    request_info: Any = None
+    history: tuple = ()
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        """Body decoded with the charset of the Content-Type (UTF-8 if none)."""
+        if encoding is None:
+            content_type = self.headers.get('Content-Type', '')
+            _, _, charset = content_type.partition('charset=')
+            encoding = charset.split(';')[0].strip() or 'utf-8'
+        return self.body.decode(encoding, errors='replace')
+
+    def json(self) -> Any:
+        """Body parsed as JSON."""
+        return json.loads(self.body)
+
+    def raise_for_status(self) -> None:
+        """Raise aiohttp.ClientResponseError for 4xx/5xx statuses."""
+        if self.status >= 400:
+            request_info = self.request_info
+            if request_info is None:
+                # Cached responses have no aiohttp request; str() of the
+                # error needs one
+                url = URL(self.url)
+                request_info = aiohttp.RequestInfo(
+                    url, self.method, CIMultiDictProxy(CIMultiDict()), url
+                )
+            raise aiohttp.ClientResponseError(
+                request_info=request_info,
+                history=self.history,
+                status=self.status,
+                message=self.reason or '',
+            )
+
+
+def request_key(method: str, url: str) -> str:
+    """Cache key of a request."""
+    return hashlib.sha256(f"{method.upper()} {url}".encode('utf-8')).hexdigest()
+
+
+def resolve_ttl(url: str, rules: list[tuple[str, float]], default: float) -> float:
+    """
+    TTL of a URL from per-endpoint rules.
+
+    Args:
+        url: Request URL
+        rules: (URL fragment, TTL seconds) pairs; the first fragment found
+            in the URL wins
+        default: TTL of URLs matching no rule
+
+    Returns:
+        TTL in seconds (0 = revalidate on every use)
+    """
+    for fragment, ttl in rules:
+        if fragment in url:
+            return ttl
+    return default
+
+
+class HTTPResponseCache:
+    """
+    Content-addressed on-disk HTTP response cache.
+
+    One instance per cache directory and mode is shared by all API
+    clients of the process (see get_http_cache), so get_statistics()
+    covers every market.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path],
+        mode: str = HTTP_CACHE_MODE_CACHE,
+        default_ttl: float = 0
+    ):
+        """
+        Open (and create if needed) the cache.
+
+        Args:
+            cache_dir: Searcher cache directory (None disables caching)
+            mode: 'off', 'cache' or 'replay'
+            default_ttl: TTL in seconds of URLs without an endpoint rule
+
+        Raises:
+            ValueError: Unknown mode, or replay mode without a cache directory
+        """
+        if mode not in HTTP_CACHE_MODES:
+            raise ValueError(f"Unknown HTTP cache mode '{mode}' (expected one of {HTTP_CACHE_MODES})")
+        if cache_dir is None and mode == HTTP_CACHE_MODE_REPLAY:
+            raise ValueError("HTTP cache replay mode requires searcher_cache_dir")
+
+        self.mode = mode if cache_dir is not None else HTTP_CACHE_MODE_OFF
+        self.default_ttl = default_ttl
+        self.root: Optional[Path] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if self.mode != HTTP_CACHE_MODE_OFF:
+            self.root = Path(cache_dir) / HTTP_CACHE_DIR_NAME
+            (self.root / HTTP_CACHE_BODIES_DIR_NAME).mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.root / HTTP_CACHE_INDEX_FILENAME))
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+        self._counters = dict.fromkeys(_COUNTERS, 0)
+
+    async def fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        method: str = 'GET',
+        headers: Optional[dict[str, str]] = None,
+        ttl: Optional[float] = None,
+        before_request: Optional[Callable[[], Awaitable[Any]]] = None,
+        **request_kwargs
+    ) -> CachedResponse:
+        """
+        Response of a request, from the cache when possible.
+
+        Args:
+            session: Client session used for network requests
+            url: Absolute request URL
+            method: HTTP method ('GET' or 'HEAD')
+            headers: Request headers
+            ttl: Seconds a stored response is served without revalidation
+                (None = default_ttl; at most HTTP_CACHE_NOT_FOUND_TTL for a
+                stored 404)
+            before_request: Awaited before each network request (rate
+                limiting); not called when the cache answers
+            **request_kwargs: Passed to session.request (e.g. timeout)
+
+        Returns:
+            CachedResponse
+
+        Raises:
+            HTTPCacheMissError: Replay mode and the request was never recorded
+        """
+        self._counters['requests'] += 1
+
+        if self.mode == HTTP_CACHE_MODE_OFF:
+            self._counters['misses'] += 1
+            return await self._request(session, method, url, headers, before_request, request_kwargs)
+
+        key = request_key(method, url)
+        entry = self._lookup(key, method, url)
+
+        if self.mode == HTTP_CACHE_MODE_REPLAY:
+            if entry is None:
+                self._counters['replay_misses'] += 1
+                raise HTTPCacheMissError(f"Not recorded: {method} {url}")
+            self._counters['hits'] += 1
+            return entry.response
+
+        ttl = self.default_ttl if ttl is None else ttl
+        if entry is not None and entry.response.status == HTTP_NOT_FOUND:
+            ttl = min(ttl, HTTP_CACHE_NOT_FOUND_TTL)
+        if entry is not None and time.time() - entry.stored_at < ttl:
+            self._counters['hits'] += 1
+            return entry.response
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            etag = entry.response.headers.get(HEADER_ETAG)
+            last_modified = entry.response.headers.get(HEADER_LAST_MODIFIED)
+            if etag:
+                request_headers[HEADER_IF_NONE_MATCH] = etag
+            if last_modified:
+                request_headers[HEADER_IF_MODIFIED_SINCE] = last_modified
+
+        response = await self._request(session, method, url, request_headers, before_request, request_kwargs)
+
+        if response.status == HTTP_NOT_MODIFIED and entry is not None:
+            self._counters['revalidated'] += 1
+            self._touch(key)
+            entry.response.revalidated = True
+            return entry.response
+
+        self._counters['misses'] += 1
+        if response.status in HTTP_CACHEABLE_STATUS_CODES:
+            self._store(key, method, url, response)
+        return response
+
+    def get_statistics(self) -> dict:
+        """Request counters and hit rate (percent) of this process."""
+        return _with_hit_rate({'mode': self.mode, **self._counters})
+
+    def close(self) -> None:
+        """Close the index database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]],
+        before_request: Optional[Callable[[], Awaitable[Any]]],
+        request_kwargs: dict
+    ) -> CachedResponse:
+        """Network request, body read completely."""
+        if before_request is not None:
+            await before_request()
+
+        async with session.request(method, url, headers=headers, **request_kwargs) as response:
+            body = b'' if method.upper() == 'HEAD' else await response.read()
+            return CachedResponse(
+                url=url,
+                status=response.status,
+                body=body,
+                method=method.upper(),
+                headers=CIMultiDict(response.headers),
+                reason=response.reason,
+                request_info=response.request_info,
+                history=response.history,
+            )
+
+    def _lookup(self, key: str, method: str, url: str) -> Optional['_Entry']:
+        """Stored response of a request key (None if missing or its body is gone)."""
+        row = self._conn.execute(
+            "SELECT status, body_hash, headers, stored_at FROM responses WHERE request_key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        status, body_hash, headers_json, stored_at = row
+        try:
+            body = self._body_path(body_hash).read_bytes()
+        except FileNotFoundError:
+            logger.debug(f"HTTP cache body missing for {url}")
+            return None
+
+        response = CachedResponse(
+            url=url,
+            status=status,
+            body=body,
+            method=method.upper(),
+            headers=CIMultiDict(json.loads(headers_json)),
+            from_cache=True,
+        )
+        return _Entry(response, stored_at)
+
+    def _store(self, key: str, method: str, url: str, response: CachedResponse) -> None:
+        """Store a network response (body written once per content hash)."""
+        body_hash = hashlib.sha256(response.body).hexdigest()
+        body_path = self._body_path(body_hash)
+        if not body_path.exists():
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=body_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(response.body)
+                os.replace(temp_name, body_path)
+            except Exception:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+
+        stored_headers = {
+            name: response.headers[name]
+            for name in HTTP_CACHE_STORED_HEADERS
+            if name in response.headers
+        }
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(request_key, method, url, status, body_hash, headers, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, method.upper(), url, response.status, body_hash,
+                 json.dumps(stored_headers), time.time())
+            )
+        self._counters['stored'] += 1
+
+    def _touch(self, key: str) -> None:
+        """Restart the TTL of a revalidated entry."""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ? WHERE request_key = ?",
+                (time.time(), key)
+            )
+
+    def _body_path(self, body_hash: str) -> Path:
+        """File of a body hash."""
+        return (
+            self.root / HTTP_CACHE_BODIES_DIR_NAME
+            / body_hash[:HTTP_CACHE_BODY_FANOUT] / body_hash
+        )
+
+
+@dataclass
+class _Entry:
+    """Stored response and the time it was stored (or last revalidated)."""
+    response: CachedResponse
+    stored_at: float
+
+
+# Shared instances: (cache directory, mode) -> cache
+_shared_caches: dict[tuple[str, str], HTTPResponseCache] = {}
+
+
+def get_http_cache(config: Optional[ConfigLoader] = None) -> HTTPResponseCache:
+    """
+    Process-wide HTTP response cache for the configured directory and mode.
+
+    Mode 'cache' is turned off when enable_cache is False; replay is
+    always honoured.
+
+    Args:
+        config: Optional ConfigLoader instance
+
+    Returns:
+        Shared HTTPResponseCache
+    """
+    config = config if config else ConfigLoader()
+
+    mode = (config.get('http_cache_mode') or HTTP_CACHE_MODE_CACHE).lower()
+    if mode == HTTP_CACHE_MODE_CACHE and not config.get('enable_cache'):
+        mode = HTTP_CACHE_MODE_OFF
+    cache_dir = config.get('searcher_cache_dir')
+
+    shared_key = (str(cache_dir), mode)
+    cache = _shared_caches.get(shared_key)
+    if cache is None:
+        default_ttl = config.get('cache_expiry_hours') * SECONDS_PER_HOUR
+        cache = HTTPResponseCache(cache_dir, mode, default_ttl)
+        _shared_caches[shared_key] = cache
+        logger.debug(f"HTTP response cache: mode={cache.mode}, dir={cache.root}")
+    return cache
+
+
+def get_http_cache_statistics() -> dict:
+    """
+    Combined statistics of the shared caches of this process.
+
+    Returns:
+        Dictionary with request counters, hit_rate (percent of requests
+        answered from the cache, revalidations included) and the modes in use
+    """
+    totals = dict.fromkeys(_COUNTERS, 0)
+    for cache in _shared_caches.values():
+        for name, value in cache._counters.items():
+            totals[name] += value
+
+    statistics = _with_hit_rate(totals)
+    statistics['modes'] = sorted({cache.mode for cache in _shared_caches.values()})
+    return statistics
+
+
+def _with_hit_rate(statistics: dict) -> dict:
+    """Add hit_rate (percent) to request counters."""
+    requests = statistics['requests']
+    statistics['hit_rate'] = (
+        (statistics['hits'] + statistics['revalidated']) / requests * 100
+        if requests > 0
+        else 0.0
+    )
+    return statistics
+
+
+__all__ = [
+    'HTTPResponseCache',
+    'CachedResponse',
+    'HTTPCacheMissError',
+    'get_http_cache',
+    'get_http_cache_statistics',
+    'resolve_ttl',
+    'request_key',
+]
@@ -0,0 +1,77 @@
+# Path: searcher/core/rate_limiter.py
+"""
+Async Token Bucket Rate Limiter
+
+Shared request budget for concurrent coroutines.
+
+Tokens refill continuously at `rate` per second up to `capacity`; each
+request takes one token and waits for it if the bucket is empty. With
+capacity 1, requests are spaced at least 1/rate seconds apart no matter
+how many coroutines call acquire() at once.
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket shared by all coroutines of one API client.
+
+    Example:
+        limiter = AsyncTokenBucket(rate=10)
+        await limiter.acquire()   # before each request
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (requests per second)
+            capacity: Maximum tokens (largest burst)
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate limit must be positive: {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting until one is available.
+
+        Waiters are served in arrival order (the lock is held while
+        waiting, so later callers queue behind earlier ones).
+
+        Returns:
+            Seconds waited
+        """
+        async with self._lock:
+            self._refill()
+
+            wait_time = 0.0
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) / self.rate
+                await asyncio.sleep(wait_time)
+                self._refill()
+
+            self._tokens -= 1
+            self.total_acquired += 1
+            self.total_wait_seconds += wait_time
+            return wait_time
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+__all__ = ['AsyncTokenBucket']
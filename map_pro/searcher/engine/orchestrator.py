@@ -15,6 +15,7 @@ Architecture:
 from typing import Optional
 
 from ..core.logger import get_logger
+from ..core.http_cache import get_http_cache_statistics
 from ..constants import (
     LOG_INPUT,
     LOG_PROCESS,
@@ -423,7 +424,8 @@ class SearchOrchestrator:
         Get orchestrator statistics.
         
         Returns:
-            Dictionary with save statistics
+            Dictionary with save statistics and, under 'http_cache', the
+            request counters and hit rate of the API response cache
         """
         return {
             'results_saved': self.results_saved,
@@ -432,7 +434,8 @@ class SearchOrchestrator:
                 (self.results_saved / (self.results_saved + self.results_failed) * 100)
                 if (self.results_saved + self.results_failed) > 0
                 else 0.0
-            )
+            ),
+            'http_cache': get_http_cache_statistics(),
         }
 
 
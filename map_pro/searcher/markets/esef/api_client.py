@@ -4,6 +4,10 @@ ESEF API Client
 
 HTTP client for filings.xbrl.org API.
 Handles authentication, rate limiting, and error handling.
+
+API requests go through the shared HTTP response cache
+(core/http_cache.py) with the per-endpoint TTLs of HTTP_CACHE_TTLS;
+file downloads are not cached.
 """
 
 import aiohttp
@@ -12,12 +16,14 @@ from typing import Optional
 
 from searcher.core.config_loader import ConfigLoader
 from searcher.core.logger import get_logger
+from searcher.core.http_cache import HTTPCacheMissError, get_http_cache, resolve_ttl
 from searcher.constants import LOG_INPUT, LOG_PROCESS, LOG_OUTPUT
 from searcher.markets.esef.constants import (
     DEFAULT_TIMEOUT,
     MAX_RETRIES,
     RETRY_DELAY,
     BACKOFF_FACTOR,
+    HTTP_CACHE_TTLS,
     HTTP_OK,
     HTTP_TOO_MANY_REQUESTS,
     HTTP_NOT_FOUND,
@@ -35,6 +41,7 @@ class ESEFAPIClient:
     - Automatic retry with exponential backoff
     - Rate limit handling
     - JSON-API response parsing
+    - On-disk response cache (shared with the other market clients)
     """
 
     def __init__(self, config: ConfigLoader = None):
@@ -53,6 +60,9 @@ class ESEFAPIClient:
         self.retry_delay = self.config.get('esef_retry_delay', RETRY_DELAY)
         self.backoff_factor = self.config.get('esef_backoff_factor', BACKOFF_FACTOR)
 
+        # Response cache (shared by all API clients of the process)
+        self._http_cache = get_http_cache(self.config)
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """
         Get or create HTTP session.
@@ -98,39 +108,45 @@ class ESEFAPIClient:
 
         session = await self._get_session()
         headers = self._build_headers()
+        ttl = resolve_ttl(url, HTTP_CACHE_TTLS, self._http_cache.default_ttl)
 
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                async with session.get(url, headers=headers) as response:
-                    status = response.status
-
-                    if status == HTTP_OK:
-                        data = await response.json()
-                        logger.debug(f"{LOG_OUTPUT} ESEF API success: {status}")
-                        return data
-
-                    elif status == HTTP_NOT_FOUND:
-                        logger.warning(f"{LOG_OUTPUT} ESEF API not found: {url}")
-                        return None
-
-                    elif status == HTTP_TOO_MANY_REQUESTS:
-                        # Rate limited - wait and retry
-                        retry_after = response.headers.get('Retry-After', '60')
-                        wait_time = int(retry_after)
-                        logger.warning(
-                            f"{LOG_PROCESS} Rate limited, waiting {wait_time}s"
-                        )
-                        await asyncio.sleep(wait_time)
-                        continue
-
-                    else:
-                        # Other error
-                        body = await response.text()
-                        logger.error(
-                            f"{LOG_OUTPUT} ESEF API error {status}: {body[:200]}"
-                        )
-                        last_error = f"HTTP {status}"
+                response = await self._http_cache.fetch(session, url, headers=headers, ttl=ttl)
+                status = response.status
+
+                if status == HTTP_OK:
+                    data = response.json()
+                    logger.debug(f"{LOG_OUTPUT} ESEF API success: {status}")
+                    return data
+
+                elif status == HTTP_NOT_FOUND:
+                    logger.warning(f"{LOG_OUTPUT} ESEF API not found: {url}")
+                    return None
+
+                elif status == HTTP_TOO_MANY_REQUESTS:
+                    # Rate limited - wait and retry
+                    retry_after = response.headers.get('Retry-After', '60')
+                    wait_time = int(retry_after)
+                    logger.warning(
+                        f"{LOG_PROCESS} Rate limited, waiting {wait_time}s"
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                else:
+                    # Other error
+                    body = response.text()
+                    logger.error(
+                        f"{LOG_OUTPUT} ESEF API error {status}: {body[:200]}"
+                    )
+                    last_error = f"HTTP {status}"
+
+            except HTTPCacheMissError as e:
+                # Replay mode: retrying cannot help
+                logger.error(f"{LOG_OUTPUT} ESEF API {e}")
+                return None
 
             except asyncio.TimeoutError:
                 logger.warning(f"{LOG_PROCESS} Request timeout (attempt {attempt + 1})")
@@ -163,8 +179,14 @@ class ESEFAPIClient:
         headers = self._build_headers()
 
         try:
-            async with session.head(url, headers=headers) as response:
-                return response.status == HTTP_OK
+            response = await self._http_cache.fetch(
+                session,
+                url,
+                method='HEAD',
+                headers=headers,
+                ttl=resolve_ttl(url, HTTP_CACHE_TTLS, self._http_cache.default_ttl)
+            )
+            return response.status == HTTP_OK
         except Exception as e:
             logger.debug(f"HEAD request failed: {e}")
             return False
@@ -181,6 +181,12 @@ MAX_RETRIES = 3
 RETRY_DELAY = 2  # Seconds
 BACKOFF_FACTOR = 2  # Exponential backoff multiplier
 
+# HTTP response cache TTLs: (URL fragment, seconds), first match wins.
+# URLs matching none (entities) use cache_expiry_hours.
+HTTP_CACHE_TTLS = [
+    ('/api/filings', 3600),  # New filings appear during the day
+]
+
 # Pagination defaults
 DEFAULT_PAGE_SIZE = 25
 MAX_PAGE_SIZE = 100
@@ -292,6 +298,7 @@ __all__ = [
     'DEFAULT_TIMEOUT',
     'RATE_LIMIT_REQUESTS',
     'MAX_RETRIES',
+    'HTTP_CACHE_TTLS',
     'DEFAULT_PAGE_SIZE',
     'MAX_PAGE_SIZE',
 
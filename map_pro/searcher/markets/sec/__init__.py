@@ -4,6 +4,7 @@
 from searcher.markets.sec.searcher import SECSearcher
 from searcher.markets.sec.api_client import SECAPIClient
 from searcher.markets.sec.company_lookup import SECCompanyLookup
+from searcher.markets.sec.company_directory import SECCompanyDirectory
 from searcher.markets.sec.url_builder import SECURLBuilder
 from searcher.markets.sec.zip_finder import SECZIPFinder
 from searcher.markets.sec.response_parser import SECResponseParser, ResponseContentType
@@ -16,6 +17,7 @@ __all__ = [
     'SECSearcher',
     'SECAPIClient',
     'SECCompanyLookup',
+    'SECCompanyDirectory',
     'SECURLBuilder',
     'SECZIPFinder',
     'SECResponseParser',
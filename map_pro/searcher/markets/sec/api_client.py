@@ -4,6 +4,13 @@ SEC API Client
 
 Async HTTP client for SEC EDGAR API with rate limiting and retry logic.
 Enforces SEC's requirements (10 req/sec, user agent).
+
+The rate limit is a token bucket shared by every coroutine using the
+client, so concurrent requests stay within sec_rate_limit.
+
+Requests go through the shared HTTP response cache (core/http_cache.py)
+with the per-endpoint TTLs of SEC_HTTP_CACHE_TTLS; cache hits take no
+rate-limit token.
 """
 
 import asyncio
@@ -18,6 +25,8 @@ from tenacity import (
 
 from searcher.core.config_loader import ConfigLoader
 from searcher.core.logger import get_logger
+from searcher.core.rate_limiter import AsyncTokenBucket
+from searcher.core.http_cache import CachedResponse, get_http_cache, resolve_ttl
 from searcher.constants import (
     LOG_INPUT,
     LOG_PROCESS,
@@ -29,9 +38,16 @@ from searcher.markets.sec.constants import (
     HEADER_ACCEPT,
     HEADER_ACCEPT_ENCODING,
     ERROR_API_FAILED,
+    HEADER_IF_NONE_MATCH,
+    HEADER_IF_MODIFIED_SINCE,
+    HEADER_ETAG,
+    HEADER_LAST_MODIFIED,
     HTTP_OK,
     HTTP_NOT_FOUND,
+    HTTP_NOT_MODIFIED,
     HTTP_TOO_MANY_REQUESTS,
+    SEC_RATE_LIMIT_BURST,
+    SEC_HTTP_CACHE_TTLS,
 )
 
 logger = get_logger(__name__, 'markets')
@@ -46,6 +62,7 @@ class SECAPIClient:
     - Automatic retry with exponential backoff
     - User agent enforcement (required by SEC)
     - Timeout handling
+    - On-disk response cache (shared with the other market clients)
     """
     
     def __init__(self, config: ConfigLoader = None):
@@ -63,9 +80,11 @@ class SECAPIClient:
         self.timeout = self.config.get('sec_timeout')
         self.retry_attempts = self.config.get('sec_retry_attempts')
         
-        # Rate limiting state
-        self._last_request_time: float = 0
-        self._min_interval: float = 1.0 / self.rate_limit
+        # Rate limiting state (shared by concurrent requests)
+        self._rate_limiter = AsyncTokenBucket(self.rate_limit, SEC_RATE_LIMIT_BURST)
+        
+        # Response cache (shared by all API clients of the process)
+        self._http_cache = get_http_cache(self.config)
         
         # Session (created on first use)
         self._session: Optional[aiohttp.ClientSession] = None
@@ -85,16 +104,82 @@ class SECAPIClient:
         """
         logger.debug(f"{LOG_INPUT} GET {url}")
         
-        # Apply rate limiting
-        await self._wait_for_rate_limit()
-        
-        # Make request with retry logic
+        # Make request with retry logic (rate limited unless cached)
         data = await self._make_request_with_retry(url)
         
         logger.debug(f"{LOG_OUTPUT} Received {len(str(data))} bytes")
         
         return data
     
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError))
+    )
+    async def get_json_if_modified(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> tuple[Optional[dict], dict[str, str]]:
+        """
+        Conditional GET returning JSON data only if it changed.
+        
+        Args:
+            url: URL to fetch
+            etag: ETag of the copy we have
+            last_modified: Last-Modified of the copy we have
+            
+        Returns:
+            (data, validators): data is None if the server answered
+            304 Not Modified (or the cached response still has the given
+            ETag / Last-Modified); validators holds the response's ETag
+            and Last-Modified headers (when sent)
+            
+        Raises:
+            Exception: If request fails after retries
+        """
+        logger.debug(f"{LOG_INPUT} Conditional GET {url}")
+        
+        headers = self._build_headers()
+        if etag:
+            headers[HEADER_IF_NONE_MATCH] = etag
+        if last_modified:
+            headers[HEADER_IF_MODIFIED_SINCE] = last_modified
+        
+        response = await self._fetch(url, headers=headers)
+        validators = {
+            header: response.headers[header]
+            for header in (HEADER_ETAG, HEADER_LAST_MODIFIED)
+            if header in response.headers
+        }
+        
+        # A cached body answers the request too; it is unchanged if it
+        # carries the validators we were given
+        unchanged = response.status == HTTP_NOT_MODIFIED or (
+            response.status == HTTP_OK and (
+                (etag and validators.get(HEADER_ETAG) == etag)
+                or (not validators.get(HEADER_ETAG) and last_modified
+                    and validators.get(HEADER_LAST_MODIFIED) == last_modified)
+            )
+        )
+        if unchanged:
+            logger.debug(f"{LOG_OUTPUT} Not modified: {url}")
+            return None, validators
+        
+        if response.status == HTTP_TOO_MANY_REQUESTS:
+            logger.warning("Rate limited by SEC - waiting before retry")
+            await asyncio.sleep(2)
+            raise aiohttp.ClientError("Rate limited")
+        
+        if response.status in RETRYABLE_STATUS_CODES:
+            logger.warning(f"Server error {response.status} - will retry")
+            raise aiohttp.ClientError(f"Server error: {response.status}")
+        
+        response.raise_for_status()
+        
+        return response.json(), validators
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -110,34 +195,27 @@ class SECAPIClient:
         Returns:
             Parsed JSON response
         """
-        session = await self._get_session()
-        
         try:
             logger.debug(f"{LOG_PROCESS} Making request to {url}")
             
-            async with session.get(
-                url,
-                headers=self._build_headers(),
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                
-                # Check for rate limiting
-                if response.status == HTTP_TOO_MANY_REQUESTS:
-                    logger.warning("Rate limited by SEC - waiting before retry")
-                    await asyncio.sleep(2)
-                    raise aiohttp.ClientError("Rate limited")
-                
-                # Check for server errors (retryable)
-                if response.status in RETRYABLE_STATUS_CODES:
-                    logger.warning(f"Server error {response.status} - will retry")
-                    raise aiohttp.ClientError(f"Server error: {response.status}")
-                
-                # Raise for other errors
-                response.raise_for_status()
-                
-                # Parse JSON
-                data = await response.json()
-                return data
+            response = await self._fetch(url)
+            
+            # Check for rate limiting
+            if response.status == HTTP_TOO_MANY_REQUESTS:
+                logger.warning("Rate limited by SEC - waiting before retry")
+                await asyncio.sleep(2)
+                raise aiohttp.ClientError("Rate limited")
+            
+            # Check for server errors (retryable)
+            if response.status in RETRYABLE_STATUS_CODES:
+                logger.warning(f"Server error {response.status} - will retry")
+                raise aiohttp.ClientError(f"Server error: {response.status}")
+            
+            # Raise for other errors
+            response.raise_for_status()
+            
+            # Parse JSON
+            return response.json()
         
         except asyncio.TimeoutError:
             logger.error(f"Request timeout: {url}")
@@ -147,19 +225,39 @@ class SECAPIClient:
             logger.error(f"Request failed: {e}")
             raise
     
-    async def _wait_for_rate_limit(self) -> None:
-        """Enforce rate limit (10 requests/second)."""
-        import time
-        
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
-        
-        if elapsed < self._min_interval:
-            wait_time = self._min_interval - elapsed
-            logger.debug(f"Rate limiting: waiting {wait_time:.3f}s")
-            await asyncio.sleep(wait_time)
+    async def _fetch(
+        self,
+        url: str,
+        method: str = 'GET',
+        headers: Optional[dict[str, str]] = None
+    ) -> CachedResponse:
+        """
+        Request through the response cache (rate limited on cache misses).
         
-        self._last_request_time = time.time()
+        Args:
+            url: URL to fetch
+            method: HTTP method ('GET' or 'HEAD')
+            headers: Request headers (default SEC headers if None)
+            
+        Returns:
+            CachedResponse
+        """
+        session = await self._get_session()
+        return await self._http_cache.fetch(
+            session,
+            url,
+            method=method,
+            headers=headers if headers is not None else self._build_headers(),
+            ttl=resolve_ttl(url, SEC_HTTP_CACHE_TTLS, self._http_cache.default_ttl),
+            before_request=self._wait_for_rate_limit,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+    
+    async def _wait_for_rate_limit(self) -> None:
+        """Enforce rate limit (sec_rate_limit requests/second, all coroutines)."""
+        wait_time = await self._rate_limiter.acquire()
+        if wait_time:
+            logger.debug(f"Rate limiting: waited {wait_time:.3f}s")
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session with proper connector."""
@@ -215,45 +313,36 @@ class SECAPIClient:
         logger.debug(f"{LOG_PROCESS} Fetching index.json for {accession_number}")
         
         try:
-            # Apply rate limiting
-            await self._wait_for_rate_limit()
-            
-            session = await self._get_session()
+            response = await self._fetch(url)
             
-            async with session.get(
-                url,
-                headers=self._build_headers(),
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                
-                # 404 means index.json doesn't exist (normal)
-                if response.status == HTTP_NOT_FOUND:
-                    logger.debug(f"No index.json for {accession_number} (404)")
-                    return None
+            # 404 means index.json doesn't exist (normal)
+            if response.status == HTTP_NOT_FOUND:
+                logger.debug(f"No index.json for {accession_number} (404)")
+                return None
 
-                # Non-200 status
-                if response.status != HTTP_OK:
-                    logger.debug(f"index.json request returned {response.status}")
-                    return None
-                
-                # Get response text
-                response_text = await response.text()
-                
-                # Check if SEC returned HTML instead of JSON
-                parser = SECResponseParser()
-                content_type = parser.detect_content_type(response, response_text)
-                
-                if content_type == ResponseContentType.HTML:
-                    logger.debug(f"No index.json for {accession_number} (HTML response)")
-                    return None
-                
-                # Parse JSON
-                import json
-                try:
-                    return json.loads(response_text)
-                except json.JSONDecodeError:
-                    logger.debug(f"Invalid JSON in index.json for {accession_number}")
-                    return None
+            # Non-200 status
+            if response.status != HTTP_OK:
+                logger.debug(f"index.json request returned {response.status}")
+                return None
+            
+            # Get response text
+            response_text = response.text()
+            
+            # Check if SEC returned HTML instead of JSON
+            parser = SECResponseParser()
+            content_type = parser.detect_content_type(response, response_text)
+            
+            if content_type == ResponseContentType.HTML:
+                logger.debug(f"No index.json for {accession_number} (HTML response)")
+                return None
+            
+            # Parse JSON
+            import json
+            try:
+                return json.loads(response_text)
+            except json.JSONDecodeError:
+                logger.debug(f"Invalid JSON in index.json for {accession_number}")
+                return None
         
         except Exception as e:
             logger.debug(f"Error fetching index.json for {accession_number}: {e}")
@@ -270,16 +359,8 @@ class SECAPIClient:
             True if URL exists (HTTP 200)
         """
         try:
-            await self._wait_for_rate_limit()
-            
-            session = await self._get_session()
-            
-            async with session.head(
-                url,
-                headers=self._build_headers(),
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                return response.status == HTTP_OK
+            response = await self._fetch(url, method='HEAD')
+            return response.status == HTTP_OK
         
         except Exception:
             return False
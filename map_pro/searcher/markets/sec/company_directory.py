@@ -0,0 +1,362 @@
+# Path: searcher/markets/sec/company_directory.py
+"""
+SEC Company Directory
+
+Local, indexed copy of SEC's company_tickers.json in SQLite.
+
+Kept in searcher_cache_dir so it survives between runs; SECCompanyLookup
+refreshes it with conditional requests (ETag / Last-Modified) once it is
+older than cache_expiry_hours.
+
+Indexes:
+- SQLite: ticker, CIK and lowercased title (B-tree), and character
+  trigrams of the lowercased title (ranked fuzzy name search)
+- In memory, loaded from SQLite on first lookup: ticker and exact-name
+  hash maps, and all lowercased titles joined into one string so that
+  a substring lookup is a single str.find
+
+Lookups keep the order of company_tickers.json (rows are numbered in
+file order), so when several companies match, the first one listed wins.
+"""
+
+import bisect
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from searcher.core.logger import get_logger
+from searcher.markets.sec.constants import (
+    SQLITE_IN_MEMORY,
+    COMPANY_DIRECTORY_SCHEMA_VERSION,
+    HEADER_ETAG,
+    HEADER_LAST_MODIFIED,
+    TICKERS_FIELD_CIK,
+    TICKERS_FIELD_TICKER,
+    TICKERS_FIELD_TITLE,
+    TICKERS_METADATA_KEY,
+    NAME_NGRAM_SIZE,
+    NAME_SEARCH_LIMIT,
+)
+
+logger = get_logger(__name__, 'markets')
+
+# Separates titles in the joined title string (never part of a name)
+_TITLE_SEPARATOR = '\x00'
+
+# Metadata keys
+_META_SCHEMA_VERSION = 'schema_version'
+_META_FETCHED_AT = 'fetched_at'
+_META_ETAG = 'etag'
+_META_LAST_MODIFIED = 'last_modified'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS companies (
+    id INTEGER PRIMARY KEY,
+    cik INTEGER NOT NULL,
+    ticker TEXT NOT NULL,
+    title TEXT NOT NULL,
+    title_lower TEXT NOT NULL,
+    ngram_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_companies_ticker ON companies(ticker);
+CREATE INDEX IF NOT EXISTS idx_companies_cik ON companies(cik);
+CREATE INDEX IF NOT EXISTS idx_companies_title ON companies(title_lower);
+CREATE TABLE IF NOT EXISTS name_ngrams (
+    ngram TEXT NOT NULL,
+    company_id INTEGER NOT NULL,
+    PRIMARY KEY (ngram, company_id)
+) WITHOUT ROWID;
+"""
+
+
+def name_ngrams(text: str) -> set[str]:
+    """
+    Character n-grams of a lowercased name.
+
+    Args:
+        text: Lowercased name
+
+    Returns:
+        Distinct n-grams (empty if text is shorter than the n-gram size)
+    """
+    return {
+        text[i:i + NAME_NGRAM_SIZE]
+        for i in range(len(text) - NAME_NGRAM_SIZE + 1)
+    }
+
+
+class SECCompanyDirectory:
+    """
+    SQLite directory of SEC companies (ticker, CIK, name).
+
+    Example:
+        directory = SECCompanyDirectory(cache_dir / COMPANY_DIRECTORY_FILENAME)
+        if directory.is_stale(24):
+            directory.replace_all(company_tickers_json, validators)
+
+        cik = directory.ticker_to_cik('AAPL')
+        matches = directory.search_names('apple', limit=5)
+    """
+
+    def __init__(self, db_path: Union[Path, str] = SQLITE_IN_MEMORY):
+        """
+        Open (and create if needed) the directory.
+
+        Args:
+            db_path: SQLite file, or ':memory:' for a per-process directory
+        """
+        if db_path != SQLITE_IN_MEMORY:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(str(db_path))
+        self._init_db()
+        
+        # In-memory lookup maps (built on first lookup)
+        self._ticker_index: Optional[dict[str, int]] = None
+        self._title_index: Optional[dict[str, int]] = None
+        self._rows: list[tuple[int, str]] = []
+        self._titles_joined = ''
+        self._title_offsets: list[int] = []
+
+    def _init_db(self) -> None:
+        """Create tables; rebuild them if the schema version changed."""
+        self._conn.executescript(_SCHEMA)
+
+        version = self._get_meta(_META_SCHEMA_VERSION)
+        if version is not None and int(version) != COMPANY_DIRECTORY_SCHEMA_VERSION:
+            logger.info(f"Rebuilding company directory (schema {version} -> "
+                        f"{COMPANY_DIRECTORY_SCHEMA_VERSION})")
+            self._conn.executescript(
+                "DROP TABLE meta; DROP TABLE companies; DROP TABLE name_ngrams;"
+            )
+            self._conn.executescript(_SCHEMA)
+
+        self._set_meta(_META_SCHEMA_VERSION, str(COMPANY_DIRECTORY_SCHEMA_VERSION))
+        self._conn.commit()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        if value is None:
+            self._conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def company_count(self) -> int:
+        """Number of entries in the directory."""
+        return self._conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+
+    def is_stale(self, max_age_hours: float) -> bool:
+        """
+        Check if the directory needs a refresh.
+
+        Args:
+            max_age_hours: Maximum age of the last successful fetch
+
+        Returns:
+            True if empty or older than max_age_hours
+        """
+        fetched_at = self._get_meta(_META_FETCHED_AT)
+        if fetched_at is None or self.company_count() == 0:
+            return True
+        return time.time() - float(fetched_at) > max_age_hours * 3600
+
+    def get_validators(self) -> tuple[Optional[str], Optional[str]]:
+        """(ETag, Last-Modified) of the stored copy, for conditional requests."""
+        return self._get_meta(_META_ETAG), self._get_meta(_META_LAST_MODIFIED)
+
+    def mark_fresh(self, validators: Optional[dict[str, str]] = None) -> None:
+        """
+        Record a successful check without new data (304 Not Modified).
+
+        Args:
+            validators: Response ETag / Last-Modified headers, if sent
+        """
+        self._store_validators(validators or {})
+        self._set_meta(_META_FETCHED_AT, str(time.time()))
+        self._conn.commit()
+
+    def replace_all(self, tickers_data: dict, validators: Optional[dict[str, str]] = None) -> int:
+        """
+        Replace the directory with a fresh company_tickers.json.
+
+        Args:
+            tickers_data: Parsed company_tickers.json ({index: entry})
+            validators: Response ETag / Last-Modified headers
+
+        Returns:
+            Number of companies stored
+        """
+        companies = []
+        ngram_rows = []
+        for key, entry in tickers_data.items():
+            # Skip the 'fields' metadata key if present
+            if key == TICKERS_METADATA_KEY or not isinstance(entry, dict):
+                continue
+
+            company_id = len(companies)
+            title = str(entry.get(TICKERS_FIELD_TITLE, ''))
+            title_lower = title.lower()
+            ngrams = name_ngrams(title_lower)
+
+            companies.append((
+                company_id,
+                int(entry.get(TICKERS_FIELD_CIK)),
+                str(entry.get(TICKERS_FIELD_TICKER, '')).upper(),
+                title,
+                title_lower,
+                len(ngrams),
+            ))
+            ngram_rows.extend((ngram, company_id) for ngram in ngrams)
+
+        with self._conn:
+            self._conn.execute("DELETE FROM companies")
+            self._conn.execute("DELETE FROM name_ngrams")
+            self._conn.executemany(
+                "INSERT INTO companies (id, cik, ticker, title, title_lower, ngram_count) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                companies
+            )
+            self._conn.executemany(
+                "INSERT INTO name_ngrams (ngram, company_id) VALUES (?, ?)", ngram_rows
+            )
+            self._store_validators(validators or {}, replace=True)
+            self._set_meta(_META_FETCHED_AT, str(time.time()))
+        
+        self._ticker_index = None
+
+        logger.info(f"Company directory updated: {len(companies)} companies")
+        return len(companies)
+
+    def _store_validators(self, validators: dict[str, str], replace: bool = False) -> None:
+        """Store response validators (replace=True drops ones not sent)."""
+        for header, meta_key in ((HEADER_ETAG, _META_ETAG),
+                                 (HEADER_LAST_MODIFIED, _META_LAST_MODIFIED)):
+            if header in validators or replace:
+                self._set_meta(meta_key, validators.get(header))
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _load_lookup_maps(self) -> None:
+        """Build the in-memory lookup maps from the stored directory."""
+        self._ticker_index = {}
+        self._title_index = {}
+        self._rows = []
+        self._title_offsets = []
+
+        offset = 0
+        titles = []
+        for cik, ticker, title, title_lower in self._conn.execute(
+            "SELECT cik, ticker, title, title_lower FROM companies ORDER BY id"
+        ):
+            position = len(self._rows)
+            self._rows.append((cik, title))
+            # First entry in file order wins
+            self._ticker_index.setdefault(ticker, position)
+            self._title_index.setdefault(title_lower, position)
+
+            self._title_offsets.append(offset)
+            titles.append(title_lower)
+            offset += len(title_lower) + len(_TITLE_SEPARATOR)
+
+        self._titles_joined = _TITLE_SEPARATOR.join(titles)
+
+    def ticker_to_cik(self, ticker: str) -> Optional[int]:
+        """
+        CIK of a ticker.
+
+        Args:
+            ticker: Stock ticker (any case)
+
+        Returns:
+            CIK (unpadded) or None if not found
+        """
+        if self._ticker_index is None:
+            self._load_lookup_maps()
+
+        position = self._ticker_index.get(ticker.upper())
+        return self._rows[position][0] if position is not None else None
+
+    def name_to_cik(self, name: str) -> Optional[tuple[int, str]]:
+        """
+        CIK of a company name: exact (case-insensitive) match first,
+        then the first company whose name contains the given text.
+
+        Args:
+            name: Company name or partial name
+
+        Returns:
+            (cik, title) or None if not found
+        """
+        if self._ticker_index is None:
+            self._load_lookup_maps()
+
+        name_lower = name.lower()
+
+        position = self._title_index.get(name_lower)
+        if position is None and _TITLE_SEPARATOR not in name_lower:
+            found_at = self._titles_joined.find(name_lower)
+            if found_at >= 0:
+                position = bisect.bisect_right(self._title_offsets, found_at) - 1
+
+        return self._rows[position] if position is not None else None
+
+    def search_names(self, query: str, limit: int = NAME_SEARCH_LIMIT) -> list[dict]:
+        """
+        Companies ranked by name similarity (n-gram Dice coefficient).
+
+        Args:
+            query: Company name or partial name
+            limit: Maximum results
+
+        Returns:
+            List of {'cik', 'ticker', 'title', 'score'} (best first)
+        """
+        query_lower = query.strip().lower()
+        ngrams = name_ngrams(query_lower)
+
+        if not ngrams:
+            rows = self._conn.execute(
+                "SELECT cik, ticker, title, 1.0 FROM companies "
+                "WHERE instr(title_lower, ?) > 0 ORDER BY id LIMIT ?",
+                (query_lower, limit)
+            ).fetchall()
+        else:
+            placeholders = ','.join('?' * len(ngrams))
+            rows = self._conn.execute(
+                f"SELECT c.cik, c.ticker, c.title, "
+                f"       2.0 * m.shared / (? + c.ngram_count) AS score "
+                f"FROM companies c "
+                f"JOIN (SELECT company_id, COUNT(*) AS shared FROM name_ngrams "
+                f"      WHERE ngram IN ({placeholders}) GROUP BY company_id) m "
+                f"  ON c.id = m.company_id "
+                f"ORDER BY score DESC, c.id LIMIT ?",
+                (len(ngrams), *ngrams, limit)
+            ).fetchall()
+
+        return [
+            {'cik': cik, 'ticker': ticker, 'title': title, 'score': round(score, 4)}
+            for cik, ticker, title, score in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+__all__ = ['SECCompanyDirectory', 'name_ngrams']
@@ -3,19 +3,28 @@
 SEC Company Lookup
 
 Resolves company identifiers (ticker, CIK, name) using SEC's company_tickers.json.
-Implements caching for performance.
+
+The file is kept in a persistent, indexed SECCompanyDirectory (SQLite in
+searcher_cache_dir) and refreshed with a conditional request once it is
+older than cache_expiry_hours, instead of being downloaded every run.
 """
 
+from pathlib import Path
 from typing import Optional
 import re
 
+from searcher.core.config_loader import ConfigLoader
 from searcher.core.logger import get_logger
+from searcher.markets.sec.company_directory import SECCompanyDirectory
 from searcher.markets.sec.constants import (
     CIK_PATTERN,
     TICKER_PATTERN,
     ERROR_INVALID_CIK,
     ERROR_INVALID_TICKER,
     ERROR_COMPANY_NOT_FOUND,
+    COMPANY_DIRECTORY_FILENAME,
+    SQLITE_IN_MEMORY,
+    NAME_SEARCH_LIMIT,
 )
 
 logger = get_logger(__name__, 'markets')
@@ -29,19 +38,24 @@ class SECCompanyLookup:
     - Ticker → CIK (e.g., 'AAPL' → '0000320193')
     - Name → CIK (e.g., 'Apple' → '0000320193')
     - CIK validation and normalization
+    - Ranked fuzzy name search (search_companies)
     
-    Caches company_tickers.json for performance.
+    company_tickers.json is stored in an SECCompanyDirectory (on disk when
+    caching is enabled, in memory otherwise).
     """
     
-    def __init__(self, api_client=None):
+    def __init__(self, api_client=None, config: ConfigLoader = None):
         """
         Initialize company lookup.
         
         Args:
             api_client: Optional SECAPIClient instance
+            config: Optional ConfigLoader instance (defaults to the API
+                client's configuration)
         """
         self.api_client = api_client
-        self._cache: Optional[dict] = None
+        self.config = config or getattr(api_client, 'config', None) or ConfigLoader()
+        self._directory: Optional[SECCompanyDirectory] = None
     
     async def resolve_identifier(self, identifier: str) -> str:
         """
@@ -85,23 +99,10 @@ class SECCompanyLookup:
         Returns:
             Padded CIK or None if not found
         """
-        await self._ensure_cache_loaded()
-        
-        ticker_upper = ticker.upper()
+        directory = await self._ensure_directory_loaded()
         
-        for key, entry in self._cache.items():
-            # Skip the 'fields' metadata key if present
-            if key == 'fields':
-                continue
-            
-            # Check ticker match (SEC API contract - stable field name)
-            company_ticker = entry.get('ticker', '')
-            if company_ticker.upper() == ticker_upper:
-                # Get CIK (SEC API contract - stable field name)
-                cik = str(entry.get('cik_str'))
-                return self._normalize_cik(cik)
-        
-        return None
+        cik = directory.ticker_to_cik(ticker)
+        return self._normalize_cik(str(cik)) if cik is not None else None
     
     async def _name_to_cik(self, name: str) -> Optional[str]:
         """
@@ -113,42 +114,65 @@ class SECCompanyLookup:
         Returns:
             Padded CIK or None if not found
         """
-        await self._ensure_cache_loaded()
+        directory = await self._ensure_directory_loaded()
         
-        name_lower = name.lower()
+        match = directory.name_to_cik(name)
+        if match is None:
+            return None
         
-        # Try exact match first
-        for key, entry in self._cache.items():
-            # Skip the 'fields' metadata key if present
-            if key == 'fields':
-                continue
-            
-            # SEC API contract - stable field name
-            company_name = entry.get('title', '').lower()
-            if company_name == name_lower:
-                cik = str(entry.get('cik_str'))
-                return self._normalize_cik(cik)
-        
-        # Try contains match
-        for key, entry in self._cache.items():
-            # Skip the 'fields' metadata key if present
-            if key == 'fields':
-                continue
+        cik, title = match
+        if title.lower() != name.lower():
+            logger.debug(f"Fuzzy match: '{name}' → '{title}'")
+        return self._normalize_cik(str(cik))
+    
+    async def search_companies(self, query: str, limit: int = NAME_SEARCH_LIMIT) -> list[dict]:
+        """
+        Find companies by name, ranked by similarity.
+        
+        Args:
+            query: Company name or partial name
+            limit: Maximum results
             
-            # SEC API contract - stable field name
-            company_name = entry.get('title', '').lower()
-            if name_lower in company_name:
-                cik = str(entry.get('cik_str'))
-                logger.debug(f"Fuzzy match: '{name}' → '{entry.get('title')}'")
-                return self._normalize_cik(cik)
-        
-        return None
+        Returns:
+            List of {'cik' (padded), 'ticker', 'title', 'score'}, best first
+        """
+        directory = await self._ensure_directory_loaded()
+        
+        matches = directory.search_names(query, limit)
+        for match in matches:
+            match['cik'] = self._normalize_cik(str(match['cik']))
+        return matches
     
-    async def _ensure_cache_loaded(self) -> None:
-        """Load company_tickers.json into cache if not already loaded."""
-        if self._cache is not None:
-            return
+    async def _ensure_directory_loaded(self) -> SECCompanyDirectory:
+        """
+        Open the company directory and refresh it if stale.
         
+        A stale directory is refreshed with a conditional request; if the
+        request fails, the stored copy is used as long as it has entries.
+        
+        Returns:
+            Company directory
+        """
+        if self._directory is not None:
+            return self._directory
+        
+        directory = SECCompanyDirectory(self._directory_path())
+        
+        max_age_hours = self.config.get('cache_expiry_hours')
+        if directory.is_stale(max_age_hours):
+            try:
+                await self._refresh_directory(directory)
+            except Exception as e:
+                if directory.company_count() == 0:
+                    directory.close()
+                    raise
+                logger.warning(f"Company directory refresh failed, using stored copy: {e}")
+        
+        self._directory = directory
+        return directory
+    
+    async def _refresh_directory(self, directory: SECCompanyDirectory) -> None:
+        """Fetch company_tickers.json if it changed since the stored copy."""
         if not self.api_client:
             from searcher.markets.sec.api_client import SECAPIClient
             self.api_client = SECAPIClient()
@@ -158,9 +182,32 @@ class SECCompanyLookup:
         
         url = url_builder.build_company_tickers_url()
         
+        etag, last_modified = directory.get_validators()
+        if directory.company_count() == 0:
+            etag = last_modified = None
+        
         logger.info("Loading company_tickers.json...")
-        self._cache = await self.api_client.get_json(url)
-        logger.info(f"Loaded {len(self._cache)} companies")
+        data, validators = await self.api_client.get_json_if_modified(url, etag, last_modified)
+        
+        if data is None:
+            directory.mark_fresh(validators)
+            logger.info(f"company_tickers.json not modified ({directory.company_count()} companies)")
+        else:
+            count = directory.replace_all(data, validators)
+            logger.info(f"Loaded {count} companies")
+    
+    def _directory_path(self):
+        """SQLite file of the directory (in memory if caching is disabled)."""
+        cache_dir = self.config.get('searcher_cache_dir')
+        if self.config.get('enable_cache') and cache_dir:
+            return Path(cache_dir) / COMPANY_DIRECTORY_FILENAME
+        return SQLITE_IN_MEMORY
+    
+    def close(self) -> None:
+        """Close the company directory."""
+        if self._directory is not None:
+            self._directory.close()
+            self._directory = None
     
     def _is_valid_cik(self, identifier: str) -> bool:
         """
@@ -25,6 +25,22 @@ MIN_JSON_SIZE_BYTES: int = 500
 # Retry Configuration
 DEFAULT_MAX_RETRIES: int = 3
 
+# Rate Limiting: token bucket capacity (1 = requests evenly spaced at
+# 1/sec_rate_limit, never a burst above the configured rate)
+SEC_RATE_LIMIT_BURST: int = 1
+
+# ZIP URL Resolution
+ZIP_RESOLUTION_CONCURRENCY: int = 8    # Filings resolved at the same time
+ZIP_URL_CACHE_FILENAME: str = 'sec_zip_urls.sqlite'
+
+# HTTP Response Cache TTLs: (URL fragment, seconds), first match wins.
+# URLs matching none use cache_expiry_hours.
+SEC_HTTP_CACHE_TTLS: list[tuple[str, int]] = [
+    ('company_tickers', 0),                   # Revalidated on every use
+    ('/submissions/', 3600),                  # New filings appear during the day
+    ('/Archives/edgar/data/', 30 * 86400),    # Accepted filings do not change
+]
+
 # Historical Constants
 SEC_FOUNDING_YEAR: int = 1934  # Year SEC was established
 
@@ -35,6 +51,9 @@ SEC_FOUNDING_YEAR: int = 1934  # Year SEC was established
 # Success codes
 HTTP_OK: int = 200
 
+# Redirection codes
+HTTP_NOT_MODIFIED: int = 304
+
 # Client error codes
 HTTP_BAD_REQUEST: int = 400
 HTTP_UNAUTHORIZED: int = 401
@@ -154,6 +173,31 @@ ERROR_API_FAILED: str = 'SEC API request failed'
 HEADER_USER_AGENT: str = 'User-Agent'
 HEADER_ACCEPT: str = 'Accept'
 HEADER_ACCEPT_ENCODING: str = 'Accept-Encoding'
+HEADER_IF_NONE_MATCH: str = 'If-None-Match'
+HEADER_IF_MODIFIED_SINCE: str = 'If-Modified-Since'
+HEADER_ETAG: str = 'ETag'
+HEADER_LAST_MODIFIED: str = 'Last-Modified'
+
+# ============================================================================
+# Company Directory (local copy of company_tickers.json)
+# ============================================================================
+
+# SQLite file (in searcher_cache_dir); in-memory when caching is disabled
+COMPANY_DIRECTORY_FILENAME: str = 'sec_company_directory.sqlite'
+SQLITE_IN_MEMORY: str = ':memory:'    # Also used by the ZIP URL cache
+
+# Bump when the directory tables change (directory is rebuilt)
+COMPANY_DIRECTORY_SCHEMA_VERSION: int = 1
+
+# company_tickers.json field names (SEC API contract - stable)
+TICKERS_FIELD_CIK: str = 'cik_str'
+TICKERS_FIELD_TICKER: str = 'ticker'
+TICKERS_FIELD_TITLE: str = 'title'
+TICKERS_METADATA_KEY: str = 'fields'
+
+# Name search: character n-gram size and default result count
+NAME_NGRAM_SIZE: int = 3
+NAME_SEARCH_LIMIT: int = 10
 
 __all__ = [
     # CIK Constants
@@ -164,10 +208,17 @@ __all__ = [
     'MIN_JSON_SIZE_BYTES',
     # Retry Configuration
     'DEFAULT_MAX_RETRIES',
+    # Rate Limiting
+    'SEC_RATE_LIMIT_BURST',
+    # ZIP URL Resolution
+    'ZIP_RESOLUTION_CONCURRENCY',
+    'ZIP_URL_CACHE_FILENAME',
+    'SEC_HTTP_CACHE_TTLS',
     # Historical
     'SEC_FOUNDING_YEAR',
     # HTTP Status Codes
     'HTTP_OK',
+    'HTTP_NOT_MODIFIED',
     'HTTP_BAD_REQUEST',
     'HTTP_UNAUTHORIZED',
     'HTTP_FORBIDDEN',
@@ -215,4 +266,18 @@ __all__ = [
     'HEADER_USER_AGENT',
     'HEADER_ACCEPT',
     'HEADER_ACCEPT_ENCODING',
+    'HEADER_IF_NONE_MATCH',
+    'HEADER_IF_MODIFIED_SINCE',
+    'HEADER_ETAG',
+    'HEADER_LAST_MODIFIED',
+    # Company Directory
+    'COMPANY_DIRECTORY_FILENAME',
+    'SQLITE_IN_MEMORY',
+    'COMPANY_DIRECTORY_SCHEMA_VERSION',
+    'TICKERS_FIELD_CIK',
+    'TICKERS_FIELD_TICKER',
+    'TICKERS_FIELD_TITLE',
+    'TICKERS_METADATA_KEY',
+    'NAME_NGRAM_SIZE',
+    'NAME_SEARCH_LIMIT',
 ]
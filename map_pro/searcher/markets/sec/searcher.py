@@ -6,6 +6,8 @@ Main searcher implementation for SEC EDGAR filings.
 Implements BaseSearcher interface with async operations.
 """
 
+import asyncio
+from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
@@ -28,11 +30,15 @@ from searcher.markets.sec.constants import (
     FORM_TYPE_ALIASES,
     ERROR_NO_FILINGS,
     ERROR_NO_ZIP,
+    SQLITE_IN_MEMORY,
+    ZIP_RESOLUTION_CONCURRENCY,
+    ZIP_URL_CACHE_FILENAME,
 )
 from searcher.markets.sec.api_client import SECAPIClient
 from searcher.markets.sec.company_lookup import SECCompanyLookup
 from searcher.markets.sec.url_builder import SECURLBuilder
 from searcher.markets.sec.zip_finder import SECZIPFinder
+from searcher.markets.sec.zip_url_cache import SECZIPURLCache
 
 logger = get_logger(__name__, 'markets')
 
@@ -45,11 +51,13 @@ class SECSearcher(BaseSearcher):
     1. Resolve identifier → CIK (via company_lookup)
     2. Fetch submissions.json (via api_client)
     3. Filter filings by form type and date
-    4. For each filing:
+    4. For each filing (concurrently, within the API client's rate limit):
        - Fetch index.json
        - Find XBRL ZIP file
        - Build result dictionary
     5. Return results
+    
+    Resolved ZIP URLs are cached per accession number (SECZIPURLCache).
     """
     
     def __init__(self):
@@ -58,6 +66,9 @@ class SECSearcher(BaseSearcher):
         self.company_lookup = SECCompanyLookup(self.api_client)
         self.url_builder = SECURLBuilder()
         self.zip_finder = SECZIPFinder(self.url_builder)
+        
+        # ZIP URL cache (opened on first use)
+        self._zip_url_cache: Optional[SECZIPURLCache] = None
     
     async def search_by_identifier(
         self,
@@ -174,6 +185,10 @@ class SECSearcher(BaseSearcher):
         """
         Process filings and build result list.
 
+        ZIP URLs of matching filings are resolved concurrently, in batches
+        of the number of results still needed, so the results are the
+        same as resolving one filing at a time in order.
+
         Args:
             cik: Company CIK
             company_name: Company name
@@ -188,13 +203,9 @@ class SECSearcher(BaseSearcher):
         Returns:
             List of filing dictionaries
         """
-        results = []
+        candidates = []
 
         for i, (accession, date, form) in enumerate(zip(accession_numbers, filing_dates, form_types)):
-            # Stop if we have enough results
-            if len(results) >= max_results:
-                break
-
             # Filter by form type
             if form != form_type_normalized:
                 continue
@@ -205,14 +216,23 @@ class SECSearcher(BaseSearcher):
             if end_date and date > end_date:
                 continue
 
-            logger.info(f"{LOG_PROCESS} Processing filing {i+1}: {form} / {date} / {accession}")
+            candidates.append((i, accession, date, form))
 
-            # Try to get XBRL ZIP URL
-            try:
-                zip_url = await self._find_zip_url(cik, accession)
+        results = []
+        semaphore = asyncio.Semaphore(ZIP_RESOLUTION_CONCURRENCY)
+        position = 0
 
+        while len(results) < max_results and position < len(candidates):
+            batch = candidates[position:position + max_results - len(results)]
+            position += len(batch)
+
+            zip_urls = await asyncio.gather(*(
+                self._resolve_filing_zip(cik, i, accession, date, form, semaphore)
+                for i, accession, date, form in batch
+            ))
+
+            for (i, accession, date, form), zip_url in zip(batch, zip_urls):
                 if not zip_url:
-                    logger.info(f"No XBRL ZIP found for {accession}, skipping")
                     continue
 
                 # Build result dictionary
@@ -229,11 +249,43 @@ class SECSearcher(BaseSearcher):
                 results.append(result)
                 logger.info(f"{LOG_OUTPUT} Added filing: {form} / {date}")
 
+        return results
+
+    async def _resolve_filing_zip(
+        self,
+        cik: str,
+        index: int,
+        accession: str,
+        date: str,
+        form: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[str]:
+        """
+        Resolve the ZIP URL of one filing (errors are logged, not raised).
+
+        Args:
+            cik: Company CIK
+            index: Position of the filing in submissions.json
+            accession: Filing accession number
+            date: Filing date
+            form: Form type
+            semaphore: Limits filings resolved at the same time
+
+        Returns:
+            ZIP URL or None
+        """
+        async with semaphore:
+            logger.info(f"{LOG_PROCESS} Processing filing {index+1}: {form} / {date} / {accession}")
+
+            try:
+                zip_url = await self._find_zip_url(cik, accession)
             except Exception as e:
                 logger.error(f"Failed to process filing {accession}: {e}")
-                continue
+                return None
 
-        return results
+            if not zip_url:
+                logger.info(f"No XBRL ZIP found for {accession}, skipping")
+            return zip_url
 
     def _normalize_form_type(self, form_type: str) -> str:
         """
@@ -261,6 +313,7 @@ class SECSearcher(BaseSearcher):
         Find XBRL ZIP URL using index.json or pattern matching.
         
         Strategy:
+        0. Cached URL of an earlier search (no requests)
         1. Try index.json (if it exists)
         2. Fallback to pattern matching with HEAD validation
         
@@ -271,19 +324,41 @@ class SECSearcher(BaseSearcher):
         Returns:
             ZIP URL or None if not found
         """
+        zip_url_cache = self._get_zip_url_cache()
+        cached_url = zip_url_cache.get(accession_number)
+        if cached_url:
+            logger.debug(f"Cached ZIP URL for {accession_number}")
+            return cached_url
+        
         # Strategy 1: Try index.json
         logger.debug(f"Trying index.json for {accession_number}")
         index_data = await self.api_client.get_filing_index(cik, accession_number)
         
+        zip_url = None
         if index_data:
             # Use index.json to find ZIP
             zip_url = self.zip_finder.find_xbrl_zip(index_data, cik, accession_number)
-            if zip_url:
-                return zip_url
         
-        # Strategy 2: Pattern matching with HEAD validation
-        logger.debug(f"No index.json, trying URL patterns for {accession_number}")
-        return await self._find_zip_by_patterns(cik, accession_number)
+        if not zip_url:
+            # Strategy 2: Pattern matching with HEAD validation
+            logger.debug(f"No index.json, trying URL patterns for {accession_number}")
+            zip_url = await self._find_zip_by_patterns(cik, accession_number)
+        
+        if zip_url:
+            zip_url_cache.put(cik, accession_number, zip_url)
+        return zip_url
+    
+    def _get_zip_url_cache(self) -> SECZIPURLCache:
+        """Open the ZIP URL cache (on disk if caching is enabled)."""
+        if self._zip_url_cache is None:
+            config = self.api_client.config
+            cache_dir = config.get('searcher_cache_dir')
+            if config.get('enable_cache') and cache_dir:
+                db_path = Path(cache_dir) / ZIP_URL_CACHE_FILENAME
+            else:
+                db_path = SQLITE_IN_MEMORY
+            self._zip_url_cache = SECZIPURLCache(db_path)
+        return self._zip_url_cache
     
     async def _find_zip_by_patterns(self, cik: str, accession_number: str) -> Optional[str]:
         """
@@ -296,10 +371,7 @@ class SECSearcher(BaseSearcher):
         Returns:
             ZIP URL or None if not found
         """
-        from searcher.core.config_loader import ConfigLoader
-        
-        config = ConfigLoader()
-        archives_base = config.get('sec_archives_base_url')
+        archives_base = self.api_client.config.get('sec_archives_base_url')
         
         # Prepare URL components
         cik_no_zeros = str(int(cik))
@@ -325,7 +397,11 @@ class SECSearcher(BaseSearcher):
         return None
     
     async def close(self) -> None:
-        """Close API client session."""
+        """Close API client session, company directory and ZIP URL cache."""
+        self.company_lookup.close()
+        if self._zip_url_cache is not None:
+            self._zip_url_cache.close()
+            self._zip_url_cache = None
         await self.api_client.close()
     
     async def __aenter__(self):
@@ -0,0 +1,112 @@
+# Path: searcher/markets/sec/zip_url_cache.py
+"""
+SEC ZIP URL Cache
+
+Resolved XBRL ZIP URLs per accession number, so repeated searches never
+fetch index.json or probe URL patterns again for a filing already
+resolved.
+
+Filings in the EDGAR archive do not change once accepted, so entries do
+not expire. Only found URLs are stored: a filing without a ZIP (or whose
+index.json request failed) is tried again by later searches.
+
+Stored in SQLite in searcher_cache_dir; in memory when caching is disabled.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from searcher.core.logger import get_logger
+from searcher.markets.sec.constants import SQLITE_IN_MEMORY
+
+logger = get_logger(__name__, 'markets')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS zip_urls (
+    accession_number TEXT PRIMARY KEY,
+    cik TEXT NOT NULL,
+    zip_url TEXT NOT NULL,
+    resolved_at REAL NOT NULL
+);
+"""
+
+
+class SECZIPURLCache:
+    """
+    Accession number -> XBRL ZIP URL.
+
+    Example:
+        cache = SECZIPURLCache(cache_dir / ZIP_URL_CACHE_FILENAME)
+        zip_url = cache.get(accession)
+        if zip_url is None:
+            zip_url = await resolve(...)
+            if zip_url:
+                cache.put(cik, accession, zip_url)
+    """
+
+    def __init__(self, db_path: Union[Path, str] = SQLITE_IN_MEMORY):
+        """
+        Open (and create if needed) the cache.
+
+        Args:
+            db_path: SQLite file, or ':memory:' for a per-process cache
+        """
+        if db_path != SQLITE_IN_MEMORY:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, accession_number: str) -> Optional[str]:
+        """
+        Cached ZIP URL of a filing.
+
+        Args:
+            accession_number: Filing accession number (with dashes)
+
+        Returns:
+            ZIP URL or None if not resolved yet
+        """
+        row = self._conn.execute(
+            "SELECT zip_url FROM zip_urls WHERE accession_number = ?",
+            (accession_number,)
+        ).fetchone()
+
+        if row:
+            self.hits += 1
+            return row[0]
+        self.misses += 1
+        return None
+
+    def put(self, cik: str, accession_number: str, zip_url: str) -> None:
+        """
+        Store the ZIP URL of a filing.
+
+        Args:
+            cik: Company CIK
+            accession_number: Filing accession number (with dashes)
+            zip_url: Resolved ZIP URL
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO zip_urls (accession_number, cik, zip_url, resolved_at) "
+                "VALUES (?, ?, ?, ?)",
+                (accession_number, cik, zip_url, time.time())
+            )
+
+    def get_statistics(self) -> dict:
+        """Cache hits and misses of this process."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+__all__ = ['SECZIPURLCache']
@@ -4,6 +4,10 @@ UK Companies House API Client
 
 Async HTTP client for Companies House API with rate limiting and retry logic.
 Enforces Companies House requirements (600 req/5min, API key authentication).
+
+JSON requests go through the shared HTTP response cache
+(core/http_cache.py) with the per-endpoint TTLs of HTTP_CACHE_TTLS;
+document downloads (get_content) are not cached.
 """
 
 import asyncio
@@ -19,6 +23,7 @@ from tenacity import (
 
 from searcher.core.config_loader import ConfigLoader
 from searcher.core.logger import get_logger
+from searcher.core.http_cache import get_http_cache, resolve_ttl
 from searcher.constants import (
     LOG_INPUT,
     LOG_PROCESS,
@@ -33,6 +38,7 @@ from searcher.markets.uk.constants import (
     MAX_RETRIES,
     RETRY_DELAY,
     BACKOFF_FACTOR,
+    HTTP_CACHE_TTLS,
     HTTP_OK,
     HTTP_NOT_FOUND,
     HTTP_TOO_MANY_REQUESTS,
@@ -54,6 +60,7 @@ class UKAPIClient:
     - Automatic retry with exponential backoff
     - Timeout handling
     - Request tracking
+    - On-disk response cache (shared with the other market clients)
     """
 
     def __init__(self, config: ConfigLoader = None):
@@ -82,6 +89,9 @@ class UKAPIClient:
         self._request_times: list[float] = []
         self._rate_limit_lock = asyncio.Lock()
 
+        # Response cache (shared by all API clients of the process)
+        self._http_cache = get_http_cache(self.config)
+
         # Session (created on first use)
         self._session: Optional[aiohttp.ClientSession] = None
 
@@ -152,9 +162,6 @@ class UKAPIClient:
             aiohttp.ClientResponseError: HTTP error
             ValueError: Invalid JSON response
         """
-        # Enforce rate limiting
-        await self._enforce_rate_limit()
-
         # Construct full URL if relative
         if not url.startswith('http'):
             url = f"{self.base_url}{url}"
@@ -163,50 +170,57 @@ class UKAPIClient:
 
         session = await self._get_session()
 
-        async with session.get(url) as response:
-            # Log response
-            logger.debug(
-                f"Response: {response.status}",
-                extra={LOG_PROCESS: 'api_response', 'status_code': response.status}
+        # Rate limiting is enforced only when the request goes to the network
+        response = await self._http_cache.fetch(
+            session,
+            url,
+            ttl=resolve_ttl(url, HTTP_CACHE_TTLS, self._http_cache.default_ttl),
+            before_request=self._enforce_rate_limit
+        )
+
+        # Log response
+        logger.debug(
+            f"Response: {response.status}",
+            extra={LOG_PROCESS: 'api_response', 'status_code': response.status}
+        )
+
+        # Handle rate limiting (shouldn't happen with our enforcement)
+        if response.status == HTTP_TOO_MANY_REQUESTS:
+            logger.warning(
+                f"{MSG_RATE_LIMIT_EXCEEDED} (Server-side)",
+                extra={LOG_PROCESS: 'rate_limit_server'}
+            )
+            await asyncio.sleep(60)
+            raise aiohttp.ClientError("Rate limit exceeded")
+
+        # Handle unauthorized (bad API key)
+        if response.status == HTTP_UNAUTHORIZED:
+            logger.error(MSG_API_KEY_INVALID, extra={LOG_OUTPUT: 'error'})
+            raise aiohttp.ClientResponseError(
+                request_info=response.request_info,
+                history=response.history,
+                status=response.status,
+                message="Invalid API key"
             )
 
-            # Handle rate limiting (shouldn't happen with our enforcement)
-            if response.status == HTTP_TOO_MANY_REQUESTS:
-                logger.warning(
-                    f"{MSG_RATE_LIMIT_EXCEEDED} (Server-side)",
-                    extra={LOG_PROCESS: 'rate_limit_server'}
-                )
-                await asyncio.sleep(60)
-                raise aiohttp.ClientError("Rate limit exceeded")
-
-            # Handle unauthorized (bad API key)
-            if response.status == HTTP_UNAUTHORIZED:
-                logger.error(MSG_API_KEY_INVALID, extra={LOG_OUTPUT: 'error'})
-                raise aiohttp.ClientResponseError(
-                    request_info=response.request_info,
-                    history=response.history,
-                    status=response.status,
-                    message="Invalid API key"
-                )
-
-            # Handle not found
-            if response.status == HTTP_NOT_FOUND:
-                return None
+        # Handle not found
+        if response.status == HTTP_NOT_FOUND:
+            return None
 
-            # Raise for other errors
-            response.raise_for_status()
+        # Raise for other errors
+        response.raise_for_status()
 
-            # Parse JSON
-            try:
-                data = await response.json()
-                logger.debug(
-                    f"Parsed JSON response",
-                    extra={LOG_OUTPUT: 'api_data', 'keys': list(data.keys()) if isinstance(data, dict) else None}
-                )
-                return data
-            except Exception as e:
-                logger.error(f"Failed to parse JSON: {e}", extra={LOG_OUTPUT: 'error'})
-                raise ValueError(f"Invalid JSON response: {e}")
+        # Parse JSON
+        try:
+            data = response.json()
+            logger.debug(
+                f"Parsed JSON response",
+                extra={LOG_OUTPUT: 'api_data', 'keys': list(data.keys()) if isinstance(data, dict) else None}
+            )
+            return data
+        except Exception as e:
+            logger.error(f"Failed to parse JSON: {e}", extra={LOG_OUTPUT: 'error'})
+            raise ValueError(f"Invalid JSON response: {e}")
 
     async def get_content(self, url: str) -> bytes:
         """
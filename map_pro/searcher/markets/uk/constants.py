@@ -80,6 +80,13 @@ MAX_RETRIES = 3
 RETRY_DELAY = 2                  # Seconds
 BACKOFF_FACTOR = 2               # Exponential backoff multiplier
 
+# HTTP response cache TTLs: (URL fragment, seconds), first match wins.
+# URLs matching none (company profiles, search) use cache_expiry_hours.
+HTTP_CACHE_TTLS = [
+    ('/filing-history', 3600),       # New filings appear during the day
+    ('/document/', 30 * 86400),      # Document metadata does not change
+]
+
 # HTTP status codes
 HTTP_OK = 200
 HTTP_CREATED = 201
@@ -158,6 +165,7 @@ __all__ = [
     'RATE_LIMIT_REQUESTS',
     'RATE_LIMIT_WINDOW',
     'MAX_RETRIES',
+    'HTTP_CACHE_TTLS',
 
     # File formats
     'FORMAT_IXBRL',
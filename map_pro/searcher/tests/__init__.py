@@ -0,0 +1,8 @@
+# Path: searcher/tests/__init__.py
+"""
+Tests for Searcher Module
+
+Internal tests runnable without network access.
+"""
+
+__all__ = ['test_http_cache']
@@ -0,0 +1,173 @@
+# Path: searcher/tests/test_http_cache.py
+"""
+Internal Test for the HTTP Response Cache
+
+Records responses from a local HTTP server in cache mode, stops the
+server, and replays them. Validates:
+1. Cached error responses raise a ClientResponseError that formats
+2. A recorded 404 replayed through SECAPIClient raises the ClientError
+   (after its retries), not an AttributeError
+3. Replay serves recorded bodies without the network
+
+Usage:
+    python -m searcher.tests.test_http_cache
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+from tenacity import RetryError, wait_none
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from searcher.core.http_cache import CachedResponse, HTTPResponseCache
+from searcher.markets.sec.api_client import SECAPIClient
+from searcher.constants import HTTP_CACHE_MODE_CACHE, HTTP_CACHE_MODE_REPLAY
+
+
+HOST = '127.0.0.1'
+PORT = 18790
+BASE_URL = f'http://{HOST}:{PORT}'
+FOUND_URL = f'{BASE_URL}/submissions/CIK0000320193.json'
+MISSING_URL = f'{BASE_URL}/submissions/CIK0000000001.json'
+
+
+class HTTPCacheTestRunner:
+    """
+    Internal test runner for the HTTP response cache.
+    """
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.errors = []
+
+    def run_all_tests(self) -> bool:
+        """Run all tests and print a summary."""
+        self.test_cached_error_formats()
+        asyncio.run(self.test_replay_recorded_404())
+        self._print_summary()
+        return self.failed == 0
+
+    def test_cached_error_formats(self):
+        """A cached 404 raises a ClientResponseError carrying the URL."""
+        test_name = 'Cached error response'
+        response = CachedResponse(url=MISSING_URL, status=404, body=b'', from_cache=True)
+        try:
+            response.raise_for_status()
+            self._fail(test_name, 'no error raised for 404')
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404 and MISSING_URL in str(e) and e.request_info.method == 'GET':
+                self._pass(test_name)
+            else:
+                self._fail(test_name, f'unexpected error: {e!r}')
+        except Exception as e:
+            self._error(test_name, f'{type(e).__name__}: {e}')
+
+    async def test_replay_recorded_404(self):
+        """Record a 200 and a 404, then replay both through SECAPIClient."""
+        test_name = 'Replay recorded 404 through SECAPIClient'
+        with tempfile.TemporaryDirectory() as cache_dir:
+            try:
+                await self._record(Path(cache_dir))
+
+                client = SECAPIClient()
+                client._http_cache = HTTPResponseCache(Path(cache_dir), HTTP_CACHE_MODE_REPLAY)
+                retrying = SECAPIClient._make_request_with_retry.retry
+                original_wait = retrying.wait
+                retrying.wait = wait_none()
+                try:
+                    data = await client.get_json(FOUND_URL)
+                    try:
+                        await client.get_json(MISSING_URL)
+                        error = None
+                    except RetryError as e:
+                        error = e.last_attempt.exception()
+                finally:
+                    retrying.wait = original_wait
+                    client._http_cache.close()
+                    await client.close()
+
+                checks = [
+                    (data == {'name': 'Apple Inc.'}, 'recorded 200 body not replayed'),
+                    (isinstance(error, aiohttp.ClientResponseError), f'expected ClientResponseError, got {error!r}'),
+                    (getattr(error, 'status', None) == 404, 'replayed status is not 404'),
+                ]
+                failed_checks = [msg for ok, msg in checks if not ok]
+                if not failed_checks:
+                    self._pass(test_name)
+                else:
+                    self._fail(test_name, '; '.join(failed_checks))
+
+            except Exception as e:
+                self._error(test_name, f'{type(e).__name__}: {e}')
+
+    async def _record(self, cache_dir: Path) -> None:
+        """Fetch both URLs from a local server in cache mode."""
+        async def submissions(request):
+            if request.path.endswith('CIK0000320193.json'):
+                return web.json_response({'name': 'Apple Inc.'})
+            return web.Response(status=404)
+
+        app = web.Application()
+        app.router.add_get('/submissions/{name}', submissions)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, HOST, PORT).start()
+
+        cache = HTTPResponseCache(cache_dir, HTTP_CACHE_MODE_CACHE)
+        try:
+            async with aiohttp.ClientSession() as session:
+                for url in (FOUND_URL, MISSING_URL):
+                    await cache.fetch(session, url)
+        finally:
+            cache.close()
+            await runner.cleanup()
+
+    def _pass(self, test_name: str):
+        """Record a passing test."""
+        self.passed += 1
+        print(f'  [PASS] {test_name}')
+
+    def _fail(self, test_name: str, reason: str):
+        """Record a failing test."""
+        self.failed += 1
+        print(f'  [FAIL] {test_name}')
+        print(f'         Reason: {reason}')
+        self.errors.append((test_name, reason))
+
+    def _error(self, test_name: str, error: str):
+        """Record a test error."""
+        self.failed += 1
+        print(f'  [ERROR] {test_name}')
+        print(f'          {error}')
+        self.errors.append((test_name, f'ERROR: {error}'))
+
+    def _print_summary(self):
+        """Print test summary."""
+        sep = '=' * 60
+        print()
+        print(sep)
+        print(f'  Passed: {self.passed}  Failed: {self.failed}')
+        if self.failed == 0:
+            print('  [OK] All tests passed!')
+        else:
+            print('  [FAIL] Some tests failed:')
+            for name, reason in self.errors:
+                print(f'    - {name}: {reason}')
+        print(sep)
+
+
+def main():
+    """Main entry point."""
+    runner = HTTPCacheTestRunner()
+    sys.exit(0 if runner.run_all_tests() else 1)
+
+
+if __name__ == '__main__':
+    main()
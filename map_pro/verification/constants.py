@@ -69,6 +69,40 @@ STATEMENTS_JSON_FILE = 'statements.json'
 REPORT_FILE = 'report.json'
 SUMMARY_FILE = 'summary.txt'
 
+# Per-filing report written by the CLI and batch verification
+VERIFICATION_REPORT_FILE = 'verification_report.json'
+
+# ==============================================================================
+# BATCH VERIFICATION
+# ==============================================================================
+# Written to the output directory root; one line/row per verified filing
+BATCH_PROGRESS_FILE = 'batch_progress.jsonl'
+BATCH_SUMMARY_CSV = 'batch_summary.csv'
+BATCH_SUMMARY_JSON = 'batch_summary.json'
+
+BATCH_STATUS_COMPLETED = 'completed'
+BATCH_STATUS_FAILED = 'failed'
+
+BATCH_SUMMARY_COLUMNS = [
+    'filing_id',
+    'market',
+    'company',
+    'form',
+    'date',
+    'status',
+    'score',
+    'total_checks',
+    'passed',
+    'failed',
+    'skipped',
+    'critical_issues',
+    'warning_issues',
+    'info_issues',
+    'duration_s',
+    'report_path',
+    'error',
+]
+
 # ==============================================================================
 # SUPPORTED MARKETS
 # ==============================================================================
@@ -141,6 +175,15 @@ __all__ = [
     'STATEMENTS_JSON_FILE',
     'REPORT_FILE',
     'SUMMARY_FILE',
+    'VERIFICATION_REPORT_FILE',
+
+    # Batch verification
+    'BATCH_PROGRESS_FILE',
+    'BATCH_SUMMARY_CSV',
+    'BATCH_SUMMARY_JSON',
+    'BATCH_STATUS_COMPLETED',
+    'BATCH_STATUS_FAILED',
+    'BATCH_SUMMARY_COLUMNS',
 
     # Markets
     'MARKET_SEC',
@@ -119,6 +119,11 @@ class ConfigLoader:
             'xbrl_filings_path': self._get_path('VERIFICATION_XBRL_FILINGS_PATH', required=True),
             'taxonomy_path': self._get_path('VERIFICATION_TAXONOMY_PATH', required=True),
 
+            # ================================================================
+            # CACHE PATHS (optional - compiled taxonomy calculations)
+            # ================================================================
+            'taxonomy_cache_dir': self._get_path('VERIFICATION_TAXONOMY_CACHE_DIR'),
+
             # ================================================================
             # OUTPUT PATHS (WRITE)
             # ================================================================
@@ -74,6 +74,9 @@ class DataPathsManager:
 
             # Logging directory
             self.config.get('log_dir'),
+
+            # Compiled taxonomy calculations (optional)
+            self.config.get('taxonomy_cache_dir'),
         ]
 
         # Filter out None values (optional paths)
@@ -8,6 +8,8 @@ Verification Processors Module
 Modules:
 - pipeline_data: Data structures passed between stages
 - orchestrator: Coordinates the 3-stage pipeline
+- batch_runner: Verifies many filings in parallel worker processes
+- report_writer: Writes per-filing verification reports
 - stage1_discovery: Extracts raw data from XBRL files
 - stage2_preparation: Transforms and organizes data
 - stage3_verification: Verifies and produces results
@@ -51,6 +53,8 @@ from .pipeline_data import (
 )
 
 from .orchestrator import PipelineOrchestrator, verify_filing
+from .batch_runner import BatchVerifier
+from .report_writer import write_report
 
 from .stage1_discovery import DiscoveryProcessor
 from .stage2_preparation import PreparationProcessor
@@ -61,6 +65,8 @@ __all__ = [
     # Orchestrator
     'PipelineOrchestrator',
     'verify_filing',
+    'BatchVerifier',
+    'write_report',
     # Stage processors
     'DiscoveryProcessor',
     'PreparationProcessor',
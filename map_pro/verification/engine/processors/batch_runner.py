@@ -0,0 +1,315 @@
+# Path: verification/engine/processors/batch_runner.py
+"""
+Batch Verifier
+
+Verifies many mapped filings without interaction, in parallel worker
+processes (see batch_workers.py).
+
+OUTPUT (verification output directory root), written as filings finish:
+- batch_progress.jsonl: run header line, then one record per filing
+- batch_summary.csv:    one row per filing (BATCH_SUMMARY_COLUMNS)
+- batch_summary.json:   totals, quality levels and failures (end of run)
+Per-filing reports are written by the workers (report_writer.py).
+
+RESUME: Progress is flushed per filing. A new run with the same pipeline
+settings skips filings already completed whose report still exists and
+retries failed ones. Different settings (e.g. a tolerance change) or
+resume=False start over.
+"""
+
+import csv
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from verification.constants import (
+    BATCH_PROGRESS_FILE,
+    BATCH_SUMMARY_CSV,
+    BATCH_SUMMARY_JSON,
+    BATCH_STATUS_COMPLETED,
+    BATCH_STATUS_FAILED,
+    BATCH_SUMMARY_COLUMNS,
+    QUALITY_EXCELLENT,
+    QUALITY_GOOD,
+    QUALITY_FAIR,
+    QUALITY_POOR,
+    QUALITY_UNUSABLE,
+)
+from verification.loaders.mapped_data import MappedFilingEntry
+
+from .batch_workers import init_verify_worker, verify_filing_task
+from .report_writer import get_filing_id
+
+
+# Called with (number done, number pending, filing record)
+ProgressCallback = Callable[[int, int, dict], None]
+
+
+class BatchVerifier:
+    """
+    Verifies a list of mapped filings in parallel, resumably.
+
+    Usage:
+        config = ConfigLoader()
+        filings = MappedDataLoader(config).discover_all_mapped_filings()
+
+        verifier = BatchVerifier(config, workers=4)
+        summary = verifier.run(filings)
+        print(f"{summary['completed']} verified, average {summary['average_score']}")
+    """
+
+    def __init__(
+        self,
+        config,
+        workers: Optional[int] = None,
+        settings: Optional[dict[str, any]] = None
+    ):
+        """
+        Initialize batch verifier.
+
+        Args:
+            config: ConfigLoader instance
+            workers: Worker processes (default: config 'max_concurrent_jobs')
+            settings: PipelineOrchestrator.configure() arguments
+                (default: canonical naming, fallback binding and the
+                configured tolerances)
+        """
+        self.logger = logging.getLogger('processors.batch')
+        self.config = config
+        self.workers = max(1, workers or config.get('max_concurrent_jobs', 1))
+        self.settings = settings or {
+            'naming_strategy': 'canonical',
+            'binding_strategy': 'fallback',
+            'calculation_tolerance': config.get('calculation_tolerance'),
+            'rounding_tolerance': config.get('rounding_tolerance'),
+        }
+
+        output_dir = config.get('output_dir')
+        if not output_dir:
+            raise ValueError("Output directory not configured")
+        self.output_dir = Path(output_dir)
+
+        self.progress_path = self.output_dir / BATCH_PROGRESS_FILE
+        self.csv_path = self.output_dir / BATCH_SUMMARY_CSV
+        self.summary_path = self.output_dir / BATCH_SUMMARY_JSON
+
+        self._records: dict[str, dict] = {}
+        self._started_at: Optional[str] = None
+
+    def run(
+        self,
+        filings: list[MappedFilingEntry],
+        resume: bool = True,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> dict[str, any]:
+        """
+        Verify filings, skipping those completed by an earlier run.
+
+        Args:
+            filings: Filings to verify
+            resume: Continue the previous run if its settings match
+            on_progress: Optional callback after each filing
+
+        Returns:
+            Batch summary dictionary (also written to batch_summary.json)
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._start(resume)
+
+        pending = [f for f in filings if get_filing_id(f) not in self._records]
+        skipped = len(filings) - len(pending)
+        if skipped:
+            self.logger.info(f"Resuming: {skipped} filings already verified")
+
+        workers = min(self.workers, len(pending)) if pending else 0
+        self.logger.info(f"Verifying {len(pending)} filings with {workers} workers")
+
+        if workers == 1:
+            self._run_inline(pending, on_progress)
+        elif workers > 1:
+            self._run_pool(pending, workers, on_progress)
+
+        summary = self._build_summary(filings, skipped)
+        self._write_json_atomic(self.summary_path, summary)
+        self.logger.info(f"Batch summary saved: {self.summary_path}")
+        return summary
+
+    def _run_inline(self, pending: list[MappedFilingEntry], on_progress) -> None:
+        """Verify in this process (single worker)."""
+        init_verify_worker(self.settings, str(self.output_dir))
+        for done, filing in enumerate(pending, 1):
+            self._record(verify_filing_task(filing), done, len(pending), on_progress)
+
+    def _run_pool(self, pending: list[MappedFilingEntry], workers: int, on_progress) -> None:
+        """Verify in worker processes, recording results as they finish."""
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_verify_worker,
+            initargs=(self.settings, str(self.output_dir)),
+        )
+        try:
+            futures = {pool.submit(verify_filing_task, filing): filing for filing in pending}
+
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    record = future.result()
+                except Exception as e:
+                    # Worker process died (e.g. BrokenProcessPool)
+                    record = self._failure_record(futures[future], f"{type(e).__name__}: {e}")
+                self._record(record, done, len(pending), on_progress)
+
+        except BaseException:
+            # Interrupted: keep what is recorded, drop queued filings
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        pool.shutdown()
+
+    def _start(self, resume: bool) -> None:
+        """Load resumable progress and rewrite progress/CSV files from it."""
+        self._records = self._load_completed() if resume else {}
+        self._started_at = datetime.now().isoformat()
+
+        header = {
+            'type': 'run',
+            'started_at': self._started_at,
+            'settings': self.settings,
+        }
+        records = list(self._records.values())
+
+        self._write_atomic(
+            self.progress_path,
+            ''.join(json.dumps(line, default=str) + '\n' for line in [header] + records)
+        )
+
+        with open(self.csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=BATCH_SUMMARY_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(records)
+
+    def _load_completed(self) -> dict[str, dict]:
+        """Completed filing records of the previous run (same settings only)."""
+        if not self.progress_path.exists():
+            return {}
+
+        records: dict[str, dict] = {}
+        with open(self.progress_path, 'r', encoding='utf-8') as f:
+            for number, line in enumerate(f):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partial last line from an interrupted write
+                    continue
+
+                if number == 0:
+                    if entry.get('type') != 'run' or entry.get('settings') != self.settings:
+                        self.logger.info("Pipeline settings changed, starting a new batch run")
+                        return {}
+                    continue
+
+                if entry.get('filing_id'):
+                    records[entry['filing_id']] = entry
+
+        return {
+            filing_id: record
+            for filing_id, record in records.items()
+            if record.get('status') == BATCH_STATUS_COMPLETED
+            and record.get('report_path') and Path(record['report_path']).exists()
+        }
+
+    def _record(self, record: dict, done: int, total: int, on_progress) -> None:
+        """Append one filing result to progress and CSV files."""
+        if record['status'] == BATCH_STATUS_COMPLETED:
+            self._records[record['filing_id']] = record
+        else:
+            self.logger.error(f"Verification failed for {record['filing_id']}: {record['error']}")
+
+        with open(self.progress_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        with open(self.csv_path, 'a', encoding='utf-8', newline='') as f:
+            csv.DictWriter(f, fieldnames=BATCH_SUMMARY_COLUMNS, extrasaction='ignore').writerow(record)
+
+        if on_progress:
+            on_progress(done, total, record)
+
+    def _failure_record(self, filing: MappedFilingEntry, error: str) -> dict:
+        """Record for a filing whose worker did not return."""
+        return {
+            'filing_id': get_filing_id(filing),
+            'market': filing.market,
+            'company': filing.company,
+            'form': filing.form,
+            'date': filing.date,
+            'status': BATCH_STATUS_FAILED,
+            'report_path': None,
+            'error': error,
+            'duration_s': 0.0,
+        }
+
+    def _build_summary(self, filings: list[MappedFilingEntry], resumed: int) -> dict[str, any]:
+        """Summarize the batch over all requested filings."""
+        filing_ids = [get_filing_id(f) for f in filings]
+        completed = [self._records[fid] for fid in filing_ids if fid in self._records]
+        failed = [fid for fid in filing_ids if fid not in self._records]
+
+        quality_levels = {level: 0 for level in (
+            QUALITY_EXCELLENT, QUALITY_GOOD, QUALITY_FAIR, QUALITY_POOR, QUALITY_UNUSABLE
+        )}
+        for record in completed:
+            quality_levels[self._quality_level(record['score'])] += 1
+
+        scores = [record['score'] for record in completed]
+
+        return {
+            'started_at': self._started_at,
+            'finished_at': datetime.now().isoformat(),
+            'settings': self.settings,
+            'total_filings': len(filings),
+            'completed': len(completed),
+            'failed': len(failed),
+            'resumed': resumed,
+            'average_score': round(sum(scores) / len(scores), 2) if scores else None,
+            'quality_levels': quality_levels,
+            'critical_issues': sum(record['critical_issues'] for record in completed),
+            'warning_issues': sum(record['warning_issues'] for record in completed),
+            'failed_filings': failed,
+        }
+
+    def _quality_level(self, score: float) -> str:
+        """Quality level for a score using the configured thresholds."""
+        if score >= self.config.get('excellent_threshold'):
+            return QUALITY_EXCELLENT
+        if score >= self.config.get('good_threshold'):
+            return QUALITY_GOOD
+        if score >= self.config.get('fair_threshold'):
+            return QUALITY_FAIR
+        if score >= self.config.get('poor_threshold'):
+            return QUALITY_POOR
+        return QUALITY_UNUSABLE
+
+    def _write_json_atomic(self, path: Path, data: dict) -> None:
+        """Write a JSON file atomically."""
+        self._write_atomic(path, json.dumps(data, indent=2, default=str))
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        """Write a text file atomically (temp file + rename)."""
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+__all__ = ['BatchVerifier']
@@ -0,0 +1,110 @@
+# Path: verification/engine/processors/batch_workers.py
+"""
+Batch Verification Worker Functions
+
+Process-pool entry points for verifying many mapped filings in parallel.
+
+Architecture:
+- Each worker process builds ONE PipelineOrchestrator in its initializer
+  and reuses it (loaders, tools, per-process caches) for every filing it
+  receives
+- Workers write each filing's verification_report.json themselves, so a
+  report exists as soon as its filing is done
+- Tasks are MappedFilingEntry objects (paths and folder metadata only);
+  results are plain dictionaries so they pickle cheaply
+- Progress and summary files stay in the parent process (BatchVerifier)
+"""
+
+import time
+from pathlib import Path
+from typing import Optional
+
+from verification.constants import BATCH_STATUS_COMPLETED, BATCH_STATUS_FAILED
+from verification.loaders.mapped_data import MappedFilingEntry
+
+from .report_writer import get_filing_id, write_report
+
+# Per-process orchestrator and output directory, set by init_verify_worker()
+_worker_orchestrator = None
+_worker_output_dir: Optional[Path] = None
+
+
+def init_verify_worker(settings: dict[str, any], output_dir: str) -> None:
+    """
+    Initialize a verification worker process.
+
+    Called once per worker by ProcessPoolExecutor (or once in-process for
+    a single worker). The orchestrator created here is reused for every
+    filing handled by this process.
+
+    Args:
+        settings: Keyword arguments for PipelineOrchestrator.configure()
+        output_dir: Verification output directory for reports
+    """
+    global _worker_orchestrator, _worker_output_dir
+
+    from verification.core.config_loader import ConfigLoader
+    from .orchestrator import PipelineOrchestrator
+
+    _worker_orchestrator = PipelineOrchestrator(ConfigLoader())
+    _worker_orchestrator.configure(**settings)
+    _worker_output_dir = Path(output_dir)
+
+
+def verify_filing_task(filing: MappedFilingEntry) -> dict[str, any]:
+    """
+    Verify one filing inside a worker process.
+
+    Never raises: failures are reported in the returned dictionary.
+
+    Args:
+        filing: Mapped filing to verify
+
+    Returns:
+        Dictionary with filing metadata, status, summary counts,
+        report_path, error and duration
+    """
+    start = time.time()
+    result = {
+        'filing_id': get_filing_id(filing),
+        'market': filing.market,
+        'company': filing.company,
+        'form': filing.form,
+        'date': filing.date,
+        'status': BATCH_STATUS_FAILED,
+        'report_path': None,
+        'error': None,
+    }
+
+    try:
+        if _worker_orchestrator is None:
+            raise RuntimeError("Verification worker not initialized")
+
+        verification = _worker_orchestrator.run(filing)
+        report_path = write_report(filing, verification, _worker_output_dir)
+
+        summary = verification.summary
+        result.update({
+            'status': BATCH_STATUS_COMPLETED,
+            'score': summary.score,
+            'total_checks': summary.total_checks,
+            'passed': summary.passed,
+            'failed': summary.failed,
+            'skipped': summary.skipped,
+            'critical_issues': summary.critical_issues,
+            'warning_issues': summary.warning_issues,
+            'info_issues': summary.info_issues,
+            'report_path': str(report_path),
+        })
+
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    result['duration_s'] = round(time.time() - start, 3)
+    return result
+
+
+__all__ = [
+    'init_verify_worker',
+    'verify_filing_task',
+]
@@ -12,9 +12,12 @@ Each stage produces immutable output that the next stage consumes.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from ..tools.context import FactStore
+
 
 # ==============================================================================
 # STAGE 1 OUTPUT: Discovery Results
@@ -184,6 +187,9 @@ class PreparationResult:
     fact_groups: dict[str, FactGroup] = field(default_factory=dict)  # context_id -> group
     all_facts_by_concept: dict[str, list] = field(default_factory=dict)  # concept -> [(ctx, val, unit, dec)]
 
+    # Indexed facts: (context, concept) -> fact, concept/period -> contexts
+    fact_store: Optional['FactStore'] = None
+
     # Sign corrections parsed from instance
     sign_corrections: dict[tuple[str, str], int] = field(default_factory=dict)  # (concept, ctx) -> correction
 
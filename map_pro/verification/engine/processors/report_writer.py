@@ -0,0 +1,126 @@
+# Path: verification/engine/processors/report_writer.py
+"""
+Verification Report Writer
+
+Writes the per-filing verification_report.json.
+
+Shared by the interactive CLI and batch verification workers so both
+produce identical reports in the same place:
+
+    {output_dir}/{market}/{company}/{form}/{date}/verification_report.json
+"""
+
+import json
+import logging
+from pathlib import Path
+
+from verification.constants import VERIFICATION_REPORT_FILE
+from verification.loaders.mapped_data import MappedFilingEntry
+
+from .pipeline_data import VerificationResult
+
+
+logger = logging.getLogger('output.report_writer')
+
+
+def get_filing_id(filing: MappedFilingEntry) -> str:
+    """Get the market/company/form/date identifier of a filing."""
+    return f"{filing.market}/{filing.company}/{filing.form}/{filing.date}"
+
+
+def get_report_path(filing: MappedFilingEntry, output_dir: Path) -> Path:
+    """Get the report path for a filing."""
+    return (
+        Path(output_dir) /
+        filing.market /
+        filing.company /
+        filing.form /
+        filing.date /
+        VERIFICATION_REPORT_FILE
+    )
+
+
+def build_report_data(filing: MappedFilingEntry, result: VerificationResult) -> dict:
+    """
+    Build the report dictionary for a verified filing.
+
+    Args:
+        filing: Filing that was verified
+        result: Verification result
+
+    Returns:
+        JSON-serializable report dictionary
+    """
+    return {
+        'filing_id': get_filing_id(filing),
+        'market': filing.market,
+        'company': filing.company,
+        'form': filing.form,
+        'date': filing.date,
+        'verified_at': result.verification_timestamp,
+        'processing_time_ms': result.processing_time_ms,
+        'summary': {
+            'score': result.summary.score,
+            'total_checks': result.summary.total_checks,
+            'passed': result.summary.passed,
+            'failed': result.summary.failed,
+            'skipped': result.summary.skipped,
+            'critical_issues': result.summary.critical_issues,
+            'warning_issues': result.summary.warning_issues,
+            'info_issues': result.summary.info_issues,
+        },
+        'checks': [
+            {
+                'check_name': c.check_name,
+                'check_type': c.check_type,
+                'passed': c.passed,
+                'severity': c.severity,
+                'message': c.message,
+                'expected_value': c.expected_value,
+                'actual_value': c.actual_value,
+                'difference': c.difference,
+                'concept': c.concept,
+                'context_id': c.context_id,
+                'details': c.details,
+            }
+            for c in result.checks
+        ]
+    }
+
+
+def write_report(
+    filing: MappedFilingEntry,
+    result: VerificationResult,
+    output_dir: Path
+) -> Path:
+    """
+    Write verification_report.json for a filing.
+
+    Args:
+        filing: Filing that was verified
+        result: Verification result
+        output_dir: Verification output directory
+
+    Returns:
+        Path to the written report
+    """
+    filing_id = get_filing_id(filing)
+
+    report_path = get_report_path(filing, output_dir)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Created report directory: {report_path.parent}")
+
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(build_report_data(filing, result), f, indent=2, default=str)
+
+    logger.info(f"Verification complete for {filing_id}")
+    logger.info(f"Score: {result.summary.score:.1f}/100, "
+                f"Checks: {result.summary.total_checks} total, "
+                f"{result.summary.passed} passed, "
+                f"{result.summary.failed} failed")
+    logger.info(f"Report saved: {report_path}")
+
+    return report_path
+
+
+__all__ = ['get_filing_id', 'get_report_path', 'build_report_data', 'write_report']
@@ -15,7 +15,7 @@ All data is prepared for Stage 3 to verify.
 
 TOOLS USED:
 - naming/: Normalizer for concept names
-- context/: ContextClassifier, ContextGrouper for context handling
+- context/: ContextClassifier, FactStore for context handling
 - period/: PeriodExtractor for period normalization
 - fact/: ValueParser for value parsing, DuplicateHandler
 - sign/: SignParser for sign correction extraction
@@ -37,7 +37,7 @@ from ..pipeline_data import (
 
 # Import tools
 from ...tools.naming import Normalizer
-from ...tools.context import ContextClassifier, ContextGrouper
+from ...tools.context import ContextClassifier, FactStore
 from ...tools.period import PeriodExtractor
 from ...tools.fact import ValueParser, DuplicateHandler
 from ...tools.sign import SignParser
@@ -290,41 +290,31 @@ class PreparationProcessor:
             result.facts.append(prepared)
 
     def _group_facts(self, result: PreparationResult) -> None:
-        """Group facts by context using C-Equal principle."""
-        grouper = ContextGrouper()
+        """
+        Group facts by context using C-Equal principle.
+
+        Builds the FactStore in one pass over the facts; FactGroups are
+        read from its (context, concept) index. Stage 3 uses the store
+        directly.
+        """
+        store = FactStore()
 
         for fact in result.facts:
-            grouper.add_fact(
-                concept=fact.concept,
-                value=fact.value,
-                context_id=fact.context_id,
-                unit=fact.unit,
-                decimals=fact.decimals,
-                original_concept=fact.original_concept,
-            )
+            ctx_info = result.contexts.get(fact.context_id)
+            store.add(fact, period_key=ctx_info.period_key if ctx_info else fact.context_id)
 
-        # Convert grouper output to FactGroup structures
-        for context_id in grouper.get_contexts():
-            ctx_group = grouper.get_context(context_id)
-            if ctx_group:
-                ctx_info = result.contexts.get(context_id)
-
-                fact_group = FactGroup(
-                    context_id=context_id,
-                    period_key=ctx_info.period_key if ctx_info else context_id,
-                    is_dimensional=ctx_info.is_dimensional if ctx_info else False,
-                    facts={},
-                )
-
-                # Copy facts from grouper to fact_group
-                for concept in ctx_group.facts.keys():
-                    # Find matching prepared fact
-                    for pf in result.facts:
-                        if pf.concept == concept and pf.context_id == context_id:
-                            fact_group.facts[concept] = pf
-                            break
-
-                result.fact_groups[context_id] = fact_group
+        result.fact_store = store
+
+        # FactGroup keeps the first fact reported per concept
+        for context_id in store.get_context_ids():
+            ctx_info = result.contexts.get(context_id)
+
+            result.fact_groups[context_id] = FactGroup(
+                context_id=context_id,
+                period_key=ctx_info.period_key if ctx_info else context_id,
+                is_dimensional=ctx_info.is_dimensional if ctx_info else False,
+                facts=store.get_context_facts(context_id),
+            )
 
     def _build_concept_lookup(self, result: PreparationResult) -> None:
         """
@@ -10,10 +10,11 @@ Uses binding checker to determine which calculations apply.
 
 TOOLS USED:
 - hierarchy/: BindingChecker for calculation binding rules
-- calculation/: SumCalculator for weighted sum verification
+- calculation/: BatchSumCalculator for weighted sum verification
+  (all bound calculations of a filing evaluated in one batch)
 - tolerance/: ToleranceChecker for value comparison
 - sign/: SignLookup for sign corrections during verification
-- context/: ContextGrouper, ContextGroup for context organization
+- context/: FactStore (built in Stage 2) for context groups and lookups
 """
 
 import logging
@@ -26,10 +27,10 @@ from ..pipeline_data import (
 )
 
 # Import tools
-from ...tools.hierarchy import BindingChecker
-from ...tools.calculation import SumCalculator
+from ...tools.hierarchy import BindingChecker, BindingResult
+from ...tools.calculation import BatchSumCalculator, SumRequest, SumResult
 from ...tools.sign import SignLookup
-from ...tools.context import ContextGrouper, ContextGroup
+from ...tools.context import FactStore
 
 # Import constants
 from ...constants.tolerances import (
@@ -62,7 +63,7 @@ class HorizontalCheckRunner:
 
         # Initialize tools with defaults
         self._binding_checker = BindingChecker(strategy='fallback')
-        self._sum_calculator = SumCalculator()
+        self._sum_calculator = BatchSumCalculator()
         self._sign_lookup = None
 
         # Configuration
@@ -110,40 +111,69 @@ class HorizontalCheckRunner:
             f"Running horizontal checks on {len(preparation.calculations)} calculations"
         )
 
-        # Build context groups for binding checker
-        context_groups = self._build_context_groups(preparation)
+        # Context groups and concept -> contexts index from Stage 2
+        fact_store = self._get_fact_store(preparation)
 
+        # Bind every (calculation, context) pair first, keeping check order;
+        # bound pairs are then evaluated together
+        slots = []
+        requests = []
         for calc in preparation.calculations:
             # Find all contexts where parent exists
-            parent_contexts = self._get_contexts_for_concept(
-                calc.parent_concept, preparation
-            )
-
-            if not parent_contexts:
-                # No facts for this calculation - skip
-                continue
+            parent_contexts = fact_store.contexts_with_concept(calc.parent_concept)
 
             # Verify in each context
             for context_id in parent_contexts:
-                check = self._verify_calculation_in_context(
-                    calc, context_id, context_groups, preparation
+                binding = self._bind_calculation(calc, context_id, fact_store, preparation)
+                if binding is None:
+                    continue
+
+                if not binding.binds:
+                    slots.append(self._build_skipped_check(calc, context_id, binding))
+                    continue
+
+                # Use ONLY what the XBRL filing declares:
+                # - Calculation linkbase weights define the parent-child relationships
+                # - Sign corrections from iXBRL sign="-" attributes (if present in filing)
+                # - NO hardcoded pattern matching or semantic inference
+                slots.append((calc, context_id, binding, len(requests)))
+                requests.append(SumRequest(
+                    children=binding.children_found,
+                    parent_value=binding.parent_value,
+                    parent_decimals=binding.parent_decimals,
+                    parent_concept=calc.parent_concept,
+                    parent_context_id=context_id,
+                ))
+
+        # Calculate all sums and compare
+        sum_results = self._sum_calculator.calculate_and_compare_all(
+            requests,
+            apply_sign_corrections=True,  # Apply sign="-" from iXBRL if declared
+        )
+
+        for slot in slots:
+            if isinstance(slot, VerificationCheck):
+                check = slot
+            else:
+                calc, context_id, binding, index = slot
+                check = self._build_calculation_check(
+                    calc, context_id, binding, sum_results[index]
                 )
-                if check:
-                    result.checks.append(check)
-                    result.horizontal_checks.append(check)
+            result.checks.append(check)
+            result.horizontal_checks.append(check)
 
         # Duplicate fact checks
         self._check_duplicates(preparation, result)
 
-    def _verify_calculation_in_context(
+    def _bind_calculation(
         self,
         calc,
         context_id: str,
-        context_groups: dict[str, ContextGroup],
+        fact_store: FactStore,
         preparation: PreparationResult
-    ) -> Optional[VerificationCheck]:
-        """Verify a single calculation in a specific context."""
-        ctx_group = context_groups.get(context_id)
+    ) -> Optional[BindingResult]:
+        """Check binding of a single calculation in a specific context."""
+        ctx_group = fact_store.get_group(context_id)
         if not ctx_group:
             return None
 
@@ -156,7 +186,7 @@ class HorizontalCheckRunner:
         parent_period_key = ctx_info.period_key if ctx_info else None
 
         # Check binding using binding checker
-        binding = self._binding_checker.check_binding_with_fallback(
+        return self._binding_checker.check_binding_with_fallback(
             context_group=ctx_group,
             parent_concept=calc.parent_concept,
             children=calc.children,
@@ -165,38 +195,37 @@ class HorizontalCheckRunner:
             parent_period_key=parent_period_key,  # Use actual period from filing
         )
 
-        if not binding.binds:
-            # Calculation doesn't bind - skip (not fail)
-            return VerificationCheck(
-                check_name=CHECK_CALCULATION_CONSISTENCY,
-                check_type='horizontal',
-                passed=False,
-                severity='info',
-                message=f"Skipped: {binding.message}",
-                concept=calc.original_parent,
-                context_id=context_id,
-                role=calc.role,
-                details={
-                    'status': 'skipped',
-                    'binding_status': binding.status.value,
-                    'missing_children': binding.children_missing,
-                },
-            )
-
-        # Calculate sum and compare
-        # Use ONLY what the XBRL filing declares:
-        # - Calculation linkbase weights define the parent-child relationships
-        # - Sign corrections from iXBRL sign="-" attributes (if present in filing)
-        # - NO hardcoded pattern matching or semantic inference
-        sum_result = self._sum_calculator.calculate_and_compare(
-            children=binding.children_found,
-            parent_value=binding.parent_value,
-            parent_decimals=binding.parent_decimals,
-            parent_concept=calc.parent_concept,
-            parent_context_id=context_id,
-            apply_sign_corrections=True,  # Apply sign="-" from iXBRL if declared
+    def _build_skipped_check(
+        self,
+        calc,
+        context_id: str,
+        binding: BindingResult
+    ) -> VerificationCheck:
+        """Calculation doesn't bind - skip (not fail)."""
+        return VerificationCheck(
+            check_name=CHECK_CALCULATION_CONSISTENCY,
+            check_type='horizontal',
+            passed=False,
+            severity='info',
+            message=f"Skipped: {binding.message}",
+            concept=calc.original_parent,
+            context_id=context_id,
+            role=calc.role,
+            details={
+                'status': 'skipped',
+                'binding_status': binding.status.value,
+                'missing_children': binding.children_missing,
+            },
         )
 
+    def _build_calculation_check(
+        self,
+        calc,
+        context_id: str,
+        binding: BindingResult,
+        sum_result: SumResult
+    ) -> VerificationCheck:
+        """Build the check for a bound calculation from its sum result."""
         # Determine severity
         if sum_result.passed:
             severity = 'info'
@@ -372,47 +401,16 @@ class HorizontalCheckRunner:
             result.checks.append(check)
             result.horizontal_checks.append(check)
 
-    def _build_context_groups(
-        self,
-        preparation: PreparationResult
-    ) -> dict[str, ContextGroup]:
-        """Build ContextGroup objects for binding checker."""
-        groups = {}
-
-        for context_id, fact_group in preparation.fact_groups.items():
-            # Create a ContextGroup using the grouper
-            grouper = ContextGrouper()
-
-            for concept, fact in fact_group.facts.items():
-                grouper.add_fact(
-                    concept=fact.concept,
-                    value=fact.value,
-                    context_id=fact.context_id,
-                    unit=fact.unit,
-                    decimals=fact.decimals,
-                    original_concept=fact.original_concept,
-                )
+    def _get_fact_store(self, preparation: PreparationResult) -> FactStore:
+        """Get the Stage 2 fact store (indexed from fact groups if absent)."""
+        if preparation.fact_store is not None:
+            return preparation.fact_store
 
-            ctx_group = grouper.get_context(context_id)
-            if ctx_group:
-                groups[context_id] = ctx_group
-
-        return groups
-
-    def _get_contexts_for_concept(
-        self,
-        concept: str,
-        preparation: PreparationResult
-    ) -> list[str]:
-        """Get all context IDs where a concept exists."""
-        contexts = []
-        if concept in preparation.all_facts_by_concept:
-            # Handle both 4-element and 5-element tuples (context_id is always first)
-            for fact_tuple in preparation.all_facts_by_concept[concept]:
-                ctx_id = fact_tuple[0]
-                if ctx_id not in contexts:
-                    contexts.append(ctx_id)
-        return contexts
+        store = FactStore()
+        for fact_group in preparation.fact_groups.values():
+            for fact in fact_group.facts.values():
+                store.add(fact, period_key=fact_group.period_key)
+        return store
 
 
 __all__ = ['HorizontalCheckRunner']
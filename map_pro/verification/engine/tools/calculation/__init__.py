@@ -7,6 +7,7 @@ Provides weight handling and sum calculation for verification.
 Modules:
 - weight_handler: Handle XBRL calculation weights
 - sum_calculator: Calculate weighted sums and compare to totals
+- batch_sum: Evaluate many sums at once (NumPy, optional)
 
 XBRL CALCULATION WEIGHTS:
 - Weight of 1.0 means ADD to sum
@@ -17,6 +18,8 @@ Usage:
         WeightHandler,
         SumCalculator,
         SumResult,
+        BatchSumCalculator,
+        SumRequest,
     )
 
     # Handle weights
@@ -29,14 +32,23 @@ Usage:
         children=children,
         parent_value=1000000
     )
+
+    # Evaluate all calculations of a filing at once
+    batch = BatchSumCalculator()
+    results = batch.calculate_and_compare_all([
+        SumRequest(children=children, parent_value=1000000),
+    ])
 """
 
 from .weight_handler import WeightHandler
 from .sum_calculator import SumCalculator, SumResult
+from .batch_sum import BatchSumCalculator, SumRequest
 
 
 __all__ = [
     'WeightHandler',
     'SumCalculator',
     'SumResult',
+    'BatchSumCalculator',
+    'SumRequest',
 ]
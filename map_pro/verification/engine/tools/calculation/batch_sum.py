@@ -0,0 +1,298 @@
+# Path: verification/engine/tools/calculation/batch_sum.py
+"""
+Batch Sum Calculator for XBRL Verification
+
+Evaluates all calculation checks of a filing in one pass.
+
+SumCalculator compares one parent in one context at a time. Here the
+bound checks of a whole filing are laid out as a sparse matrix instead:
+
+    W   rows = checks, columns = child fact slots, entries = arc weights
+    V   one value per distinct child fact (concept, context, value),
+        with iXBRL sign corrections applied
+
+Expected sums are W @ V, computed with np.bincount over the COO entries.
+bincount adds contributions in child order, exactly as the scalar loop
+does, so sums are bit-identical. Rounding to the comparison decimals and
+the tolerance test also run on arrays.
+
+EXACTNESS: Results equal SumCalculator.calculate_and_compare field for
+field. Integral values (the usual case for monetary facts) are rounded
+with exact integer round-half-even. Other values that need rounding
+(fractions at a decimals precision, magnitudes beyond 2**53) go through
+DecimalTolerance.round_to_decimals. Without NumPy, or for requests with
+non-numeric values, every request goes through calculate_and_compare.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .sum_calculator import SumCalculator, SumResult
+
+
+# Integral float64 values below this are exact as int64
+MAX_EXACT_INTEGER = 2 ** 53
+
+# Largest power of ten used for integer rounding (fits in int64)
+MAX_ROUNDING_EXPONENT = 15
+
+
+@dataclass
+class SumRequest:
+    """
+    One calculation to evaluate (arguments of calculate_and_compare).
+
+    Attributes:
+        children: Child dicts ('concept', 'value', 'weight', 'context_id', ...)
+        parent_value: Reported total
+        parent_decimals: Parent decimal precision
+        parent_concept: Parent concept for sign correction
+        parent_context_id: Parent context for sign correction
+    """
+    children: list[dict]
+    parent_value: float
+    parent_decimals: Optional[int] = None
+    parent_concept: Optional[str] = None
+    parent_context_id: Optional[str] = None
+
+
+class BatchSumCalculator(SumCalculator):
+    """
+    SumCalculator that evaluates many requests at once.
+
+    Usage:
+        calculator = BatchSumCalculator()
+        calculator.set_sign_lookup(sign_lookup)
+
+        results = calculator.calculate_and_compare_all([
+            SumRequest(children=children, parent_value=1000000,
+                       parent_decimals=-3, parent_concept='assets',
+                       parent_context_id='c-1'),
+            ...
+        ])
+    """
+
+    def calculate_and_compare_all(
+        self,
+        requests: list[SumRequest],
+        apply_sign_corrections: bool = True
+    ) -> list[SumResult]:
+        """
+        Calculate sums and compare to parents for all requests.
+
+        Args:
+            requests: Calculations to evaluate
+            apply_sign_corrections: Whether to apply iXBRL sign corrections
+
+        Returns:
+            SumResult per request, in request order
+        """
+        if np is None:
+            return [self._calculate_one(r, apply_sign_corrections) for r in requests]
+
+        use_signs = bool(apply_sign_corrections and self._sign_lookup)
+        corrections_cache: dict[tuple[str, str], int] = {}
+
+        def correction(concept: str, context_id: str) -> int:
+            key = (concept, context_id)
+            sign = corrections_cache.get(key)
+            if sign is None:
+                sign = corrections_cache[key] = self._sign_lookup.get_correction(concept, context_id)
+            return sign
+
+        # Sparse layout: W as COO (row, slot, weight), V as slot values
+        slots: dict[tuple, int] = {}
+        slot_values: list[float] = []
+        slot_corrected: list[bool] = []
+        rows: list[int] = []
+        columns: list[int] = []
+        weights: list[float] = []
+
+        batched: list[int] = []
+        layouts: list[list[tuple[dict, str, str, float, int]]] = []
+        actual_values: list[float] = []
+        corrections: list[int] = []
+        decimals: list[Optional[int]] = []
+        min_decimals: list[Optional[int]] = []
+
+        results: list[Optional[SumResult]] = [None] * len(requests)
+
+        for index, request in enumerate(requests):
+            if not self._is_numeric(request):
+                results[index] = self._calculate_one(request, apply_sign_corrections)
+                continue
+
+            row = len(batched)
+            layout = []
+            count = 0
+
+            for child in request.children:
+                concept = child.get('concept', '')
+                original_concept = child.get('original_concept', concept)
+                value = child.get('value', 0.0)
+                context_id = child.get('context_id', '')
+
+                key = (original_concept, context_id, value)
+                slot = slots.get(key)
+                if slot is None:
+                    corrected = use_signs and correction(original_concept, context_id) == -1
+                    slot = slots[key] = len(slot_values)
+                    slot_values.append(-abs(value) if corrected else value)
+                    slot_corrected.append(corrected)
+
+                if slot_corrected[slot]:
+                    count += 1
+
+                weight = child.get('weight', 1.0)
+                rows.append(row)
+                columns.append(slot)
+                weights.append(self._weight_handler.normalize_weight(weight))
+                layout.append((child, concept, original_concept, weight, slot))
+
+            actual_value = request.parent_value
+            if use_signs and request.parent_concept:
+                if correction(request.parent_concept, request.parent_context_id or '') == -1:
+                    actual_value = -abs(request.parent_value)
+                    count += 1
+
+            minimum = self.get_min_decimals(request.children, request.parent_decimals)
+
+            batched.append(index)
+            layouts.append(layout)
+            actual_values.append(actual_value)
+            corrections.append(count)
+            min_decimals.append(minimum)
+            decimals.append(self._decimal_tolerance.get_comparison_decimals(
+                minimum, request.parent_decimals
+            ))
+
+        if not batched:
+            return results
+
+        # Expected sums: W @ V
+        values = np.asarray(slot_values, dtype=np.float64)
+        contributions = values[np.asarray(columns, dtype=np.intp)] * np.asarray(weights, dtype=np.float64)
+        sums = np.bincount(
+            np.asarray(rows, dtype=np.intp), weights=contributions, minlength=len(batched)
+        )
+        actuals = np.asarray(actual_values, dtype=np.float64)
+
+        # Tolerance comparison at the lowest decimals
+        rounded_sums = self._round_all(sums, decimals)
+        rounded_actuals = self._round_all(actuals, decimals)
+        differences = np.abs(rounded_sums - rounded_actuals)
+
+        epsilons: dict[Optional[int], float] = {}
+        for d in decimals:
+            if d not in epsilons:
+                epsilons[d] = self._decimal_tolerance.get_epsilon(d)
+        passed = differences <= np.asarray([epsilons[d] for d in decimals], dtype=np.float64)
+
+        contribution_list = contributions.tolist()
+        position = 0
+        for row, index in enumerate(batched):
+            expected_sum = float(sums[row])
+            actual_value = actual_values[row]
+            difference = float(differences[row])
+            row_passed = bool(passed[row])
+
+            child_contributions = []
+            for child, concept, original_concept, weight, slot in layouts[row]:
+                child_contributions.append({
+                    'concept': concept,
+                    'original_concept': original_concept,
+                    'value': child.get('value'),
+                    'weight': weight,
+                    'contribution': contribution_list[position],
+                    'decimals': child.get('decimals'),
+                    'sign_corrected': slot_corrected[slot],
+                })
+                position += 1
+
+            results[index] = SumResult(
+                expected_sum=expected_sum,
+                actual_value=actual_value,
+                difference=difference,
+                passed=row_passed,
+                min_decimals=min_decimals[row],
+                children_contributions=child_contributions,
+                sign_corrections_applied=corrections[row],
+                message=self._build_message(
+                    expected_sum, actual_value, difference, row_passed, corrections[row]
+                ),
+            )
+
+        return results
+
+    def _calculate_one(self, request: SumRequest, apply_sign_corrections: bool) -> SumResult:
+        """Evaluate a single request with the scalar path."""
+        return self.calculate_and_compare(
+            children=request.children,
+            parent_value=request.parent_value,
+            parent_decimals=request.parent_decimals,
+            parent_concept=request.parent_concept,
+            parent_context_id=request.parent_context_id,
+            apply_sign_corrections=apply_sign_corrections,
+        )
+
+    @staticmethod
+    def _is_numeric(request: SumRequest) -> bool:
+        """True if parent and child values are plain numbers."""
+        parent_type = type(request.parent_value)
+        if parent_type is int:
+            # Reported as-is when it passes; must survive float64 exactly
+            if abs(request.parent_value) >= MAX_EXACT_INTEGER:
+                return False
+        elif parent_type is not float:
+            return False
+        return all(type(child.get('value', 0.0)) in (int, float) for child in request.children)
+
+    def _round_all(self, values, decimals: list[Optional[int]]):
+        """
+        Round values like DecimalTolerance.round_to_decimals.
+
+        Args:
+            values: float64 array
+            decimals: Comparison decimals per value (None = no rounding)
+
+        Returns:
+            float64 array of rounded values
+        """
+        has_decimals = np.asarray([d is not None for d in decimals], dtype=bool)
+        exponents = np.asarray([d if d is not None else 0 for d in decimals], dtype=np.int64)
+
+        integral = (
+            np.isfinite(values)
+            & (np.abs(values) < MAX_EXACT_INTEGER)
+            & (np.floor(values) == values)
+        )
+
+        rounded = values.copy()
+        # No rounding, or an integer at decimals >= 0: value is unchanged
+        exact = ~has_decimals | (integral & (exponents >= 0))
+
+        # Integer at negative decimals: round half-even to 10**-decimals
+        scaled = has_decimals & integral & (exponents < 0) & (exponents >= -MAX_ROUNDING_EXPONENT)
+        if scaled.any():
+            integers = values[scaled].astype(np.int64)
+            powers = np.power(10, -exponents[scaled]).astype(np.int64)
+            quotients, remainders = np.divmod(np.abs(integers), powers)
+            twice = remainders * 2
+            quotients += (twice > powers) | ((twice == powers) & (quotients % 2 == 1))
+            rounded[scaled] = (np.sign(integers) * quotients * powers).astype(np.float64)
+            exact |= scaled
+
+        for position in np.flatnonzero(~exact).tolist():
+            rounded[position] = self._decimal_tolerance.round_to_decimals(
+                float(values[position]), decimals[position]
+            )
+
+        return rounded
+
+
+__all__ = ['BatchSumCalculator', 'SumRequest']
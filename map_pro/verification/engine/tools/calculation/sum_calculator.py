@@ -273,15 +273,6 @@ class SumCalculator:
         passed = tolerance_result.values_equal
         difference = tolerance_result.difference
 
-        # Build message
-        if passed:
-            message = f"expected {expected_sum:,.0f}, found {actual_value:,.0f} OK"
-        else:
-            message = f"expected {expected_sum:,.0f}, found {actual_value:,.0f}, diff {difference:,.0f}"
-
-        if corrections > 0:
-            message += f" ({corrections} sign corrections)"
-
         return SumResult(
             expected_sum=expected_sum,
             actual_value=actual_value,
@@ -290,9 +281,28 @@ class SumCalculator:
             min_decimals=min_decimals,
             children_contributions=contributions,
             sign_corrections_applied=corrections,
-            message=message,
+            message=self._build_message(expected_sum, actual_value, difference, passed, corrections),
         )
 
+    @staticmethod
+    def _build_message(
+        expected_sum: float,
+        actual_value: float,
+        difference: float,
+        passed: bool,
+        corrections: int
+    ) -> str:
+        """Build the human-readable comparison message."""
+        if passed:
+            message = f"expected {expected_sum:,.0f}, found {actual_value:,.0f} OK"
+        else:
+            message = f"expected {expected_sum:,.0f}, found {actual_value:,.0f}, diff {difference:,.0f}"
+
+        if corrections > 0:
+            message += f" ({corrections} sign corrections)"
+
+        return message
+
     def get_min_decimals(self, children: list[dict], parent_decimals: Optional[int]) -> Optional[int]:
         """
         Get minimum decimals from children and parent.
@@ -8,8 +8,9 @@ Modules:
 - classifier: Classify contexts as dimensional or default
 - matcher: Match contexts for compatibility (C-Equal, period, year)
 - grouper: Group facts by context_id for verification
+- fact_store: Index prepared facts by context, concept and period
 
-These tools are STATELESS (classifier, matcher) or STATEFUL containers (grouper)
+These tools are STATELESS (classifier, matcher) or STATEFUL containers (grouper, fact_store)
 that can be used across all processing stages.
 
 Usage:
@@ -36,6 +37,7 @@ Usage:
 from .classifier import ContextClassifier
 from .matcher import ContextMatcher
 from .grouper import ContextGroup, ContextGrouper
+from .fact_store import FactStore
 
 
 __all__ = [
@@ -43,4 +45,5 @@ __all__ = [
     'ContextMatcher',
     'ContextGroup',
     'ContextGrouper',
+    'FactStore',
 ]
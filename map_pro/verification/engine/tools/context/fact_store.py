@@ -0,0 +1,136 @@
+# Path: verification/engine/tools/context/fact_store.py
+"""
+Fact Store for XBRL Verification
+
+Indexed store of prepared facts, built once during preparation and read
+by verification.
+
+Indexes (all built in a single pass over the facts):
+- (context_id, concept) -> fact (first fact reported for the pair)
+- concept -> context_ids containing it
+- period_key -> context_ids for that period
+- context_id -> ContextGroup (c-equal group used by binding checks)
+
+Context lists keep first-seen (document) order, so consumers iterate
+contexts in the same order the facts were reported.
+
+DESIGN: Stateful container, like ContextGrouper (which it wraps for the
+c-equal groups). Facts are duck-typed: any object with concept, value,
+context_id, unit, decimals and original_concept attributes.
+"""
+
+import logging
+from typing import Any, Iterator, Optional
+
+from .grouper import ContextGroup, ContextGrouper
+
+
+class FactStore:
+    """
+    Prepared facts indexed by context, concept and period.
+
+    Usage:
+        store = FactStore()
+        for fact in prepared_facts:
+            store.add(fact, period_key=contexts[fact.context_id].period_key)
+
+        store.get('c-1', 'assets')               # -> fact or None
+        store.contexts_with_concept('assets')    # -> ['c-1', 'c-4']
+        store.contexts_for_period('i_2024-12-31')
+        store.get_group('c-1')                   # -> ContextGroup
+    """
+
+    def __init__(self):
+        self._grouper = ContextGrouper()
+        self._by_context: dict[str, dict[str, Any]] = {}
+        # dict keys as ordered sets
+        self._contexts_by_concept: dict[str, dict[str, None]] = {}
+        self._contexts_by_period: dict[str, dict[str, None]] = {}
+        self._period_keys: dict[str, str] = {}
+        self.fact_count = 0
+        self.logger = logging.getLogger('tools.context.fact_store')
+
+    def add(self, fact: Any, period_key: Optional[str] = None) -> None:
+        """
+        Index a prepared fact.
+
+        Args:
+            fact: Prepared fact (PreparedFact or compatible)
+            period_key: Normalized period of the fact's context
+                (defaults to the context_id)
+        """
+        context_id = fact.context_id
+        concept = fact.concept
+
+        self._grouper.add_fact(
+            concept=concept,
+            value=fact.value,
+            context_id=context_id,
+            unit=fact.unit,
+            decimals=fact.decimals,
+            original_concept=fact.original_concept,
+        )
+
+        context_facts = self._by_context.get(context_id)
+        if context_facts is None:
+            context_facts = self._by_context[context_id] = {}
+            period_key = period_key or context_id
+            self._period_keys[context_id] = period_key
+            self._contexts_by_period.setdefault(period_key, {})[context_id] = None
+
+        if concept not in context_facts:
+            context_facts[concept] = fact
+            self._contexts_by_concept.setdefault(concept, {})[context_id] = None
+
+        self.fact_count += 1
+
+    def get(self, context_id: str, concept: str) -> Optional[Any]:
+        """Get the fact for a concept in a context (first reported)."""
+        context_facts = self._by_context.get(context_id)
+        if context_facts is None:
+            return None
+        return context_facts.get(concept)
+
+    def get_context_facts(self, context_id: str) -> dict[str, Any]:
+        """Get concept -> fact for one context (copy)."""
+        return dict(self._by_context.get(context_id, {}))
+
+    def get_group(self, context_id: str) -> Optional[ContextGroup]:
+        """Get the c-equal ContextGroup for a context."""
+        return self._grouper.get_context(context_id)
+
+    def get_period_key(self, context_id: str) -> Optional[str]:
+        """Get the period key a context was indexed under."""
+        return self._period_keys.get(context_id)
+
+    def contexts_with_concept(self, concept: str) -> list[str]:
+        """Get context IDs that report a concept."""
+        return list(self._contexts_by_concept.get(concept, ()))
+
+    def contexts_for_period(self, period_key: str) -> list[str]:
+        """Get context IDs for a period key."""
+        return list(self._contexts_by_period.get(period_key, ()))
+
+    def get_context_ids(self) -> list[str]:
+        """Get all context IDs (first-seen order)."""
+        return list(self._by_context)
+
+    def iter_groups(self) -> Iterator[ContextGroup]:
+        """Iterate over c-equal context groups."""
+        return self._grouper.iter_groups()
+
+    @property
+    def concept_count(self) -> int:
+        """Number of distinct concepts."""
+        return len(self._contexts_by_concept)
+
+    @property
+    def context_count(self) -> int:
+        """Number of contexts with facts."""
+        return len(self._by_context)
+
+    def __len__(self) -> int:
+        return self.fact_count
+
+
+__all__ = ['FactStore']
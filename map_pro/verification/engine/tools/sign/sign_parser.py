@@ -7,6 +7,11 @@ Parses sign="-" attributes from iXBRL instance documents.
 In iXBRL, negative values are often displayed as positive text with a
 sign="-" attribute on the ix:nonFraction element. This parser extracts
 these attributes for use in sign correction during verification.
+
+The parser records the same attributes in its instance scan
+(parsed.instance.json, see loaders/instance_sidecar.py). When a scan of
+the instance document is available it is used instead of reading and
+pattern-matching the document again.
 """
 
 import logging
@@ -31,6 +36,9 @@ class SignParser:
         parser = SignParser()
         count = parser.parse_document('/path/to/instance.htm')
 
+        # Or from the parser's instance scan (no document read)
+        count = parser.parse_scan(load_instance_scan(parsed_json_path))
+
         # Get all parsed corrections
         corrections = parser.get_corrections()
 
@@ -49,7 +57,11 @@ class SignParser:
         """Initialize logger."""
         self.logger = logging.getLogger('tools.sign.sign_parser')
 
-    def parse_document(self, instance_file: str | Path) -> int:
+    def parse_document(
+        self,
+        instance_file: str | Path,
+        scan: Optional[dict] = None
+    ) -> int:
         """
         Parse XBRL instance document to extract sign attributes.
 
@@ -57,6 +69,9 @@ class SignParser:
 
         Args:
             instance_file: Path to XBRL instance document (.htm, .xml)
+            scan: Optional instance scan (load_instance_scan); used
+                instead of reading the document if it describes this
+                exact file (same name, size and modification time)
 
         Returns:
             Number of sign corrections found
@@ -69,6 +84,11 @@ class SignParser:
         if str(instance_path) in self.parsed_files:
             return len([k for k in self.corrections if k[0] == str(instance_path)])
 
+        if scan and self._scan_matches(scan, instance_path):
+            count = self.parse_scan(scan)
+            self.parsed_files.add(str(instance_path))
+            return count
+
         try:
             with open(instance_path, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -95,6 +115,58 @@ class SignParser:
             self.logger.error(f"Error parsing {instance_path}: {e}")
             return 0
 
+    def parse_scan(self, scan: dict) -> int:
+        """
+        Extract sign attributes from the parser's instance scan.
+
+        Args:
+            scan: Instance scan dictionary (load_instance_scan)
+
+        Returns:
+            Number of sign corrections found
+        """
+        if not scan:
+            return 0
+
+        instance_file = scan.get('instance_file') or {}
+        file_name = instance_file.get('name', 'instance scan')
+        count = 0
+
+        for entry in scan.get('numeric_facts', []):
+            sign_attr = entry.get('sign')
+            concept = entry.get('concept')
+            context_id = entry.get('context_ref')
+            if sign_attr not in ('+', '-') or not concept or not context_id:
+                continue
+
+            # sign="-" means the value should be negated
+            sign_multiplier = -1 if sign_attr == '-' else 1
+
+            key = (concept, context_id)
+            if key not in self.corrections:
+                self.corrections[key] = SignInfo(
+                    concept=concept,
+                    context_id=context_id,
+                    sign_multiplier=sign_multiplier,
+                    source=SignSource.XBRL_ATTRIBUTE,
+                    notes=f"sign='{sign_attr}' in {file_name}"
+                )
+                count += 1
+
+        self.logger.info(f"Read instance scan of {file_name}: found {count} sign corrections")
+        return count
+
+    @staticmethod
+    def _scan_matches(scan: dict, instance_path: Path) -> bool:
+        """True if the scan was taken from this version of the document."""
+        instance_file = scan.get('instance_file') or {}
+        stat = instance_path.stat()
+        return (
+            instance_file.get('name') == instance_path.name
+            and instance_file.get('size') == stat.st_size
+            and instance_file.get('mtime_ns') == stat.st_mtime_ns
+        )
+
     def _parse_ixbrl(self, content: str, source_file: Path) -> int:
         """
         Parse inline XBRL (iXBRL) document for sign attributes.
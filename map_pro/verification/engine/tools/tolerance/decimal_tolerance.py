@@ -197,6 +197,21 @@ class DecimalTolerance:
         # e.g., -6 (millions) is less precise than -3 (thousands)
         return min(d1, d2)
 
+    def get_epsilon(self, comparison_decimals: Optional[int]) -> float:
+        """
+        Get the largest difference still treated as equal.
+
+        Args:
+            comparison_decimals: Decimals used for comparison (normalized)
+
+        Returns:
+            Epsilon for floating point comparison of rounded values
+        """
+        if comparison_decimals is None:
+            return DECIMAL_COMPARISON_EPSILON_BASE
+        return (10 ** (-comparison_decimals if comparison_decimals >= 0 else 0)
+                * DECIMAL_EPSILON_MULTIPLIER)
+
     def compare(
         self,
         value1: float,
@@ -228,11 +243,7 @@ class DecimalTolerance:
 
         # Values are equal if rounded values match
         # Use small epsilon for floating point comparison
-        if comparison_decimals is None:
-            epsilon = DECIMAL_COMPARISON_EPSILON_BASE
-        else:
-            epsilon = (10 ** (-comparison_decimals if comparison_decimals >= 0 else 0)
-                       * DECIMAL_EPSILON_MULTIPLIER)
+        epsilon = self.get_epsilon(comparison_decimals)
 
         values_equal = difference <= epsilon
 
@@ -15,6 +15,7 @@ Architecture:
   - MappedReader: Read mapped statement JSON files
   - XBRLReader: Read calculation/presentation linkbases
   - TaxonomyReader: Read taxonomy definitions
+  - load_instance_scan: Read the parser's instance scan sidecar
 """
 
 # Blind Doorkeepers (path discovery only)
@@ -38,6 +39,8 @@ from .taxonomy_calc_reader import (
     TaxonomyCalculations,
     CalculationRelationship,
 )
+from .taxonomy_calc_cache import TaxonomyCalcCache
+from .instance_sidecar import load_instance_scan
 
 
 __all__ = [
@@ -65,4 +68,6 @@ __all__ = [
     'TaxonomyCalcReader',
     'TaxonomyCalculations',
     'CalculationRelationship',
+    'TaxonomyCalcCache',
+    'load_instance_scan',
 ]
@@ -42,6 +42,11 @@ MAPPED_OUTPUT_SUBDIRS = ['json', 'csv', 'excel']
 # Main parsed output file
 PARSED_JSON_FILE = 'parsed.json'
 
+# Instance scan written by the parser (parsed.instance.json): contexts,
+# ix:nonFraction attributes (sign, scale, format) and instance identity
+INSTANCE_SIDECAR_SUFFIX = '.instance.json'
+INSTANCE_SIDECAR_VERSION = 1
+
 # ==============================================================================
 # XBRL FILING DETECTION
 # ==============================================================================
@@ -83,6 +88,16 @@ SCHEMA_FILE_PATTERNS = ['.xsd']
 # Instance document patterns
 INSTANCE_FILE_PATTERNS = ['.xml', '.xbrl', '.xhtml', '.htm', '.html']
 
+# ==============================================================================
+# TAXONOMY CALCULATION CACHE
+# ==============================================================================
+
+# Compiled taxonomy calculations file: {taxonomy_id}.calc.pickle
+TAXONOMY_CALC_CACHE_SUFFIX = '.calc.pickle'
+
+# Bump when CalculationRelationship/TaxonomyCalculations change shape
+TAXONOMY_CALC_CACHE_VERSION = 1
+
 # ==============================================================================
 # XBRL SPECIFICATION CONSTANTS
 # ==============================================================================
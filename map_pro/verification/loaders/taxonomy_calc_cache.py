@@ -0,0 +1,187 @@
+# Path: verification/loaders/taxonomy_calc_cache.py
+"""
+Taxonomy Calculation Cache
+
+Persistent store for compiled taxonomy calculations.
+
+Standard taxonomies (us-gaap-2024, ifrs-2024, ...) ship hundreds of
+calculation linkbase files that never change once installed. Parsing them
+is the slowest part of starting a verification run, so the parsed result
+(relationships plus by_parent/by_child/by_role indexes) is written once
+per taxonomy and loaded directly by later runs.
+
+RESPONSIBILITY: Save/load compiled TaxonomyCalculations. Does not parse
+linkbases (TaxonomyCalcReader does).
+
+INVALIDATION: Each entry records a fingerprint of the linkbase files it
+was built from (relative path, size, modification time). Any added,
+removed or modified linkbase makes the entry stale and it is rebuilt.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+from .constants import TAXONOMY_CALC_CACHE_SUFFIX, TAXONOMY_CALC_CACHE_VERSION
+
+if TYPE_CHECKING:
+    from .taxonomy_calc_reader import TaxonomyCalculations
+
+
+# (relative path, size in bytes, mtime in ns) per linkbase file
+Fingerprint = tuple[tuple[str, int, int], ...]
+
+
+class TaxonomyCalcCache:
+    """
+    On-disk cache of compiled taxonomy calculations.
+
+    One file per taxonomy ID in cache_dir. Files are written atomically,
+    so concurrent verification runs never read a partial entry.
+
+    Example:
+        cache = TaxonomyCalcCache(cache_dir)
+        fingerprint = cache.fingerprint(taxonomy_dir, calc_files)
+
+        calculations = cache.load('us-gaap-2024', fingerprint)
+        if calculations is None:
+            calculations = parse_linkbases(calc_files)
+            cache.save(calculations, fingerprint)
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize taxonomy calculation cache.
+
+        Args:
+            cache_dir: Directory for compiled calculation files
+        """
+        self.logger = logging.getLogger('input.taxonomy_calc_cache')
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def fingerprint(taxonomy_dir: Path, calc_files: list[Path]) -> Fingerprint:
+        """
+        Build the invalidation fingerprint for a set of linkbase files.
+
+        Args:
+            taxonomy_dir: Taxonomy root directory
+            calc_files: Calculation linkbase files found in it
+
+        Returns:
+            Sorted tuple of (relative path, size, mtime_ns)
+        """
+        entries = []
+        for calc_file in calc_files:
+            stat = calc_file.stat()
+            entries.append((
+                calc_file.relative_to(taxonomy_dir).as_posix(),
+                stat.st_size,
+                stat.st_mtime_ns,
+            ))
+        return tuple(sorted(entries))
+
+    def _path(self, taxonomy_id: str) -> Path:
+        """Get cache file path for a taxonomy."""
+        return self.cache_dir / f"{taxonomy_id}{TAXONOMY_CALC_CACHE_SUFFIX}"
+
+    def load(
+        self,
+        taxonomy_id: str,
+        fingerprint: Fingerprint
+    ) -> Optional['TaxonomyCalculations']:
+        """
+        Load compiled calculations if the entry is still valid.
+
+        Args:
+            taxonomy_id: Taxonomy identifier
+            fingerprint: Current fingerprint of the taxonomy's linkbases
+
+        Returns:
+            TaxonomyCalculations with indexes built, or None if missing/stale
+        """
+        path = self._path(taxonomy_id)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Unreadable calculation cache {path.name}: {e}")
+            return None
+
+        if not isinstance(entry, dict) or entry.get('version') != TAXONOMY_CALC_CACHE_VERSION:
+            self.logger.info(f"Calculation cache format changed for {taxonomy_id}, rebuilding")
+            return None
+
+        if entry.get('fingerprint') != fingerprint:
+            self.logger.info(f"Calculation linkbases changed for {taxonomy_id}, rebuilding")
+            return None
+
+        return entry.get('calculations')
+
+    def save(self, calculations: 'TaxonomyCalculations', fingerprint: Fingerprint) -> bool:
+        """
+        Write compiled calculations (atomically).
+
+        Args:
+            calculations: Calculations with indexes built
+            fingerprint: Fingerprint of the linkbases they were parsed from
+
+        Returns:
+            True if written
+        """
+        path = self._path(calculations.taxonomy_id)
+        entry = {
+            'version': TAXONOMY_CALC_CACHE_VERSION,
+            'fingerprint': fingerprint,
+            'calculations': calculations,
+        }
+
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self.logger.info(f"Saved compiled calculations: {path.name}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not write calculation cache {path.name}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return False
+
+    def invalidate(self, taxonomy_id: Optional[str] = None) -> int:
+        """
+        Delete cache entries.
+
+        Args:
+            taxonomy_id: Taxonomy to drop (None = all)
+
+        Returns:
+            Number of files removed
+        """
+        if taxonomy_id:
+            paths = [self._path(taxonomy_id)]
+        elif self.cache_dir.exists():
+            paths = list(self.cache_dir.glob(f"*{TAXONOMY_CALC_CACHE_SUFFIX}"))
+        else:
+            paths = []
+
+        removed = 0
+        for path in paths:
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+
+__all__ = ['TaxonomyCalcCache']
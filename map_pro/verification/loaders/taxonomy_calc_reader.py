@@ -14,6 +14,10 @@ IMPORTANT: This is separate from company XBRL calculation linkbase.
 - Taxonomy calculation: How the standard defines calculations
 
 Both sources should be used for verification and comparison.
+
+CACHING: Parsed calculations are kept in memory per reader and, when
+VERIFICATION_TAXONOMY_CACHE_DIR is configured, compiled to disk per
+taxonomy (see TaxonomyCalcCache) so later runs skip linkbase parsing.
 """
 
 import logging
@@ -23,6 +27,7 @@ from pathlib import Path
 from typing import Optional
 
 from .taxonomy import TaxonomyLoader
+from .taxonomy_calc_cache import TaxonomyCalcCache
 from .constants import (
     XLINK_NAMESPACE,
     XBRL_LINKBASE_NAMESPACE,
@@ -152,17 +157,24 @@ class TaxonomyCalcReader:
         bs_rels = calculations.by_role.get('http://fasb.org/role/statement/StatementOfFinancialPositionClassified')
     """
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, cache_dir: Optional[Path] = None):
         """
         Initialize taxonomy calculation reader.
 
         Args:
             config: Optional ConfigLoader for path resolution
+            cache_dir: Optional directory for compiled calculations
+                (defaults to config 'taxonomy_cache_dir'; None disables
+                the on-disk cache)
         """
         self.logger = logging.getLogger('input.taxonomy_calc_reader')
         self._taxonomy_loader = TaxonomyLoader(config) if config else None
         self._cache: dict[str, TaxonomyCalculations] = {}
 
+        if cache_dir is None and config:
+            cache_dir = config.get('taxonomy_cache_dir')
+        self._disk_cache = TaxonomyCalcCache(cache_dir) if cache_dir else None
+
     def read_taxonomy_calculations(self, taxonomy_id: str) -> Optional[TaxonomyCalculations]:
         """
         Read all calculation relationships from a taxonomy.
@@ -189,6 +201,8 @@ class TaxonomyCalcReader:
                 from ..core.config_loader import ConfigLoader
                 config = ConfigLoader()
                 taxonomy_path = config.get('taxonomy_path')
+                if self._disk_cache is None and config.get('taxonomy_cache_dir'):
+                    self._disk_cache = TaxonomyCalcCache(config.get('taxonomy_cache_dir'))
                 if taxonomy_path:
                     taxonomy_dir = taxonomy_path / taxonomy_id
                 else:
@@ -208,6 +222,19 @@ class TaxonomyCalcReader:
 
             self.logger.info(f"Found {len(calc_files)} calculation linkbase files")
 
+            # Compiled copy from an earlier run (indexes already built)
+            fingerprint = None
+            if self._disk_cache:
+                fingerprint = self._disk_cache.fingerprint(taxonomy_dir, calc_files)
+                calculations = self._disk_cache.load(taxonomy_id, fingerprint)
+                if calculations is not None:
+                    self.logger.info(
+                        f"Loaded compiled calculations for {taxonomy_id}: "
+                        f"{len(calculations.relationships)} relationships"
+                    )
+                    self._cache[taxonomy_id] = calculations
+                    return calculations
+
             # Parse all calculation linkbases
             calculations = TaxonomyCalculations(taxonomy_id=taxonomy_id)
 
@@ -223,6 +250,9 @@ class TaxonomyCalcReader:
                 f"from {taxonomy_id} ({len(calculations.by_parent)} parent concepts)"
             )
 
+            if self._disk_cache:
+                self._disk_cache.save(calculations, fingerprint)
+
             # Cache the result
             self._cache[taxonomy_id] = calculations
 
@@ -431,9 +461,16 @@ class TaxonomyCalcReader:
 
         return tree
 
-    def clear_cache(self) -> None:
-        """Clear the taxonomy calculations cache."""
+    def clear_cache(self, persistent: bool = False) -> None:
+        """
+        Clear the taxonomy calculations cache.
+
+        Args:
+            persistent: Also delete compiled calculations on disk
+        """
         self._cache.clear()
+        if persistent and self._disk_cache:
+            self._disk_cache.invalidate()
         self.logger.info("Taxonomy calculations cache cleared")
 
     def list_available_taxonomies(self) -> list[str]:
@@ -0,0 +1,114 @@
+# Path: verification/tests/benchmark_pipeline.py
+"""
+Pipeline Benchmark for Verification Module v2
+
+Times Stage 2 (preparation) and Stage 3 (verification) on real mapped
+filings. Discovery (file reading) is done once per filing and excluded,
+so the numbers reflect fact organisation and checking only.
+
+Filings come from the configured mapper output directory
+(VERIFICATION_MAPPER_OUTPUT_DIR) and calculations from the configured
+XBRL filings path (VERIFICATION_XBRL_FILINGS_PATH).
+
+Usage:
+    python -m verification.tests.benchmark_pipeline
+
+    # More repetitions, only one company
+    python -m verification.tests.benchmark_pipeline --repeat 10 --company PLUG
+"""
+
+import sys
+import time
+import logging
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from verification.core.config_loader import ConfigLoader
+from verification.loaders.mapped_data import MappedDataLoader
+from verification.engine.processors import PipelineOrchestrator
+
+
+def benchmark_filing(orchestrator: PipelineOrchestrator, filing, repeat: int) -> dict:
+    """
+    Time preparation and verification for one filing.
+
+    Args:
+        orchestrator: Pipeline orchestrator
+        filing: MappedFilingEntry
+        repeat: Number of timed runs (best time is reported)
+
+    Returns:
+        Dictionary with counts and best times in seconds
+    """
+    discovery = orchestrator.run_discovery(filing)
+
+    best_preparation = best_verification = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        preparation = orchestrator.run_preparation(discovery)
+        best_preparation = min(best_preparation, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        verification = orchestrator.run_verification(preparation)
+        best_verification = min(best_verification, time.perf_counter() - start)
+
+    return {
+        'facts': len(discovery.facts),
+        'calculations': len(discovery.calculations),
+        'contexts': len(preparation.fact_groups),
+        'checks': len(verification.checks),
+        'preparation': best_preparation,
+        'verification': best_verification,
+    }
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark verification pipeline stages')
+    parser.add_argument(
+        '--repeat', '-n',
+        type=int,
+        default=5,
+        help='Timed runs per filing (best is reported)',
+    )
+    parser.add_argument(
+        '--company',
+        help='Only filings whose company name contains this text',
+    )
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.disable(logging.INFO)
+
+    config = ConfigLoader()
+    filings = MappedDataLoader(config).discover_all_mapped_filings()
+    if args.company:
+        filings = [f for f in filings if args.company.lower() in f.company.lower()]
+
+    if not filings:
+        print(f"No mapped filings found in {config.get('mapper_output_dir')}")
+        sys.exit(1)
+
+    sep = '=' * 78
+    print(sep)
+    print(f"  {'Filing':<32}{'Facts':>7}{'Calcs':>7}{'Checks':>8}{'Stage 2':>12}{'Stage 3':>12}")
+    print(sep)
+
+    for filing in filings:
+        stats = benchmark_filing(PipelineOrchestrator(config), filing, max(1, args.repeat))
+        name = f"{filing.company}/{filing.form}"[:31]
+        print(
+            f"  {name:<32}{stats['facts']:>7}{stats['calculations']:>7}{stats['checks']:>8}"
+            f"{stats['preparation'] * 1000:>10.1f}ms{stats['verification'] * 1000:>10.1f}ms"
+        )
+
+    print(sep)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,11 +9,20 @@ Validates mapped financial statements for quality assessment.
 Usage:
     python verify.py
 
+    # Non-interactive: verify every mapped filing in parallel
+    python verify.py --batch
+    python verify.py --batch --workers 8 --company PLUG
+    python verify.py --batch --fresh       # ignore earlier batch progress
+
 The CLI will:
 1. Show available companies with mapped statements
 2. Allow selection of filing to verify
 3. Run verification checks using 3-stage pipeline
 4. Display results and save reports
+
+Batch mode verifies all filings found by MappedDataLoader in worker
+processes, writing reports and batch progress/summary files as filings
+finish. An interrupted batch resumes where it stopped.
 """
 
 import sys
@@ -28,6 +37,7 @@ from verification.core.config_loader import ConfigLoader
 from verification.core.data_paths import ensure_data_paths
 from verification.core.logger.ipo_logging import setup_ipo_logging
 from verification.engine import PipelineOrchestrator, VerificationResult
+from verification.engine.processors import BatchVerifier, write_report
 
 # Use existing loaders from verification module
 from verification.loaders.mapped_data import MappedDataLoader, MappedFilingEntry
@@ -46,9 +56,16 @@ class VerificationCLI:
     Uses the new 3-stage pipeline architecture.
     """
 
-    def __init__(self):
-        """Initialize CLI components."""
+    def __init__(self, workers: int = None):
+        """
+        Initialize CLI components.
+
+        Args:
+            workers: Worker processes for batch verification
+                (default: VERIFICATION_MAX_CONCURRENT_JOBS)
+        """
         self.config = ConfigLoader()
+        self.workers = workers
 
         # Setup IPO logging
         self._setup_logging()
@@ -106,6 +123,30 @@ class VerificationCLI:
                 print("\nExiting verification module.")
                 break
 
+    def run_batch(self, resume: bool = True, company: str = None) -> None:
+        """
+        Verify all mapped filings without interaction.
+
+        Args:
+            resume: Continue an interrupted batch run with the same settings
+            company: Only filings whose company name contains this text
+        """
+        self._print_header()
+
+        # Ensure directories exist
+        ensure_data_paths()
+
+        filings = self.mapped_loader.discover_all_mapped_filings()
+        if company:
+            filings = [f for f in filings if company.lower() in f.company.lower()]
+
+        if not filings:
+            print("\nNo mapped statements found.")
+            print("Please run the mapper module first to create mapped statements.")
+            return
+
+        self._verify_all(filings, resume=resume)
+
     def _print_header(self) -> None:
         """Print CLI header."""
         sep = '=' * 60
@@ -185,32 +226,35 @@ class VerificationCLI:
         # Save outputs
         self._save_outputs(filing, result)
 
-    def _verify_all(self, filings: list[MappedFilingEntry]) -> None:
+    def _verify_all(self, filings: list[MappedFilingEntry], resume: bool = False) -> None:
         """
-        Verify all filings.
+        Verify all filings in parallel worker processes.
 
         Args:
             filings: List of filings to verify
+            resume: Skip filings completed by an earlier batch run
         """
         print(f'\nVerifying {len(filings)} filings...\n')
 
-        results = []
-        for i, filing in enumerate(filings, 1):
-            print(f'[{i}/{len(filings)}] {filing.company} | {filing.form}...')
-
-            # Run verification - pass MappedFilingEntry directly
-            result = self.orchestrator.run(filing)
-            results.append((filing, result))
+        verifier = BatchVerifier(self.config, workers=self.workers)
+        summary = verifier.run(filings, resume=resume, on_progress=self._print_batch_progress)
 
-            # Save outputs
-            self._save_outputs(filing, result, quiet=True)
-
-            print(f'        Score: {result.summary.score:.1f}/100 '
-                  f'({result.summary.critical_issues} critical, '
-                  f'{result.summary.warning_issues} warnings)')
+        if summary['resumed']:
+            print(f"\n{summary['resumed']} filings already verified by an earlier run")
 
         # Show summary
-        self._display_batch_summary(results)
+        self._display_batch_summary(summary)
+        print(f'\n[OUTPUT] Batch summary saved: {verifier.summary_path}')
+
+    def _print_batch_progress(self, done: int, total: int, record: dict) -> None:
+        """Print one line per finished filing."""
+        print(f"[{done}/{total}] {record['company']} | {record['form']}...")
+        if record.get('error'):
+            print(f"        FAILED: {record['error']}")
+        else:
+            print(f"        Score: {record['score']:.1f}/100 "
+                  f"({record['critical_issues']} critical, "
+                  f"{record['warning_issues']} warnings)")
 
     def _display_results(self, result: VerificationResult, filing: MappedFilingEntry) -> None:
         """Display verification results."""
@@ -277,7 +321,7 @@ class VerificationCLI:
         print(f'               {desc}')
         print(sep)
 
-    def _display_batch_summary(self, results: list[tuple]) -> None:
+    def _display_batch_summary(self, summary: dict) -> None:
         """Display summary of batch verification."""
         sep = '=' * 60
 
@@ -285,26 +329,19 @@ class VerificationCLI:
         print('BATCH VERIFICATION SUMMARY')
         print(sep)
 
-        print(f'Total filings verified: {len(results)}')
+        print(f"Total filings verified: {summary['completed']}")
+        if summary['failed']:
+            print(f"Failed:                 {summary['failed']}")
         print()
 
-        # Count by score range
-        excellent = sum(1 for _, r in results if r.summary.score >= 90)
-        good = sum(1 for _, r in results if 75 <= r.summary.score < 90)
-        fair = sum(1 for _, r in results if 50 <= r.summary.score < 75)
-        poor = sum(1 for _, r in results if r.summary.score < 50)
-
         print('By Quality Level:')
-        print(f'  EXCELLENT (90+): {excellent}')
-        print(f'  GOOD (75-89):    {good}')
-        print(f'  FAIR (50-74):    {fair}')
-        print(f'  POOR (<50):      {poor}')
+        for level, count in summary['quality_levels'].items():
+            print(f'  {level:<10} {count}')
         print()
 
         # Average score
-        if results:
-            avg_score = sum(r.summary.score for _, r in results) / len(results)
-            print(f'Average Score: {avg_score:.1f}/100')
+        if summary['average_score'] is not None:
+            print(f"Average Score: {summary['average_score']:.1f}/100")
 
         print(sep)
 
@@ -322,8 +359,6 @@ class VerificationCLI:
             result: Verification result
             quiet: If True, don't print output paths
         """
-        import json
-
         filing_id = f"{filing.market}/{filing.company}/{filing.form}/{filing.date}"
 
         # Get output directory
@@ -334,65 +369,7 @@ class VerificationCLI:
                 print('[WARN] No output directory configured')
             return
 
-        # Create output path
-        report_dir = (
-            Path(output_dir) /
-            filing.market /
-            filing.company /
-            filing.form /
-            filing.date
-        )
-        report_dir.mkdir(parents=True, exist_ok=True)
-        logger_output.info(f"Created report directory: {report_dir}")
-
-        # Save verification report
-        report_path = report_dir / 'verification_report.json'
-        report_data = {
-            'filing_id': filing_id,
-            'market': filing.market,
-            'company': filing.company,
-            'form': filing.form,
-            'date': filing.date,
-            'verified_at': result.verification_timestamp,
-            'processing_time_ms': result.processing_time_ms,
-            'summary': {
-                'score': result.summary.score,
-                'total_checks': result.summary.total_checks,
-                'passed': result.summary.passed,
-                'failed': result.summary.failed,
-                'skipped': result.summary.skipped,
-                'critical_issues': result.summary.critical_issues,
-                'warning_issues': result.summary.warning_issues,
-                'info_issues': result.summary.info_issues,
-            },
-            'checks': [
-                {
-                    'check_name': c.check_name,
-                    'check_type': c.check_type,
-                    'passed': c.passed,
-                    'severity': c.severity,
-                    'message': c.message,
-                    'expected_value': c.expected_value,
-                    'actual_value': c.actual_value,
-                    'difference': c.difference,
-                    'concept': c.concept,
-                    'context_id': c.context_id,
-                    'details': c.details,
-                }
-                for c in result.checks
-            ]
-        }
-
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, default=str)
-
-        # Log output activity
-        logger_output.info(f"Verification complete for {filing_id}")
-        logger_output.info(f"Score: {result.summary.score:.1f}/100, "
-                          f"Checks: {result.summary.total_checks} total, "
-                          f"{result.summary.passed} passed, "
-                          f"{result.summary.failed} failed")
-        logger_output.info(f"Report saved: {report_path}")
+        report_path = write_report(filing, result, output_dir)
 
         if not quiet:
             print(f'\n[OUTPUT] Report saved: {report_path}')
@@ -414,9 +391,37 @@ class VerificationCLI:
 
 def main():
     """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Verify mapped financial statements')
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Verify all mapped filings without interaction',
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        help='Worker processes for batch verification',
+    )
+    parser.add_argument(
+        '--company',
+        help='Batch: only filings whose company name contains this text',
+    )
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help='Batch: re-verify everything instead of resuming',
+    )
+
+    args = parser.parse_args()
+
     try:
-        cli = VerificationCLI()
-        cli.run()
+        cli = VerificationCLI(workers=args.workers)
+        if args.batch:
+            cli.run_batch(resume=not args.fresh, company=args.company)
+        else:
+            cli.run()
     except KeyboardInterrupt:
         print('\n\nVerification cancelled.')
         sys.exit(0)
@@ -33,6 +33,7 @@ from typing import Optional
 
 from database.models.base import (
     initialize_engine,
+    get_engine,
     create_all_tables,
     session_scope,
     get_connection_info,
@@ -74,7 +75,12 @@ class HierarchyStorage:
         )
     """
 
-    def __init__(self, db_url: Optional[str] = None, use_sqlite: bool = False):
+    def __init__(
+        self,
+        db_url: Optional[str] = None,
+        use_sqlite: bool = False,
+        bulk_load: bool = False,
+    ):
         """
         Initialize hierarchy storage.
 
@@ -82,9 +88,12 @@ class HierarchyStorage:
             db_url: Optional database URL. If None, uses PostgreSQL from config.
                     Pass ':memory:' for SQLite in-memory (testing).
             use_sqlite: If True, forces SQLite in-memory mode (for testing).
+            bulk_load: If True, nodes are bulk-inserted (COPY/executemany)
+                       instead of added one ORM object at a time.
         """
         self._db_url = db_url
         self._use_sqlite = use_sqlite
+        self._bulk_load = bulk_load
         self._builder = HierarchyBuilder()
         self._initialized = False
 
@@ -105,6 +114,20 @@ class HierarchyStorage:
         info = get_connection_info()
         logger.info(f"HierarchyStorage initialized: {info.get('type', 'unknown')}")
 
+    def deferred_indexes(self):
+        """
+        Context manager deferring hierarchy node indexes during a backfill.
+
+        Indexes are dropped on entry and rebuilt once on exit.
+
+        Example:
+            with storage.deferred_indexes():
+                for filing in filings:
+                    storage.process_filing_folder(...)
+        """
+        self.initialize()
+        return HierarchyOperations.deferred_node_indexes(get_engine())
+
     def process_filing_folder(
         self,
         folder_path: Path,
@@ -219,6 +242,7 @@ class HierarchyStorage:
                     filing_id=filing.filing_id,
                     hierarchies=hierarchies,
                     fact_merger=fact_merger,
+                    bulk=self._bulk_load,
                 )
 
                 # Update result
@@ -307,6 +331,7 @@ class HierarchyStorage:
                     session,
                     filing_id=filing.filing_id,
                     hierarchies=hierarchies,
+                    bulk=self._bulk_load,
                 )
 
                 result['statement_count'] = len(stored_hierarchies)
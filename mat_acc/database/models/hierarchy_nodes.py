@@ -233,6 +233,30 @@ class HierarchyNode(Base):
         Returns:
             HierarchyNode database model instance
         """
+        return cls(**cls.values_from_hierarchy_node(
+            hierarchy_id, node, parent_mat_acc_id
+        ))
+
+    @staticmethod
+    def values_from_hierarchy_node(
+        hierarchy_id: str,
+        node: 'process.hierarchy.HierarchyNode',
+        parent_mat_acc_id: Optional[str] = None
+    ) -> dict:
+        """
+        Column values for a process.hierarchy.HierarchyNode.
+
+        Used by from_hierarchy_node() and by bulk loading, which inserts
+        rows without creating model instances.
+
+        Args:
+            hierarchy_id: ID of parent StatementHierarchy
+            node: HierarchyNode from process.hierarchy module
+            parent_mat_acc_id: mat_acc_id of parent (for non-root nodes)
+
+        Returns:
+            Dictionary of column name to value
+        """
         mat_acc_id = node.metadata.get('mat_acc_id', '')
         mat_acc_position = node.metadata.get('mat_acc_position', '')
 
@@ -242,23 +266,23 @@ class HierarchyNode(Base):
         level = int(parts[1]) if len(parts) >= 2 else node.depth
         sibling = int(parts[2]) if len(parts) >= 3 else 1
 
-        return cls(
-            hierarchy_id=hierarchy_id,
-            mat_acc_id=mat_acc_id,
-            mat_acc_position=mat_acc_position,
-            level=level,
-            sibling=sibling,
-            parent_mat_acc_id=parent_mat_acc_id,
-            concept=node.concept,
-            label=node.label,
-            node_type=node.node_type.value,
-            has_value=node.has_value,
-            value=float(node.value) if node.value is not None else None,
-            unit=node.unit,
-            decimals=node.decimals,
-            context_ref=node.metadata.get('context_ref'),
-            order=node.order,
-        )
+        return {
+            'hierarchy_id': hierarchy_id,
+            'mat_acc_id': mat_acc_id,
+            'mat_acc_position': mat_acc_position,
+            'level': level,
+            'sibling': sibling,
+            'parent_mat_acc_id': parent_mat_acc_id,
+            'concept': node.concept,
+            'label': node.label,
+            'node_type': node.node_type.value,
+            'has_value': node.has_value,
+            'value': float(node.value) if node.value is not None else None,
+            'unit': node.unit,
+            'decimals': node.decimals,
+            'context_ref': node.metadata.get('context_ref'),
+            'order': node.order,
+        }
 
     def __repr__(self) -> str:
         return (
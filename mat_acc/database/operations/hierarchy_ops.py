@@ -7,11 +7,23 @@ Provides methods for storing, querying, and managing hierarchies.
 
 Supports fact merging: when a FactMerger is provided, nodes are expanded
 into fact instances with context_ref, enabling unique mat_acc_id per fact.
+
+Bulk loading: with bulk=True, a hierarchy's nodes are flattened into row
+tuples and inserted in one statement (PostgreSQL COPY with psycopg2,
+executemany otherwise) instead of one ORM object per node. Rows go
+through the session's connection, so they commit or roll back with the
+rest of the filing. For large backfills, deferred_node_indexes() drops
+the hierarchy_nodes indexes and rebuilds them once at the end.
 """
 
+import io
 import logging
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterator, Tuple, TYPE_CHECKING
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from database.models.statement_hierarchies import StatementHierarchy
@@ -25,6 +37,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Columns written by bulk loading, in row tuple order
+BULK_NODE_COLUMNS = (
+    'node_id', 'hierarchy_id', 'mat_acc_id', 'mat_acc_position', 'level',
+    'sibling', 'parent_mat_acc_id', 'concept', 'label', 'node_type',
+    'has_value', 'value', 'unit', 'decimals', 'context_ref', 'order',
+    'created_at',
+)
+
+
 class HierarchyOperations:
     """
     Operations for StatementHierarchy and HierarchyNode records.
@@ -48,6 +69,14 @@ class HierarchyOperations:
                     name=name,
                     root=root
                 )
+
+    For large backfills:
+        with HierarchyOperations.deferred_node_indexes(get_engine()):
+            for filing in filings:
+                with session_scope() as session:
+                    HierarchyOperations.store_all_hierarchies(
+                        session, filing_id, hierarchies, bulk=True
+                    )
     """
 
     @staticmethod
@@ -56,7 +85,8 @@ class HierarchyOperations:
         filing_id: str,
         name: str,
         root: 'process.hierarchy.HierarchyNode',
-        fact_merger: Optional['FactMerger'] = None
+        fact_merger: Optional['FactMerger'] = None,
+        bulk: bool = False
     ) -> StatementHierarchy:
         """
         Store a hierarchy from HierarchyBuilder output.
@@ -71,6 +101,8 @@ class HierarchyOperations:
             name: Statement name
             root: Root HierarchyNode from process.hierarchy
             fact_merger: Optional FactMerger for expanding nodes with facts
+            bulk: Insert nodes as rows in one statement instead of
+                  ORM objects (nodes are not added to the session)
 
         Returns:
             Created StatementHierarchy instance
@@ -129,13 +161,20 @@ class HierarchyOperations:
         session.flush()  # Get the ID
 
         # Store all nodes (with fact expansion if merger provided)
-        actual_node_count = HierarchyOperations._store_nodes_recursive(
-            session,
-            hierarchy.hierarchy_id,
-            root,
-            parent_mat_acc_id=None,
-            fact_merger=fact_merger
-        )
+        if bulk:
+            rows = HierarchyOperations.flatten_nodes(
+                hierarchy.hierarchy_id, root, fact_merger=fact_merger
+            )
+            HierarchyOperations._bulk_insert_nodes(session, rows)
+            actual_node_count = len(rows)
+        else:
+            actual_node_count = HierarchyOperations._store_nodes_recursive(
+                session,
+                hierarchy.hierarchy_id,
+                root,
+                parent_mat_acc_id=None,
+                fact_merger=fact_merger
+            )
 
         # Update node count if fact expansion changed it
         if actual_node_count != node_count:
@@ -172,8 +211,6 @@ class HierarchyOperations:
         Returns:
             Number of nodes stored (including expanded fact instances)
         """
-        from process.hierarchy.mat_acc_id import normalize_context_ref
-
         nodes_stored = 0
         mat_acc_position = node.metadata.get('mat_acc_position', '')
 
@@ -187,28 +224,10 @@ class HierarchyOperations:
         if facts_to_store:
             # Store one node per fact (with context_ref)
             for fact in facts_to_store:
-                # Create mat_acc_id with context_ref
-                ctx = normalize_context_ref(fact.context_ref)
-                mat_acc_id_with_ctx = f"{mat_acc_position}-{ctx}"
-
                 # Create database node with fact data
-                db_node = DBHierarchyNode(
-                    hierarchy_id=hierarchy_id,
-                    mat_acc_id=mat_acc_id_with_ctx,
-                    mat_acc_position=mat_acc_position,
-                    level=node.depth,
-                    sibling=node.metadata.get('sibling', 1),
-                    parent_mat_acc_id=parent_mat_acc_id,
-                    concept=node.concept,
-                    label=node.label,
-                    node_type=node.node_type.value,
-                    has_value=fact.has_numeric_value,
-                    value=fact.numeric_value,
-                    unit=fact.unit,
-                    decimals=fact.decimals,
-                    context_ref=fact.context_ref,
-                    order=node.order,
-                )
+                db_node = DBHierarchyNode(**HierarchyOperations._fact_values(
+                    hierarchy_id, node, fact, parent_mat_acc_id
+                ))
                 session.add(db_node)
                 nodes_stored += 1
         else:
@@ -237,12 +256,208 @@ class HierarchyOperations:
 
         return nodes_stored
 
+    @staticmethod
+    def _fact_values(
+        hierarchy_id: str,
+        node: 'process.hierarchy.HierarchyNode',
+        fact: Any,
+        parent_mat_acc_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Column values for one fact instance of a concept node.
+
+        Args:
+            hierarchy_id: ID of parent StatementHierarchy
+            node: Concept node the fact belongs to
+            fact: Fact from FactMerger.get_facts_for_concept()
+            parent_mat_acc_id: mat_acc_position of the structural parent
+
+        Returns:
+            Dictionary of column name to value
+        """
+        from process.hierarchy.mat_acc_id import normalize_context_ref
+
+        mat_acc_position = node.metadata.get('mat_acc_position', '')
+
+        # Create mat_acc_id with context_ref
+        ctx = normalize_context_ref(fact.context_ref)
+
+        return {
+            'hierarchy_id': hierarchy_id,
+            'mat_acc_id': f"{mat_acc_position}-{ctx}",
+            'mat_acc_position': mat_acc_position,
+            'level': node.depth,
+            'sibling': node.metadata.get('sibling', 1),
+            'parent_mat_acc_id': parent_mat_acc_id,
+            'concept': node.concept,
+            'label': node.label,
+            'node_type': node.node_type.value,
+            'has_value': fact.has_numeric_value,
+            'value': fact.numeric_value,
+            'unit': fact.unit,
+            'decimals': fact.decimals,
+            'context_ref': fact.context_ref,
+            'order': node.order,
+        }
+
+    @staticmethod
+    def flatten_nodes(
+        hierarchy_id: str,
+        root: 'process.hierarchy.HierarchyNode',
+        fact_merger: Optional['FactMerger'] = None
+    ) -> List[Tuple]:
+        """
+        Flatten a hierarchy into node row tuples, without recursion.
+
+        Produces the same rows, in the same (pre-order) order, as
+        _store_nodes_recursive(): one row per fact when fact_merger has
+        facts for a concept, otherwise one structural row.
+
+        Args:
+            hierarchy_id: ID of parent StatementHierarchy
+            root: Root HierarchyNode from process.hierarchy
+            fact_merger: Optional FactMerger for fact expansion
+
+        Returns:
+            List of tuples in BULK_NODE_COLUMNS order
+        """
+        rows = []
+        created_at = datetime.utcnow()
+
+        # (node, parent mat_acc_position); children pushed in reverse
+        # so they pop in document order
+        stack = [(root, None)]
+        while stack:
+            node, parent_mat_acc_id = stack.pop()
+
+            facts = None
+            if fact_merger and node.concept:
+                facts = fact_merger.get_facts_for_concept(node.concept)
+
+            if facts:
+                values_list = [
+                    HierarchyOperations._fact_values(
+                        hierarchy_id, node, fact, parent_mat_acc_id
+                    )
+                    for fact in facts
+                ]
+            else:
+                values_list = [DBHierarchyNode.values_from_hierarchy_node(
+                    hierarchy_id, node, parent_mat_acc_id
+                )]
+
+            for values in values_list:
+                values['node_id'] = str(uuid.uuid4())
+                values['created_at'] = created_at
+                rows.append(tuple(values[column] for column in BULK_NODE_COLUMNS))
+
+            mat_acc_position = node.metadata.get('mat_acc_position', '')
+            for child in reversed(node.children):
+                stack.append((child, mat_acc_position))
+
+        return rows
+
+    @staticmethod
+    def _bulk_insert_nodes(session: Session, rows: List[Tuple]) -> None:
+        """
+        Insert node rows on the session's connection (same transaction).
+
+        Uses COPY on PostgreSQL with psycopg2, executemany otherwise.
+
+        Args:
+            session: Database session
+            rows: Tuples in BULK_NODE_COLUMNS order
+        """
+        if not rows:
+            return
+
+        connection = session.connection()
+        dialect = connection.dialect
+
+        if dialect.name == 'postgresql' and dialect.driver == 'psycopg2':
+            quote = dialect.identifier_preparer.quote
+            buffer = io.StringIO(HierarchyOperations._copy_csv_payload(rows))
+
+            cursor = connection.connection.cursor()
+            try:
+                cursor.copy_expert(
+                    f"COPY {quote(DBHierarchyNode.__tablename__)} "
+                    f"({', '.join(quote(c) for c in BULK_NODE_COLUMNS)}) "
+                    f"FROM STDIN WITH (FORMAT csv)",
+                    buffer
+                )
+            finally:
+                cursor.close()
+        else:
+            session.execute(
+                insert(DBHierarchyNode.__table__),
+                [dict(zip(BULK_NODE_COLUMNS, row)) for row in rows]
+            )
+
+    @staticmethod
+    def _copy_csv_payload(rows: List[Tuple]) -> str:
+        """
+        Format node rows for COPY ... (FORMAT csv).
+
+        COPY reads an unquoted empty field as NULL and a quoted one ("")
+        as an empty string. csv.writer cannot tell the two apart (it
+        quotes None as "" with QUOTE_NONNUMERIC), so fields are written
+        here: None unquoted and empty, strings always quoted.
+
+        Args:
+            rows: Tuples in BULK_NODE_COLUMNS order
+
+        Returns:
+            CSV text, one line per row
+        """
+        def field(value: Any) -> str:
+            if value is None:
+                return ''
+            if isinstance(value, str):
+                return '"' + value.replace('"', '""') + '"'
+            if isinstance(value, bool):
+                return 'true' if value else 'false'
+            if isinstance(value, datetime):
+                return value.isoformat(sep=' ')
+            return str(value)
+
+        return ''.join(','.join(field(value) for value in row) + '\n' for row in rows)
+
+    @staticmethod
+    @contextmanager
+    def deferred_node_indexes(bind) -> Iterator[None]:
+        """
+        Drop hierarchy_nodes indexes for the duration of a backfill.
+
+        Every index is rebuilt on exit, also when the backfill fails.
+        The primary key is kept.
+
+        Args:
+            bind: Engine (or connection) owning the tables
+
+        Example:
+            with HierarchyOperations.deferred_node_indexes(get_engine()):
+                populate_all_filings()
+        """
+        indexes = sorted(DBHierarchyNode.__table__.indexes, key=lambda i: i.name)
+        for index in indexes:
+            index.drop(bind, checkfirst=True)
+        logger.info(f"Deferred {len(indexes)} hierarchy node indexes")
+
+        try:
+            yield
+        finally:
+            for index in indexes:
+                index.create(bind, checkfirst=True)
+            logger.info(f"Rebuilt {len(indexes)} hierarchy node indexes")
+
     @staticmethod
     def store_all_hierarchies(
         session: Session,
         filing_id: str,
         hierarchies: Dict[str, 'process.hierarchy.HierarchyNode'],
-        fact_merger: Optional['FactMerger'] = None
+        fact_merger: Optional['FactMerger'] = None,
+        bulk: bool = False
     ) -> List[StatementHierarchy]:
         """
         Store all hierarchies for a filing.
@@ -255,6 +470,7 @@ class HierarchyOperations:
             filing_id: ID of parent ProcessedFiling
             hierarchies: Dict mapping statement names to root nodes
             fact_merger: Optional FactMerger for fact expansion
+            bulk: Bulk-load nodes (see store_hierarchy)
 
         Returns:
             List of created StatementHierarchy instances
@@ -264,7 +480,8 @@ class HierarchyOperations:
 
         for name, root in hierarchies.items():
             hierarchy = HierarchyOperations.store_hierarchy(
-                session, filing_id, name, root, fact_merger=fact_merger
+                session, filing_id, name, root,
+                fact_merger=fact_merger, bulk=bulk
             )
             results.append(hierarchy)
             total_nodes += hierarchy.node_count
@@ -101,6 +101,7 @@ from .taxonomy_reader import (
     TaxonomyElement,
     TaxonomyLabel,
 )
+from .taxonomy_store import TaxonomyStore
 from .taxonomy_analyzer import (
     TaxonomyFileAnalyzer,
     FileCapabilities,
@@ -162,6 +163,7 @@ __all__ = [
     'TaxonomyInfo',
     'TaxonomyElement',
     'TaxonomyLabel',
+    'TaxonomyStore',
     'TaxonomyFileAnalyzer',
     'FileCapabilities',
     'DirectoryAnalysis',
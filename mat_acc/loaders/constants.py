@@ -211,6 +211,15 @@ SCHEMA_FILE_PATTERNS = ['.xsd']
 # Instance document patterns
 INSTANCE_FILE_PATTERNS = ['.xml', '.xbrl', '.xhtml', '.htm', '.html']
 
+# ==============================================================================
+# COMPILED TAXONOMY STORE
+# ==============================================================================
+
+# Compiled elements and labels per taxonomy, under the configured cache_dir
+TAXONOMY_STORE_DIRNAME = 'taxonomy_store'
+TAXONOMY_STORE_SUFFIX = '.sqlite'
+TAXONOMY_STORE_VERSION = 1
+
 # ==============================================================================
 # XBRL SPECIFICATION CONSTANTS
 # ==============================================================================
@@ -604,6 +613,9 @@ __all__ = [
     'MAPPED_STATEMENT_FOLDERS',
     'PARSED_JSON_FILE',
     'PARSED_OUTPUT_FILES',
+    'TAXONOMY_STORE_DIRNAME',
+    'TAXONOMY_STORE_SUFFIX',
+    'TAXONOMY_STORE_VERSION',
     'CALCULATION_LINKBASE_PATTERNS',
     'PRESENTATION_LINKBASE_PATTERNS',
     'DEFINITION_LINKBASE_PATTERNS',
@@ -14,6 +14,11 @@ Architecture:
 This is the INTERPRETATION layer:
 - taxonomy_data.py: WHERE are taxonomies? (paths only)
 - taxonomy_reader.py: WHAT is in them? (content interpretation)
+- taxonomy_store.py: compiled copy of what was read (persistent cache)
+
+With a cache_dir configured (MAT_ACC_CACHE_DIR, MAT_ACC_ENABLE_CACHING),
+each taxonomy is parsed once and written to a compiled store; later runs
+load the store and read labels from it on demand.
 
 Example:
     from loaders import TaxonomyDataLoader, TaxonomyReader
@@ -203,6 +208,9 @@ class TaxonomyReader:
         # Cache for loaded taxonomies
         self._taxonomy_cache: dict[str, TaxonomyInfo] = {}
 
+        # Persistent compiled store (None when caching is not configured)
+        self._store = self._create_store()
+
         logger.info("TaxonomyReader initialized")
 
     def read_taxonomy(self, taxonomy: TaxonomyEntry) -> Optional[TaxonomyInfo]:
@@ -223,6 +231,14 @@ class TaxonomyReader:
             return self._taxonomy_cache[cache_key]
 
         try:
+            fingerprint = None
+            if self._store:
+                fingerprint = self._store.fingerprint(taxonomy.taxonomy_path)
+                info = self._store.load(taxonomy, fingerprint)
+                if info:
+                    self._taxonomy_cache[cache_key] = info
+                    return info
+
             info = TaxonomyInfo(
                 taxonomy_name=taxonomy.taxonomy_name,
                 taxonomy_path=taxonomy.taxonomy_path,
@@ -239,6 +255,8 @@ class TaxonomyReader:
 
             # Cache the result
             self._taxonomy_cache[cache_key] = info
+            if self._store:
+                self._save_to_store(info, fingerprint)
 
             logger.info(
                 f"Read taxonomy {taxonomy.taxonomy_name}: "
@@ -251,6 +269,22 @@ class TaxonomyReader:
             logger.error(f"Error reading taxonomy {taxonomy.taxonomy_name}: {e}")
             return None
 
+    def _create_store(self):
+        """Create the compiled taxonomy store if caching is configured."""
+        cache_dir = self.config.get('cache_dir')
+        if not cache_dir or not self.config.get('enable_caching', True):
+            return None
+
+        from .taxonomy_store import TaxonomyStore
+        return TaxonomyStore(cache_dir)
+
+    def _save_to_store(self, info: TaxonomyInfo, fingerprint: str) -> None:
+        """Write a parsed taxonomy to the compiled store (best effort)."""
+        try:
+            self._store.save(info, fingerprint)
+        except Exception as e:
+            logger.warning(f"Could not save taxonomy store for {info.taxonomy_name}: {e}")
+
     def get_element_label(
         self,
         taxonomy_name: str,
@@ -449,10 +483,19 @@ class TaxonomyReader:
             tree = ET.parse(label_path)
             root = tree.getroot()
 
-            # Build locator map (label -> href/element)
+            # One pass over the linkbase collects:
+            # - locator map (label -> href/element)
+            # - label arcs to map locators to labels
+            # - labels
             locators = {}
+            label_arcs = {}
+            labels_map = {}
             for elem in root.iter():
-                if elem.tag.endswith('}loc') or 'loc' in elem.tag:
+                tag = elem.tag
+                if not isinstance(tag, str):
+                    continue
+
+                if tag.endswith('}loc') or 'loc' in tag:
                     label_attr = elem.get(f'{{{XLINK_NAMESPACE}}}label')
                     href = elem.get(f'{{{XLINK_NAMESPACE}}}href', '')
                     if label_attr and href:
@@ -463,10 +506,7 @@ class TaxonomyReader:
                             element_name = element_id.split('_')[-1] if '_' in element_id else element_id
                             locators[label_attr] = element_name
 
-            # Find label arcs to map locators to labels
-            label_arcs = {}
-            for elem in root.iter():
-                if 'labelArc' in elem.tag:
+                if 'labelArc' in tag:
                     from_attr = elem.get(f'{{{XLINK_NAMESPACE}}}from')
                     to_attr = elem.get(f'{{{XLINK_NAMESPACE}}}to')
                     if from_attr and to_attr:
@@ -474,10 +514,7 @@ class TaxonomyReader:
                             label_arcs[from_attr] = []
                         label_arcs[from_attr].append(to_attr)
 
-            # Find labels
-            labels_map = {}
-            for elem in root.iter():
-                if elem.tag.endswith('}label') and elem.text:
+                if tag.endswith('}label') and elem.text:
                     label_attr = elem.get(f'{{{XLINK_NAMESPACE}}}label')
                     role = elem.get(f'{{{XLINK_NAMESPACE}}}role', 'standard')
                     lang = elem.get('{http://www.w3.org/XML/1998/namespace}lang', 'en')
@@ -0,0 +1,352 @@
+# Path: mat_acc/loaders/taxonomy_store.py
+"""
+Compiled Taxonomy Store - Persistent Elements and Labels
+
+On-disk store of what TaxonomyReader extracts from a taxonomy library.
+
+Standard taxonomies (us-gaap, ifrs, ...) are hundreds of schema and
+label linkbase files that never change once installed, yet every run
+re-parsed them to look up labels for a filing's concepts. The store
+keeps the extracted elements and labels in one SQLite file per
+taxonomy, so later runs query only the concepts they need.
+
+LAYOUT ({cache_dir}/taxonomy_store/{taxonomy_name}-{fingerprint}.sqlite):
+    meta      key/value: store version, taxonomy name/path, namespace,
+              version, element and label counts
+    elements  one row per element (TaxonomyElement fields)
+    labels    one row per label (TaxonomyLabel fields), with its position
+              so labels come back in linkbase order
+
+INVALIDATION: The file name carries a fingerprint of every file in the
+taxonomy directory (relative path, size, modification time). Adding,
+removing or changing any file selects a new store, which is built once
+and replaces the old one.
+
+Example:
+    store = TaxonomyStore(cache_dir)
+    fingerprint = store.fingerprint(taxonomy.taxonomy_path)
+
+    info = store.load(taxonomy, fingerprint)
+    if info is None:
+        info = parse_taxonomy(taxonomy)
+        store.save(info, fingerprint)
+
+    label = info.get_label('Assets')   # one indexed query
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .taxonomy_data import TaxonomyEntry
+from .taxonomy_reader import TaxonomyElement, TaxonomyInfo, TaxonomyLabel
+from .constants import (
+    TAXONOMY_STORE_DIRNAME,
+    TAXONOMY_STORE_SUFFIX,
+    TAXONOMY_STORE_VERSION,
+)
+
+
+logger = logging.getLogger('loaders.taxonomy_store')
+
+
+# Element columns, in TaxonomyElement field order
+ELEMENT_COLUMNS = (
+    'name', 'element_id', 'namespace', 'element_type', 'substitution_group',
+    'period_type', 'balance', 'abstract', 'nillable',
+)
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE elements (
+    name TEXT PRIMARY KEY,
+    element_id TEXT, namespace TEXT, element_type TEXT,
+    substitution_group TEXT, period_type TEXT, balance TEXT,
+    abstract INTEGER, nillable INTEGER
+);
+CREATE TABLE labels (
+    element_name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    label_text TEXT, label_role TEXT, language TEXT,
+    PRIMARY KEY (element_name, position)
+) WITHOUT ROWID;
+"""
+
+
+# ==============================================================================
+# STORE-BACKED MAPPINGS
+# ==============================================================================
+
+class _StoredMapping(Mapping, ABC):
+    """Read-only mapping over one table, loading rows on first access."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+        self._rows: dict[str, any] = {}
+        self._count: Optional[int] = None
+
+    @abstractmethod
+    def _fetch(self, key: str) -> Optional[any]:
+        """Value stored for key, or None if the table has no such key."""
+        pass
+
+    @abstractmethod
+    def _keys_query(self) -> str:
+        """SQL query returning every key of the table, one per row."""
+        pass
+
+    def __getitem__(self, key: str) -> any:
+        if key not in self._rows:
+            self._rows[key] = self._fetch(key)
+        value = self._rows[key]
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        for (key,) in self._connection.execute(self._keys_query()):
+            yield key
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = sum(1 for _ in self)
+        return self._count
+
+
+class StoredElements(_StoredMapping):
+    """Element name -> TaxonomyElement, read from the store."""
+
+    def _fetch(self, key: str) -> Optional[TaxonomyElement]:
+        row = self._connection.execute(
+            f"SELECT {', '.join(ELEMENT_COLUMNS)} FROM elements WHERE name = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        values = dict(zip(ELEMENT_COLUMNS, row))
+        values['abstract'] = bool(values['abstract'])
+        values['nillable'] = bool(values['nillable'])
+        return TaxonomyElement(**values)
+
+    def _keys_query(self) -> str:
+        return "SELECT name FROM elements"
+
+
+class StoredLabels(_StoredMapping):
+    """Element name -> list of TaxonomyLabel (linkbase order), read from the store."""
+
+    def _fetch(self, key: str) -> Optional[list[TaxonomyLabel]]:
+        rows = self._connection.execute(
+            "SELECT label_text, label_role, language FROM labels "
+            "WHERE element_name = ? ORDER BY position", (key,)
+        ).fetchall()
+        if not rows:
+            return None
+        return [
+            TaxonomyLabel(
+                element_name=key, label_text=text, label_role=role, language=language
+            )
+            for text, role, language in rows
+        ]
+
+    def _keys_query(self) -> str:
+        return "SELECT DISTINCT element_name FROM labels"
+
+
+# ==============================================================================
+# TAXONOMY STORE
+# ==============================================================================
+
+class TaxonomyStore:
+    """
+    Compiled elements and labels of taxonomy libraries.
+
+    Files are written atomically (temp file + rename), so concurrent runs
+    never open a partial store.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize taxonomy store.
+
+        Args:
+            cache_dir: mat_acc cache directory (store files go in a
+                subdirectory)
+        """
+        self.store_dir = Path(cache_dir) / TAXONOMY_STORE_DIRNAME
+
+    @staticmethod
+    def fingerprint(taxonomy_path: Path) -> str:
+        """
+        Fingerprint every file in a taxonomy directory.
+
+        Only file metadata is read (no file contents).
+
+        Args:
+            taxonomy_path: Taxonomy directory
+
+        Returns:
+            Hex digest of the sorted (relative path, size, mtime_ns) entries
+        """
+        entries = []
+        for directory, _, files in os.walk(taxonomy_path):
+            for file_name in files:
+                path = os.path.join(directory, file_name)
+                stat = os.stat(path)
+                entries.append(
+                    f"{os.path.relpath(path, taxonomy_path)}\0{stat.st_size}\0{stat.st_mtime_ns}"
+                )
+        entries.sort()
+
+        digest = hashlib.sha256(f"v{TAXONOMY_STORE_VERSION}".encode())
+        for entry in entries:
+            digest.update(entry.encode('utf-8', 'surrogateescape'))
+            digest.update(b'\n')
+        return digest.hexdigest()[:32]
+
+    def path_for(self, taxonomy_name: str, fingerprint: str) -> Path:
+        """Store file for a taxonomy at a fingerprint."""
+        return self.store_dir / f"{self._safe_name(taxonomy_name)}-{fingerprint}{TAXONOMY_STORE_SUFFIX}"
+
+    def load(self, taxonomy: TaxonomyEntry, fingerprint: str) -> Optional[TaxonomyInfo]:
+        """
+        Open the compiled store of a taxonomy.
+
+        Args:
+            taxonomy: Taxonomy to load
+            fingerprint: Current fingerprint of its directory
+
+        Returns:
+            TaxonomyInfo whose elements and labels are read from the store
+            on demand, or None if no current store exists
+        """
+        path = self.path_for(taxonomy.taxonomy_name, fingerprint)
+        if not path.exists():
+            return None
+
+        try:
+            connection = sqlite3.connect(
+                f"file:{path}?mode=ro", uri=True, check_same_thread=False
+            )
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+            if meta.get('store_version') != str(TAXONOMY_STORE_VERSION):
+                connection.close()
+                return None
+
+            info = TaxonomyInfo(
+                taxonomy_name=taxonomy.taxonomy_name,
+                taxonomy_path=taxonomy.taxonomy_path,
+                namespace=meta.get('namespace', ''),
+                version=meta.get('version', ''),
+                element_count=int(meta.get('element_count', 0)),
+                label_count=int(meta.get('label_count', 0)),
+                elements=StoredElements(connection),
+                labels=StoredLabels(connection),
+            )
+            logger.info(f"Loaded compiled taxonomy store: {path.name}")
+            return info
+
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open taxonomy store {path}: {e}")
+            return None
+
+    def save(self, info: TaxonomyInfo, fingerprint: str) -> Path:
+        """
+        Write the compiled store of a parsed taxonomy.
+
+        Older stores of the same taxonomy are removed.
+
+        Args:
+            info: TaxonomyInfo with in-memory elements and labels
+            fingerprint: Fingerprint of its directory
+
+        Returns:
+            Path to the store file
+        """
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(info.taxonomy_name, fingerprint)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            connection = sqlite3.connect(tmp_name)
+            try:
+                connection.executescript(SCHEMA)
+                connection.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ('store_version', str(TAXONOMY_STORE_VERSION)),
+                        ('taxonomy_name', info.taxonomy_name),
+                        ('taxonomy_path', str(info.taxonomy_path)),
+                        ('namespace', info.namespace),
+                        ('version', info.version),
+                        ('element_count', str(info.element_count)),
+                        ('label_count', str(info.label_count)),
+                    ]
+                )
+                connection.executemany(
+                    f"INSERT INTO elements ({', '.join(ELEMENT_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(ELEMENT_COLUMNS))})",
+                    (
+                        tuple(getattr(element, column) for column in ELEMENT_COLUMNS)
+                        for element in info.elements.values()
+                    )
+                )
+                connection.executemany(
+                    "INSERT INTO labels (element_name, position, label_text, label_role, language) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (element_name, position, label.label_text, label.label_role, label.language)
+                        for element_name, labels in info.labels.items()
+                        for position, label in enumerate(labels)
+                    )
+                )
+                connection.commit()
+            finally:
+                connection.close()
+
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+        self._remove_stale(info.taxonomy_name, path)
+        logger.info(
+            f"Saved compiled taxonomy store: {path.name} "
+            f"({info.element_count} elements, {info.label_count} labels)"
+        )
+        return path
+
+    def _remove_stale(self, taxonomy_name: str, current: Path) -> None:
+        """Delete stores of a taxonomy built from an earlier directory state."""
+        prefix = f"{self._safe_name(taxonomy_name)}-"
+        for path in self.store_dir.glob(f"*{TAXONOMY_STORE_SUFFIX}"):
+            if path != current and path.name.startswith(prefix) \
+                    and len(path.name) == len(current.name):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _safe_name(taxonomy_name: str) -> str:
+        """Taxonomy name usable as a file name."""
+        return re.sub(r'[^A-Za-z0-9._-]', '_', taxonomy_name)
+
+
+__all__ = ['TaxonomyStore', 'StoredElements', 'StoredLabels']
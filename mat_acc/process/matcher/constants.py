@@ -0,0 +1,59 @@
+# Path: mat_acc/process/matcher/constants.py
+"""
+Constants for the Matching Engine
+
+Tuning values for candidate retrieval in ConceptIndex.
+"""
+
+from typing import Final
+
+
+# ==============================================================================
+# LABEL RANKING (BM25 over label tokens)
+# ==============================================================================
+LABEL_TOKEN_MIN_LENGTH: Final[int] = 3
+"""Label words shorter than this are not indexed."""
+
+BM25_K1: Final[float] = 1.2
+"""Term frequency saturation."""
+
+BM25_B: Final[float] = 0.75
+"""Label length normalization (0 = none, 1 = full)."""
+
+
+# ==============================================================================
+# LOCAL NAME RANKING (character n-grams)
+# ==============================================================================
+LOCAL_NAME_NGRAM_SIZE: Final[int] = 3
+"""Character n-gram length for local name matching."""
+
+LOCAL_NAME_WEIGHT: Final[float] = 2.0
+"""Score added for a local name that covers a pattern completely."""
+
+LOCAL_NAME_MIN_COVERAGE: Final[float] = 0.6
+"""Share of a pattern's (idf-weighted) n-grams a local name must contain."""
+
+LOCAL_NAME_NGRAM_MAX_DF_RATIO: Final[float] = 0.25
+"""N-grams in more than this share of local names are ignored (too common)."""
+
+
+# ==============================================================================
+# CANDIDATE RETRIEVAL
+# ==============================================================================
+DEFAULT_MAX_CANDIDATES: Final[int] = 100
+"""Default number of candidates returned by ConceptIndex.get_candidates()."""
+
+
+__all__ = [
+    # Label ranking
+    'LABEL_TOKEN_MIN_LENGTH',
+    'BM25_K1',
+    'BM25_B',
+    # Local name ranking
+    'LOCAL_NAME_NGRAM_SIZE',
+    'LOCAL_NAME_WEIGHT',
+    'LOCAL_NAME_MIN_COVERAGE',
+    'LOCAL_NAME_NGRAM_MAX_DF_RATIO',
+    # Candidate retrieval
+    'DEFAULT_MAX_CANDIDATES',
+]
@@ -41,6 +41,7 @@ from ..models.component_definition import (
     RelationType,
     ExpectedSign,
 )
+from ..evaluators.compiled_label_rules import CompiledLabelRules
 
 
 class ComponentLoader:
@@ -81,6 +82,7 @@ class ComponentLoader:
         self.formulas_path = self.dictionary_path / 'formulas'
 
         self._components_cache: Optional[dict[str, ComponentDefinition]] = None
+        self._compiled_label_rules: Optional[CompiledLabelRules] = None
 
     def load_all(self, use_cache: bool = True) -> dict[str, ComponentDefinition]:
         """
@@ -126,8 +128,38 @@ class ComponentLoader:
 
         self.logger.info(f"Loaded {len(components)} component definitions")
         self._components_cache = components
+        self._compiled_label_rules = self._compile_label_rules(components)
         return components
 
+    def get_compiled_label_rules(self) -> CompiledLabelRules:
+        """
+        Get the label rules of all components, compiled for one-pass matching.
+
+        Compiled when the components are loaded.
+
+        Returns:
+            CompiledLabelRules for the loaded components
+        """
+        if self._compiled_label_rules is None:
+            self.load_all()
+        if self._compiled_label_rules is None:
+            # Components directory missing: nothing to match
+            self._compiled_label_rules = CompiledLabelRules({})
+        return self._compiled_label_rules
+
+    def _compile_label_rules(
+        self,
+        components: dict[str, ComponentDefinition]
+    ) -> CompiledLabelRules:
+        """Compile the label rules of all components."""
+        compiled = CompiledLabelRules({
+            component_id: component.matching_rules.label_rules
+            for component_id, component in components.items()
+            if component.matching_rules.label_rules
+        })
+        self.logger.info(f"Compiled {compiled.pattern_count} label patterns")
+        return compiled
+
     def load_file(self, file_path: Path) -> Optional[ComponentDefinition]:
         """
         Load a single component definition from a YAML file.
@@ -451,6 +483,7 @@ class ComponentLoader:
     def clear_cache(self) -> None:
         """Clear the components cache."""
         self._components_cache = None
+        self._compiled_label_rules = None
 
 
 __all__ = ['ComponentLoader']
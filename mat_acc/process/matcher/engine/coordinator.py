@@ -24,6 +24,7 @@ from ..evaluators import (
     CalculationEvaluator,
     DefinitionEvaluator,
 )
+from ..evaluators.compiled_label_rules import LabelScan
 from ..scoring import ScoreAggregator, Tiebreaker
 
 
@@ -71,11 +72,16 @@ class MatchingCoordinator:
         # Load component definitions
         self.component_loader = ComponentLoader(dictionary_path)
         self.components = self.component_loader.load_all()
+        self.label_rules = self.component_loader.get_compiled_label_rules()
 
         self.logger.info(
             f"Loaded {len(self.components)} component definitions"
         )
 
+        # Label scans of the current index's concepts (qname -> (concept, scan))
+        self._label_scan_index: Optional[ConceptIndex] = None
+        self._label_scans: dict[str, tuple[ConceptMetadata, LabelScan]] = {}
+
         # Initialize evaluators
         self.evaluators = {
             'label': LabelEvaluator(),
@@ -294,7 +300,11 @@ class MatchingCoordinator:
             if component.matching_rules.label_rules:
                 result = self.evaluators['label'].evaluate(
                     concept=concept,
-                    rules=component.matching_rules.label_rules
+                    rules=component.matching_rules.label_rules,
+                    context={
+                        'label_scan': self._get_label_scan(concept, concept_index),
+                        'component_id': component_id,
+                    }
                 )
                 evaluation_results['label'] = result
 
@@ -420,6 +430,36 @@ class MatchingCoordinator:
             tiebreaker_used=tiebreaker_used
         )
 
+    def _get_label_scan(
+        self,
+        concept: ConceptMetadata,
+        concept_index: ConceptIndex
+    ) -> LabelScan:
+        """
+        Get the label rule matches of a concept for all components.
+
+        Each concept is scanned once per index, the first time any
+        component evaluates it.
+
+        Args:
+            concept: Candidate concept
+            concept_index: Index the concept came from
+
+        Returns:
+            LabelScan of the concept
+        """
+        if concept_index is not self._label_scan_index:
+            self._label_scan_index = concept_index
+            self._label_scans = {}
+
+        cached = self._label_scans.get(concept.qname)
+        if cached is not None and cached[0] is concept:
+            return cached[1]
+
+        scan = self.label_rules.scan(concept)
+        self._label_scans[concept.qname] = (concept, scan)
+        return scan
+
     def _get_candidates(
         self,
         component: ComponentDefinition,
@@ -428,7 +468,7 @@ class MatchingCoordinator:
         """
         Get candidate concepts for matching.
 
-        Uses the concept index for fast pre-filtering.
+        Uses the concept index for ranked pre-filtering (best first).
 
         Args:
             component: Component definition
@@ -442,6 +482,10 @@ class MatchingCoordinator:
         for rule in component.matching_rules.label_rules:
             label_patterns.extend(rule.patterns)
 
+        local_name_patterns = []
+        for rule in component.matching_rules.local_name_rules:
+            local_name_patterns.extend(rule.patterns)
+
         # Get characteristic filters
         balance_type = None
         period_type = None
@@ -458,7 +502,7 @@ class MatchingCoordinator:
             balance_type=balance_type,
             period_type=period_type,
             exclude_abstract=not component.characteristics.is_abstract,
-            max_candidates=100
+            local_name_patterns=local_name_patterns,
         )
 
         # Convert to concept metadata objects
@@ -671,6 +715,9 @@ class MatchingCoordinator:
         """Reload component definitions from disk."""
         self.component_loader.clear_cache()
         self.components = self.component_loader.load_all()
+        self.label_rules = self.component_loader.get_compiled_label_rules()
+        self._label_scan_index = None
+        self._label_scans = {}
         self.logger.info(f"Reloaded {len(self.components)} components")
 
     def get_match_diagnostics(self) -> dict[str, dict]:
@@ -12,6 +12,9 @@ Evaluators:
 - DefinitionEvaluator: Match against definition text
 - ReferenceEvaluator: Match against accounting standard references
 - LocalNameEvaluator: Match against concept local name
+
+CompiledLabelRules compiles the label rules of all components so each
+concept's labels are scanned once for every component.
 """
 
 from .base_evaluator import BaseEvaluator, EvaluationResult
@@ -19,6 +22,7 @@ from .label_evaluator import LabelEvaluator
 from .hierarchy_evaluator import HierarchyEvaluator
 from .calculation_evaluator import CalculationEvaluator
 from .definition_evaluator import DefinitionEvaluator
+from .compiled_label_rules import CompiledLabelRules, LabelScan
 
 __all__ = [
     'BaseEvaluator',
@@ -27,4 +31,6 @@ __all__ = [
     'HierarchyEvaluator',
     'CalculationEvaluator',
     'DefinitionEvaluator',
+    'CompiledLabelRules',
+    'LabelScan',
 ]
@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from ..models.concept_metadata import ConceptMetadata
+from .compiled_label_rules import normalize_for_matching
 
 
 @dataclass
@@ -146,12 +147,7 @@ class BaseEvaluator(ABC):
         Returns:
             Normalized text with punctuation removed
         """
-        # Remove common punctuation that varies between sources
-        # Keep letters, numbers, and spaces
-        normalized = re.sub(r"['\",\(\)\-]", '', text)
-        # Collapse multiple spaces
-        normalized = re.sub(r'\s+', ' ', normalized)
-        return normalized.strip()
+        return normalize_for_matching(text)
 
     def _text_contains(
         self,
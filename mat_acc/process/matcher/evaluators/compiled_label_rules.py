@@ -0,0 +1,331 @@
+# Path: mat_acc/process/matcher/evaluators/compiled_label_rules.py
+"""
+Compiled Label Rules
+
+Label rules of all components compiled into pattern automata, so each
+concept's labels are scanned once for every component instead of once
+per component, rule and pattern.
+
+Patterns are normalized (and lowercased, unless case-sensitive) when the
+rules are compiled:
+- contains:    Aho-Corasick automaton
+- starts_with: prefix trie
+- ends_with:   suffix trie (trie of reversed patterns)
+- exact:       dictionary
+- regex:       precompiled expressions
+
+Matching is identical to LabelEvaluator's per-pattern checks, including
+which label and pattern are reported when several match a rule (first
+label in concept order, then first pattern in rule order).
+
+Example:
+    compiled = CompiledLabelRules({
+        cid: component.matching_rules.label_rules
+        for cid, component in components.items()
+    })
+
+    scan = compiled.scan(concept)          # once per concept
+    matches = scan.matches_for('current_assets')
+    # {rule_index: (label_type, label_text, pattern)}
+"""
+
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass, field
+
+from ..models.concept_metadata import ConceptMetadata
+from ..models.component_definition import LabelRule, MatchType
+
+
+logger = logging.getLogger('matcher.evaluators.compiled_label_rules')
+
+# Punctuation that varies between sources ("Stockholders' Equity", "Assets, Current")
+_PUNCTUATION_PATTERN = re.compile(r"['\",\(\)\-]")
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_for_matching(text: str) -> str:
+    """
+    Normalize text for matching by removing punctuation.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Text with punctuation removed and whitespace collapsed
+    """
+    normalized = _PUNCTUATION_PATTERN.sub('', text)
+    normalized = _WHITESPACE_PATTERN.sub(' ', normalized)
+    return normalized.strip()
+
+
+# ==============================================================================
+# PATTERN STRUCTURES
+# ==============================================================================
+
+class PatternAutomaton:
+    """
+    Aho-Corasick automaton: finds every pattern contained in a text
+    in one pass over the text.
+    """
+
+    def __init__(self):
+        self._goto: list[dict[str, int]] = [{}]
+        self._outputs: list[list[int]] = [[]]
+        self._fail: list[int] = [0]
+        self._built = True
+
+    def add(self, pattern: str, value: int) -> None:
+        """Add a pattern; value is reported when it is found."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._outputs.append([])
+                self._fail.append(0)
+            state = next_state
+        self._outputs[state].append(value)
+        self._built = False
+
+    def _build(self) -> None:
+        """Compute failure links (breadth-first) and merge outputs."""
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                )
+        self._built = True
+
+    def search(self, text: str) -> set[int]:
+        """Values of all patterns contained in text."""
+        if not self._built:
+            self._build()
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        found = set(outputs[0])
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+class AffixTrie:
+    """Trie that finds every pattern that is a prefix of a text."""
+
+    def __init__(self):
+        self._children: list[dict[str, int]] = [{}]
+        self._outputs: list[list[int]] = [[]]
+
+    def add(self, pattern: str, value: int) -> None:
+        """Add a pattern; value is reported when it is a prefix of the text."""
+        node = 0
+        for char in pattern:
+            child = self._children[node].get(char)
+            if child is None:
+                child = len(self._children)
+                self._children[node][char] = child
+                self._children.append({})
+                self._outputs.append([])
+            node = child
+        self._outputs[node].append(value)
+
+    def search(self, text: str) -> set[int]:
+        """Values of all patterns that are prefixes of text."""
+        found = set(self._outputs[0])
+        node = 0
+        for char in text:
+            node = self._children[node].get(char)
+            if node is None:
+                break
+            found.update(self._outputs[node])
+        return found
+
+
+@dataclass
+class _PatternGroup:
+    """Patterns sharing one case sensitivity."""
+    contains: PatternAutomaton = field(default_factory=PatternAutomaton)
+    prefixes: AffixTrie = field(default_factory=AffixTrie)
+    suffixes: AffixTrie = field(default_factory=AffixTrie)
+    exact: dict[str, list[int]] = field(default_factory=dict)
+
+    def search(self, text: str) -> set[int]:
+        """Values of all patterns of the group matching normalized text."""
+        found = self.contains.search(text)
+        found |= self.prefixes.search(text)
+        found |= self.suffixes.search(text[::-1])
+        found.update(self.exact.get(text, ()))
+        return found
+
+
+# ==============================================================================
+# LABEL SCAN
+# ==============================================================================
+
+@dataclass
+class LabelScan:
+    """
+    Label rule matches of one concept for all components.
+
+    Attributes:
+        labels: (label_type, label_text) of the concept's non-empty labels
+        rule_matches: component_id -> {rule_index: (label_position, pattern_index)}
+        patterns: component_id -> patterns of each rule
+    """
+    labels: list[tuple[str, str]]
+    rule_matches: dict[str, dict[int, tuple[int, int]]]
+    patterns: dict[str, list[list[str]]]
+
+    def matches_for(self, component_id: str) -> dict[int, tuple[str, str, str]]:
+        """
+        Matched label rules of a component.
+
+        Returns:
+            {rule_index: (label_type, label_text, pattern)}
+        """
+        patterns = self.patterns.get(component_id, [])
+        result = {}
+        for rule_index, (label_position, pattern_index) in \
+                self.rule_matches.get(component_id, {}).items():
+            label_type, label_text = self.labels[label_position]
+            result[rule_index] = (
+                label_type, label_text, patterns[rule_index][pattern_index]
+            )
+        return result
+
+
+# ==============================================================================
+# COMPILED LABEL RULES
+# ==============================================================================
+
+class CompiledLabelRules:
+    """
+    Label rules of many components, compiled for one-pass matching.
+
+    Compile once per dictionary load (ComponentLoader does this), then
+    scan each concept once.
+    """
+
+    def __init__(self, rules_by_component: dict[str, list[LabelRule]]):
+        """
+        Compile label rules.
+
+        Args:
+            rules_by_component: component_id -> label rules
+        """
+        # Pattern entries: (component_id, rule_index, pattern_index)
+        self._entries: list[tuple[str, int, int]] = []
+        self._groups: dict[bool, _PatternGroup] = {}
+        self._regexes: list[tuple[re.Pattern, int]] = []
+        self._patterns: dict[str, list[list[str]]] = {}
+
+        for component_id, rules in rules_by_component.items():
+            self._patterns[component_id] = [list(rule.patterns) for rule in rules]
+            for rule_index, rule in enumerate(rules):
+                for pattern_index, pattern in enumerate(rule.patterns):
+                    value = len(self._entries)
+                    self._entries.append((component_id, rule_index, pattern_index))
+                    self._add_pattern(pattern, rule, value)
+
+    @property
+    def pattern_count(self) -> int:
+        """Number of compiled patterns."""
+        return len(self._entries)
+
+    def _add_pattern(self, pattern: str, rule: LabelRule, value: int) -> None:
+        """Add one pattern to the structure of its match type."""
+        if rule.match_type == MatchType.REGEX:
+            flags = 0 if rule.case_sensitive else re.IGNORECASE
+            try:
+                self._regexes.append((re.compile(pattern, flags), value))
+            except re.error:
+                logger.warning(f"Invalid regex pattern: {pattern}")
+            return
+
+        key = normalize_for_matching(pattern)
+        if not rule.case_sensitive:
+            key = key.lower()
+
+        group = self._groups.setdefault(rule.case_sensitive, _PatternGroup())
+        if rule.match_type == MatchType.CONTAINS:
+            group.contains.add(key, value)
+        elif rule.match_type == MatchType.STARTS_WITH:
+            group.prefixes.add(key, value)
+        elif rule.match_type == MatchType.ENDS_WITH:
+            group.suffixes.add(key[::-1], value)
+        elif rule.match_type == MatchType.EXACT:
+            group.exact.setdefault(key, []).append(value)
+        else:
+            logger.warning(f"Unknown match type: {rule.match_type}")
+
+    def scan(self, concept: ConceptMetadata) -> LabelScan:
+        """
+        Match every compiled rule against a concept's labels.
+
+        Each label is normalized once.
+
+        Args:
+            concept: Concept to scan
+
+        Returns:
+            LabelScan with the first matching label and pattern per rule
+        """
+        labels = [
+            (label_type, label_text)
+            for label_type, label_text in (concept.labels or {}).items()
+            if label_text
+        ]
+
+        rule_matches: dict[str, dict[int, tuple[int, int]]] = {}
+        for label_position, (_, label_text) in enumerate(labels):
+            normalized = normalize_for_matching(label_text)
+
+            found: set[int] = set()
+            for case_sensitive, group in self._groups.items():
+                found |= group.search(normalized if case_sensitive else normalized.lower())
+            for regex, value in self._regexes:
+                if regex.search(label_text):
+                    found.add(value)
+
+            for value in found:
+                component_id, rule_index, pattern_index = self._entries[value]
+                component_matches = rule_matches.setdefault(component_id, {})
+                current = component_matches.get(rule_index)
+                # Labels are scanned in order: an earlier label always wins
+                if current is None or (
+                    current[0] == label_position and pattern_index < current[1]
+                ):
+                    component_matches[rule_index] = (label_position, pattern_index)
+
+        return LabelScan(labels=labels, rule_matches=rule_matches, patterns=self._patterns)
+
+
+__all__ = [
+    'CompiledLabelRules',
+    'LabelScan',
+    'PatternAutomaton',
+    'AffixTrie',
+    'normalize_for_matching',
+]
@@ -44,6 +44,11 @@ class LabelEvaluator(BaseEvaluator):
                 )
             ]
         )
+
+    The coordinator scans each concept once with the dictionary's
+    CompiledLabelRules and passes the scan as context['label_scan']
+    (with context['component_id']), so patterns are not matched again
+    per component.
     """
 
     @property
@@ -62,7 +67,8 @@ class LabelEvaluator(BaseEvaluator):
         Args:
             concept: Concept with labels to match
             rules: List of LabelRule objects
-            context: Optional additional context
+            context: Optional additional context ('label_scan' and
+                'component_id' to use precompiled matches)
 
         Returns:
             EvaluationResult with total score and matched rules
@@ -79,34 +85,19 @@ class LabelEvaluator(BaseEvaluator):
                 evaluator_type=self.evaluator_type
             )
 
-        for rule in rules:
+        scanned = None
+        if context and context.get('label_scan') is not None:
+            scanned = context['label_scan'].matches_for(context['component_id'])
+
+        for rule_index, rule in enumerate(rules):
             # Try to match against any label
-            matched = False
-            matched_label_type = None
-            matched_label_text = None
-            matched_pattern = None
-
-            for label_type, label_text in labels.items():
-                if not label_text:
-                    continue
-
-                for pattern in rule.patterns:
-                    if self._matches_pattern(
-                        label_text,
-                        pattern,
-                        rule.match_type,
-                        rule.case_sensitive
-                    ):
-                        matched = True
-                        matched_label_type = label_type
-                        matched_label_text = label_text
-                        matched_pattern = pattern
-                        break
-
-                if matched:
-                    break
-
-            if matched:
+            if scanned is not None:
+                match = scanned.get(rule_index)
+            else:
+                match = self._find_match(labels, rule)
+
+            if match is not None:
+                matched_label_type, matched_label_text, matched_pattern = match
                 total_score += rule.weight
                 matched_rules.append({
                     'patterns': rule.patterns,
@@ -129,6 +120,36 @@ class LabelEvaluator(BaseEvaluator):
             evaluator_type=self.evaluator_type
         )
 
+    def _find_match(
+        self,
+        labels: dict[str, str],
+        rule: LabelRule
+    ) -> Optional[tuple[str, str, str]]:
+        """
+        Find the first label and pattern matching a rule.
+
+        Args:
+            labels: Concept labels (label_type -> text)
+            rule: Label rule
+
+        Returns:
+            (label_type, label_text, pattern) or None
+        """
+        for label_type, label_text in labels.items():
+            if not label_text:
+                continue
+
+            for pattern in rule.patterns:
+                if self._matches_pattern(
+                    label_text,
+                    pattern,
+                    rule.match_type,
+                    rule.case_sensitive
+                ):
+                    return label_type, label_text, pattern
+
+        return None
+
     def _matches_pattern(
         self,
         text: str,
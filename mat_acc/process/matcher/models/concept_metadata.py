@@ -6,9 +6,30 @@ Models for storing concept attributes used during matching.
 The ConceptIndex provides fast lookup during candidate filtering.
 """
 
+import heapq
+import math
+import re
 from typing import Optional, Any
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+from ..constants import (
+    LABEL_TOKEN_MIN_LENGTH,
+    BM25_K1,
+    BM25_B,
+    LOCAL_NAME_NGRAM_SIZE,
+    LOCAL_NAME_WEIGHT,
+    LOCAL_NAME_MIN_COVERAGE,
+    LOCAL_NAME_NGRAM_MAX_DF_RATIO,
+    DEFAULT_MAX_CANDIDATES,
+)
+
+
+# Words in labels and patterns
+_WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+
+# Characters kept for local name n-grams
+_NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]')
 
 
 @dataclass
@@ -123,6 +144,12 @@ class ConceptIndex:
         - by_balance_type: Balance type -> concepts
         - by_period_type: Period type -> concepts
         - by_parent: Parent concept -> child concepts
+
+    Ranking (built on first get_candidates() call after concepts change):
+        - BM25 impact postings: label word -> {ordinal: score}
+        - Local name n-gram postings: n-gram -> [ordinal]
+        - Characteristic bitsets: one int per balance type, period type
+          and abstract flag, bit i = concept with ordinal i
     """
 
     def __init__(self):
@@ -137,6 +164,9 @@ class ConceptIndex:
         self._by_parent: dict[str, list[str]] = defaultdict(list)
         self._by_level: dict[int, list[str]] = defaultdict(list)
 
+        # Ranking structures, rebuilt lazily after concepts change
+        self._ranking: Optional[_RankingIndex] = None
+
     def add_concept(self, concept: ConceptMetadata) -> None:
         """
         Add a concept to the index.
@@ -146,6 +176,7 @@ class ConceptIndex:
         """
         qname = concept.qname
         self._concepts[qname] = concept
+        self._ranking = None
 
         # Index by local name (lowercase for case-insensitive lookup)
         local_lower = concept.local_name.lower()
@@ -286,13 +317,21 @@ class ConceptIndex:
         balance_type: Optional[str] = None,
         period_type: Optional[str] = None,
         exclude_abstract: bool = True,
-        max_candidates: int = 100
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        local_name_patterns: Optional[list[str]] = None
     ) -> list[str]:
         """
-        Get candidate concepts for matching.
+        Get candidate concepts for matching, best first.
 
-        Uses multiple indexes to quickly find likely candidates
-        before full rule evaluation.
+        Concepts are scored with BM25 over their label words plus
+        local name n-gram coverage of the patterns, and the top
+        max_candidates are returned. Ties are broken by QName, so the
+        result does not depend on insertion or hash order.
+
+        Label patterns are matched against local names only when no
+        label word matches; local_name_patterns always are.
+        If nothing scores, the first max_candidates concepts passing the
+        characteristic filters are returned in insertion order.
 
         Characteristic filtering is permissive:
         - Concepts with matching characteristics are included
@@ -305,69 +344,54 @@ class ConceptIndex:
             period_type: Preferred period type (None = no preference)
             exclude_abstract: Whether to exclude abstract concepts
             max_candidates: Maximum candidates to return
+            local_name_patterns: Patterns to search for in local names
 
         Returns:
-            List of candidate QNames
+            List of candidate QNames, highest score first
         """
-        # Extract words from patterns
-        all_words = set()
-        for pattern in label_patterns:
-            words = self._tokenize(pattern)
-            all_words.update(words)
-
-        # Find by label words (union of matches for each word)
-        label_matches = set()
-        for word in all_words:
-            label_matches.update(self._by_label_word.get(word, set()))
-
-        # If no label matches, try local name patterns
-        if not label_matches:
-            for pattern in label_patterns:
-                label_matches.update(self.find_by_local_name(f"*{pattern}*"))
-
-        # Filter by characteristics
-        if label_matches:
-            candidates = label_matches
-        else:
-            candidates = set(self._concepts.keys())
-
-        # Apply PERMISSIVE characteristic filters
-        # Include concepts with matching type OR unknown (None) type
-        # Only exclude concepts with WRONG type
-        if balance_type:
-            filtered = set()
-            for qname in candidates:
-                concept = self._concepts[qname]
-                # Include if: matches OR is unknown (None)
-                if concept.balance_type is None or concept.balance_type == balance_type:
-                    filtered.add(qname)
-            candidates = filtered
-
-        if period_type:
-            filtered = set()
-            for qname in candidates:
-                concept = self._concepts[qname]
-                # Include if: matches OR is unknown (None)
-                if concept.period_type is None or concept.period_type == period_type:
-                    filtered.add(qname)
-            candidates = filtered
-
-        if exclude_abstract:
-            candidates = {
-                qname for qname in candidates
-                if not self._concepts[qname].is_abstract
-            }
+        ranking = self._get_ranking()
+        allowed = ranking.allowed(balance_type, period_type, exclude_abstract)
+
+        # Distinct words from patterns
+        words = {
+            word
+            for pattern in label_patterns
+            for word in self._tokenize(pattern)
+        }
 
-        # Limit and return
-        return list(candidates)[:max_candidates]
+        name_patterns = list(local_name_patterns or [])
+        if not ranking.has_label_words(words):
+            name_patterns.extend(label_patterns)
+
+        scores = ranking.score_local_names(name_patterns, allowed) if name_patterns else {}
+        scores = ranking.add_label_scores(scores, words, allowed)
+
+        qnames = ranking.qnames
+        if scores:
+            ranked = [(-score, qnames[ordinal]) for ordinal, score in scores.items()]
+            return [qname for _, qname in heapq.nsmallest(max_candidates, ranked)]
+
+        # Nothing scored: unranked fallback in insertion order
+        candidates = []
+        for ordinal, qname in enumerate(qnames):
+            if _is_set(allowed, ordinal):
+                candidates.append(qname)
+                if len(candidates) >= max_candidates:
+                    break
+        return candidates
+
+    def _get_ranking(self) -> '_RankingIndex':
+        """Ranking structures for the current concepts (built on demand)."""
+        if self._ranking is None:
+            self._ranking = _RankingIndex(list(self._concepts.values()), self._tokenize)
+        return self._ranking
 
     def _tokenize(self, text: str) -> list[str]:
         """Tokenize text into lowercase words."""
         # Remove punctuation and split
-        import re
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        words = _WORD_PATTERN.findall(text.lower())
         # Filter short words
-        return [w for w in words if len(w) >= 3]
+        return [w for w in words if len(w) >= LABEL_TOKEN_MIN_LENGTH]
 
     def __len__(self) -> int:
         """Return number of indexed concepts."""
@@ -378,6 +402,192 @@ class ConceptIndex:
         return qname in self._concepts
 
 
+def _is_set(bits: bytes, ordinal: int) -> bool:
+    """Test a bit of a little-endian bitset."""
+    return bool(bits[ordinal >> 3] & (1 << (ordinal & 7)))
+
+
+class _RankingIndex:
+    """
+    Scored inverted index over a fixed set of concepts.
+
+    Built once per ConceptIndex state. Queries only touch the postings
+    of their own words and n-grams, so cost follows how selective the
+    patterns are rather than how many concepts the filing has.
+    """
+
+    def __init__(self, concepts: list[ConceptMetadata], tokenize):
+        """
+        Build ranking structures.
+
+        Args:
+            concepts: Concepts in insertion order (ordinal = position)
+            tokenize: Label tokenizer (ConceptIndex._tokenize)
+        """
+        self.qnames = [concept.qname for concept in concepts]
+        count = len(concepts)
+
+        self._build_label_postings(concepts, tokenize, count)
+        self._build_ngram_postings(concepts, count)
+        self._build_bitsets(concepts)
+
+    def _build_label_postings(self, concepts, tokenize, count: int) -> None:
+        """BM25 impact per (label word, concept)."""
+        term_counts = []
+        for concept in concepts:
+            tokens = []
+            for label in concept.get_all_labels():
+                tokens.extend(tokenize(label))
+            term_counts.append((Counter(tokens), len(tokens)))
+
+        average_length = (sum(length for _, length in term_counts) / count) if count else 0.0
+
+        postings: dict[str, list[tuple[int, int, int]]] = defaultdict(list)
+        for ordinal, (counts, length) in enumerate(term_counts):
+            for word, frequency in counts.items():
+                postings[word].append((ordinal, frequency, length))
+
+        self._label_postings: dict[str, dict[int, float]] = {}
+        for word, entries in postings.items():
+            document_frequency = len(entries)
+            idf = math.log(1.0 + (count - document_frequency + 0.5) / (document_frequency + 0.5))
+            impacts = {}
+            for ordinal, frequency, length in entries:
+                norm = 1.0 - BM25_B + BM25_B * (length / average_length if average_length else 0.0)
+                impacts[ordinal] = idf * frequency * (BM25_K1 + 1.0) / (frequency + BM25_K1 * norm)
+            self._label_postings[word] = impacts
+
+    def _build_ngram_postings(self, concepts, count: int) -> None:
+        """Local name n-gram -> concept ordinals, with n-gram idf."""
+        postings: dict[str, list[int]] = defaultdict(list)
+        for ordinal, concept in enumerate(concepts):
+            for ngram in self._ngrams(concept.local_name):
+                postings[ngram].append(ordinal)
+
+        max_frequency = max(1, int(count * LOCAL_NAME_NGRAM_MAX_DF_RATIO))
+        self._ngram_postings: dict[str, tuple[float, list[int]]] = {
+            ngram: (math.log(1.0 + count / len(ordinals)), ordinals)
+            for ngram, ordinals in postings.items()
+            if len(ordinals) <= max_frequency
+        }
+
+    def _build_bitsets(self, concepts) -> None:
+        """Characteristic bitsets (bit i = concept ordinal i)."""
+        self._balance_bits: dict[Optional[str], int] = defaultdict(int)
+        self._period_bits: dict[Optional[str], int] = defaultdict(int)
+        self._concrete_bits = 0
+
+        for ordinal, concept in enumerate(concepts):
+            bit = 1 << ordinal
+            self._balance_bits[concept.balance_type] |= bit
+            self._period_bits[concept.period_type] |= bit
+            if not concept.is_abstract:
+                self._concrete_bits |= bit
+
+        self._all_bits = (1 << len(concepts)) - 1
+        self._allowed_cache: dict[tuple, bytes] = {}
+
+    def allowed(
+        self,
+        balance_type: Optional[str],
+        period_type: Optional[str],
+        exclude_abstract: bool
+    ) -> bytes:
+        """
+        Concepts passing the permissive characteristic filters.
+
+        Returns the combined bitset as little-endian bytes, so testing a
+        concept is one byte lookup (ordinal >> 3, bit ordinal & 7).
+        Cached per filter combination.
+        """
+        key = (balance_type, period_type, exclude_abstract)
+        allowed = self._allowed_cache.get(key)
+        if allowed is None:
+            mask = self._concrete_bits if exclude_abstract else self._all_bits
+            if balance_type:
+                mask &= self._balance_bits.get(balance_type, 0) | self._balance_bits.get(None, 0)
+            if period_type:
+                mask &= self._period_bits.get(period_type, 0) | self._period_bits.get(None, 0)
+            allowed = mask.to_bytes(len(self.qnames) // 8 + 1, 'little')
+            self._allowed_cache[key] = allowed
+        return allowed
+
+    def has_label_words(self, words: set[str]) -> bool:
+        """Whether any concept label contains one of the words."""
+        return any(word in self._label_postings for word in words)
+
+    def add_label_scores(
+        self,
+        scores: dict[int, float],
+        words: set[str],
+        allowed: bytes
+    ) -> dict[int, float]:
+        """
+        Add BM25 label scores for query words.
+
+        Only the postings of the query words are read, so the cost follows
+        how common the words are, not how many concepts are indexed.
+
+        Args:
+            scores: Scores so far (allowed concepts only), updated in place
+            words: Query words
+            allowed: Characteristic filter from allowed()
+
+        Returns:
+            Scores per allowed concept ordinal
+        """
+        get = scores.get
+        # Sorted so floating point sums are identical run to run
+        for word in sorted(words):
+            for ordinal, impact in self._label_postings.get(word, {}).items():
+                current = get(ordinal)
+                if current is not None:
+                    scores[ordinal] = current + impact
+                elif _is_set(allowed, ordinal):
+                    scores[ordinal] = impact
+        return scores
+
+    def score_local_names(self, patterns: list[str], allowed: bytes) -> dict[int, float]:
+        """
+        Local name score per allowed concept ordinal.
+
+        A local name scores LOCAL_NAME_WEIGHT times the idf-weighted share
+        of a pattern's n-grams it contains (best pattern), if that share
+        reaches LOCAL_NAME_MIN_COVERAGE.
+        """
+        best: dict[int, float] = {}
+        for pattern in patterns:
+            weighted = [
+                self._ngram_postings[ngram]
+                for ngram in sorted(set(self._ngrams(pattern)))
+                if ngram in self._ngram_postings
+            ]
+            total = sum(idf for idf, _ in weighted)
+            if not total:
+                continue
+
+            covered: dict[int, float] = {}
+            for idf, ordinals in weighted:
+                for ordinal in ordinals:
+                    covered[ordinal] = covered.get(ordinal, 0.0) + idf
+
+            for ordinal, weight in covered.items():
+                coverage = weight / total
+                if coverage >= LOCAL_NAME_MIN_COVERAGE and _is_set(allowed, ordinal):
+                    score = LOCAL_NAME_WEIGHT * coverage
+                    if score > best.get(ordinal, 0.0):
+                        best[ordinal] = score
+        return best
+
+    @staticmethod
+    def _ngrams(text: str) -> list[str]:
+        """Character n-grams of text (lowercase letters and digits only)."""
+        key = _NON_ALNUM_PATTERN.sub('', text.lower())
+        if len(key) <= LOCAL_NAME_NGRAM_SIZE:
+            return [key] if key else []
+        return [key[i:i + LOCAL_NAME_NGRAM_SIZE] for i in range(len(key) - LOCAL_NAME_NGRAM_SIZE + 1)]
+
+
 __all__ = [
     'ConceptMetadata',
     'ConceptIndex',
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# Path: mat_acc/scripts/bench_concept_index.py
+"""
+ConceptIndex Candidate Retrieval Benchmark
+
+Times ConceptIndex.get_candidates() for every component definition in the
+dictionary against the concepts of one or more parsed filings, and checks
+that results do not depend on the order concepts were indexed in.
+
+Concepts are built from the facts in parsed.json (labels generated from
+local names, as ConceptBuilder does when no label is available).
+
+Usage:
+    python scripts/bench_concept_index.py PARSED_JSON [PARSED_JSON ...]
+
+Options:
+    --repeat N   Timed passes over all components (default: 20)
+    --scale N    Index N copies of the concepts under distinct prefixes,
+                 to see how query time grows with index size (default: 1)
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from process.matcher.engine.component_loader import ComponentLoader
+from process.matcher.engine.coordinator import MatchingCoordinator
+from process.matcher.models.concept_metadata import ConceptMetadata, ConceptIndex
+
+
+def local_name_to_label(local_name: str) -> str:
+    """Convert local name to a label (e.g., "AssetsCurrent" -> "Assets Current")."""
+    spaced = re.sub(r'([a-z])([A-Z])', r'\1 \2', local_name)
+    return re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1 \2', spaced)
+
+
+def load_concepts(parsed_json_paths: list[Path], scale: int) -> list[ConceptMetadata]:
+    """Build one ConceptMetadata per distinct fact concept."""
+    seen: dict[str, dict] = {}
+    for path in parsed_json_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        facts = data.get('facts') or data.get('instance', {}).get('facts', [])
+        for fact in facts:
+            concept = fact.get('concept', '')
+            if concept and concept not in seen:
+                seen[concept] = fact
+
+    concepts = []
+    for copy in range(scale):
+        for qname, fact in seen.items():
+            prefix, _, local_name = qname.rpartition(':')
+            if copy:
+                prefix = f"{prefix}{copy}"
+            concepts.append(ConceptMetadata(
+                qname=f"{prefix}:{local_name}",
+                local_name=local_name,
+                prefix=prefix,
+                labels={'standard': local_name_to_label(local_name)},
+                period_type=fact.get('period_type'),
+                is_abstract=local_name.endswith('Abstract'),
+            ))
+    return concepts
+
+
+def build_index(concepts: list[ConceptMetadata]) -> ConceptIndex:
+    """Index concepts in the given order."""
+    index = ConceptIndex()
+    for concept in concepts:
+        index.add_concept(concept)
+    return index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark ConceptIndex candidate retrieval')
+    parser.add_argument('parsed_json', nargs='+', type=Path, help='parsed.json files')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed passes (default: 20)')
+    parser.add_argument('--scale', type=int, default=1, help='Copies of the concepts (default: 1)')
+    args = parser.parse_args()
+
+    concepts = load_concepts(args.parsed_json, max(1, args.scale))
+    components = list(ComponentLoader().load_all().values())
+    coordinator = MatchingCoordinator()
+
+    print(f"Concepts:   {len(concepts)}")
+    print(f"Components: {len(components)}")
+
+    start = time.perf_counter()
+    index = build_index(concepts)
+    index.get_candidates([])  # build ranking structures
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Index build (incl. ranking): {build_ms:.1f} ms")
+
+    # Timed retrieval
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        results = [coordinator._get_candidates(component, index) for component in components]
+    elapsed = time.perf_counter() - start
+    queries = args.repeat * len(components)
+    print(f"Retrieval: {queries} queries, {elapsed * 1e6 / queries:.1f} us/query")
+    print(f"Candidates per query: {sum(len(r) for r in results) / len(results):.1f} average")
+
+    # Determinism: same candidates in the same order for shuffled build orders
+    expected = [[c.qname for c in result] for result in results]
+    shuffled = list(concepts)
+    for seed in range(3):
+        random.Random(seed).shuffle(shuffled)
+        other = build_index(shuffled)
+        actual = [
+            [c.qname for c in coordinator._get_candidates(component, other)]
+            for component in components
+        ]
+        if actual != expected:
+            print(f"[FAIL] Candidates differ for shuffled build order (seed {seed})")
+            return 1
+    print("[OK] Candidates identical across shuffled build orders")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
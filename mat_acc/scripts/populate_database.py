@@ -14,6 +14,8 @@ Options:
     --dry-run    Show what would be processed without writing to database
     --market X   Only process filings from market X (e.g., 'sec')
     --skip-taxonomy  Skip taxonomy availability check
+    --bulk       Bulk-insert hierarchy nodes (COPY on PostgreSQL)
+    --defer-indexes  Drop node indexes during the run, rebuild them at the end
 
 The script will:
     1. Ensure taxonomy libraries are available (scan, process-manual, download)
@@ -26,6 +28,7 @@ Expected directory structure:
     {mapper_output_dir}/{market}/{company}/{form}/{date}/json/core_statements/*.json
 """
 
+import contextlib
 import os
 import subprocess
 import sys
@@ -328,6 +331,8 @@ def populate_database(
     dry_run: bool = False,
     market_filter: Optional[str] = None,
     skip_taxonomy: bool = False,
+    bulk: bool = False,
+    defer_indexes: bool = False,
 ):
     """
     Populate the database with hierarchies from mapped statement files.
@@ -341,6 +346,9 @@ def populate_database(
         dry_run: If True, show what would be done without making changes
         market_filter: Only process filings from specified market
         skip_taxonomy: If True, skip taxonomy availability check
+        bulk: If True, bulk-insert hierarchy nodes (one transaction per filing)
+        defer_indexes: If True, drop node indexes while filings are stored
+                       and rebuild them once at the end
     """
     from config_loader import ConfigLoader
     from database import HierarchyStorage
@@ -398,10 +406,16 @@ def populate_database(
         print(f"Processing {len(filings)} filings (limited)")
 
     # Initialize storage
+    index_scope = contextlib.nullcontext()
     if not dry_run:
-        storage = HierarchyStorage()
+        storage = HierarchyStorage(bulk_load=bulk)
         storage.initialize()
         print("Database initialized")
+        if bulk:
+            print("Mode: BULK LOAD")
+        if defer_indexes:
+            print("Node indexes deferred until all filings are stored")
+            index_scope = storage.deferred_indexes()
         print()
 
     # Process filings
@@ -410,44 +424,45 @@ def populate_database(
     total_statements = 0
     total_nodes = 0
 
-    for i, filing in enumerate(filings, 1):
-        print(f"[{i}/{len(filings)}] {filing['company_name']} - "
-              f"{filing['form_type']} ({filing['filing_date']})")
-
-        if dry_run:
-            print(f"         Path: {filing['path']}")
-            print(f"         Statements: {filing['statement_count']} JSON files")
-            if filing.get('parsed_json_path'):
-                print(f"         Parsed JSON: {filing['parsed_json_path']}")
-            else:
-                print(f"         Parsed JSON: NOT FOUND (context_ref will be empty)")
-            success_count += 1
-            continue
-
-        try:
-            result = storage.process_filing_folder(
-                folder_path=filing['path'],
-                market=filing['market'],
-                company_name=filing['company_name'],
-                form_type=filing['form_type'],
-                filing_date=filing['filing_date'],
-                parsed_json_path=filing.get('parsed_json_path'),
-            )
-
-            if result['errors']:
-                print(f"         ERRORS: {result['errors']}")
-                error_count += 1
-            else:
-                print(f"         Stored: {result['statement_count']} statements, "
-                      f"{result['total_nodes']} nodes")
+    with index_scope:
+        for i, filing in enumerate(filings, 1):
+            print(f"[{i}/{len(filings)}] {filing['company_name']} - "
+                  f"{filing['form_type']} ({filing['filing_date']})")
+
+            if dry_run:
+                print(f"         Path: {filing['path']}")
+                print(f"         Statements: {filing['statement_count']} JSON files")
+                if filing.get('parsed_json_path'):
+                    print(f"         Parsed JSON: {filing['parsed_json_path']}")
+                else:
+                    print(f"         Parsed JSON: NOT FOUND (context_ref will be empty)")
                 success_count += 1
-                total_statements += result['statement_count']
-                total_nodes += result['total_nodes']
+                continue
 
-        except Exception as e:
-            print(f"         ERROR: {e}")
-            logger.exception("Error processing filing")
-            error_count += 1
+            try:
+                result = storage.process_filing_folder(
+                    folder_path=filing['path'],
+                    market=filing['market'],
+                    company_name=filing['company_name'],
+                    form_type=filing['form_type'],
+                    filing_date=filing['filing_date'],
+                    parsed_json_path=filing.get('parsed_json_path'),
+                )
+
+                if result['errors']:
+                    print(f"         ERRORS: {result['errors']}")
+                    error_count += 1
+                else:
+                    print(f"         Stored: {result['statement_count']} statements, "
+                          f"{result['total_nodes']} nodes")
+                    success_count += 1
+                    total_statements += result['statement_count']
+                    total_nodes += result['total_nodes']
+
+            except Exception as e:
+                print(f"         ERROR: {e}")
+                logger.exception("Error processing filing")
+                error_count += 1
 
     # Summary
     print()
@@ -489,6 +504,16 @@ def main():
         action='store_true',
         help='Skip taxonomy availability check (scan, process-manual, download)'
     )
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Bulk-insert hierarchy nodes (COPY on PostgreSQL, executemany on SQLite)'
+    )
+    parser.add_argument(
+        '--defer-indexes',
+        action='store_true',
+        help='Drop node indexes during the run and rebuild them once at the end'
+    )
 
     args = parser.parse_args()
 
@@ -497,6 +522,8 @@ def main():
         dry_run=args.dry_run,
         market_filter=args.market,
         skip_taxonomy=args.skip_taxonomy,
+        bulk=args.bulk,
+        defer_indexes=args.defer_indexes,
     )
 
 
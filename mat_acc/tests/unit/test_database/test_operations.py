@@ -18,7 +18,7 @@ from database.models.processed_filings import ProcessedFiling
 from database.models.statement_hierarchies import StatementHierarchy
 from database.models.hierarchy_nodes import HierarchyNode
 from database.operations.filing_ops import FilingOperations
-from database.operations.hierarchy_ops import HierarchyOperations
+from database.operations.hierarchy_ops import HierarchyOperations, BULK_NODE_COLUMNS
 
 
 @pytest.fixture(autouse=True)
@@ -618,3 +618,75 @@ class TestHierarchyOperations:
         )
 
         assert HierarchyOperations.count_nodes(db_session) == 3
+
+    def test_store_hierarchy_bulk(self, db_session, filing, mock_hierarchy_root):
+        """Test bulk loading stores the same nodes as ORM storage."""
+        orm = HierarchyOperations.store_hierarchy(
+            db_session,
+            filing_id=filing.filing_id,
+            name='Balance Sheet',
+            root=mock_hierarchy_root,
+        )
+        bulk = HierarchyOperations.store_hierarchy(
+            db_session,
+            filing_id=filing.filing_id,
+            name='Balance Sheet (bulk)',
+            root=mock_hierarchy_root,
+            bulk=True,
+        )
+
+        def node_values(hierarchy_id):
+            nodes = db_session.query(HierarchyNode).filter_by(
+                hierarchy_id=hierarchy_id
+            ).order_by(HierarchyNode.level).all()
+            return [
+                {k: v for k, v in n.to_dict().items() if k not in ('node_id', 'hierarchy_id')}
+                for n in nodes
+            ]
+
+        assert bulk.node_count == 3
+        assert node_values(bulk.hierarchy_id) == node_values(orm.hierarchy_id)
+
+    def test_copy_csv_payload(self, mock_hierarchy_root):
+        """Test COPY payload writes None as NULL and keeps empty strings."""
+        from datetime import datetime
+
+        payload = HierarchyOperations._copy_csv_payload([
+            ('n1', None, 'say "hi"', '', 1.5, 2, True, datetime(2024, 1, 2, 3, 4, 5)),
+        ])
+        assert payload == '"n1",,"say ""hi""","",1.5,2,true,2024-01-02 03:04:05\n'
+
+        # Structural root node: no parent, value, unit, decimals or context
+        rows = HierarchyOperations.flatten_nodes('h1', mock_hierarchy_root)
+        fields = dict(zip(
+            BULK_NODE_COLUMNS,
+            HierarchyOperations._copy_csv_payload(rows[:1]).rstrip('\n').split(',')
+        ))
+        for column in ('parent_mat_acc_id', 'value', 'unit', 'decimals', 'context_ref'):
+            assert fields[column] == ''
+
+    def test_deferred_node_indexes(self, db_session, filing, mock_hierarchy_root):
+        """Test node indexes are dropped during a backfill and rebuilt after."""
+        from sqlalchemy import inspect
+        from database.models.base import get_engine
+
+        def index_names():
+            return {i['name'] for i in inspect(get_engine()).get_indexes('hierarchy_nodes')}
+
+        # In-memory SQLite shares one connection: commit before DDL
+        db_session.commit()
+        expected = index_names()
+
+        with HierarchyOperations.deferred_node_indexes(get_engine()):
+            assert index_names() == set()
+            with session_scope() as session:
+                HierarchyOperations.store_hierarchy(
+                    session,
+                    filing_id=filing.filing_id,
+                    name='Balance Sheet',
+                    root=mock_hierarchy_root,
+                    bulk=True,
+                )
+
+        assert expected and index_names() == expected
+        assert HierarchyOperations.count_nodes(db_session) == 3
@@ -7,6 +7,7 @@ Tests all loader classes including:
 - MappedDataLoader / MappedReader
 - ParsedDataLoader / ParsedReader
 - XBRLDataLoader / XBRLReader
+- TaxonomyReader / TaxonomyStore
 """
 
 import json
@@ -349,6 +350,105 @@ class TestXBRLReader:
         assert concept == 'schema.xsd'
 
 
+# ==============================================================================
+# TAXONOMY STORE TESTS
+# ==============================================================================
+
+TAXONOMY_SCHEMA = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           xmlns:xbrli="http://www.xbrl.org/2003/instance"
+           targetNamespace="http://example.com/test">
+  <xs:element name="Assets" id="test_Assets" type="xbrli:monetaryItemType"
+              substitutionGroup="xbrli:item" xbrli:periodType="instant"
+              xbrli:balance="debit" nillable="true"/>
+  <xs:element name="Revenues" id="test_Revenues" type="xbrli:monetaryItemType"
+              substitutionGroup="xbrli:item" xbrli:periodType="duration"
+              xbrli:balance="credit" nillable="true"/>
+</xs:schema>
+"""
+
+TAXONOMY_LABELS = """<?xml version="1.0" encoding="UTF-8"?>
+<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase"
+               xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:labelLink xlink:type="extended" xlink:role="http://www.xbrl.org/2003/role/link">
+    <link:loc xlink:type="locator" xlink:href="test.xsd#test_Assets" xlink:label="loc_Assets"/>
+    <link:label xlink:type="resource" xlink:label="lab_Assets" xml:lang="en-US"
+                xlink:role="http://www.xbrl.org/2003/role/label">Assets</link:label>
+    <link:label xlink:type="resource" xlink:label="lab_Assets_terse" xml:lang="en-US"
+                xlink:role="http://www.xbrl.org/2003/role/terseLabel">Total assets</link:label>
+    <link:labelArc xlink:type="arc" xlink:from="loc_Assets" xlink:to="lab_Assets"/>
+    <link:labelArc xlink:type="arc" xlink:from="loc_Assets" xlink:to="lab_Assets_terse"/>
+  </link:labelLink>
+</link:linkbase>
+"""
+
+
+class TestTaxonomyStore:
+    """Test the compiled taxonomy store used by TaxonomyReader."""
+
+    def _setup(self, temp_dir):
+        from loaders.taxonomy_data import TaxonomyEntry
+
+        taxonomy_dir = temp_dir / 'taxonomies' / 'test-2024'
+        taxonomy_dir.mkdir(parents=True)
+        (taxonomy_dir / 'test.xsd').write_text(TAXONOMY_SCHEMA)
+        (taxonomy_dir / 'test_lab.xml').write_text(TAXONOMY_LABELS)
+
+        settings = {
+            'taxonomy_dir': temp_dir / 'taxonomies',
+            'cache_dir': temp_dir / 'cache',
+            'enable_caching': True,
+        }
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+
+        entry = TaxonomyEntry(
+            taxonomy_path=taxonomy_dir,
+            taxonomy_name='test-2024',
+            source_type='libraries',
+            relative_path=Path('test-2024'),
+        )
+        return config, entry
+
+    def test_store_matches_parsed_taxonomy(self, temp_dir):
+        """Should load the same elements and labels from the store."""
+        from loaders.taxonomy_reader import TaxonomyReader
+        from loaders.taxonomy_store import StoredLabels
+
+        config, entry = self._setup(temp_dir)
+
+        parsed = TaxonomyReader(config).read_taxonomy(entry)
+        stored = TaxonomyReader(config).read_taxonomy(entry)
+
+        assert isinstance(stored.labels, StoredLabels)
+        assert stored.namespace == parsed.namespace == 'http://example.com/test'
+        assert stored.element_count == parsed.element_count == 2
+        assert stored.label_count == parsed.label_count == 2
+        assert stored.elements['Assets'] == parsed.elements['Assets']
+        assert stored.elements['Revenues'].balance == 'credit'
+        assert stored.labels['Assets'] == parsed.labels['Assets']
+        assert stored.get_label('Assets') == 'Assets'
+        assert stored.get_label('Assets', role='terse') == 'Total assets'
+        assert stored.get_label('Missing') is None
+        assert sorted(stored.elements) == ['Assets', 'Revenues']
+
+    def test_store_rebuilt_when_taxonomy_changes(self, temp_dir):
+        """Should rebuild the store when a taxonomy file changes."""
+        from loaders.taxonomy_reader import TaxonomyReader
+
+        config, entry = self._setup(temp_dir)
+        TaxonomyReader(config).read_taxonomy(entry)
+
+        labels_file = entry.taxonomy_path / 'test_lab.xml'
+        labels_file.write_text(TAXONOMY_LABELS.replace('>Assets<', '>Assets, total<'))
+
+        info = TaxonomyReader(config).read_taxonomy(entry)
+
+        assert info.get_label('Assets') == 'Assets, total'
+        stores = list((temp_dir / 'cache' / 'taxonomy_store').glob('*.sqlite'))
+        assert len(stores) == 1
+
+
 # ==============================================================================
 # LOADER CONSTANTS TESTS
 # ==============================================================================
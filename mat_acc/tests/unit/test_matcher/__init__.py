@@ -0,0 +1,2 @@
+# Path: mat_acc/tests/unit/test_matcher/__init__.py
+"""Tests for the matching engine components."""
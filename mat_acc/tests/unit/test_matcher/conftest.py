@@ -0,0 +1,36 @@
+# Path: mat_acc/tests/unit/test_matcher/conftest.py
+"""
+Shared Fixtures for Matcher Tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add mat_acc to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from process.matcher.models.concept_metadata import ConceptMetadata
+
+
+@pytest.fixture
+def make_concept():
+    """
+    Factory for us-gaap concepts.
+
+    labels is either the standard label or a role -> label dict.
+    """
+    def _make_concept(local_name, labels, balance_type=None, period_type='instant', is_abstract=False):
+        if isinstance(labels, str):
+            labels = {'standard': labels}
+        return ConceptMetadata(
+            qname=f"us-gaap:{local_name}",
+            local_name=local_name,
+            prefix='us-gaap',
+            labels=labels,
+            balance_type=balance_type,
+            period_type=period_type,
+            is_abstract=is_abstract,
+        )
+    return _make_concept
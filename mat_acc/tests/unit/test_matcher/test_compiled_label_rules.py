@@ -0,0 +1,103 @@
+# Path: mat_acc/tests/unit/test_matcher/test_compiled_label_rules.py
+"""
+Tests for CompiledLabelRules (one-pass label rule matching).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add mat_acc to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from process.matcher.evaluators import LabelEvaluator
+from process.matcher.evaluators.compiled_label_rules import (
+    AffixTrie,
+    CompiledLabelRules,
+    PatternAutomaton,
+)
+from process.matcher.models.component_definition import LabelRule, MatchType
+
+
+RULES = {
+    'current_assets': [
+        LabelRule(patterns=['current assets', 'assets, current'], match_type=MatchType.CONTAINS, weight=15),
+        LabelRule(patterns=['total current assets'], match_type=MatchType.EXACT, weight=5),
+    ],
+    'inventory': [
+        LabelRule(patterns=['inventory'], match_type=MatchType.STARTS_WITH, weight=10),
+        LabelRule(patterns=[', net'], match_type=MatchType.ENDS_WITH, weight=3),
+        LabelRule(patterns=[r'^inventor(y|ies)\b'], match_type=MatchType.REGEX, weight=2),
+    ],
+    'case_sensitive': [
+        LabelRule(patterns=['EBITDA'], match_type=MatchType.CONTAINS, case_sensitive=True, weight=7),
+    ],
+}
+
+# (local name, labels) of the concepts scanned
+CONCEPT_LABELS = [
+    ('AssetsCurrent', {'standard': 'Total Current Assets', 'terse': 'Assets, Current'}),
+    ('InventoryNet', {'terse': '', 'standard': 'Inventory, Net', 'verbose': 'Inventories - Net'}),
+    ('Ebitda', {'standard': 'Adjusted EBITDA', 'terse': 'ebitda'}),
+    ('OtherAssetsCurrent', {'standard': 'Other (Current) Assets'}),
+    ('Empty', {'standard': ''}),
+]
+
+
+class TestPatternStructures:
+    """Tests for the Aho-Corasick automaton and affix trie."""
+
+    def test_automaton_finds_overlapping_patterns(self):
+        automaton = PatternAutomaton()
+        for value, pattern in enumerate(['he', 'she', 'his', 'hers', 'ers']):
+            automaton.add(pattern, value)
+
+        assert automaton.search('ushers') == {0, 1, 3, 4}
+        assert automaton.search('history') == {2}
+        assert automaton.search('xyz') == set()
+
+    def test_affix_trie_finds_prefixes(self):
+        trie = AffixTrie()
+        for value, pattern in enumerate(['net', 'net income', 'income']):
+            trie.add(pattern, value)
+
+        assert trie.search('net income loss') == {0, 1}
+        assert trie.search('income') == {2}
+
+
+class TestCompiledLabelRules:
+    """Compiled matching must equal LabelEvaluator's per-pattern matching."""
+
+    @pytest.fixture
+    def compiled(self):
+        return CompiledLabelRules(RULES)
+
+    @pytest.mark.parametrize('local_name,labels', CONCEPT_LABELS, ids=[c[0] for c in CONCEPT_LABELS])
+    def test_same_result_as_evaluator(self, compiled, make_concept, local_name, labels):
+        concept = make_concept(local_name, labels)
+        evaluator = LabelEvaluator()
+        scan = compiled.scan(concept)
+
+        for component_id, rules in RULES.items():
+            expected = evaluator.evaluate(concept, rules)
+            actual = evaluator.evaluate(
+                concept, rules, {'label_scan': scan, 'component_id': component_id}
+            )
+            assert actual.to_dict() == expected.to_dict()
+
+    def test_first_label_then_first_pattern_reported(self, compiled, make_concept):
+        scan = compiled.scan(make_concept(*CONCEPT_LABELS[0]))
+
+        matches = scan.matches_for('current_assets')
+
+        # Both labels match; the standard label comes first in the concept
+        assert matches[0] == ('standard', 'Total Current Assets', 'current assets')
+        assert matches[1] == ('standard', 'Total Current Assets', 'total current assets')
+
+    def test_case_sensitive_rule(self, compiled, make_concept):
+        scan = compiled.scan(make_concept(*CONCEPT_LABELS[2]))
+
+        assert scan.matches_for('case_sensitive') == {
+            0: ('standard', 'Adjusted EBITDA', 'EBITDA')
+        }
@@ -0,0 +1,89 @@
+# Path: mat_acc/tests/unit/test_matcher/test_concept_index.py
+"""
+Tests for ConceptIndex candidate retrieval.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add mat_acc to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from process.matcher.models.concept_metadata import ConceptIndex
+
+
+@pytest.fixture
+def concepts(make_concept):
+    """Balance sheet concepts plus unrelated filler."""
+    result = [
+        make_concept('AssetsCurrent', 'Total Current Assets', 'debit'),
+        make_concept('Assets', 'Total Assets', 'debit'),
+        make_concept('LiabilitiesCurrent', 'Total Current Liabilities', 'credit'),
+        make_concept('InventoryNet', 'Inventory, Net', 'debit'),
+        make_concept('AssetsAbstract', 'Assets', is_abstract=True),
+        make_concept('OtherAssetsCurrent', 'Other Current Assets', None),
+    ]
+    for i in range(50):
+        result.append(make_concept(f'FillerItem{i}', f'Filler item {i}', 'credit', 'duration'))
+    return result
+
+
+def build_index(concepts):
+    """Index concepts in the given order."""
+    index = ConceptIndex()
+    for concept in concepts:
+        index.add_concept(concept)
+    return index
+
+
+class TestGetCandidates:
+    """Tests for ConceptIndex.get_candidates()."""
+
+    def test_best_match_first(self, concepts):
+        """Test the concept matching all words ranks first."""
+        index = build_index(concepts)
+
+        candidates = index.get_candidates(['Total Current Assets'], balance_type='debit')
+
+        assert candidates[0] == 'us-gaap:AssetsCurrent'
+
+    def test_permissive_characteristic_filters(self, concepts):
+        """Test wrong characteristics are excluded, unknown ones kept."""
+        index = build_index(concepts)
+
+        candidates = index.get_candidates(['current assets'], balance_type='debit')
+
+        assert 'us-gaap:OtherAssetsCurrent' in candidates   # balance unknown
+        assert 'us-gaap:LiabilitiesCurrent' not in candidates   # credit
+        assert 'us-gaap:AssetsAbstract' not in candidates   # abstract
+
+    def test_top_k_independent_of_insertion_order(self, concepts):
+        """Test truncated results are identical for any build order."""
+        expected = build_index(concepts).get_candidates(['filler'], max_candidates=10)
+
+        for seed in range(3):
+            shuffled = list(concepts)
+            random.Random(seed).shuffle(shuffled)
+            assert build_index(shuffled).get_candidates(['filler'], max_candidates=10) == expected
+
+    def test_local_name_patterns(self, concepts):
+        """Test local name patterns match concepts whose labels differ."""
+        index = build_index(concepts)
+
+        candidates = index.get_candidates(
+            ['stock'], local_name_patterns=['InventoryNet'], balance_type='debit'
+        )
+
+        assert candidates == ['us-gaap:InventoryNet']
+
+    def test_index_updates_after_add(self, concepts, make_concept):
+        """Test concepts added after a query are found by later queries."""
+        index = build_index(concepts)
+        assert index.get_candidates(['goodwill']) != ['us-gaap:Goodwill']
+
+        index.add_concept(make_concept('Goodwill', 'Goodwill', 'debit'))
+
+        assert index.get_candidates(['goodwill']) == ['us-gaap:Goodwill']